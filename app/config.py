@@ -48,6 +48,8 @@ class Settings(BaseSettings):
     mail_starttls: bool = os.getenv("MAIL_STARTTLS", "true").lower() == "true"
     mail_ssl_tls: bool = os.getenv("MAIL_SSL_TLS", "false").lower() == "true"
     mail_from_name: str = os.getenv("MAIL_FROM_NAME", "Weather Flick")
+    mail_backend: str = os.getenv("MAIL_BACKEND", "smtp")  # smtp, memory
+    mail_pool_size: int = int(os.getenv("MAIL_POOL_SIZE", "5"))
 
     # Redis 설정
     redis_url: str = os.getenv("REDIS_URL", "redis://localhost:6379")
@@ -55,6 +57,32 @@ class Settings(BaseSettings):
     redis_port: int = int(os.getenv("REDIS_PORT", "6379"))
     redis_ttl: int = int(os.getenv("REDIS_TTL", "3600"))  # 1시간 기본 캐시
 
+    # 알림 큐 워커 설정 (별도 프로세스로 실행하는 경우 false)
+    notification_worker_enabled: bool = (
+        os.getenv("NOTIFICATION_WORKER_ENABLED", "false").lower() == "true"
+    )
+
+    # 헬스 체크 설정 (초) - 레디니스 프로브는 이 주기로 갱신된 스냅샷을 응답
+    health_check_interval: float = float(os.getenv("HEALTH_CHECK_INTERVAL", "15"))
+    health_upstream_check_interval: float = float(
+        os.getenv("HEALTH_UPSTREAM_CHECK_INTERVAL", "300")
+    )
+
+    # 카탈로그 데이터셋 버전 확인 주기 (초) - 조건부 요청(ETag) 검증에 사용
+    dataset_version_interval: float = float(os.getenv("DATASET_VERSION_INTERVAL", "30"))
+
+    # 지연 초기화 설정 - 사용 빈도가 낮은 라우터를 첫 요청 시 로드하고,
+    # 시작 직후 백그라운드에서 지연 라우터/클라이언트를 미리 생성
+    lazy_routers_enabled: bool = (
+        os.getenv("LAZY_ROUTERS_ENABLED", "true").lower() == "true"
+    )
+    lazy_warm_up_enabled: bool = (
+        os.getenv("LAZY_WARM_UP_ENABLED", "true").lower() == "true"
+    )
+
+    # 경로 geometry 저장 시 Douglas–Peucker 허용 오차 (m) - 0이면 단순화 없이 폴리라인 인코딩만
+    route_geometry_tolerance: float = float(os.getenv("ROUTE_GEOMETRY_TOLERANCE", "1.0"))
+
     # 외부 API 설정
     weather_api_key: str = os.getenv("WEATHER_API_KEY", "")
     weather_api_url: str = "http://api.weatherapi.com/v1"
@@ -101,6 +129,10 @@ class Settings(BaseSettings):
     tmap_api_key: str = os.getenv("TMAP_API_KEY", "")
     tmap_api_url: str = "https://apis.openapi.sk.com/tmap"
 
+    # 교통정보 API 워커당 동시 요청 수 (여행 계획 전체 경로 생성 시 병렬 요청 제한)
+    tmap_max_concurrency: int = int(os.getenv("TMAP_MAX_CONCURRENCY", "10"))
+    odsay_max_concurrency: int = int(os.getenv("ODSAY_MAX_CONCURRENCY", "10"))
+
     # 프론트엔드 설정
     frontend_url: str = os.getenv("FRONTEND_URL", "http://localhost:5173")
 
@@ -26,17 +26,6 @@ engine = create_engine(
     pool_reset_on_return='commit',  # 연결 반환 시 커밋 상태로 리셋
 )
 
-# SQLAlchemy 메타데이터 캐시 강제 새로고침
-from sqlalchemy import MetaData
-
-metadata = MetaData()
-try:
-    metadata.reflect(bind=engine)
-    # Clear any cached metadata
-    metadata.clear()
-except Exception as e:
-    print(f"Metadata reflection warning: {e}")
-
 # 세션 팩토리 생성
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
@@ -71,6 +60,13 @@ def check_db_connection():
         return False, f"Database connection failed: {str(e)}"
 
 
+# fork된 워커의 연결 풀 초기화
+def dispose_engine_after_fork():
+    """gunicorn post_fork 훅에서 호출 (preload 시 마스터에서 연 연결을 워커가 공유하지 않도록)"""
+    # close=False: 부모 프로세스의 연결은 닫지 않고 워커 풀에서만 버림
+    engine.dispose(close=False)
+
+
 # 연결 풀 상태 확인
 def get_pool_status():
     """연결 풀 상태 정보 반환"""
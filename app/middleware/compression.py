@@ -0,0 +1,156 @@
+"""
+응답 압축 미들웨어 (brotli/gzip)
+
+- Accept-Encoding 협상 (q 값 반영, 같으면 br 우선), MINIMUM_SIZE 미만 응답은 압축하지 않음
+- JSON/텍스트 응답만 압축, 이미 Content-Encoding이 있는 응답(캐시의 사전 압축 본문)은 그대로 전달
+- 요청마다 압축하는 동적 응답은 빠른 레벨, 캐시에 보관하는 본문은 높은 레벨로 한 번만 압축
+- 압축한 표현의 강한 ETag에는 인코딩 접미사를 붙여 원본 표현과 구분 ("...-br", "...-gzip")
+- brotli 패키지가 없으면 gzip만 사용
+"""
+
+import asyncio
+import gzip
+import logging
+from collections.abc import Callable
+
+from starlette.datastructures import MutableHeaders
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.responses import Response
+
+logger = logging.getLogger(__name__)
+
+# brotli를 선택적으로 import
+try:
+    import brotli
+except ImportError:
+    brotli = None
+    logger.warning("brotli not installed - using gzip only")
+
+MINIMUM_SIZE = 1024  # 이보다 작은 응답은 압축 이득보다 비용이 큼
+THREAD_THRESHOLD = 256 * 1024  # 이보다 큰 응답은 스레드에서 압축 (이벤트 루프 점유 방지)
+COMPRESSIBLE_TYPES = (
+    "application/json",
+    "application/javascript",
+    "application/xml",
+    "image/svg+xml",
+    "text/",
+)
+SKIP_TYPES = ("text/event-stream",)
+
+# 인코딩별 압축 레벨 (동적: 요청마다 압축, 캐시: 한 번 압축 후 재사용)
+DYNAMIC_LEVELS = {"br": 4, "gzip": 6}
+CACHED_LEVELS = {"br": 9, "gzip": 9}
+ETAG_SUFFIXES = {"br": "-br", "gzip": "-gzip"}
+
+
+def supported_encodings() -> tuple[str, ...]:
+    return ("br", "gzip") if brotli is not None else ("gzip",)
+
+
+def choose_encoding(accept_encoding: str | None) -> str | None:
+    """Accept-Encoding에서 사용할 인코딩 선택 (없으면 None)"""
+    if not accept_encoding:
+        return None
+    weights: dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        weight = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                weight = float(params[2:])
+            except ValueError:
+                weight = 0.0
+        weights[name] = weight
+
+    best, best_weight = None, 0.0
+    for encoding in supported_encodings():
+        weight = weights.get(encoding, weights.get("*", 0.0))
+        if weight > best_weight:
+            best, best_weight = encoding, weight
+    return best
+
+
+def is_compressible_type(content_type: str | None) -> bool:
+    if not content_type:
+        return False
+    content_type = content_type.lower()
+    return not content_type.startswith(SKIP_TYPES) and content_type.startswith(COMPRESSIBLE_TYPES)
+
+
+def is_compressible(content_type: str | None, size: int) -> bool:
+    return size >= MINIMUM_SIZE and is_compressible_type(content_type)
+
+
+def compress(body: bytes, encoding: str, level: int) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=level)
+    return gzip.compress(body, compresslevel=level, mtime=0)
+
+
+def encoded_etag(etag: str, encoding: str) -> str:
+    """압축한 표현의 ETag ("abc" → "abc-br"), 약한 ETag도 그대로 접미사만 추가"""
+    if not etag.endswith('"'):
+        return etag
+    return etag[:-1] + ETAG_SUFFIXES[encoding] + '"'
+
+
+def strip_encoding_suffix(etag: str) -> str:
+    for suffix in ETAG_SUFFIXES.values():
+        if etag.endswith(suffix + '"'):
+            return etag[: -len(suffix) - 1] + '"'
+    return etag
+
+
+def add_vary(headers: MutableHeaders, value: str = "Accept-Encoding"):
+    vary = headers.get("vary")
+    if not vary:
+        headers["Vary"] = value
+    elif value.lower() not in (item.strip().lower() for item in vary.split(",")):
+        headers["Vary"] = f"{vary}, {value}"
+
+
+class CompressionMiddleware(BaseHTTPMiddleware):
+    """동적 응답 압축 미들웨어"""
+
+    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+        encoding = choose_encoding(request.headers.get("accept-encoding"))
+        response = await call_next(request)
+
+        if (
+            request.method == "HEAD"
+            or response.status_code < 200
+            or response.status_code in (204, 304)
+            or "content-encoding" in response.headers
+            or not is_compressible_type(response.headers.get("content-type"))
+        ):
+            return response
+
+        # 압축 여부가 Accept-Encoding에 따라 달라지므로 공유 캐시가 구분하도록 함
+        add_vary(response.headers)
+        content_length = response.headers.get("content-length")
+        if encoding is None or (content_length is not None and int(content_length) < MINIMUM_SIZE):
+            return response
+
+        body = b"".join([chunk async for chunk in response.body_iterator])
+        headers = MutableHeaders(raw=list(response.headers.raw))
+        if len(body) >= MINIMUM_SIZE:
+            level = DYNAMIC_LEVELS[encoding]
+            if len(body) >= THREAD_THRESHOLD:
+                compressed = await asyncio.to_thread(compress, body, encoding, level)
+            else:
+                compressed = compress(body, encoding, level)
+            if len(compressed) < len(body):
+                body = compressed
+                headers["Content-Encoding"] = encoding
+                if "etag" in headers:
+                    headers["ETag"] = encoded_etag(headers["etag"], encoding)
+        headers["Content-Length"] = str(len(body))
+        compressed_response = Response(content=body, status_code=response.status_code)
+        # Set-Cookie 등 중복 헤더를 유지하도록 원본 헤더 목록을 그대로 사용
+        compressed_response.raw_headers = headers.raw
+        return compressed_response
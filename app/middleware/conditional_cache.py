@@ -0,0 +1,285 @@
+"""
+조건부 요청(ETag/Last-Modified) 캐시 미들웨어
+자주 바뀌지 않는 카탈로그 응답(지역, 카테고리, 날씨 지원 도시, 여행 코스 목록)에 적용
+
+- ETag: 데이터셋 버전 + 요청 경로/쿼리로 계산한 강한 ETag (같은 버전이면 모든 워커에서 같은 값)
+- If-None-Match/If-Modified-Since가 현재 버전과 맞으면 엔드포인트(DB)를 거치지 않고 304 응답
+- 같은 버전의 200 응답 본문은 워커 메모리(LRU, 용량 제한)에 보관하여 재직렬화 없이 응답
+- 보관한 본문은 인코딩(br/gzip)별로 한 번만 높은 레벨로 압축해 함께 보관 (요청마다 재압축하지 않음)
+- Cache-Control로 CDN/브라우저 캐시 허용 (로그인 사용자별 응답이 있는 경로는 비로그인 요청만 적용)
+- 데이터셋 버전을 모르면(시작 직후, 확인 작업 정지) 캐시 없이 그대로 처리
+"""
+
+import asyncio
+import hashlib
+import logging
+import re
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import UTC
+from email.utils import format_datetime, parsedate_to_datetime
+
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.responses import Response
+
+from app.middleware.compression import (
+    CACHED_LEVELS,
+    THREAD_THRESHOLD,
+    choose_encoding,
+    compress,
+    encoded_etag,
+    is_compressible,
+    strip_encoding_suffix,
+)
+from app.services.dataset_versions import DatasetVersion, dataset_versions
+
+logger = logging.getLogger(__name__)
+
+RESPONSE_CACHE_MAX_BYTES = 32 * 1024 * 1024  # 워커당 본문 캐시 용량
+RESPONSE_CACHE_MAX_ENTRY_BYTES = 4 * 1024 * 1024  # 이보다 큰 응답은 본문 캐시 안 함
+
+# 캐시된 응답에 그대로 복사하지 않는 헤더 (응답마다 다시 계산)
+_SKIP_HEADERS = {"content-length", "etag", "last-modified", "cache-control"}
+
+
+@dataclass(frozen=True, slots=True)
+class CacheRule:
+    """조건부 캐시 적용 경로"""
+
+    pattern: re.Pattern
+    dataset: str
+    max_age: int  # Cache-Control max-age (초)
+    anonymous_only: bool = False  # 로그인 사용자별 응답이 있는 경로 (Authorization 요청은 제외)
+
+
+CACHE_RULES: tuple[CacheRule, ...] = (
+    CacheRule(re.compile(r"/api/regions(/.*)?"), "regions", 300),
+    CacheRule(re.compile(r"/api/local/regions(/top_level_dedup)?/?"), "regions", 300),
+    CacheRule(re.compile(r"/api/local/regions_point/?"), "regions", 300),
+    CacheRule(re.compile(r"/api/categories(/.*)?"), "categories", 300),
+    CacheRule(re.compile(r"/api/weather/cities/?"), "weather_cities", 3600),
+    CacheRule(re.compile(r"/api/travel-courses/?"), "travel_courses", 60, anonymous_only=True),
+)
+
+
+@dataclass(slots=True)
+class CachedResponse:
+    """본문 캐시 항목"""
+
+    body: bytes
+    headers: list[tuple[str, str]]
+    encoded: dict[str, bytes] = field(default_factory=dict)  # 인코딩 → 사전 압축 본문
+
+    @property
+    def size(self) -> int:
+        return len(self.body) + sum(len(data) for data in self.encoded.values())
+
+    @property
+    def content_type(self) -> str | None:
+        return next((value for name, value in self.headers if name == "content-type"), None)
+
+
+class ResponseBodyCache:
+    """ETag → 응답 본문 LRU (워커 프로세스 로컬, 전체 바이트 수 제한)"""
+
+    def __init__(self, max_bytes: int = RESPONSE_CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._entries: OrderedDict[str, CachedResponse] = OrderedDict()
+        self.stats = {"hits": 0, "misses": 0, "not_modified": 0}
+
+    def get(self, etag: str) -> CachedResponse | None:
+        entry = self._entries.get(etag)
+        if entry is None:
+            self.stats["misses"] += 1
+            return None
+        self._entries.move_to_end(etag)
+        self.stats["hits"] += 1
+        return entry
+
+    def set(self, etag: str, entry: CachedResponse):
+        if len(entry.body) > RESPONSE_CACHE_MAX_ENTRY_BYTES:
+            return
+        previous = self._entries.pop(etag, None)
+        if previous is not None:
+            self.size -= previous.size
+        self._entries[etag] = entry
+        self.size += entry.size
+        self._evict()
+
+    def set_encoded(self, etag: str, entry: CachedResponse, encoding: str, data: bytes):
+        """사전 압축 본문 추가 (항목이 이미 교체/제거되었으면 크기 계산에서 제외)"""
+        entry.encoded[encoding] = data
+        if self._entries.get(etag) is entry:
+            self.size += len(data)
+            self._evict()
+
+    def _evict(self):
+        while self.size > self.max_bytes and self._entries:
+            _, evicted = self._entries.popitem(last=False)
+            self.size -= evicted.size
+
+
+# 전역 인스턴스
+response_body_cache = ResponseBodyCache()
+
+
+def find_cache_rule(request: Request) -> CacheRule | None:
+    path = request.url.path
+    for rule in CACHE_RULES:
+        if rule.pattern.fullmatch(path):
+            if rule.anonymous_only and "authorization" in request.headers:
+                return None
+            return rule
+    return None
+
+
+def make_etag(version: DatasetVersion, request: Request) -> str:
+    """데이터셋 버전 + 경로/쿼리 기반 강한 ETag"""
+    target = request.url.path
+    if request.url.query:
+        target += "?" + request.url.query
+    return f'"{version.version}-{hashlib.md5(target.encode()).hexdigest()[:12]}"'
+
+
+def matching_etag(if_none_match: str, etag: str) -> str | None:
+    """If-None-Match에서 현재 ETag와 맞는 태그 (약한 비교: W/ 접두사, 압축 인코딩 접미사 무시)"""
+    if if_none_match.strip() == "*":
+        return etag
+    for tag in if_none_match.split(","):
+        tag = tag.strip().removeprefix("W/")
+        if strip_encoding_suffix(tag) == etag:
+            return tag
+    return None
+
+
+def not_modified_since(if_modified_since: str, version: DatasetVersion) -> bool:
+    if version.last_modified is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=UTC)
+    last_modified = version.last_modified
+    if last_modified.tzinfo is None:
+        last_modified = last_modified.replace(tzinfo=UTC)
+    # HTTP 날짜는 초 단위
+    return last_modified.replace(microsecond=0) <= since
+
+
+class ConditionalCacheMiddleware(BaseHTTPMiddleware):
+    """카탈로그 응답 ETag/304/본문 캐시 미들웨어"""
+
+    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+        if request.method not in ("GET", "HEAD"):
+            return await call_next(request)
+        rule = find_cache_rule(request)
+        if rule is None:
+            return await call_next(request)
+
+        version = dataset_versions.get(rule.dataset)
+        if version is not None:
+            etag = make_etag(version, request)
+            validators = self._validator_headers(rule, version, etag)
+
+            if_none_match = request.headers.get("if-none-match")
+            if_modified_since = request.headers.get("if-modified-since")
+            matched = matching_etag(if_none_match, etag) if if_none_match else None
+            if matched or (
+                not if_none_match
+                and if_modified_since
+                and not_modified_since(if_modified_since, version)
+            ):
+                response_body_cache.stats["not_modified"] += 1
+                # 클라이언트가 가진 표현(압축 여부)의 ETag로 응답
+                return Response(status_code=304, headers={**validators, "ETag": matched or etag})
+
+            if request.method == "GET":
+                cached = response_body_cache.get(etag)
+                if cached is not None:
+                    return await self._respond(request, etag, cached, validators)
+
+        response = await call_next(request)
+        if response.status_code != 200 or request.method != "GET":
+            return response
+
+        body = b"".join([chunk async for chunk in response.body_iterator])
+        headers = [
+            (name, value)
+            for name, value in response.headers.items()
+            if name not in _SKIP_HEADERS
+        ]
+        entry = CachedResponse(body=body, headers=headers)
+
+        if version is None and dataset_versions.is_static(rule.dataset):
+            version = dataset_versions.set_static(rule.dataset, body)
+            etag = make_etag(version, request)
+            validators = self._validator_headers(rule, version, etag)
+        if version is None:
+            # 버전을 모르면 검증 헤더 없이 원래 응답 그대로
+            return self._build_response(entry, {})
+
+        response_body_cache.set(etag, entry)
+        return await self._respond(request, etag, entry, validators)
+
+    async def _respond(
+        self, request: Request, etag: str, entry: CachedResponse, validators: dict[str, str]
+    ) -> Response:
+        """Accept-Encoding에 맞는 표현으로 응답 (압축 본문은 인코딩별 최초 1회만 생성)"""
+        encoding = choose_encoding(request.headers.get("accept-encoding"))
+        if encoding is None or not is_compressible(entry.content_type, len(entry.body)):
+            return self._build_response(entry, validators)
+
+        data = entry.encoded.get(encoding)
+        if data is None:
+            level = CACHED_LEVELS[encoding]
+            if len(entry.body) >= THREAD_THRESHOLD:
+                data = await asyncio.to_thread(compress, entry.body, encoding, level)
+            else:
+                data = compress(entry.body, encoding, level)
+            response_body_cache.set_encoded(etag, entry, encoding, data)
+        if len(data) >= len(entry.body):
+            return self._build_response(entry, validators)
+
+        validators = {**validators, "ETag": encoded_etag(etag, encoding)}
+        response = self._build_response(entry, validators, body=data)
+        response.headers["Content-Encoding"] = encoding
+        return response
+
+    @staticmethod
+    def _validator_headers(rule: CacheRule, version: DatasetVersion, etag: str) -> dict[str, str]:
+        headers = {
+            "ETag": etag,
+            "Cache-Control": f"public, max-age={rule.max_age}, stale-while-revalidate={rule.max_age}",
+        }
+        if version.last_modified is not None:
+            headers["Last-Modified"] = format_datetime(
+                version.last_modified.astimezone(UTC), usegmt=True
+            )
+        # 압축 여부가 Accept-Encoding에 따라, 로그인 요청과 응답이 달라 공유 캐시가 구분하도록 함
+        headers["Vary"] = "Accept-Encoding, Authorization" if rule.anonymous_only else "Accept-Encoding"
+        return headers
+
+    @staticmethod
+    def _build_response(
+        entry: CachedResponse, validators: dict[str, str], body: bytes | None = None
+    ) -> Response:
+        response = Response(content=entry.body if body is None else body, status_code=200)
+        for name, value in entry.headers:
+            if name == "vary" and "Vary" in validators:
+                merged = [item.strip() for item in value.split(",")]
+                merged += [
+                    item.strip()
+                    for item in validators["Vary"].split(",")
+                    if item.strip().lower() not in (m.lower() for m in merged)
+                ]
+                validators = {**validators, "Vary": ", ".join(merged)}
+                continue
+            response.headers.append(name, value)
+        for name, value in validators.items():
+            response.headers[name] = value
+        return response
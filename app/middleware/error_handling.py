@@ -176,43 +176,25 @@ class TimeoutMiddleware(BaseHTTPMiddleware):
 
 
 class HealthCheckMiddleware(BaseHTTPMiddleware):
-    """헬스체크 미들웨어"""
+    """헬스체크 미들웨어 (라이브니스는 I/O 없이, 레디니스는 백그라운드 스냅샷으로 응답)"""
+    
+    LIVENESS_PATHS = {"/", "/livez"}
+    READINESS_PATHS = {"/health", "/api/health", "/readyz"}
     
     async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        # 헬스체크 엔드포인트는 빠른 응답
-        if request.url.path in ["/health", "/", "/api/health"]:
-            try:
-                # 간단한 데이터베이스 연결 확인
-                from app.database import check_db_connection
-                db_ok, db_msg = check_db_connection()
-                
-                if not db_ok:
-                    logger.warning(f"Health check database failure: {db_msg}")
-                    return JSONResponse(
-                        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                        content={
-                            "status": "unhealthy", 
-                            "database": db_msg,
-                            "service": "weather-flick-backend"
-                        }
-                    )
-                
-                return JSONResponse(
-                    content={
-                        "status": "healthy",
-                        "database": "connected",
-                        "service": "weather-flick-backend"
-                    }
-                )
-            except Exception as e:
-                logger.error(f"Health check error: {e}")
-                return JSONResponse(
-                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                    content={
-                        "status": "unhealthy",
-                        "error": str(e),
-                        "service": "weather-flick-backend"
-                    }
-                )
+        path = request.url.path
+        if path in self.LIVENESS_PATHS and request.method in ("GET", "HEAD"):
+            from app.services.health_checker import health_checker
+            return JSONResponse(content=health_checker.is_alive())
+        
+        if path in self.READINESS_PATHS and request.method in ("GET", "HEAD"):
+            from app.services.health_checker import health_checker
+            ready, body = health_checker.readiness()
+            if not ready:
+                logger.warning(f"Readiness check failed: {body}")
+            return JSONResponse(
+                status_code=status.HTTP_200_OK if ready else status.HTTP_503_SERVICE_UNAVAILABLE,
+                content=body,
+            )
         
         return await call_next(request)
\ No newline at end of file
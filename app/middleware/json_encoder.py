@@ -1,17 +1,70 @@
 """
 JSON 직렬화 미들웨어
 타임존 정보가 포함된 datetime 객체를 일관되게 직렬화
+
+- FastJSONResponse: orjson 기반 기본 응답 클래스 (UUID/date/Enum/numpy는 orjson 기본 처리,
+  datetime은 TimezoneUtils.format_for_api 규칙, Decimal은 jsonable_encoder와 같은 숫자 변환)
+- 이미 dict/모델을 만든 라우트는 FastJSONResponse를 직접 반환하면
+  response_model 재검증과 jsonable_encoder 순회를 건너뜀 (response_model은 문서용으로 유지)
 """
 
 import json
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
 from typing import Any
+
+import orjson
 from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
 from fastapi.responses import JSONResponse
+from pydantic import BaseModel
 from starlette.middleware.base import BaseHTTPMiddleware
 
 from app.utils.timezone_utils import TimezoneUtils
 
+ORJSON_OPTIONS = (
+    orjson.OPT_PASSTHROUGH_DATETIME  # datetime은 default에서 KST/UTC 규칙 적용
+    | orjson.OPT_NON_STR_KEYS
+    | orjson.OPT_SERIALIZE_NUMPY
+)
+
+# 1988년 서머타임 종료 이후 KST는 고정 +09:00 → pytz localize 없이 변환 가능
+KST_FIXED = timezone(timedelta(hours=9))
+KST_FIXED_SINCE = datetime(1988, 10, 9)
+
+
+def format_datetime(value: datetime) -> str:
+    """TimezoneUtils.format_for_api와 같은 결과 (naive는 KST로 보고 UTC 변환)"""
+    if value.tzinfo is None and value >= KST_FIXED_SINCE:
+        return value.replace(tzinfo=KST_FIXED).astimezone(timezone.utc).isoformat()
+    return TimezoneUtils.format_for_api(value)
+
+
+def orjson_default(obj: Any) -> Any:
+    """orjson이 직접 처리하지 못하는 타입 변환"""
+    if isinstance(obj, datetime):
+        return format_datetime(obj)
+    if isinstance(obj, Decimal):
+        # jsonable_encoder와 같이 정수면 int, 아니면 float
+        return int(obj) if obj.as_tuple().exponent >= 0 else float(obj)
+    if isinstance(obj, BaseModel):
+        return obj.model_dump()
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    return jsonable_encoder(obj)
+
+
+def dumps(data: Any) -> bytes:
+    """API 응답 규칙으로 JSON 직렬화"""
+    return orjson.dumps(data, default=orjson_default, option=ORJSON_OPTIONS)
+
+
+class FastJSONResponse(JSONResponse):
+    """orjson 기반 JSON 응답"""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
 
 class DateTimeEncoder(json.JSONEncoder):
     """
@@ -89,10 +142,9 @@ def create_timezone_aware_response(data: Any, status_code: int = 200) -> JSONRes
     """
     타임존 정보가 포함된 JSON 응답 생성
     """
-    processed_data = process_response_data(data)
-    
-    response = JSONResponse(
-        content=processed_data,
+    # datetime 변환은 직렬화 중에 처리 (별도 순회 없음)
+    response = FastJSONResponse(
+        content=data,
         status_code=status_code
     )
     
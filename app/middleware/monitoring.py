@@ -1,14 +1,31 @@
 """
 시스템 모니터링 미들웨어
 성능 메트릭, 요청 추적, 리소스 사용량 모니터링
+
+- 엔드포인트 메트릭은 실제 경로가 아닌 매칭된 라우트 템플릿(/api/travel-plans/{plan_id}) 기준
+  → 메모리는 라우트 수에 비례
+- 라우트/메서드/상태 코드별 고정 버킷 지연 시간 히스토그램을 Prometheus 형식으로 /metrics에 노출
+- PROMETHEUS_MULTIPROC_DIR 설정 시 gunicorn 워커들의 값을 합산하여 노출 (prometheus_client 멀티프로세스 모드)
+- SystemMetrics 요약(/system 조회용)은 워커 프로세스 로컬 값 → 응답에 worker_pid 포함, 전체 합계는 /metrics 사용
 """
+import os
 import time
 import psutil
 import asyncio
+from bisect import bisect_left
 from typing import Dict, Any
 from collections import defaultdict, deque
 from datetime import datetime, timedelta
 
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
 from starlette.responses import Response, JSONResponse
@@ -16,9 +33,59 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# 지연 시간 히스토그램 버킷 (초)
+LATENCY_BUCKETS = (
+    0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75, 1.0, 2.5, 5.0, 10.0, 30.0,
+)
+UNMATCHED_ROUTE = "<unmatched>"  # 라우트에 매칭되지 않은 요청 (404 스캔 등)
+HOURLY_HISTORY = 48  # 시간대별 요청 수 보관 시간
+
+REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds",
+    "HTTP 요청 처리 시간",
+    ["method", "route", "status"],
+    buckets=LATENCY_BUCKETS,
+)
+REQUEST_EXCEPTIONS = Counter(
+    "http_request_exceptions_total",
+    "처리 중 예외가 발생한 HTTP 요청 수",
+    ["method", "route"],
+)
+
+
+def get_route_template(request: Request) -> str:
+    """매칭된 라우트의 경로 템플릿 (매칭 전이거나 실패 시 UNMATCHED_ROUTE)"""
+    route = request.scope.get("route")
+    return getattr(route, "path", None) or UNMATCHED_ROUTE
+
+
+def bucket_quantile(bucket_counts: list[int], quantile: float, max_time: float) -> float:
+    """버킷 카운트로 분위수 추정 (해당 버킷의 상한값)"""
+    total = sum(bucket_counts)
+    if total == 0:
+        return 0.0
+    target = quantile * total
+    cumulative = 0
+    for upper, count in zip(LATENCY_BUCKETS, bucket_counts):
+        cumulative += count
+        if cumulative >= target:
+            return min(upper, max_time)
+    return max_time
+
+
+def metrics_response() -> Response:
+    """Prometheus 텍스트 형식 메트릭 응답"""
+    if os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+        # 워커별 파일을 합산
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return Response(generate_latest(registry), media_type=CONTENT_TYPE_LATEST)
+
 
 class SystemMetrics:
-    """시스템 메트릭 수집 및 저장"""
+    """시스템 메트릭 수집 및 저장 (워커 프로세스 로컬)"""
     
     def __init__(self, max_history: int = 1000):
         self.max_history = max_history
@@ -33,14 +100,16 @@ class SystemMetrics:
         self.memory_usage = deque(maxlen=100)
         self.disk_usage = deque(maxlen=100)
         
-        # 엔드포인트별 메트릭
+        # 엔드포인트(라우트 템플릿)별 메트릭
         self.endpoint_metrics = defaultdict(lambda: {
             'count': 0,
             'total_time': 0.0,
             'avg_time': 0.0,
             'min_time': float('inf'),
             'max_time': 0.0,
-            'errors': 0
+            'errors': 0,
+            # 마지막 칸은 가장 큰 버킷 초과
+            'buckets': [0] * (len(LATENCY_BUCKETS) + 1),
         })
         
         # 시간대별 메트릭
@@ -51,7 +120,7 @@ class SystemMetrics:
     
     def record_request(self, method: str, path: str, status_code: int, 
                       response_time: float, error: bool = False):
-        """요청 메트릭 기록"""
+        """요청 메트릭 기록 (path는 라우트 템플릿)"""
         # 전체 요청 수
         self.request_count[f"{method}"] += 1
         self.request_count["total"] += 1
@@ -75,11 +144,16 @@ class SystemMetrics:
         endpoint['avg_time'] = endpoint['total_time'] / endpoint['count']
         endpoint['min_time'] = min(endpoint['min_time'], response_time)
         endpoint['max_time'] = max(endpoint['max_time'], response_time)
+        endpoint['buckets'][bisect_left(LATENCY_BUCKETS, response_time)] += 1
         if error:
             endpoint['errors'] += 1
         
         # 시간대별 요청 수
         hour_key = datetime.now().strftime("%Y-%m-%d_%H")
+        if hour_key not in self.hourly_requests:
+            # 오래된 시간대 정리
+            for old_key in sorted(self.hourly_requests)[:-(HOURLY_HISTORY - 1)]:
+                del self.hourly_requests[old_key]
         self.hourly_requests[hour_key] += 1
     
     def record_system_metrics(self):
@@ -120,6 +194,7 @@ class SystemMetrics:
         recent_disk = list(self.disk_usage)[-10:] if self.disk_usage else []
         
         return {
+            "worker_pid": os.getpid(),
             "uptime": str(uptime),
             "total_requests": total_requests,
             "total_errors": total_errors,
@@ -159,6 +234,8 @@ class SystemMetrics:
                 "count": metrics['count'],
                 "avg_time": round(metrics['avg_time'], 3),
                 "max_time": round(metrics['max_time'], 3),
+                "p95_time": round(bucket_quantile(metrics['buckets'], 0.95, metrics['max_time']), 3),
+                "p99_time": round(bucket_quantile(metrics['buckets'], 0.99, metrics['max_time']), 3),
                 "errors": metrics['errors'],
                 "error_rate": round((metrics['errors'] / metrics['count'] * 100), 2) if metrics['count'] > 0 else 0
             }
@@ -180,7 +257,6 @@ class MonitoringMiddleware(BaseHTTPMiddleware):
         
         start_time = time.time()
         method = request.method
-        path = request.url.path
         
         try:
             response = await call_next(request)
@@ -191,31 +267,38 @@ class MonitoringMiddleware(BaseHTTPMiddleware):
             # 에러 여부 판단
             is_error = response.status_code >= 400
             
+            # 라우팅이 끝난 뒤에만 scope에 매칭된 라우트가 있음
+            route = get_route_template(request)
+            
             # 메트릭 기록
             system_metrics.record_request(
                 method=method,
-                path=path,
+                path=route,
                 status_code=response.status_code,
                 response_time=response_time,
                 error=is_error
             )
+            REQUEST_LATENCY.labels(method, route, str(response.status_code)).observe(response_time)
             
             # 응답 헤더에 메트릭 정보 추가
             response.headers["X-Response-Time"] = f"{response_time:.3f}s"
-            response.headers["X-Request-ID"] = str(hash(f"{method}_{path}_{start_time}"))
+            response.headers["X-Request-ID"] = str(hash(f"{method}_{request.url.path}_{start_time}"))
             
             return response
             
         except Exception as e:
             # 예외 발생 시에도 메트릭 기록
             response_time = time.time() - start_time
+            route = get_route_template(request)
             system_metrics.record_request(
                 method=method,
-                path=path,
+                path=route,
                 status_code=500,
                 response_time=response_time,
                 error=True
             )
+            REQUEST_LATENCY.labels(method, route, "500").observe(response_time)
+            REQUEST_EXCEPTIONS.labels(method, route).inc()
             raise
 
 
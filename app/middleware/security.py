@@ -3,11 +3,19 @@ Security middleware module
 Middleware for protecting against XSS, clickjacking, CSRF and other security threats
 """
 
+import asyncio
+import logging
+import time
+import uuid
 from collections.abc import Callable
 
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
-from starlette.responses import Response
+from starlette.responses import JSONResponse, Response
+
+from app.utils.redis_client import get_redis_client
+
+logger = logging.getLogger(__name__)
 
 
 class SecurityHeadersMiddleware(BaseHTTPMiddleware):
@@ -66,22 +74,43 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
 
 
 class RateLimitMiddleware(BaseHTTPMiddleware):
-    """Rate Limiting middleware (simple memory-based implementation)"""
+    """
+    Rate Limiting middleware (sliding window)
+
+    Counts are kept in Redis (sorted set per client IP) so the limit applies
+    across all gunicorn workers. Without Redis it falls back to a worker-local
+    memory window (the effective limit is then per worker).
+    """
+
+    key_prefix = "rate_limit"
 
     def __init__(self, app, max_requests: int = 100, window_seconds: int = 60):
         super().__init__(app)
         self.max_requests = max_requests
         self.window_seconds = window_seconds
-        self.requests = {}  # {client_ip: [(timestamp, count), ...]}
-
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        import time
-
-        from starlette.responses import JSONResponse
+        self.requests = {}  # Worker-local fallback: {client_ip: [(timestamp, count), ...]}
+
+    def _hit_shared(self, client_ip: str, current_time: float) -> int | None:
+        """Record the request in Redis and return the count before it (None without Redis)"""
+        client = get_redis_client().get_client()
+        if client is None:
+            return None
+        key = f"{self.key_prefix}:{client_ip}"
+        member = f"{current_time:.6f}:{uuid.uuid4().hex[:8]}"
+        pipe = client.pipeline(transaction=True)
+        pipe.zremrangebyscore(key, 0, current_time - self.window_seconds)
+        pipe.zcard(key)
+        pipe.zadd(key, {member: current_time})
+        pipe.expire(key, self.window_seconds)
+        _, current_requests, _, _ = pipe.execute()
 
-        client_ip = request.client.host
-        current_time = time.time()
+        if current_requests >= self.max_requests:
+            # Rejected requests do not consume the window
+            client.zrem(key, member)
+        return current_requests
 
+    def _hit_local(self, client_ip: str, current_time: float) -> int:
+        """Record the request in worker memory and return the count before it"""
         # Cleanup: Remove old request records
         if client_ip in self.requests:
             self.requests[client_ip] = [
@@ -96,6 +125,28 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
 
         current_requests = sum(count for _, count in self.requests[client_ip])
 
+        # Add request record
+        if current_requests < self.max_requests:
+            self.requests[client_ip].append((current_time, 1))
+        return current_requests
+
+    async def _hit(self, client_ip: str, current_time: float) -> int:
+        # Blocking Redis round trips run off the event loop
+        try:
+            current_requests = await asyncio.to_thread(self._hit_shared, client_ip, current_time)
+        except Exception as e:
+            logger.warning(f"Shared rate limit unavailable, using worker-local window: {e}")
+            current_requests = None
+        if current_requests is None:
+            return self._hit_local(client_ip, current_time)
+        return current_requests
+
+    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+        client_ip = request.client.host
+        current_time = time.time()
+
+        current_requests = await self._hit(client_ip, current_time)
+
         # Rate limit check
         if current_requests >= self.max_requests:
             response = JSONResponse(
@@ -114,9 +165,6 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
             )
             return response
 
-        # Add request record
-        self.requests[client_ip].append((current_time, 1))
-
         response = await call_next(request)
 
         # Add rate limit headers
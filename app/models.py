@@ -20,6 +20,7 @@ from sqlalchemy import (
     DECIMAL,
     Boolean,
     Column,
+    Computed,
     Date,
     DateTime,
     Enum,
@@ -35,11 +36,20 @@ from sqlalchemy import (
     Enum as SqlEnum,
 )
 from sqlalchemy.dialects.postgresql import ARRAY, JSONB, UUID
-from sqlalchemy.orm import declarative_base, relationship
+from sqlalchemy.orm import declarative_base, deferred, relationship
 from sqlalchemy.sql import func
 
 Base = declarative_base()
 
+# 주변 장소 검색용 격자 셀 (위경도 GEO_CELL_SIZE_DEG도 단위)
+# cell = (위도 행 + 1800) * 10000 + (경도 열 + 3600) 으로 인코딩하여
+# 같은 위도 행의 셀들이 연속된 정수 구간이 되도록 합니다.
+GEO_CELL_SIZE_DEG = 0.05
+GEO_CELL_EXPRESSION = (
+    f"(floor(latitude / {GEO_CELL_SIZE_DEG})::integer + 1800) * 10000"
+    f" + (floor(longitude / {GEO_CELL_SIZE_DEG})::integer + 3600)"
+)
+
 
 # ===========================================
 # Enum 정의
@@ -389,6 +399,7 @@ class TouristAttraction(Base):
     zipcode = Column(String(10))
     latitude = Column(DECIMAL(10, 8))
     longitude = Column(DECIMAL(11, 8))
+    geo_cell = Column(Integer, Computed(GEO_CELL_EXPRESSION, persisted=True), index=True)
 
     # 연락처 정보
     homepage = Column(Text)
@@ -405,9 +416,9 @@ class TouristAttraction(Base):
     faxno = Column(String(50))
     mlevel = Column(Integer)
 
-    # JSON 데이터
-    detail_intro_info = Column(JSONB)
-    detail_additional_info = Column(JSONB)
+    # JSON 데이터 (기본 지연 로드, 접근 시 detail 그룹을 한 번에 로드)
+    detail_intro_info = deferred(Column(JSONB), group="detail")
+    detail_additional_info = deferred(Column(JSONB), group="detail")
 
     # 메타데이터
     data_quality_score = Column(DECIMAL(5, 2))
@@ -451,6 +462,7 @@ class CulturalFacility(Base):
     zipcode = Column(String(10))
     latitude = Column(DECIMAL(10, 8))
     longitude = Column(DECIMAL(11, 8))
+    geo_cell = Column(Integer, Computed(GEO_CELL_EXPRESSION, persisted=True), index=True)
 
     # 연락처 정보
     tel = Column(String(50))
@@ -477,9 +489,9 @@ class CulturalFacility(Base):
     faxno = Column(String(50))
     mlevel = Column(Integer)
 
-    # JSON 데이터
-    detail_intro_info = Column(JSONB)
-    detail_additional_info = Column(JSONB)
+    # JSON 데이터 (기본 지연 로드, 접근 시 detail 그룹을 한 번에 로드)
+    detail_intro_info = deferred(Column(JSONB), group="detail")
+    detail_additional_info = deferred(Column(JSONB), group="detail")
 
     # 메타데이터
     data_quality_score = Column(DECIMAL(5, 2))
@@ -555,9 +567,9 @@ class FestivalEvent(Base):
     faxno = Column(String(50))
     mlevel = Column(Integer)
 
-    # JSON 데이터
-    detail_intro_info = Column(JSONB)
-    detail_additional_info = Column(JSONB)
+    # JSON 데이터 (기본 지연 로드, 접근 시 detail 그룹을 한 번에 로드)
+    detail_intro_info = deferred(Column(JSONB), group="detail")
+    detail_additional_info = deferred(Column(JSONB), group="detail")
 
     # 메타데이터
     data_quality_score = Column(DECIMAL(5, 2))
@@ -599,6 +611,7 @@ class Restaurant(Base):
     zipcode = Column(String)
     latitude = Column(Float)
     longitude = Column(Float)
+    geo_cell = Column(Integer, Computed(GEO_CELL_EXPRESSION, persisted=True), index=True)
 
     # 연락처 정보
     tel = Column(String)
@@ -664,6 +677,7 @@ class Accommodation(Base):
     # 위치 정보
     latitude = Column(Float)
     longitude = Column(Float)
+    geo_cell = Column(Integer, Computed(GEO_CELL_EXPRESSION, persisted=True), index=True)
 
     # 카테고리 정보
     category_code = Column(String(10))
@@ -731,6 +745,7 @@ class Shopping(Base):
     zipcode = Column(String(10))
     latitude = Column(DECIMAL(10, 8))
     longitude = Column(DECIMAL(11, 8))
+    geo_cell = Column(Integer, Computed(GEO_CELL_EXPRESSION, persisted=True), index=True)
 
     # 연락처 정보
     tel = Column(String(50))
@@ -759,9 +774,9 @@ class Shopping(Base):
     faxno = Column(String(50))
     mlevel = Column(Integer)
 
-    # JSON 데이터
-    detail_intro_info = Column(JSONB)
-    detail_additional_info = Column(JSONB)
+    # JSON 데이터 (기본 지연 로드, 접근 시 detail 그룹을 한 번에 로드)
+    detail_intro_info = deferred(Column(JSONB), group="detail")
+    detail_additional_info = deferred(Column(JSONB), group="detail")
 
     # 메타데이터
     data_quality_score = Column(DECIMAL(5, 2))
@@ -798,6 +813,7 @@ class LeisureSports(Base):
     zipcode = Column(String)
     latitude = Column(DECIMAL(10, 8))
     longitude = Column(DECIMAL(11, 8))
+    geo_cell = Column(Integer, Computed(GEO_CELL_EXPRESSION, persisted=True), index=True)
     tel = Column(String)
     homepage = Column(String)
     overview = Column(Text)
@@ -814,8 +830,8 @@ class LeisureSports(Base):
     telname = Column(String(100))
     faxno = Column(String(50))
     mlevel = Column(Integer)
-    detail_intro_info = Column(JSONB)
-    detail_additional_info = Column(JSONB)
+    detail_intro_info = deferred(Column(JSONB), group="detail")
+    detail_additional_info = deferred(Column(JSONB), group="detail")
     sigungu_code = Column(String)
 
 
@@ -856,8 +872,8 @@ class TravelCourse(Base):
     updated_at = Column(DateTime(timezone=True))
     last_sync_at = Column(DateTime(timezone=True))
     mlevel = Column(Integer)
-    detail_intro_info = Column(JSONB)
-    detail_additional_info = Column(JSONB)
+    detail_intro_info = deferred(Column(JSONB), group="detail")
+    detail_additional_info = deferred(Column(JSONB), group="detail")
     booktour = Column(String(1))
     createdtime = Column(String)
     modifiedtime = Column(String)
@@ -1406,6 +1422,23 @@ class DestinationSave(Base):
     )
 
 
+class EntityCounter(Base):
+    """
+    좋아요/저장 카운터 테이블
+    사용처: weather-flick-back
+    설명: Redis 카운터 캐시의 write-behind 대상 (비정규화된 집계 값)
+    """
+
+    __tablename__ = "entity_counters"
+
+    counter_type = Column(String(50), primary_key=True)  # travel_course_likes 등
+    entity_id = Column(String(100), primary_key=True)
+    value = Column(Integer, nullable=False, default=0)
+    updated_at = Column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
+
+
 # ===========================================
 # 기타 기능 테이블
 # ===========================================
@@ -2284,6 +2317,9 @@ class TravelRouteCreate(BaseModel):
     destination_lat: float | None = None
     destination_lng: float | None = None
     transport_type: str | None = None
+    duration: int | None = None
+    distance: float | None = None
+    route_data: dict[str, Any] | None = None
 
 
 class TravelRouteUpdate(BaseModel):
@@ -2301,6 +2337,7 @@ class TravelRouteUpdate(BaseModel):
     duration: int | None = None
     distance: float | None = None
     cost: float | None = None
+    route_data: dict[str, Any] | None = None
 
 
 class TravelRouteResponse(BaseModel):
@@ -2577,6 +2614,12 @@ class DestinationLikeResponse(BaseModel):
         from_attributes = True
 
 
+class DestinationLikeCursorPage(BaseModel):
+    """여행지 좋아요 목록 커서 페이지 응답 스키마"""
+    likes: list[DestinationLikeResponse]
+    pagination: dict[str, Any]
+
+
 class DestinationSaveCreate(BaseModel):
     """여행지 저장 생성 스키마"""
     destination_id: uuid.UUID
@@ -2596,6 +2639,12 @@ class DestinationSaveResponse(BaseModel):
         from_attributes = True
 
 
+class DestinationSaveCursorPage(BaseModel):
+    """여행지 저장 목록 커서 페이지 응답 스키마"""
+    saves: list[DestinationSaveResponse]
+    pagination: dict[str, Any]
+
+
 class DestinationResponse(BaseModel):
     """여행지 응답 스키마"""
     destination_id: uuid.UUID
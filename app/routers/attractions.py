@@ -127,7 +127,18 @@ async def get_attractions_by_region(
             tour_api_area_code = region_to_tour_api_mapping.get(region_code, region_code)
 
         # TouristAttraction과 Region 테이블을 조인하여 tour_api_area_code로 조회
-        query = db.query(TouristAttraction).join(
+        # 응답에 쓰는 컬럼만 조회 (JSONB 상세 정보 등 제외)
+        query = db.query(
+            TouristAttraction.content_id,
+            TouristAttraction.attraction_name,
+            TouristAttraction.category_name,
+            TouristAttraction.address,
+            TouristAttraction.latitude,
+            TouristAttraction.longitude,
+            TouristAttraction.description,
+            TouristAttraction.image_url,
+            TouristAttraction.created_at,
+        ).join(
             Region, TouristAttraction.region_code == Region.region_code
         ).filter(
             Region.tour_api_area_code == tour_api_area_code
@@ -1,15 +1,14 @@
 """맞춤 여행 추천 라우터"""
 
-import hashlib
 import logging
 import random
-from datetime import datetime, timedelta
-from typing import Any
 
 from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from app.database import get_db
+from app.middleware.json_encoder import FastJSONResponse
 from app.models import (
     Accommodation,
     CategoryCode,
@@ -35,13 +34,15 @@ router = APIRouter(
     tags=["custom-travel"],
 )
 
-# 인메모리 캐시 (실제 프로덕션에서는 Redis 사용 권장)
-recommendation_cache: dict[str, dict[str, Any]] = {}
-CACHE_DURATION = timedelta(minutes=30)  # 30분 캐시
-
 # 카테고리 코드 캐시 (데이터베이스 조회 최소화)
+# 워커 프로세스 로컬: 거의 바뀌지 않는 코드표라 워커마다 한 번씩 조회해도 충분
 category_code_cache = {}
 
+def overview_preview(model, length: int = 100):
+    """설명은 앞부분만 잘라서 조회 (전체 overview 텍스트 전송 방지)"""
+    return func.substr(model.overview, 1, length).label("overview")
+
+
 def get_category_name(code: str, db: Session) -> str:
     """카테고리 코드를 한글 이름으로 변환 (데이터베이스 사용)"""
     if not code:
@@ -65,24 +66,6 @@ def get_category_name(code: str, db: Session) -> str:
     return code  # None 대신 코드를 반환하여 태그에 포함되도록 함
 
 
-def get_cache_key(request: CustomTravelRecommendationRequest) -> str:
-    """요청 데이터를 기반으로 캐시 키 생성"""
-    key_data = f"{request.region_code}:{request.days}:{request.who}:{','.join(sorted(request.styles))}:{request.schedule}"
-    return hashlib.md5(key_data.encode()).hexdigest()
-
-
-def clean_expired_cache():
-    """만료된 캐시 항목 제거"""
-    now = datetime.now()
-    expired_keys = [
-        key
-        for key, value in recommendation_cache.items()
-        if now - value["timestamp"] > CACHE_DURATION
-    ]
-    for key in expired_keys:
-        del recommendation_cache[key]
-
-
 @router.post("/recommendations", response_model=CustomTravelRecommendationResponse)
 async def get_custom_travel_recommendations(
     request: CustomTravelRecommendationRequest,
@@ -96,14 +79,6 @@ async def get_custom_travel_recommendations(
     AI가 최적화된 여행 일정을 생성합니다.
     """
     try:
-        # 캐시 확인 - 개발 중에는 비활성화
-        # clean_expired_cache()
-        # cache_key = get_cache_key(request)
-
-        # if cache_key in recommendation_cache:
-        #     cached_data = recommendation_cache[cache_key]
-        #     return CustomTravelRecommendationResponse(**cached_data["response"])
-        
         # 요청 검증
         if not request.region_code:
             logger.error("Region code is missing in request")
@@ -214,11 +189,19 @@ async def get_custom_travel_recommendations(
             logger.info(f"Using hardcoded mapping: {request.region_code} -> {db_region_code}")
 
         # 순차적 DB 쿼리 실행 (안정성 우선)
+        # 후보 장소는 일정 생성에 쓰는 컬럼만 행 튜플로 조회 (모델에 없는 overview 등은 hasattr로 건너뜀)
 
         try:
             # 관광지 조회
             attractions = (
-                db.query(TouristAttraction)
+                db.query(
+                    TouristAttraction.content_id,
+                    TouristAttraction.attraction_name,
+                    TouristAttraction.category_code,
+                    TouristAttraction.address,
+                    TouristAttraction.latitude,
+                    TouristAttraction.longitude,
+                )
                 .filter(TouristAttraction.region_code == db_region_code)
                 .limit(500)  # 성능 개선을 위해 제한
                 .all()
@@ -227,7 +210,16 @@ async def get_custom_travel_recommendations(
 
             # 문화시설 조회
             cultural_facilities = (
-                db.query(CulturalFacility)
+                db.query(
+                    CulturalFacility.content_id,
+                    CulturalFacility.facility_name,
+                    CulturalFacility.category_code,
+                    overview_preview(CulturalFacility),
+                    CulturalFacility.first_image,
+                    CulturalFacility.address,
+                    CulturalFacility.latitude,
+                    CulturalFacility.longitude,
+                )
                 .filter(CulturalFacility.region_code == db_region_code)
                 .limit(200)
                 .all()
@@ -236,7 +228,16 @@ async def get_custom_travel_recommendations(
 
             # 음식점 조회
             restaurants = (
-                db.query(Restaurant)
+                db.query(
+                    Restaurant.content_id,
+                    Restaurant.restaurant_name,
+                    Restaurant.cuisine_type,
+                    overview_preview(Restaurant),
+                    Restaurant.first_image,
+                    Restaurant.address,
+                    Restaurant.latitude,
+                    Restaurant.longitude,
+                )
                 .filter(Restaurant.region_code == db_region_code)
                 .limit(100)
                 .all()
@@ -245,7 +246,16 @@ async def get_custom_travel_recommendations(
 
             # 쇼핑 장소 조회
             shopping_places = (
-                db.query(Shopping)
+                db.query(
+                    Shopping.content_id,
+                    Shopping.shop_name,
+                    Shopping.category_code,
+                    overview_preview(Shopping),
+                    Shopping.first_image,
+                    Shopping.address,
+                    Shopping.latitude,
+                    Shopping.longitude,
+                )
                 .filter(Shopping.region_code == db_region_code)
                 .limit(300)
                 .all()
@@ -254,7 +264,15 @@ async def get_custom_travel_recommendations(
 
             # 숙박시설 조회
             accommodations = (
-                db.query(Accommodation)
+                db.query(
+                    Accommodation.content_id,
+                    Accommodation.accommodation_name,
+                    Accommodation.category_code,
+                    Accommodation.accommodation_type,
+                    Accommodation.address,
+                    Accommodation.latitude,
+                    Accommodation.longitude,
+                )
                 .filter(Accommodation.region_code == db_region_code)
                 .limit(50)
                 .all()
@@ -716,13 +734,8 @@ async def get_custom_travel_recommendations(
             recommendation_type="custom_ai" if use_ai else "custom_basic",
         )
 
-        # 응답을 캐시에 저장 - 개발 중에는 비활성화
-        # recommendation_cache[cache_key] = {
-        #     "response": response.dict(),
-        #     "timestamp": datetime.now(),
-        # }
-
-        return response
+        # 생성 시 검증한 모델을 response_model로 다시 검증하지 않고 바로 직렬화
+        return FastJSONResponse(response)
 
     except HTTPException:
         # HTTPException은 그대로 전달
@@ -1,14 +1,14 @@
 """
 여행지 좋아요 및 저장 관련 API 엔드포인트
 """
-from typing import List, Optional
+from typing import List, Optional, Union
 from uuid import UUID, uuid4
 import re
 
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import and_, func, select
+from sqlalchemy import and_, select
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session
 
 from app.auth import get_current_active_user
 from app.database import get_db
@@ -16,14 +16,22 @@ from app.models import (
     Destination,
     DestinationLike,
     DestinationLikeCreate,
+    DestinationLikeCursorPage,
     DestinationLikeResponse,
     DestinationResponse,
     DestinationSave,
     DestinationSaveCreate,
+    DestinationSaveCursorPage,
     DestinationSaveResponse,
     TravelCourse,
     User,
 )
+from app.services.counter_service import counter_service
+from app.utils.pagination import (
+    InvalidCursorError,
+    create_cursor_pagination_info,
+    paginate_by_cursor,
+)
 
 router = APIRouter(
     prefix="/destinations",
@@ -32,65 +40,83 @@ router = APIRouter(
 )
 
 
-def get_destination_with_stats(
-    db: Session, destination_id: UUID, current_user_id: Optional[UUID] = None
-) -> Optional[dict]:
-    """여행지 정보와 좋아요/저장 통계를 함께 가져오는 헬퍼 함수"""
-    destination = db.query(Destination).filter(
-        Destination.destination_id == destination_id
-    ).first()
-    
-    if not destination:
-        return None
-    
-    # 좋아요 수 계산
-    likes_count = db.query(func.count(DestinationLike.id)).filter(
-        DestinationLike.destination_id == destination_id
-    ).scalar()
-    
-    # 저장 수 계산
-    saves_count = db.query(func.count(DestinationSave.id)).filter(
-        DestinationSave.destination_id == destination_id
-    ).scalar()
-    
-    result = {
-        "destination_id": destination.destination_id,
-        "name": destination.name,
-        "province": destination.province,
-        "region": destination.region,
-        "category": destination.category,
-        "is_indoor": destination.is_indoor,
-        "tags": destination.tags,
-        "latitude": float(destination.latitude) if destination.latitude else None,
-        "longitude": float(destination.longitude) if destination.longitude else None,
-        "image_url": destination.image_url,
-        "rating": destination.rating,
-        "likes_count": likes_count,
-        "saves_count": saves_count,
-        "is_liked": False,
-        "is_saved": False,
-    }
-    
+def get_destinations_with_stats(
+    db: Session, destination_ids: List[UUID], current_user_id: Optional[UUID] = None
+) -> dict:
+    """여러 여행지 정보와 좋아요/저장 통계를 일괄 조회하는 헬퍼 함수
+
+    destination_id(문자열)를 키로 하는 dict를 반환합니다.
+    """
+    if not destination_ids:
+        return {}
+
+    destinations = db.query(Destination).filter(
+        Destination.destination_id.in_(destination_ids)
+    ).all()
+
+    if not destinations:
+        return {}
+
+    ids = [destination.destination_id for destination in destinations]
+
+    # 좋아요/저장 수 일괄 조회 (카운터 캐시)
+    likes_counts = counter_service.get_counts(db, "destination_likes", ids)
+    saves_counts = counter_service.get_counts(db, "destination_saves", ids)
+
     # 현재 사용자의 좋아요/저장 여부 확인
+    liked_ids = set()
+    saved_ids = set()
     if current_user_id:
-        is_liked = db.query(DestinationLike).filter(
-            and_(
-                DestinationLike.user_id == current_user_id,
-                DestinationLike.destination_id == destination_id
+        liked_ids = {
+            row.destination_id
+            for row in db.query(DestinationLike.destination_id).filter(
+                and_(
+                    DestinationLike.user_id == current_user_id,
+                    DestinationLike.destination_id.in_(ids)
+                )
             )
-        ).first() is not None
-        
-        is_saved = db.query(DestinationSave).filter(
-            and_(
-                DestinationSave.user_id == current_user_id,
-                DestinationSave.destination_id == destination_id
+        }
+        saved_ids = {
+            row.destination_id
+            for row in db.query(DestinationSave.destination_id).filter(
+                and_(
+                    DestinationSave.user_id == current_user_id,
+                    DestinationSave.destination_id.in_(ids)
+                )
             )
-        ).first() is not None
-        
-        result["is_liked"] = is_liked
-        result["is_saved"] = is_saved
-    
-    return result
+        }
+
+    results = {}
+    for destination in destinations:
+        key = str(destination.destination_id)
+        results[key] = {
+            "destination_id": destination.destination_id,
+            "name": destination.name,
+            "province": destination.province,
+            "region": destination.region,
+            "category": destination.category,
+            "is_indoor": destination.is_indoor,
+            "tags": destination.tags,
+            "latitude": float(destination.latitude) if destination.latitude else None,
+            "longitude": float(destination.longitude) if destination.longitude else None,
+            "image_url": destination.image_url,
+            "rating": destination.rating,
+            "likes_count": likes_counts.get(key, 0),
+            "saves_count": saves_counts.get(key, 0),
+            "is_liked": destination.destination_id in liked_ids,
+            "is_saved": destination.destination_id in saved_ids,
+        }
+
+    return results
+
+
+def get_destination_with_stats(
+    db: Session, destination_id: UUID, current_user_id: Optional[UUID] = None
+) -> Optional[dict]:
+    """여행지 정보와 좋아요/저장 통계를 함께 가져오는 헬퍼 함수"""
+    return get_destinations_with_stats(
+        db, [destination_id], current_user_id
+    ).get(str(destination_id))
 
 
 # 좋아요 관련 엔드포인트
@@ -130,6 +156,7 @@ async def create_destination_like(
         db.add(new_like)
         db.commit()
         db.refresh(new_like)
+        counter_service.increment(db, "destination_likes", new_like.destination_id)
         
         # 응답에 여행지 정보 포함
         response = DestinationLikeResponse(
@@ -168,31 +195,50 @@ async def delete_destination_like(
     
     db.delete(like)
     db.commit()
+    counter_service.increment(db, "destination_likes", destination_id, -1)
     
     return {"message": "Like removed successfully"}
 
 
-@router.get("/likes", response_model=List[DestinationLikeResponse])
+@router.get(
+    "/likes",
+    response_model=Union[List[DestinationLikeResponse], DestinationLikeCursorPage],
+)
 async def get_my_destination_likes(
     skip: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(
+        None, description="커서 페이지네이션 (첫 페이지는 빈 값, 이후 pagination.next_cursor 사용)"
+    ),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user),
 ):
     """내가 좋아요한 여행지 목록 조회"""
-    likes = db.query(DestinationLike).filter(
+    query = db.query(DestinationLike).filter(
         DestinationLike.user_id == current_user.user_id
-    ).options(
-        joinedload(DestinationLike.destination)
-    ).order_by(
-        DestinationLike.created_at.desc()
-    ).offset(skip).limit(limit).all()
+    )
+    
+    next_cursor = None
+    if cursor is not None:
+        # 커서 모드: (created_at, id) keyset 조회
+        try:
+            likes, next_cursor = paginate_by_cursor(
+                query, DestinationLike.created_at, DestinationLike.id, cursor, limit
+            )
+        except InvalidCursorError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+    else:
+        likes = query.order_by(
+            DestinationLike.created_at.desc()
+        ).offset(skip).limit(limit).all()
+    
+    destinations_data = get_destinations_with_stats(
+        db, [like.destination_id for like in likes], current_user.user_id
+    )
     
     result = []
     for like in likes:
-        destination_data = get_destination_with_stats(
-            db, like.destination_id, current_user.user_id
-        )
+        destination_data = destinations_data.get(str(like.destination_id))
         result.append(
             DestinationLikeResponse(
                 id=like.id,
@@ -203,6 +249,9 @@ async def get_my_destination_likes(
             )
         )
     
+    if cursor is not None:
+        return {"likes": result, "pagination": create_cursor_pagination_info(limit, next_cursor)}
+
     return result
 
 
@@ -244,6 +293,7 @@ async def create_destination_save(
         db.add(new_save)
         db.commit()
         db.refresh(new_save)
+        counter_service.increment(db, "destination_saves", new_save.destination_id)
         
         # 응답에 여행지 정보 포함
         response = DestinationSaveResponse(
@@ -283,31 +333,50 @@ async def delete_destination_save(
     
     db.delete(save)
     db.commit()
+    counter_service.increment(db, "destination_saves", destination_id, -1)
     
     return {"message": "Save removed successfully"}
 
 
-@router.get("/saves", response_model=List[DestinationSaveResponse])
+@router.get(
+    "/saves",
+    response_model=Union[List[DestinationSaveResponse], DestinationSaveCursorPage],
+)
 async def get_my_destination_saves(
     skip: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(
+        None, description="커서 페이지네이션 (첫 페이지는 빈 값, 이후 pagination.next_cursor 사용)"
+    ),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user),
 ):
     """내가 저장한 여행지 목록 조회"""
-    saves = db.query(DestinationSave).filter(
+    query = db.query(DestinationSave).filter(
         DestinationSave.user_id == current_user.user_id
-    ).options(
-        joinedload(DestinationSave.destination)
-    ).order_by(
-        DestinationSave.created_at.desc()
-    ).offset(skip).limit(limit).all()
+    )
+    
+    next_cursor = None
+    if cursor is not None:
+        # 커서 모드: (created_at, id) keyset 조회
+        try:
+            saves, next_cursor = paginate_by_cursor(
+                query, DestinationSave.created_at, DestinationSave.id, cursor, limit
+            )
+        except InvalidCursorError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+    else:
+        saves = query.order_by(
+            DestinationSave.created_at.desc()
+        ).offset(skip).limit(limit).all()
+    
+    destinations_data = get_destinations_with_stats(
+        db, [save.destination_id for save in saves], current_user.user_id
+    )
     
     result = []
     for save in saves:
-        destination_data = get_destination_with_stats(
-            db, save.destination_id, current_user.user_id
-        )
+        destination_data = destinations_data.get(str(save.destination_id))
         result.append(
             DestinationSaveResponse(
                 id=save.id,
@@ -319,6 +388,9 @@ async def get_my_destination_saves(
             )
         )
     
+    if cursor is not None:
+        return {"saves": result, "pagination": create_cursor_pagination_info(limit, next_cursor)}
+
     return result
 
 
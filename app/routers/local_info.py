@@ -1,3 +1,4 @@
+import asyncio
 from typing import Any
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
@@ -5,6 +6,7 @@ from sqlalchemy.orm import Session
 
 from app.auth import get_current_active_user
 from app.database import get_db
+from app.middleware.json_encoder import FastJSONResponse
 
 # ORM 모델만 별도로 import
 # Pydantic 모델은 필요할 때만 별도로 import
@@ -22,6 +24,73 @@ from app.services.local_info_service import local_info_service
 
 router = APIRouter(prefix="/local", tags=["local_info"])
 
+# 목록 응답에 포함되는 컬럼만 조회 (ORM 엔티티/JSONB 상세 정보 로드 없이 행 튜플로 받음)
+RESTAURANT_LIST_COLUMNS = (
+    Restaurant.content_id,
+    Restaurant.region_code,
+    Restaurant.restaurant_name,
+    Restaurant.category_code,
+    Restaurant.sub_category_code,
+    Restaurant.address,
+    Restaurant.detail_address,
+    Restaurant.zipcode,
+    Restaurant.latitude,
+    Restaurant.longitude,
+    Restaurant.tel,
+    Restaurant.homepage,
+    Restaurant.cuisine_type,
+    Restaurant.specialty_dish,
+    Restaurant.operating_hours,
+    Restaurant.rest_date,
+    Restaurant.reservation_info,
+    Restaurant.credit_card,
+    Restaurant.smoking,
+    Restaurant.parking,
+    Restaurant.room_available,
+    Restaurant.children_friendly,
+    Restaurant.takeout,
+    Restaurant.delivery,
+    Restaurant.overview,
+    Restaurant.first_image,
+    Restaurant.first_image_small,
+    Restaurant.data_quality_score,
+    Restaurant.processing_status,
+    Restaurant.created_at,
+    Restaurant.updated_at,
+    Restaurant.last_sync_at,
+)
+ACCOMMODATION_LIST_COLUMNS = (
+    Accommodation.content_id,
+    Accommodation.region_code,
+    Accommodation.accommodation_name,
+    Accommodation.accommodation_type,
+    Accommodation.address,
+    Accommodation.tel,
+    Accommodation.latitude,
+    Accommodation.longitude,
+    Accommodation.parking,
+    Accommodation.created_at,
+)
+TOURIST_ATTRACTION_LIST_COLUMNS = (
+    TouristAttraction.content_id,
+    TouristAttraction.region_code,
+    TouristAttraction.attraction_name,
+    TouristAttraction.category_code,
+    TouristAttraction.category_name,
+    TouristAttraction.address,
+    TouristAttraction.latitude,
+    TouristAttraction.longitude,
+    TouristAttraction.description,
+    TouristAttraction.image_url,
+    TouristAttraction.homepage,
+    TouristAttraction.zipcode,
+    TouristAttraction.data_quality_score,
+    TouristAttraction.processing_status,
+    TouristAttraction.created_at,
+    TouristAttraction.updated_at,
+    TouristAttraction.last_sync_at,
+)
+
 
 @router.get("/cities")
 async def get_supported_cities(db: Any = Depends(get_db)):
@@ -53,11 +122,15 @@ async def search_restaurants(
     ),
     keyword: str | None = Query(None, description="검색 키워드"),
     limit: int = Query(20, description="결과 개수", ge=1, le=100),
-    db: Session = Depends(get_db),
 ):
     """맛집 검색"""
     restaurants = await local_info_service.search_restaurants(
-        city=city, region=region, category=category, keyword=keyword, limit=limit, db=db
+        city=city,
+        region=region,
+        category=category,
+        keyword=keyword,
+        limit=limit,
+        include_db=True,
     )
     return {"restaurants": restaurants, "total": len(restaurants)}
 
@@ -85,7 +158,7 @@ async def get_all_restaurants(
     """
     try:
         # 쿼리 시작
-        query = db.query(Restaurant)
+        query = db.query(*RESTAURANT_LIST_COLUMNS)
 
         # 필터 적용 - region_code를 tour_api_area_code로 매핑
         if region_code:
@@ -133,49 +206,14 @@ async def get_all_restaurants(
         offset = (page - 1) * page_size
         restaurants = query.offset(offset).limit(page_size).all()
 
-        # 응답 데이터 구성
-        restaurant_list = []
-        for restaurant in restaurants:
-            restaurant_data = {
-                "content_id": restaurant.content_id,
-                "region_code": restaurant.region_code,
-                "restaurant_name": restaurant.restaurant_name,
-                "category_code": restaurant.category_code,
-                "sub_category_code": restaurant.sub_category_code,
-                "address": restaurant.address,
-                "detail_address": restaurant.detail_address,
-                "zipcode": restaurant.zipcode,
-                "latitude": restaurant.latitude,
-                "longitude": restaurant.longitude,
-                "tel": restaurant.tel,
-                "homepage": restaurant.homepage,
-                "cuisine_type": restaurant.cuisine_type,
-                "specialty_dish": restaurant.specialty_dish,
-                "operating_hours": restaurant.operating_hours,
-                "rest_date": restaurant.rest_date,
-                "reservation_info": restaurant.reservation_info,
-                "credit_card": restaurant.credit_card,
-                "smoking": restaurant.smoking,
-                "parking": restaurant.parking,
-                "room_available": restaurant.room_available,
-                "children_friendly": restaurant.children_friendly,
-                "takeout": restaurant.takeout,
-                "delivery": restaurant.delivery,
-                "overview": restaurant.overview,
-                "first_image": restaurant.first_image,
-                "first_image_small": restaurant.first_image_small,
-                "data_quality_score": restaurant.data_quality_score,
-                "processing_status": restaurant.processing_status,
-                "created_at": restaurant.created_at,
-                "updated_at": restaurant.updated_at,
-                "last_sync_at": restaurant.last_sync_at,
-            }
-            restaurant_list.append(restaurant_data)
+        # 응답 데이터 구성 (컬럼명이 곧 응답 키)
+        restaurant_list = [dict(row._mapping) for row in restaurants]
 
         # 페이지네이션 정보 계산
         total_pages = (total_count + page_size - 1) // page_size
 
-        return {
+        # 이미 응답 형태의 dict이므로 jsonable_encoder 순회 없이 바로 직렬화
+        return FastJSONResponse({
             "restaurants": restaurant_list,
             "pagination": {
                 "page": page,
@@ -189,7 +227,7 @@ async def get_all_restaurants(
                 "region_code": region_code,
                 "category_code": category_code,
             },
-        }
+        })
 
     except Exception as e:
         raise HTTPException(
@@ -255,7 +293,7 @@ async def get_all_accommodations(
     """
     try:
         # 쿼리 시작
-        query = db.query(Accommodation)
+        query = db.query(*ACCOMMODATION_LIST_COLUMNS)
 
         # 필터 적용 - region_code를 tour_api_area_code로 매핑
         if region_code:
@@ -307,27 +345,13 @@ async def get_all_accommodations(
         offset = (page - 1) * page_size
         accommodations = query.offset(offset).limit(page_size).all()
 
-        # 응답 데이터 구성
-        accommodation_list = []
-        for accommodation in accommodations:
-            accommodation_data = {
-                "content_id": accommodation.content_id,
-                "region_code": accommodation.region_code,
-                "accommodation_name": accommodation.accommodation_name,
-                "accommodation_type": accommodation.accommodation_type,
-                "address": accommodation.address,
-                "tel": accommodation.tel,
-                "latitude": accommodation.latitude,
-                "longitude": accommodation.longitude,
-                "parking": accommodation.parking,
-                "created_at": accommodation.created_at,
-            }
-            accommodation_list.append(accommodation_data)
+        # 응답 데이터 구성 (컬럼명이 곧 응답 키)
+        accommodation_list = [dict(row._mapping) for row in accommodations]
 
         # 페이지네이션 정보 계산
         total_pages = (total_count + page_size - 1) // page_size
 
-        return {
+        return FastJSONResponse({
             "accommodations": accommodation_list,
             "pagination": {
                 "page": page,
@@ -342,7 +366,7 @@ async def get_all_accommodations(
                 "category_code": category_code,
                 "accommodation_type": accommodation_type,
             },
-        }
+        })
 
     except Exception as e:
         raise HTTPException(
@@ -374,7 +398,7 @@ async def get_all_tourist_attractions(
     """
     try:
         # 쿼리 시작
-        query = db.query(TouristAttraction)
+        query = db.query(*TOURIST_ATTRACTION_LIST_COLUMNS)
 
         # 필터 적용 - region_code를 tour_api_area_code로 매핑
         if region_code:
@@ -422,29 +446,8 @@ async def get_all_tourist_attractions(
         offset = (page - 1) * page_size
         attractions = query.offset(offset).limit(page_size).all()
 
-        # 응답 데이터 구성
-        attraction_list = []
-        for attraction in attractions:
-            attraction_data = {
-                "content_id": attraction.content_id,
-                "region_code": attraction.region_code,
-                "attraction_name": attraction.attraction_name,
-                "category_code": attraction.category_code,
-                "category_name": attraction.category_name,
-                "address": attraction.address,
-                "latitude": attraction.latitude,
-                "longitude": attraction.longitude,
-                "description": attraction.description,
-                "image_url": attraction.image_url,
-                "homepage": attraction.homepage,
-                "zipcode": attraction.zipcode,
-                "data_quality_score": attraction.data_quality_score,
-                "processing_status": attraction.processing_status,
-                "created_at": attraction.created_at,
-                "updated_at": attraction.updated_at,
-                "last_sync_at": attraction.last_sync_at,
-            }
-            attraction_list.append(attraction_data)
+        # 응답 데이터 구성 (컬럼명이 곧 응답 키)
+        attraction_list = [dict(row._mapping) for row in attractions]
 
         # 페이지네이션 정보 계산
         total_pages = (total_count + page_size - 1) // page_size
@@ -478,31 +481,34 @@ async def search_all(
 ):
     """통합 검색 (인증 필요)"""
     results = SearchResult()
+    category = search_request.category
 
-    # 도시 정보
-    city_info = await local_info_service.get_city_info(search_request.city)
-    if city_info:
-        results.city_info = city_info
+    async def _none():
+        return None
 
-    # 맛집 검색
-    if not search_request.category or search_request.category == "restaurant":
-        restaurants = await local_info_service.search_restaurants(
+    # 도시 정보와 카테고리별 검색을 동시에 실행
+    city_info, restaurants, transportations, accommodations = await asyncio.gather(
+        local_info_service.get_city_info(search_request.city),
+        local_info_service.search_restaurants(
             city=search_request.city, keyword=search_request.keyword, limit=10
         )
-        results.restaurants = restaurants
+        if not category or category == "restaurant"
+        else _none(),
+        local_info_service.search_transportation(city=search_request.city, limit=10)
+        if not category or category == "transportation"
+        else _none(),
+        local_info_service.search_accommodations(city=search_request.city, limit=10)
+        if not category or category == "accommodation"
+        else _none(),
+    )
 
-    # 교통 정보 검색
-    if not search_request.category or search_request.category == "transportation":
-        transportations = await local_info_service.search_transportation(
-            city=search_request.city, limit=10
-        )
+    if city_info:
+        results.city_info = city_info
+    if restaurants is not None:
+        results.restaurants = restaurants
+    if transportations is not None:
         results.transportations = transportations
-
-    # 숙소 검색
-    if not search_request.category or search_request.category == "accommodation":
-        accommodations = await local_info_service.search_accommodations(
-            city=search_request.city, limit=10
-        )
+    if accommodations is not None:
         results.accommodations = accommodations
 
     return results
@@ -679,15 +685,20 @@ async def get_nearby_places(
     radius: float = Query(5.0, description="반경 (km)", ge=0.1, le=50.0),
     category: str | None = Query(None, description="카테고리"),
     limit: int = Query(20, description="결과 개수", ge=1, le=100),
+    db: Session = Depends(get_db),
 ):
     """주변 장소 검색"""
-    nearby_places = await local_info_service.get_nearby_places(
-        latitude=latitude,
-        longitude=longitude,
-        radius=radius,
-        category=category,
-        limit=limit,
-    )
+    try:
+        nearby_places = await local_info_service.get_nearby_places(
+            db,
+            latitude=latitude,
+            longitude=longitude,
+            radius=radius,
+            category=category,
+            limit=limit,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     return {"places": nearby_places, "total": len(nearby_places)}
 
 
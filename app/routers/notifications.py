@@ -8,6 +8,7 @@
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
 from typing import List, Optional
+import asyncio
 import uuid
 from datetime import datetime
 
@@ -448,3 +449,45 @@ async def send_notifications(
             failed_count=len(request.user_ids),
             notification_ids=[]
         )
+
+
+@router.get("/worker/metrics")
+async def get_notification_worker_metrics(
+    current_user: User = Depends(get_current_active_user),
+):
+    """
+    알림 큐 워커 처리량 메트릭 (관리자용)
+
+    Redis에 기록된 모든 워커(gunicorn 워커, 단독 실행 워커)의 메트릭과 합계를 반환합니다.
+    Redis를 사용할 수 없으면 현재 프로세스의 워커 메트릭만 반환합니다 (scope: "process").
+    """
+    if current_user.role != "ADMIN":
+        raise HTTPException(status_code=403, detail="Admin access required")
+
+    from app.config import settings
+    from app.services.notification_worker import (
+        collect_worker_metrics,
+        notification_worker,
+        summarize_worker_metrics,
+    )
+
+    workers = await asyncio.to_thread(collect_worker_metrics)
+    scope = "cluster"
+    if workers is None:
+        scope = "process"
+        workers = []
+        if notification_worker.metrics.batches:
+            workers.append(
+                {
+                    "worker_id": notification_worker.worker_id,
+                    "queues": notification_worker.queue_names,
+                    **notification_worker.metrics.to_dict(),
+                }
+            )
+
+    return {
+        "enabled": settings.notification_worker_enabled,
+        "scope": scope,
+        "totals": summarize_worker_metrics(workers),
+        "workers": workers,
+    }
@@ -3,12 +3,19 @@
 """
 
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 
 from app.database import get_db
 from app.services.region_service import RegionService
 from app.models import Region
+from app.utils.pagination import (
+    TOTAL_MODE_PATTERN,
+    InvalidCursorError,
+    count_total,
+    create_cursor_pagination_info,
+    paginate_by_cursor,
+)
 
 router = APIRouter(prefix="/api/regions", tags=["Regions"])
 
@@ -18,17 +25,30 @@ async def get_all_regions(
     db: Session = Depends(get_db),
     page: int = 1,
     page_size: int = 100,
+    cursor: Optional[str] = Query(None, description="커서 페이지네이션 (첫 페이지는 빈 값, 이후 next_cursor 사용)"),
+    total_mode: Optional[str] = Query(None, pattern=TOTAL_MODE_PATTERN, description="전체 개수 계산 방식 (기본: offset=exact, cursor=estimated)"),
 ) -> dict:
     """
     모든 지역 정보 조회
     """
     try:
-        # 전체 지역 개수
-        total_count = db.query(Region).filter(Region.is_active == True).count()
+        query = db.query(Region).filter(Region.is_active == True)
         
-        # 페이지네이션 적용
-        offset = (page - 1) * page_size
-        regions = db.query(Region).filter(Region.is_active == True).offset(offset).limit(page_size).all()
+        next_cursor = None
+        if cursor is not None:
+            # 커서 모드: (created_at, region_code) keyset 조회
+            total_count, total_is_estimate = count_total(query, total_mode or "estimated")
+            regions, next_cursor = paginate_by_cursor(
+                query, Region.created_at, Region.region_code, cursor, page_size,
+                descending=False,
+            )
+        else:
+            # 전체 지역 개수
+            total_count, total_is_estimate = count_total(query, total_mode or "exact")
+            
+            # 페이지네이션 적용
+            offset = (page - 1) * page_size
+            regions = query.offset(offset).limit(page_size).all()
         
         # 응답 데이터 구성
         region_list = []
@@ -49,16 +69,30 @@ async def get_all_regions(
             }
             region_list.append(region_data)
         
+        if cursor is not None:
+            return {
+                "regions": region_list,
+                "pagination": create_cursor_pagination_info(
+                    page_size, next_cursor, total_count, total_is_estimate
+                ),
+            }
+        
         return {
             "regions": region_list,
             "pagination": {
                 "page": page,
                 "page_size": page_size,
                 "total_count": total_count,
-                "total_pages": (total_count + page_size - 1) // page_size,
+                "total_pages": (
+                    (total_count + page_size - 1) // page_size
+                    if total_count is not None
+                    else None
+                ),
             }
         }
         
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(
             status_code=500,
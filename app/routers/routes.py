@@ -3,11 +3,14 @@
 여행 계획의 경로 정보 관리 및 교통 정보 제공
 """
 
+import asyncio
+import json
 import logging
 import uuid
 from typing import Any
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from app.auth import get_current_user
@@ -26,6 +29,11 @@ from app.models import (
     User,
 )
 from app.services.google_places_service import google_places_service
+from app.services.route_geometry import (
+    GEOMETRY_FORMAT_PATTERN,
+    compact_route_data,
+    prepare_route_data,
+)
 from app.services.route_service import route_service
 from app.services.tmap_service import tmap_service
 
@@ -33,10 +41,63 @@ router = APIRouter(prefix="/routes", tags=["routes"])
 
 logger = logging.getLogger(__name__)
 
+ZOOM_QUERY = Query(None, ge=0, le=22, description="지도 줌 레벨 (지정 시 해당 해상도로 경로 단순화)")
+GEOMETRY_FORMAT_QUERY = Query(
+    "polyline",
+    pattern=GEOMETRY_FORMAT_PATTERN,
+    description="경로 좌표 형식 (polyline: 인코딩된 폴리라인, coordinates: 이전 좌표 목록)",
+)
+
+
+# 하위 경로 결과가 담기는 키 (비교/추천/타임머신 경로)
+NESTED_ROUTE_KEYS = (
+    "routes",
+    "all_routes",
+    "recommended",
+    "recommended_route",
+    "timemachine_data",
+    "predicted_route",
+    "comparison",
+)
+
+
+def _prepare_route_result(result: dict[str, Any], zoom: int | None, geometry_format: str) -> dict[str, Any]:
+    """경로 결과의 route_data를 응답 형식으로 변환 (비교/추천/타임머신 경로 포함)"""
+    if not isinstance(result, dict):
+        return result
+    prepared = dict(result)
+    if isinstance(prepared.get("route_data"), dict):
+        prepared["route_data"] = prepare_route_data(prepared["route_data"], zoom, geometry_format)
+    for key in NESTED_ROUTE_KEYS:
+        value = prepared.get(key)
+        if isinstance(value, list):
+            prepared[key] = [_prepare_route_result(item, zoom, geometry_format) for item in value]
+        elif isinstance(value, dict):
+            if key in ("routes", "all_routes") and "route_data" not in value:
+                # 교통수단별 경로 결과 ({"walk": {...}, "car": {...}})
+                prepared[key] = {
+                    transport_type: _prepare_route_result(item, zoom, geometry_format)
+                    for transport_type, item in value.items()
+                }
+            else:
+                prepared[key] = _prepare_route_result(value, zoom, geometry_format)
+    return prepared
+
+
+def _prepare_route_response(
+    route: TravelRoute, zoom: int | None = None, geometry_format: str = "polyline"
+) -> TravelRouteResponse:
+    """저장된 경로를 응답 스키마로 변환 (route_data는 요청한 줌/형식으로)"""
+    route_response = TravelRouteResponse.from_orm_with_mapping(route)
+    route_response.route_data = prepare_route_data(route.route_data, zoom, geometry_format)
+    return route_response
+
 
 @router.post("/calculate", response_model=RouteCalculationResponse)
 async def calculate_route(
     request: RouteCalculationRequest,
+    zoom: int | None = ZOOM_QUERY,
+    geometry_format: str = GEOMETRY_FORMAT_QUERY,
     current_user: User = Depends(get_current_user)
 ):
     """경로 계산 API"""
@@ -54,7 +115,7 @@ async def calculate_route(
             duration=result.get("duration"),
             distance=result.get("distance"),
             cost=result.get("cost"),
-            route_data=result.get("route_data"),
+            route_data=prepare_route_data(result.get("route_data"), zoom, geometry_format),
             transport_type=result.get("transport_type", request.transport_type),
             message=result.get("message")
         )
@@ -69,6 +130,8 @@ async def calculate_route(
 @router.post("/calculate/multiple")
 async def calculate_multiple_routes(
     request: RouteCalculationRequest,
+    zoom: int | None = ZOOM_QUERY,
+    geometry_format: str = GEOMETRY_FORMAT_QUERY,
     current_user: User = Depends(get_current_user)
 ):
     """여러 교통수단 경로 동시 계산"""
@@ -80,7 +143,7 @@ async def calculate_multiple_routes(
             request.destination_lng
         )
 
-        return result
+        return _prepare_route_result(result, zoom, geometry_format)
 
     except Exception as e:
         raise HTTPException(
@@ -93,6 +156,8 @@ async def calculate_multiple_routes(
 async def get_recommended_route(
     request: RouteCalculationRequest,
     preferences: dict[str, Any] | None = None,
+    zoom: int | None = ZOOM_QUERY,
+    geometry_format: str = GEOMETRY_FORMAT_QUERY,
     current_user: User = Depends(get_current_user)
 ):
     """상황에 맞는 최적 경로 추천"""
@@ -105,7 +170,7 @@ async def get_recommended_route(
             preferences
         )
 
-        return result
+        return _prepare_route_result(result, zoom, geometry_format)
 
     except Exception as e:
         raise HTTPException(
@@ -124,7 +189,7 @@ async def create_travel_route(
     try:
         # 여행 계획 소유권 확인
         travel_plan = db.query(TravelPlan).filter(
-            TravelPlan.plan_id == route_data.travel_plan_id,
+            TravelPlan.plan_id == route_data.plan_id,
             TravelPlan.user_id == current_user.user_id
         ).first()
 
@@ -134,24 +199,24 @@ async def create_travel_route(
                 detail="여행 계획을 찾을 수 없거나 접근 권한이 없습니다."
             )
 
-        # 새 경로 생성
+        # 새 경로 생성 (경로 좌표는 폴리라인으로 압축해 저장)
         new_route = TravelRoute(
             id=uuid.uuid4(),
-            travel_plan_id=route_data.travel_plan_id,
-            origin_place_id=route_data.origin_place_id,
-            destination_place_id=route_data.destination_place_id,
-            route_order=route_data.route_order,
-            transport_mode=route_data.transport_mode,
-            duration_minutes=route_data.duration_minutes,
-            distance_km=route_data.distance_km,
-            route_data=route_data.route_data
+            travel_plan_id=route_data.plan_id,
+            origin_place_id=route_data.departure_name,
+            destination_place_id=route_data.destination_name,
+            route_order=route_data.sequence,
+            transport_mode=route_data.transport_type,
+            duration_minutes=route_data.duration,
+            distance_km=route_data.distance,
+            route_data=compact_route_data(route_data.route_data)
         )
 
         db.add(new_route)
         db.commit()
         db.refresh(new_route)
 
-        return new_route
+        return _prepare_route_response(new_route)
 
     except HTTPException:
         raise
@@ -166,6 +231,8 @@ async def create_travel_route(
 @router.get("/plan/{plan_id}", response_model=list[TravelRouteResponse])
 async def get_travel_plan_routes(
     plan_id: uuid.UUID,
+    zoom: int | None = ZOOM_QUERY,
+    geometry_format: str = GEOMETRY_FORMAT_QUERY,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -191,7 +258,7 @@ async def get_travel_plan_routes(
         # 프론트엔드 호환 형식으로 변환
         enhanced_routes = []
         for route in routes:
-            route_response = TravelRouteResponse.from_orm_with_mapping(route)
+            route_response = _prepare_route_response(route, zoom, geometry_format)
             
             # 장소명에서 좌표 추출 시도
             try:
@@ -229,6 +296,8 @@ async def get_travel_plan_routes(
 @router.get("/{route_id}", response_model=TravelRouteResponse)
 async def get_travel_route(
     route_id: uuid.UUID,
+    zoom: int | None = ZOOM_QUERY,
+    geometry_format: str = GEOMETRY_FORMAT_QUERY,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -256,7 +325,7 @@ async def get_travel_route(
                 detail="해당 경로에 접근할 권한이 없습니다."
             )
 
-        return route
+        return _prepare_route_response(route, zoom, geometry_format)
 
     except HTTPException:
         raise
@@ -300,13 +369,15 @@ async def update_travel_route(
 
         # 경로 정보 업데이트
         update_data = route_data.dict(exclude_unset=True)
+        if "route_data" in update_data:
+            update_data["route_data"] = compact_route_data(update_data["route_data"])
         for field, value in update_data.items():
             setattr(route, field, value)
 
         db.commit()
         db.refresh(route)
 
-        return route
+        return _prepare_route_response(route)
 
     except HTTPException:
         raise
@@ -369,13 +440,46 @@ async def delete_travel_route(
         )
 
 
+def _parse_day(day_str: str) -> int | None:
+    """일정 키("Day 1", "day2")에서 일차 번호 추출"""
+    try:
+        return int(day_str.replace('Day ', '').replace('day', ''))
+    except (ValueError, AttributeError):
+        return None
+
+
+def _place_coords(place: dict[str, Any], place_details: dict[str, dict], default_name: str) -> dict[str, Any] | None:
+    """일정 장소의 좌표 (일정에 좌표가 없으면 Place ID 상세 정보 사용)"""
+    if place.get('latitude') and place.get('longitude'):
+        return {
+            'latitude': place['latitude'],
+            'longitude': place['longitude'],
+            'name': place.get('name', place.get('description', default_name))
+        }
+    if place.get('place_id') and place['place_id'] in place_details:
+        detail = place_details[place['place_id']]
+        if detail.get('latitude') and detail.get('longitude'):
+            return {
+                'latitude': detail['latitude'],
+                'longitude': detail['longitude'],
+                'name': detail.get('name', place.get('description', default_name))
+            }
+    return None
+
+
 @router.post("/plan/{plan_id}/auto-generate")
 async def auto_generate_routes(
     plan_id: uuid.UUID,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    """여행 계획의 일정을 기반으로 자동 경로 생성"""
+    """
+    여행 계획의 일정을 기반으로 자동 경로 생성
+
+    1. 좌표 확인: 장소 상세 정보(Place ID)와 출발지 검색을 한 번에 병렬 조회
+    2. 경로 계산: 모든 구간을 동시에 계산 (TMAP/ODsay 동시 요청 수는 각 서비스에서 제한)
+    3. 저장: 기존 경로 삭제와 새 경로 일괄 삽입을 하나의 트랜잭션으로 처리
+    """
     try:
         # 여행 계획 조회 및 소유권 확인
         travel_plan = db.query(TravelPlan).filter(
@@ -395,30 +499,7 @@ async def auto_generate_routes(
                 detail="여행 일정이 없어 경로를 생성할 수 없습니다."
             )
 
-        # 기존 경로들을 먼저 삭제 (중복 방지)
-        existing_routes = db.query(TravelRoute).filter(
-            TravelRoute.travel_plan_id == plan_id
-        ).all()
-
-        if existing_routes:
-            # 관련된 교통수단 상세 정보도 함께 삭제
-            for route in existing_routes:
-                db.query(TransportationDetail).filter(
-                    TransportationDetail.travel_route_id == route.id
-                ).delete()
-
-            # 기존 경로 삭제
-            db.query(TravelRoute).filter(
-                TravelRoute.travel_plan_id == plan_id
-            ).delete()
-
-            db.commit()
-
-        generated_routes = []
-        route_counter = 1  # 순차적인 경로 번호
-
         # Itinerary JSON 파싱
-        import json
         try:
             itinerary = json.loads(travel_plan.itinerary) if isinstance(travel_plan.itinerary, str) else travel_plan.itinerary
         except (json.JSONDecodeError, TypeError) as e:
@@ -427,278 +508,124 @@ async def auto_generate_routes(
                 detail=f"여행 일정 데이터 파싱 오류: {str(e)}"
             )
 
-        # 먼저 모든 Place ID를 수집
-        all_place_ids = set()
-        for day_str, places in itinerary.items():
-            for place in places:
-                if place.get('place_id'):
-                    all_place_ids.add(place['place_id'])
-
-        # Google Places API로 좌표 정보 일괄 조회
-        place_details = {}
-        if all_place_ids:
-            place_details = await google_places_service.get_multiple_place_details(list(all_place_ids))
+        # 일차별로 정렬 (일차 번호를 알 수 없는 항목은 제외)
+        days = sorted(
+            (
+                (day, places or [])
+                for day, places in ((_parse_day(day_str), places) for day_str, places in itinerary.items())
+                if day is not None
+            ),
+            key=lambda item: item[0]
+        )
 
-        # 일차별로 정렬된 리스트 생성
-        sorted_days = sorted(itinerary.items(), key=lambda x: int(x[0].replace('Day ', '').replace('day', '')))
+        # 1. 좌표 확인 - Place ID 상세 정보와 출발지 검색을 동시에 조회
+        all_place_ids = list({
+            place['place_id'] for _, places in days for place in places if place.get('place_id')
+        })
+        needs_start = bool(travel_plan.start_location) and any(day == 1 and places for day, places in days)
 
-        # 각 일차별로 경로 생성
-        for day_str, places in sorted_days:
-            if not places:
-                continue
+        async def fetch_place_details() -> dict[str, dict]:
+            if not all_place_ids:
+                return {}
+            return await google_places_service.get_multiple_place_details(all_place_ids)
 
+        async def fetch_start_detail() -> dict[str, Any] | None:
+            if not needs_start:
+                return None
             try:
-                day = int(day_str.replace('Day ', '').replace('day', ''))
-            except (ValueError, AttributeError):
-                continue
-
-            # 첫 번째 일차인 경우, 출발지에서 첫 번째 목적지로의 경로 생성
-            if day == 1 and travel_plan.start_location and len(places) >= 1:
-                first_place = places[0]
-
-                # 출발지 좌표 정보 (Google Places API로 검색)
-                start_coords = None
-                if travel_plan.start_location:
-                    try:
-                        # start_location을 Google Places API로 검색하여 좌표 획득
-                        start_detail = await google_places_service.search_place_by_text(travel_plan.start_location)
-                        if start_detail and start_detail.get('latitude') and start_detail.get('longitude'):
-                            start_coords = {
-                                'latitude': start_detail['latitude'],
-                                'longitude': start_detail['longitude'],
-                                'name': travel_plan.start_location
-                            }
-                    except Exception as e:
-                        logger.warning(f"출발지 좌표 조회 실패: {str(e)}")
-
-                # 첫 번째 목적지 좌표 정보
-                first_coords = None
-                if first_place.get('latitude') and first_place.get('longitude'):
-                    first_coords = {
-                        'latitude': first_place['latitude'],
-                        'longitude': first_place['longitude'],
-                        'name': first_place.get('name', first_place.get('description', '첫 번째 목적지'))
-                    }
-                elif first_place.get('place_id') and first_place['place_id'] in place_details:
-                    detail = place_details[first_place['place_id']]
-                    if detail.get('latitude') and detail.get('longitude'):
-                        first_coords = {
-                            'latitude': detail['latitude'],
-                            'longitude': detail['longitude'],
-                            'name': detail.get('name', first_place.get('description', '첫 번째 목적지'))
-                        }
+                return await google_places_service.search_place_by_text(travel_plan.start_location)
+            except Exception as e:
+                logger.warning(f"출발지 좌표 조회 실패: {str(e)}")
+                return None
 
-                # 출발지에서 첫 번째 목적지로의 경로 생성
-                if start_coords and first_coords:
-                    try:
-                        route_result = await route_service.get_recommended_route(
-                            start_coords['latitude'],
-                            start_coords['longitude'],
-                            first_coords['latitude'],
-                            first_coords['longitude']
-                        )
-
-                        if route_result.get('success') and route_result.get('recommended'):
-                            recommended = route_result['recommended']
-
-                            # 출발지 → 첫 번째 목적지 경로 저장
-                            start_route = TravelRoute(
-                                id=uuid.uuid4(),
-                                travel_plan_id=plan_id,
-                                origin_place_id=start_coords['name'],
-                                destination_place_id=first_coords['name'],
-                                route_order=route_counter,
-                                transport_mode=recommended.get('transport_type'),
-                                duration_minutes=recommended.get('duration'),
-                                distance_km=recommended.get('distance'),
-                                route_data=recommended.get('route_data')
-                            )
-
-                            db.add(start_route)
-                            generated_routes.append(start_route)
-                            route_counter += 1
-
-                    except Exception as route_error:
-                        logger.warning(f"출발지 경로 계산 중 오류: {str(route_error)}")
-
-            # 일차 내 연속된 장소 간 경로 생성
-            if len(places) >= 2:
-                for i in range(len(places) - 1):
-                    current_place = places[i]
-                    next_place = places[i + 1]
-
-                    # 좌표 정보 확인 및 가져오기
-                    current_coords = None
-                    next_coords = None
-
-                    # 기존 좌표 정보가 있으면 사용
-                    if current_place.get('latitude') and current_place.get('longitude'):
-                        current_coords = {
-                            'latitude': current_place['latitude'],
-                            'longitude': current_place['longitude'],
-                            'name': current_place.get('name', current_place.get('description', '출발지'))
-                        }
-                    # Place ID로 좌표 조회
-                    elif current_place.get('place_id') and current_place['place_id'] in place_details:
-                        detail = place_details[current_place['place_id']]
-                        if detail.get('latitude') and detail.get('longitude'):
-                            current_coords = {
-                                'latitude': detail['latitude'],
-                                'longitude': detail['longitude'],
-                                'name': detail.get('name', current_place.get('description', '출발지'))
-                            }
+        place_details, start_detail = await asyncio.gather(fetch_place_details(), fetch_start_detail())
 
-                    # 다음 장소 좌표 확인
-                    if next_place.get('latitude') and next_place.get('longitude'):
-                        next_coords = {
-                            'latitude': next_place['latitude'],
-                            'longitude': next_place['longitude'],
-                            'name': next_place.get('name', next_place.get('description', '도착지'))
-                        }
-                    elif next_place.get('place_id') and next_place['place_id'] in place_details:
-                        detail = place_details[next_place['place_id']]
-                        if detail.get('latitude') and detail.get('longitude'):
-                            next_coords = {
-                                'latitude': detail['latitude'],
-                                'longitude': detail['longitude'],
-                                'name': detail.get('name', next_place.get('description', '도착지'))
-                            }
+        start_coords = None
+        if start_detail and start_detail.get('latitude') and start_detail.get('longitude'):
+            start_coords = {
+                'latitude': start_detail['latitude'],
+                'longitude': start_detail['longitude'],
+                'name': travel_plan.start_location
+            }
 
-                    # 두 장소 모두 좌표가 있는 경우만 경로 생성
-                    if current_coords and next_coords:
-                        try:
-                            # 최적 경로 계산
-                            route_result = await route_service.get_recommended_route(
-                                current_coords['latitude'],
-                                current_coords['longitude'],
-                                next_coords['latitude'],
-                                next_coords['longitude']
-                            )
-
-                            if route_result.get('success') and route_result.get('recommended'):
-                                recommended = route_result['recommended']
-
-                                # 경로 정보 저장
-                                # 일차 내 모든 연속된 장소 간 경로 생성
-                                route_order = route_counter
-                                route_counter += 1
-                                    
-                                new_route = TravelRoute(
-                                    id=uuid.uuid4(),
-                                    travel_plan_id=plan_id,
-                                    origin_place_id=current_coords['name'],
-                                    destination_place_id=next_coords['name'],
-                                    route_order=route_order,
-                                    transport_mode=recommended.get('transport_type'),
-                                    duration_minutes=recommended.get('duration'),
-                                    distance_km=recommended.get('distance'),
-                                    route_data=recommended.get('route_data')
-                                )
-
-                                db.add(new_route)
-                                generated_routes.append(new_route)
-
-                        except Exception as route_error:
-                            print(f"경로 계산 중 오류: {str(route_error)}")
-                            continue
-
-        # 일차 간 경로 생성 (1일차 마지막 → 2일차 첫 번째, 2일차 마지막 → 3일차 첫 번째 등)
-        for i in range(len(sorted_days) - 1):
-            current_day_str, current_places = sorted_days[i]
-            next_day_str, next_places = sorted_days[i + 1]
-
-            if not current_places or not next_places:
+        # 구간 목록 (저장 순서: 일차별 [출발지 → 첫 목적지], 일차 내 연속 장소, 이후 일차 간 이동)
+        legs = []
+        for day, places in days:
+            if not places:
                 continue
-
-            try:
-                current_day = int(current_day_str.replace('Day ', '').replace('day', ''))
-                next_day = int(next_day_str.replace('Day ', '').replace('day', ''))
-            except (ValueError, AttributeError):
+            if day == 1 and start_coords:
+                legs.append((start_coords, _place_coords(places[0], place_details, '첫 번째 목적지')))
+            for current_place, next_place in zip(places, places[1:]):
+                legs.append((
+                    _place_coords(current_place, place_details, '출발지'),
+                    _place_coords(next_place, place_details, '도착지')
+                ))
+        for (_, current_places), (_, next_places) in zip(days, days[1:]):
+            if current_places and next_places:
+                legs.append((
+                    _place_coords(current_places[-1], place_details, '출발지'),
+                    _place_coords(next_places[0], place_details, '도착지')
+                ))
+        # 두 장소 모두 좌표가 있는 구간만 경로 생성
+        legs = [(origin, destination) for origin, destination in legs if origin and destination]
+
+        # 2. 경로 계산 - 같은 좌표 구간은 한 번만 계산하고 모든 구간을 동시에 요청
+        unique_legs: dict[tuple, tuple[dict, dict]] = {}
+        for origin, destination in legs:
+            key = (origin['latitude'], origin['longitude'], destination['latitude'], destination['longitude'])
+            unique_legs.setdefault(key, (origin, destination))
+
+        results = await asyncio.gather(
+            *(
+                route_service.get_recommended_route(
+                    origin['latitude'], origin['longitude'],
+                    destination['latitude'], destination['longitude']
+                )
+                for origin, destination in unique_legs.values()
+            ),
+            return_exceptions=True
+        )
+        leg_results = dict(zip(unique_legs, results, strict=True))
+
+        new_routes = []
+        for origin, destination in legs:
+            route_result = leg_results[
+                (origin['latitude'], origin['longitude'], destination['latitude'], destination['longitude'])
+            ]
+            if isinstance(route_result, Exception):
+                logger.warning(f"경로 계산 중 오류 ({origin['name']} → {destination['name']}): {route_result}")
+                continue
+            if not (route_result.get('success') and route_result.get('recommended')):
                 continue
 
-            # 현재 일차 마지막 장소
-            last_place = current_places[-1]
-            # 다음 일차 첫 번째 장소
-            first_place = next_places[0]
-
-            # 좌표 정보 확인 및 가져오기
-            last_coords = None
-            first_coords = None
-
-            # 마지막 장소 좌표 확인
-            if last_place.get('latitude') and last_place.get('longitude'):
-                last_coords = {
-                    'latitude': last_place['latitude'],
-                    'longitude': last_place['longitude'],
-                    'name': last_place.get('name', last_place.get('description', '출발지'))
-                }
-            elif last_place.get('place_id') and last_place['place_id'] in place_details:
-                detail = place_details[last_place['place_id']]
-                if detail.get('latitude') and detail.get('longitude'):
-                    last_coords = {
-                        'latitude': detail['latitude'],
-                        'longitude': detail['longitude'],
-                        'name': detail.get('name', last_place.get('description', '출발지'))
-                    }
-
-            # 첫 번째 장소 좌표 확인
-            if first_place.get('latitude') and first_place.get('longitude'):
-                first_coords = {
-                    'latitude': first_place['latitude'],
-                    'longitude': first_place['longitude'],
-                    'name': first_place.get('name', first_place.get('description', '도착지'))
-                }
-            elif first_place.get('place_id') and first_place['place_id'] in place_details:
-                detail = place_details[first_place['place_id']]
-                if detail.get('latitude') and detail.get('longitude'):
-                    first_coords = {
-                        'latitude': detail['latitude'],
-                        'longitude': detail['longitude'],
-                        'name': detail.get('name', first_place.get('description', '도착지'))
-                    }
-
-            # 두 장소 모두 좌표가 있는 경우만 일차 간 경로 생성
-            if last_coords and first_coords:
-                try:
-                    # 최적 경로 계산
-                    route_result = await route_service.get_recommended_route(
-                        last_coords['latitude'],
-                        last_coords['longitude'],
-                        first_coords['latitude'],
-                        first_coords['longitude']
-                    )
+            recommended = route_result['recommended']
+            new_routes.append(TravelRoute(
+                id=uuid.uuid4(),
+                travel_plan_id=plan_id,
+                origin_place_id=origin['name'],
+                destination_place_id=destination['name'],
+                route_order=len(new_routes) + 1,  # 생성된 경로 기준 순차 번호
+                transport_mode=recommended.get('transport_type'),
+                duration_minutes=recommended.get('duration'),
+                distance_km=recommended.get('distance'),
+                route_data=compact_route_data(recommended.get('route_data'))
+            ))
+
+        # 3. 저장 - 기존 경로(교통수단 상세 정보 포함) 삭제와 새 경로 삽입을 한 트랜잭션으로
+        existing_route_ids = select(TravelRoute.id).where(TravelRoute.travel_plan_id == plan_id)
+        db.query(TransportationDetail).filter(
+            TransportationDetail.travel_route_id.in_(existing_route_ids)
+        ).delete(synchronize_session=False)
+        db.query(TravelRoute).filter(
+            TravelRoute.travel_plan_id == plan_id
+        ).delete(synchronize_session=False)
+        db.add_all(new_routes)
+        db.commit()
 
-                    if route_result.get('success') and route_result.get('recommended'):
-                        recommended = route_result['recommended']
-
-                        # 일차 간 경로 정보 저장 (다음 일차 시작 전 경로)
-                        route_order = route_counter
-                        route_counter += 1
-                        new_route = TravelRoute(
-                            id=uuid.uuid4(),
-                            travel_plan_id=plan_id,
-                            origin_place_id=last_coords['name'],
-                            destination_place_id=first_coords['name'],
-                            route_order=route_order,
-                            transport_mode=recommended.get('transport_type'),
-                            duration_minutes=recommended.get('duration'),
-                            distance_km=recommended.get('distance'),
-                            route_data=recommended.get('route_data')
-                        )
-
-                        db.add(new_route)
-                        generated_routes.append(new_route)
-
-                except Exception as route_error:
-                    print(f"일차 간 경로 계산 중 오류: {str(route_error)}")
-                    continue
-
-        if generated_routes:
-            db.commit()
-
-            # 생성된 경로들을 새로고침
-            for route in generated_routes:
-                db.refresh(route)
+        # 생성된 경로들을 한 번의 조회로 새로고침
+        generated_routes = db.query(TravelRoute).filter(
+            TravelRoute.travel_plan_id == plan_id
+        ).order_by(TravelRoute.route_order).all()
 
         return {
             "message": f"{len(generated_routes)}개의 경로가 자동 생성되었습니다.",
@@ -819,6 +746,8 @@ async def get_detailed_route_info(
     route_id: uuid.UUID,
     include_pois: bool = True,
     include_alternatives: bool = False,
+    zoom: int | None = ZOOM_QUERY,
+    geometry_format: str = GEOMETRY_FORMAT_QUERY,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -864,7 +793,7 @@ async def get_detailed_route_info(
                 "duration": route.duration,
                 "distance": route.distance,
                 "cost": route.cost,
-                "stored_route_data": route.route_data
+                "stored_route_data": prepare_route_data(route.route_data, zoom, geometry_format)
             }
         }
 
@@ -882,7 +811,7 @@ async def get_detailed_route_info(
             )
 
             if car_result.get("success"):
-                detailed_info["real_time_route"] = car_result
+                detailed_info["real_time_route"] = _prepare_route_result(car_result, zoom, geometry_format)
 
                 # 대안 경로도 요청한 경우
                 if include_alternatives:
@@ -899,7 +828,7 @@ async def get_detailed_route_info(
                     if comfort_result.get("success"):
                         alternative_routes.append({
                             "type": "편한길",
-                            "route_data": comfort_result
+                            "route_data": _prepare_route_result(comfort_result, zoom, geometry_format)
                         })
 
                     # 최적 경로 옵션
@@ -913,7 +842,7 @@ async def get_detailed_route_info(
                     if optimal_result.get("success"):
                         alternative_routes.append({
                             "type": "최적 경로",
-                            "route_data": optimal_result
+                            "route_data": _prepare_route_result(optimal_result, zoom, geometry_format)
                         })
 
                     detailed_info["alternative_routes"] = alternative_routes
@@ -962,7 +891,7 @@ async def get_detailed_route_info(
             )
 
             if walk_result.get("success"):
-                detailed_info["real_time_route"] = walk_result
+                detailed_info["real_time_route"] = _prepare_route_result(walk_result, zoom, geometry_format)
 
         # 경로별 상세 안내 정보 추출
         if detailed_info.get("real_time_route"):
@@ -978,8 +907,12 @@ async def get_detailed_route_info(
                     "taxi_fee": real_time_data.get("taxi_fee", 0)
                 },
                 "detailed_instructions": [],
-                "route_geometry": real_time_data.get("route_data", {}).get("geometry", [])
             }
+            # 경로 좌표 (polyline 형식은 인코딩 문자열, coordinates 형식은 좌표 목록)
+            if geometry_format == "coordinates":
+                enhanced_guide["route_geometry"] = real_time_data.get("route_data", {}).get("geometry", [])
+            else:
+                enhanced_guide["route_polyline"] = real_time_data.get("route_data", {}).get("polyline")
 
             # 상세 안내점 정보
             guide_points = real_time_data.get("route_data", {}).get("guide_points", [])
@@ -1051,6 +984,8 @@ async def get_timemachine_route_info(
     route_id: uuid.UUID,
     departure_time: str | None = None,
     include_comparison: bool = False,
+    zoom: int | None = ZOOM_QUERY,
+    geometry_format: str = GEOMETRY_FORMAT_QUERY,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -1266,7 +1201,7 @@ async def get_timemachine_route_info(
         return {
             "success": True,
             "route_info": route_info,
-            "timemachine_info": timemachine_info,
+            "timemachine_info": _prepare_route_result(timemachine_info, zoom, geometry_format),
             "prediction_info": prediction_info,
             "data_sources": {
                 "timemachine_data": "TMAP API" if route.transport_type == "car" else None,
@@ -1291,6 +1226,8 @@ async def get_enhanced_multi_route(
     request: RouteCalculationRequest,
     include_timemachine: bool = True,
     departure_time: str | None = None,
+    zoom: int | None = ZOOM_QUERY,
+    geometry_format: str = GEOMETRY_FORMAT_QUERY,
     current_user: User = Depends(get_current_user)
 ):
     """프론트엔드 EnhancedTransportCard를 위한 다중 경로 정보"""
@@ -1479,7 +1416,10 @@ async def get_enhanced_multi_route(
 
         return {
             "success": True,
-            "routes": enhanced_routes,
+            "routes": {
+                transport_type: _prepare_route_result(route, zoom, geometry_format)
+                for transport_type, route in enhanced_routes.items()
+            },
             "recommendations": recommendations,
             "context_info": {
                 "distance": distance,
@@ -1510,6 +1450,8 @@ async def get_enhanced_multi_route_batch(
     routes: list[RouteCalculationRequest],
     include_timemachine: bool = True,
     departure_time: str | None = None,
+    zoom: int | None = ZOOM_QUERY,
+    geometry_format: str = GEOMETRY_FORMAT_QUERY,
     current_user: User = Depends(get_current_user)
 ):
     """여러 경로에 대한 배치 처리 API"""
@@ -1631,7 +1573,10 @@ async def get_enhanced_multi_route_batch(
                 return {
                     "success": True,
                     "route_request": route_request.dict(),
-                    "routes": enhanced_routes,
+                    "routes": {
+                        transport_type: _prepare_route_result(route, zoom, geometry_format)
+                        for transport_type, route in enhanced_routes.items()
+                    },
                     "recommendations": recommendations,
                     "context_info": {
                         "distance": distance,
@@ -1682,6 +1627,8 @@ async def get_enhanced_multi_route_batch(
 async def get_timemachine_comparison(
     request: RouteCalculationRequest,
     departure_times: list[str],
+    zoom: int | None = ZOOM_QUERY,
+    geometry_format: str = GEOMETRY_FORMAT_QUERY,
     current_user: User = Depends(get_current_user)
 ):
     """여러 출발 시간대별 경로 비교 (타임머신)"""
@@ -1706,6 +1653,8 @@ async def get_timemachine_comparison(
                 )
 
                 if comparison_result.get("success"):
+                    comparison_result = _prepare_route_result(comparison_result, zoom, geometry_format)
+
                     # 시간 정보 파싱
                     from datetime import datetime
                     try:
@@ -0,0 +1,74 @@
+"""통합 장소 검색 라우터"""
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+
+from app.database import get_db
+from app.schemas.place_search import NearbyPlacesResponse, PlaceSearchResponse
+from app.services.content_registry import CONTENT_TABLES
+from app.services.nearby_service import MAX_RADIUS_KM, nearby_service
+from app.services.place_search_service import SEARCH_TYPES, place_search_service
+
+router = APIRouter(
+    prefix="/search",
+    tags=["search"],
+)
+
+
+@router.get("/places", response_model=PlaceSearchResponse)
+def search_places(
+    q: str = Query(..., min_length=1, max_length=100, description="검색어"),
+    types: str | None = Query(
+        None,
+        description=f"검색할 타입 (쉼표 구분): {', '.join(SEARCH_TYPES)}",
+    ),
+    region_code: str | None = Query(None, description="지역 코드 필터"),
+    limit: int = Query(20, ge=1, le=100, description="결과 개수"),
+    db: Session = Depends(get_db),
+):
+    """
+    관광지/음식점/숙박/문화시설/쇼핑/레저/지역 통합 검색
+
+    트라이그램 유사도 기준으로 정렬되며 오타나 띄어쓰기 차이도 일부 허용합니다.
+    """
+    type_list = [t.strip() for t in types.split(",") if t.strip()] if types else None
+    try:
+        results = place_search_service.search(
+            db, q, types=type_list, region_code=region_code, limit=limit
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return PlaceSearchResponse(query=q, results=results, total=len(results))
+
+
+@router.get("/nearby", response_model=NearbyPlacesResponse)
+def search_nearby_places(
+    latitude: float = Query(..., ge=-90, le=90, description="위도"),
+    longitude: float = Query(..., ge=-180, le=180, description="경도"),
+    radius: float = Query(5.0, gt=0, le=MAX_RADIUS_KM, description="반경 (km)"),
+    types: str | None = Query(
+        None,
+        description=f"콘텐츠 타입 (쉼표 구분): {', '.join(CONTENT_TABLES)}",
+    ),
+    limit: int = Query(20, ge=1, le=100, description="결과 개수"),
+    db: Session = Depends(get_db),
+):
+    """
+    반경 내 관광지/음식점/숙박/문화시설/쇼핑/레저 장소를 거리순으로 조회
+    """
+    type_list = [t.strip() for t in types.split(",") if t.strip()] if types else None
+    try:
+        results = nearby_service.nearby(
+            db, latitude, longitude, radius_km=radius, types=type_list, limit=limit
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return NearbyPlacesResponse(
+        latitude=latitude,
+        longitude=longitude,
+        radius_km=radius,
+        results=results,
+        total=len(results),
+    )
@@ -1,113 +1,29 @@
-import asyncio
 import logging
-import time
 from datetime import datetime
-from typing import Any
 
-import httpx
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy import text
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, HTTPException
 
-from app.config import settings
-from app.database import get_db
+from app.services.health_checker import health_checker
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/system", tags=["system"])
 
 
-async def check_database_connection(db: Session) -> dict[str, Any]:
-    """데이터베이스 연결 상태를 확인합니다."""
-    try:
-        start_time = time.time()
-        # 간단한 쿼리로 DB 연결 테스트
-        result = db.execute(text("SELECT 1")).fetchone()
-        response_time = round((time.time() - start_time) * 1000, 2)
-
-        if result:
-            return {
-                "status": "연결됨",
-                "response_time": f"{response_time}ms"
-            }
-        else:
-            return {
-                "status": "오류",
-                "response_time": f"{response_time}ms"
-            }
-    except Exception as e:
-        logger.error(f"Database connection check failed: {str(e)}")
-        return {
-            "status": f"오류({str(e)})",
-            "response_time": "N/A"
-        }
-
-
-async def check_external_api(url: str, timeout: int = 5) -> dict[str, Any]:
-    """외부 API 상태를 확인합니다."""
-    try:
-        start_time = time.time()
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            response = await client.get(url)
-            response_time = round((time.time() - start_time) * 1000, 2)
-
-            if response.status_code == 200:
-                return {
-                    "status": "정상",
-                    "response_time": f"{response_time}ms"
-                }
-            else:
-                return {
-                    "status": f"오류({response.status_code})",
-                    "response_time": f"{response_time}ms"
-                }
-    except TimeoutError:
-        return {
-            "status": "타임아웃",
-            "response_time": "N/A"
-        }
-    except Exception as e:
-        logger.error(f"External API check failed for {url}: {str(e)}")
-        return {
-            "status": f"오류({str(e)})",
-            "response_time": "N/A"
-        }
-
-
 @router.get("/status")
-async def get_system_status(db: Session = Depends(get_db)):
+async def get_system_status():
     """
     시스템 전체 상태를 확인합니다.
     데이터베이스 연결, 외부 API 상태 등을 종합적으로 체크합니다.
     """
     try:
-        # 데이터베이스 상태 확인
-        db_status = await check_database_connection(db)
-
-        # 외부 API 상태 확인 (병렬 처리)
-        api_checks = []
-
-        # 기상청 API
-        if hasattr(settings, 'KMA_API_URL') and settings.KMA_API_URL:
-            api_checks.append(('weather_api', check_external_api(settings.KMA_API_URL)))
-
-        # 한국관광공사 API
-        if hasattr(settings, 'TOUR_API_BASE_URL') and settings.TOUR_API_BASE_URL:
-            api_checks.append(('tourism_api', check_external_api(settings.TOUR_API_BASE_URL)))
-
-        # Google Places API
-        if hasattr(settings, 'GOOGLE_PLACES_API_URL') and settings.GOOGLE_PLACES_API_URL:
-            api_checks.append(('google_places', check_external_api(settings.GOOGLE_PLACES_API_URL)))
-
-        # Naver Map API (기본 상태 체크용 URL)
-        if hasattr(settings, 'NAVER_MAP_API_URL') and settings.NAVER_MAP_API_URL:
-            api_checks.append(('naver_map', check_external_api(settings.NAVER_MAP_API_URL)))
-
-        # 병렬로 외부 API 체크 실행
-        external_apis = {}
-        if api_checks:
-            api_results = await asyncio.gather(*[check for _, check in api_checks])
-            external_apis = {name: result for (name, _), result in zip(api_checks, api_results, strict=False)}
+        # 백그라운드 헬스 체크의 마지막 결과 사용 (요청마다 DB/외부 API를 호출하지 않음)
+        if health_checker.checked_at is None:
+            await health_checker.refresh()
+        if health_checker.upstreams_checked_at is None:
+            await health_checker.refresh_upstreams()
+        db_status = health_checker.database
+        external_apis = health_checker.external_apis
 
         # 전체 서비스 상태 판단
         service_status = "정상"
@@ -127,7 +43,9 @@ async def get_system_status(db: Session = Depends(get_db)):
             "data": {
                 "service_status": service_status,
                 "database": db_status,
+                "redis": health_checker.redis,
                 "external_apis": external_apis,
+                "checked_at": datetime.fromtimestamp(health_checker.checked_at).isoformat(),
                 "timestamp": datetime.now().isoformat(),
                 "server_info": {
                     "name": "weather-flick-back",
@@ -1,14 +1,22 @@
 # app/routers/travel_courses.py
 from fastapi import APIRouter, Depends, Query, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, undefer_group
 from sqlalchemy.exc import IntegrityError
 from typing import Optional
 from app.database import get_db
+from app.middleware.json_encoder import FastJSONResponse
 from app.models import TravelCourse, TravelCourseLike, TravelCourseSave, User
 from app.schema_models.travel_course import TravelCourseListResponse, TravelCourseDetailResponse
 from app.schema_models.travel_course import TravelCourseResponse
 from app.schemas.travel_course_like import TravelCourseLikeCreate, TravelCourseLikeResponse
 from app.auth import get_current_user_optional, get_current_user
+from app.services.counter_service import counter_service
+from app.utils.pagination import (
+    TOTAL_MODE_PATTERN,
+    InvalidCursorError,
+    count_total,
+    paginate_by_cursor,
+)
 
 router = APIRouter(prefix="/travel-courses", tags=["travel-courses"])
 
@@ -19,9 +27,10 @@ async def get_travel_courses(
     page: int = Query(1, ge=1, description="페이지 번호 (1부터 시작)"),
     limit: int = Query(10, ge=1, le=50, description="페이지당 항목 수 (최대 50)"),
     region_code: Optional[int] = Query(None, description="지역 코드 (숫자 ID, 예: 1=서울, 6=부산)"),
-    liked_only: Optional[bool] = Query(False, description="좋아요한 코스만 조회 (로그인 필요)")
+    liked_only: Optional[bool] = Query(False, description="좋아요한 코스만 조회 (로그인 필요)"),
+    cursor: Optional[str] = Query(None, description="커서 페이지네이션 (첫 페이지는 빈 값, 이후 nextCursor 사용)"),
+    total_mode: Optional[str] = Query(None, pattern=TOTAL_MODE_PATTERN, description="전체 개수 계산 방식 (기본: offset=exact, cursor=estimated)")
 ) -> TravelCourseListResponse:
-    offset = (page - 1) * limit
     query = db.query(TravelCourse)
     
     # 좋아요 필터링 (로그인된 사용자만)
@@ -40,8 +49,25 @@ async def get_travel_courses(
     if region_code:
         query = query.filter(TravelCourse.region_code == str(region_code))
     
-    total_count = query.count()  # 전체 개수
-    courses = query.offset(offset).limit(limit).all()
+    next_cursor = None
+    total_is_estimate = False
+    if cursor is not None:
+        # 커서 모드: (created_at, 기본 키) keyset으로 페이지 깊이와 무관하게 조회
+        total_count, total_is_estimate = count_total(query, total_mode or "estimated")
+        try:
+            courses, next_cursor = paginate_by_cursor(
+                query,
+                TravelCourse.created_at,
+                (TravelCourse.content_id, TravelCourse.region_code, TravelCourse.course_name),
+                cursor,
+                limit,
+            )
+        except InvalidCursorError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    else:
+        offset = (page - 1) * limit
+        total_count, total_is_estimate = count_total(query, total_mode or "exact")  # 전체 개수
+        courses = query.offset(offset).limit(limit).all()
     
     # 로그인된 사용자가 있는 경우 좋아요 및 저장 정보 조회
     user_likes = set()
@@ -57,6 +83,13 @@ async def get_travel_courses(
         ).all()
         user_saves = {save.content_id for save in saved_course_ids}
     
+    # 페이지 내 코스들의 총 좋아요 수 일괄 조회
+    like_counts = {}
+    if current_user and courses:
+        like_counts = counter_service.get_counts(
+            db, "travel_course_likes", [course.content_id for course in courses]
+        )
+    
     # ORM 객체를 Pydantic 모델로 변환 (좋아요 정보 포함)
     course_models = []
     for course in courses:
@@ -68,10 +101,7 @@ async def get_travel_courses(
                 course_dict['is_liked'] = course.content_id in user_likes
                 course_dict['is_saved'] = course.content_id in user_saves
                 # 해당 코스의 총 좋아요 수도 추가
-                total_likes = db.query(TravelCourseLike).filter(
-                    TravelCourseLike.content_id == course.content_id
-                ).count()
-                course_dict['total_likes'] = total_likes
+                course_dict['total_likes'] = like_counts.get(course.content_id, 0)
             else:
                 course_dict['is_liked'] = None  # 비로그인 사용자
                 course_dict['is_saved'] = None  # 비로그인 사용자
@@ -82,7 +112,14 @@ async def get_travel_courses(
             # 로그는 운영 환경에서는 적절한 로깅 시스템으로 대체 필요
             raise HTTPException(status_code=500, detail="데이터 변환 중 오류가 발생했습니다")
     
-    return TravelCourseListResponse(courses=course_models, totalCount=total_count)
+    # course_models는 이미 검증된 dict이므로 response_model 재검증 없이 바로 직렬화
+    return FastJSONResponse({
+        "courses": course_models,
+        "totalCount": total_count,
+        "nextCursor": next_cursor,
+        "hasMore": next_cursor is not None if cursor is not None else None,
+        "totalIsEstimate": total_is_estimate,
+    })
 
 @router.get("/{course_id}", response_model=TravelCourseDetailResponse)
 async def get_travel_course_detail(
@@ -92,7 +129,12 @@ async def get_travel_course_detail(
 ) -> TravelCourseDetailResponse:
     """여행 코스 상세 정보 조회"""
     # 복합 기본키 대응: content_id로만 조회하되 첫 번째 결과 사용
-    course = db.query(TravelCourse).filter(TravelCourse.content_id == course_id).first()
+    course = (
+        db.query(TravelCourse)
+        .options(undefer_group("detail"))  # 상세 응답에 포함되는 JSONB 컬럼
+        .filter(TravelCourse.content_id == course_id)
+        .first()
+    )
 
     if not course:
         raise HTTPException(status_code=404, detail="여행 코스를 찾을 수 없습니다")
@@ -115,9 +157,7 @@ async def get_travel_course_detail(
         ).first() is not None
         
         # 총 좋아요 수
-        total_likes = db.query(TravelCourseLike).filter(
-            TravelCourseLike.content_id == course_id
-        ).count()
+        total_likes = counter_service.get_count(db, "travel_course_likes", course_id)
         
         course_dict['is_liked'] = is_liked
         course_dict['is_saved'] = is_saved
@@ -158,10 +198,10 @@ async def toggle_travel_course_like(
         db.delete(existing_like)
         db.commit()
         
-        # 총 좋아요 수 계산
-        total_likes = db.query(TravelCourseLike).filter(
-            TravelCourseLike.content_id == course_id
-        ).count()
+        # 총 좋아요 수 갱신
+        total_likes = counter_service.increment(
+            db, "travel_course_likes", course_id, -1
+        )
         
         return {
             "message": "좋아요가 취소되었습니다.",
@@ -180,10 +220,10 @@ async def toggle_travel_course_like(
             db.commit()
             db.refresh(db_like)
             
-            # 총 좋아요 수 계산
-            total_likes = db.query(TravelCourseLike).filter(
-                TravelCourseLike.content_id == course_id
-            ).count()
+            # 총 좋아요 수 갱신
+            total_likes = counter_service.increment(
+                db, "travel_course_likes", course_id
+            )
             
             return {
                 "message": "좋아요가 추가되었습니다.",
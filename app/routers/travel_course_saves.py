@@ -5,7 +5,7 @@ from typing import List, Optional
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import and_, func
+from sqlalchemy import and_
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session, joinedload
 
@@ -19,6 +19,7 @@ from app.models import (
     User,
     Base,
 )
+from app.services.counter_service import counter_service
 
 router = APIRouter(
     prefix="/travel-course-saves",
@@ -37,52 +38,74 @@ async def init_table():
         raise HTTPException(status_code=500, detail=f"Table creation failed: {str(e)}")
 
 
+def get_travel_courses_with_stats(
+    db: Session, content_ids: List[str], current_user_id: Optional[UUID] = None
+) -> dict:
+    """여러 여행 코스 정보와 저장 통계를 일괄 조회하는 헬퍼 함수
+
+    content_id를 키로 하는 dict를 반환합니다.
+    """
+    if not content_ids:
+        return {}
+
+    travel_courses = db.query(TravelCourse).filter(
+        TravelCourse.content_id.in_(content_ids)
+    ).all()
+
+    if not travel_courses:
+        return {}
+
+    ids = [travel_course.content_id for travel_course in travel_courses]
+
+    # 저장 수 일괄 조회 (카운터 캐시)
+    saves_counts = counter_service.get_counts(db, "travel_course_saves", ids)
+
+    # 현재 사용자의 저장 여부 확인
+    saved_ids = set()
+    if current_user_id:
+        saved_ids = {
+            row.content_id
+            for row in db.query(TravelCourseSave.content_id).filter(
+                and_(
+                    TravelCourseSave.user_id == current_user_id,
+                    TravelCourseSave.content_id.in_(ids)
+                )
+            )
+        }
+
+    results = {}
+    for travel_course in travel_courses:
+        # 복합 기본키 대응: content_id별 첫 번째 결과 사용
+        if travel_course.content_id in results:
+            continue
+        results[travel_course.content_id] = {
+            "content_id": travel_course.content_id,
+            "course_name": travel_course.course_name,
+            "course_theme": travel_course.course_theme,
+            "region_code": travel_course.region_code,
+            "required_time": travel_course.required_time,
+            "difficulty_level": travel_course.difficulty_level,
+            "schedule": travel_course.schedule,
+            "course_distance": travel_course.course_distance,
+            "address": travel_course.address,
+            "overview": travel_course.overview,
+            "first_image": travel_course.first_image,
+            "latitude": float(travel_course.latitude) if travel_course.latitude else None,
+            "longitude": float(travel_course.longitude) if travel_course.longitude else None,
+            "saves_count": saves_counts.get(travel_course.content_id, 0),
+            "is_saved": travel_course.content_id in saved_ids,
+        }
+
+    return results
+
+
 def get_travel_course_with_stats(
     db: Session, content_id: str, current_user_id: Optional[UUID] = None
 ) -> Optional[dict]:
     """여행 코스 정보와 저장 통계를 함께 가져오는 헬퍼 함수"""
-    travel_course = db.query(TravelCourse).filter(
-        TravelCourse.content_id == content_id
-    ).first()
-    
-    if not travel_course:
-        return None
-    
-    # 저장 수 계산
-    saves_count = db.query(func.count(TravelCourseSave.id)).filter(
-        TravelCourseSave.content_id == content_id
-    ).scalar()
-    
-    result = {
-        "content_id": travel_course.content_id,
-        "course_name": travel_course.course_name,
-        "course_theme": travel_course.course_theme,
-        "region_code": travel_course.region_code,
-        "required_time": travel_course.required_time,
-        "difficulty_level": travel_course.difficulty_level,
-        "schedule": travel_course.schedule,
-        "course_distance": travel_course.course_distance,
-        "address": travel_course.address,
-        "overview": travel_course.overview,
-        "first_image": travel_course.first_image,
-        "latitude": float(travel_course.latitude) if travel_course.latitude else None,
-        "longitude": float(travel_course.longitude) if travel_course.longitude else None,
-        "saves_count": saves_count,
-        "is_saved": False,
-    }
-    
-    # 현재 사용자의 저장 여부 확인
-    if current_user_id:
-        is_saved = db.query(TravelCourseSave).filter(
-            and_(
-                TravelCourseSave.user_id == current_user_id,
-                TravelCourseSave.content_id == content_id
-            )
-        ).first() is not None
-        
-        result["is_saved"] = is_saved
-    
-    return result
+    return get_travel_courses_with_stats(
+        db, [content_id], current_user_id
+    ).get(content_id)
 
 
 @router.post("/", response_model=TravelCourseSaveResponse)
@@ -122,6 +145,7 @@ async def create_travel_course_save(
         db.add(new_save)
         db.commit()
         db.refresh(new_save)
+        counter_service.increment(db, "travel_course_saves", new_save.content_id)
         
         # 응답에 여행 코스 정보 포함
         travel_course_data = get_travel_course_with_stats(
@@ -164,6 +188,7 @@ async def delete_travel_course_save(
     
     db.delete(save)
     db.commit()
+    counter_service.increment(db, "travel_course_saves", content_id, -1)
     
     return {"message": "Save removed successfully"}
 
@@ -182,11 +207,13 @@ async def get_my_travel_course_saves(
         TravelCourseSave.created_at.desc()
     ).offset(skip).limit(limit).all()
     
+    travel_courses_data = get_travel_courses_with_stats(
+        db, [save.content_id for save in saves], current_user.user_id
+    )
+    
     result = []
     for save in saves:
-        travel_course_data = get_travel_course_with_stats(
-            db, save.content_id, current_user.user_id
-        )
+        travel_course_data = travel_courses_data.get(save.content_id)
         result.append(
             TravelCourseSaveResponse(
                 id=save.id,
@@ -22,6 +22,13 @@ from app.utils import (
     create_pagination_info,
     create_standard_response,
 )
+from app.utils.pagination import (
+    TOTAL_MODE_PATTERN,
+    InvalidCursorError,
+    count_total,
+    create_cursor_pagination_info,
+    paginate_by_cursor,
+)
 
 router = APIRouter(
     prefix="/travel-plans",
@@ -132,6 +139,14 @@ async def get_travel_plans(
     page: int = Query(1, ge=1),
     limit: int = Query(20, ge=1, le=100),
     status: str | None = None,
+    cursor: str | None = Query(
+        None, description="커서 페이지네이션 (첫 페이지는 빈 값, 이후 next_cursor 사용)"
+    ),
+    total_mode: str | None = Query(
+        None,
+        pattern=TOTAL_MODE_PATTERN,
+        description="전체 개수 계산 방식 (기본: offset=exact, cursor=estimated)",
+    ),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
@@ -144,12 +159,27 @@ async def get_travel_plans(
         if status:
             query = query.filter(TravelPlan.status == status)
 
-        # 총 개수 조회
-        total = query.count()
-
-        # 페이지네이션 적용
-        offset = (page - 1) * limit
-        plans = query.offset(offset).limit(limit).all()
+        next_cursor = None
+        if cursor is not None:
+            # 커서 모드: (created_at, plan_id) keyset 조회
+            total, total_is_estimate = count_total(query, total_mode or "estimated")
+            try:
+                plans, next_cursor = paginate_by_cursor(
+                    query, TravelPlan.created_at, TravelPlan.plan_id, cursor, limit
+                )
+            except InvalidCursorError as e:
+                return create_error_response(
+                    code="INVALID_CURSOR",
+                    message=str(e),
+                    details=[{"field": "cursor", "message": str(e)}],
+                )
+        else:
+            # 총 개수 조회
+            total, total_is_estimate = count_total(query, total_mode or "exact")
+
+            # 페이지네이션 적용
+            offset = (page - 1) * limit
+            plans = query.offset(offset).limit(limit).all()
 
         # 응답 데이터 구성
         response_data = []
@@ -188,7 +218,14 @@ async def get_travel_plans(
             response_data.append(plan_dict)
 
         # 페이지네이션 정보
-        pagination = create_pagination_info(page, limit, total)
+        if cursor is not None:
+            pagination = create_cursor_pagination_info(
+                limit, next_cursor, total, total_is_estimate
+            )
+        elif total is None:
+            pagination = {"page": page, "limit": limit, "total": None}
+        else:
+            pagination = create_pagination_info(page, limit, total)
 
         return create_standard_response(
             success=True, data=response_data, pagination=pagination
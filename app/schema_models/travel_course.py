@@ -25,7 +25,11 @@ class TravelCourseResponse(BaseModel):
 
 class TravelCourseListResponse(BaseModel):
     courses: List[TravelCourseResponse]
-    totalCount: int
+    totalCount: Optional[int]
+    # 커서 페이지네이션 정보 (cursor 모드에서만 사용)
+    nextCursor: Optional[str] = None
+    hasMore: Optional[bool] = None
+    totalIsEstimate: bool = False
     model_config = ConfigDict(from_attributes=True)
 
 class TravelCourseDetailResponse(BaseModel):
@@ -0,0 +1,59 @@
+"""
+통합 장소 검색 Pydantic 스키마
+"""
+
+from typing import Literal
+
+from pydantic import BaseModel
+
+PlaceType = Literal[
+    "tourist_attraction",
+    "restaurant",
+    "accommodation",
+    "cultural_facility",
+    "shopping",
+    "leisure_sports",
+    "region",
+]
+
+
+class PlaceSearchResult(BaseModel):
+    """장소 검색 결과 항목"""
+    place_type: PlaceType
+    id: str
+    name: str
+    address: str | None = None
+    latitude: float | None = None
+    longitude: float | None = None
+    image_url: str | None = None
+    region_code: str | None = None
+    score: float
+
+
+class PlaceSearchResponse(BaseModel):
+    """장소 검색 응답"""
+    query: str
+    results: list[PlaceSearchResult]
+    total: int
+
+
+class NearbyPlaceResult(BaseModel):
+    """주변 장소 항목"""
+    place_type: PlaceType
+    id: str
+    name: str
+    address: str | None = None
+    latitude: float
+    longitude: float
+    image_url: str | None = None
+    region_code: str | None = None
+    distance_km: float
+
+
+class NearbyPlacesResponse(BaseModel):
+    """주변 장소 검색 응답"""
+    latitude: float
+    longitude: float
+    radius_km: float
+    results: list[NearbyPlaceResult]
+    total: int
@@ -1,3 +1,2 @@
 # services package
-from .realtime_info_service import realtime_info_service
-from .travel_plan_optimizer import travel_plan_optimizer
+# 서비스는 각 모듈에서 직접 import (패키지 import만으로 numpy 등 무거운 의존성을 로드하지 않도록 재노출하지 않음)
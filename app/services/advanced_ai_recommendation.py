@@ -15,7 +15,6 @@ from typing import Any, Dict, List, Optional, Tuple
 from dataclasses import dataclass, asdict
 from enum import Enum
 
-from openai import OpenAI
 from sqlalchemy.orm import Session
 from tenacity import retry, stop_after_attempt, wait_exponential
 
@@ -121,6 +120,9 @@ class AdvancedAIRecommendationService:
         for proxy_var in ['HTTP_PROXY', 'HTTPS_PROXY', 'http_proxy', 'https_proxy', 'ALL_PROXY', 'all_proxy', 'NO_PROXY', 'no_proxy']:
             os.environ.pop(proxy_var, None)
         
+        # openai 패키지는 import 비용이 커서 서비스 생성 시점에 로드
+        from openai import OpenAI
+
         # OpenAI v1.x에서는 proxies 파라미터를 지원하지 않음
         self.client = OpenAI(api_key=settings.openai_api_key)
         
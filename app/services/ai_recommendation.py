@@ -5,7 +5,6 @@ import os
 from datetime import datetime, timedelta
 from typing import Any
 
-from openai import OpenAI
 from sqlalchemy.orm import Session
 
 from app.models import (
@@ -14,6 +13,7 @@ from app.models import (
     PlaceRecommendation,
 )
 from app.services.route_optimizer import RouteOptimizer, Place, RouteConstraints
+from app.utils.lazy import lazy_instance
 from app.utils.timezone_utils import TimezoneUtils
 # KMA Weather Service removed - weather features temporarily disabled
 
@@ -22,13 +22,22 @@ from app.utils.timezone_utils import TimezoneUtils
 for proxy_var in ['HTTP_PROXY', 'HTTPS_PROXY', 'http_proxy', 'https_proxy', 'ALL_PROXY', 'all_proxy', 'NO_PROXY', 'no_proxy']:
     os.environ.pop(proxy_var, None)
 
-try:
-    # OpenAI v1.x에서는 proxies 파라미터를 지원하지 않음
-    # 환경 변수로 설정된 proxy는 이미 제거했으므로 기본 설정으로 초기화
-    client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-except Exception as e:
-    print(f"Failed to initialize OpenAI client: {e}")
-    client = None
+
+
+def _create_openai_client():
+    try:
+        # openai 패키지는 import 비용이 커서 첫 호출 시점에 로드
+        from openai import OpenAI
+
+        # OpenAI v1.x에서는 proxies 파라미터를 지원하지 않음
+        # 환경 변수로 설정된 proxy는 이미 제거했으므로 기본 설정으로 초기화
+        return OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+    except Exception as e:
+        print(f"Failed to initialize OpenAI client: {e}")
+        return None
+
+
+client = lazy_instance(_create_openai_client, "ai_recommendation.client")
 
 
 class AIRecommendationService:
@@ -0,0 +1,488 @@
+"""
+협업 필터링 엔진
+사용자×아이템 상호작용 희소 행렬로부터 이웃(top-K)을 미리 계산하여 추천을 제공
+
+- 입력: 추천 코스 좋아요, 여행지 리뷰/좋아요, 사용자 활동 로그
+- 아이템-아이템 / 사용자-사용자 코사인 유사도 top-K를 NumPy로 오프라인 계산
+- 모델은 프로세스 메모리에 보관하고 Redis로 워커 간 공유 (한 워커만 재계산)
+- 요청 시에는 DB 조회 없이 배열 연산만으로 추천 (수 ms)
+"""
+
+import asyncio
+import base64
+import io
+import logging
+import time
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any
+
+import numpy as np
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.models import DestinationLike, RecommendLike, Review, UserActivityLog
+from app.utils.redis_client import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+# 상호작용 유형별 가중치
+WEIGHT_COURSE_LIKE = 2.0
+WEIGHT_DESTINATION_LIKE = 2.0
+WEIGHT_REVIEW_BASE = 2.5  # 평점 - 2.5 (4점 → 1.5, 5점 → 2.5)
+ACTIVITY_WEIGHTS = {
+    "destination_view": 0.5,
+    "like_added": 2.0,
+    "bookmark_added": 2.0,
+}
+MAX_INTERACTION_WEIGHT = 5.0
+ACTIVITY_LOOKBACK_DAYS = 90
+
+COURSE_ITEM_PREFIX = "course:"
+
+MODEL_KEY = "cf:model"
+MODEL_VERSION_KEY = "cf:model:version"
+MODEL_LOCK_KEY = "cf:model:lock"
+
+REBUILD_INTERVAL_SECONDS = 1800
+# 한 열(아이템/사용자)에서 쌍을 만들 최대 행 수 - 그룹당 최대 쌍 수 = n(n-1)/2 (100 → 4,950)
+MAX_GROUP_SIZE = 100
+SYNC_INTERVAL_SECONDS = 60
+
+
+def _cooccurrence_topk(
+    rows: np.ndarray,
+    cols: np.ndarray,
+    weights: np.ndarray,
+    n_rows: int,
+    k: int,
+    max_group_size: int,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    행 간 코사인 유사도 top-K 계산
+
+    같은 열을 공유하는 행 쌍만 계산하므로 전체 n² 비교가 필요 없습니다.
+    인기 열(예: 매우 많은 사용자가 조회한 아이템)은 max_group_size개 행만
+    무작위 표본으로 사용하여 쌍 수 폭증을 막습니다 (시드 고정으로 재계산 간 결과 유지).
+
+    Returns:
+        (이웃 인덱스 (n_rows, k) - 없으면 -1, 유사도 (n_rows, k))
+    """
+    neighbors = np.full((n_rows, k), -1, dtype=np.int32)
+    similarities = np.zeros((n_rows, k), dtype=np.float32)
+    if len(rows) == 0 or k == 0:
+        return neighbors, similarities
+
+    order = np.argsort(cols, kind="stable")
+    rows, cols, weights = rows[order], cols[order], weights[order]
+    boundaries = np.flatnonzero(np.diff(cols)) + 1
+    starts = np.concatenate(([0], boundaries))
+    ends = np.concatenate((boundaries, [len(cols)]))
+
+    rng = np.random.default_rng(0)
+    pair_src, pair_dst, pair_weight = [], [], []
+    for start, end in zip(starts, ends):
+        size = end - start
+        if size < 2:
+            continue
+        if size > max_group_size:
+            sample = start + rng.choice(size, max_group_size, replace=False)
+            size = max_group_size
+        else:
+            sample = np.arange(start, end)
+        group_rows = rows[sample]
+        group_weights = weights[sample]
+        left, right = np.triu_indices(size, 1)
+        pair_src.append(group_rows[left])
+        pair_dst.append(group_rows[right])
+        pair_weight.append(group_weights[left] * group_weights[right])
+
+    if not pair_src:
+        return neighbors, similarities
+
+    src = np.concatenate(pair_src).astype(np.int64)
+    dst = np.concatenate(pair_dst).astype(np.int64)
+    products = np.concatenate(pair_weight)
+    # 대칭 쌍 추가 후 (src, dst)별 내적 합산
+    keys = np.concatenate((src * n_rows + dst, dst * n_rows + src))
+    unique_keys, inverse = np.unique(keys, return_inverse=True)
+    dots = np.bincount(inverse, weights=np.concatenate((products, products)))
+
+    src = unique_keys // n_rows
+    dst = unique_keys % n_rows
+    norms = np.sqrt(np.bincount(rows, weights=weights**2, minlength=n_rows))
+    sims = dots / (norms[src] * norms[dst])
+
+    # 행별 유사도 내림차순 정렬 후 상위 k개만 유지
+    order = np.lexsort((-sims, src))
+    src, dst, sims = src[order], dst[order], sims[order]
+    group_starts = np.concatenate(([0], np.flatnonzero(np.diff(src)) + 1))
+    group_sizes = np.diff(np.concatenate((group_starts, [len(src)])))
+    rank = np.arange(len(src)) - np.repeat(group_starts, group_sizes)
+    keep = rank < k
+
+    neighbors[src[keep], rank[keep]] = dst[keep]
+    similarities[src[keep], rank[keep]] = sims[keep]
+    return neighbors, similarities
+
+
+@dataclass
+class CollaborativeModel:
+    """사전 계산된 협업 필터링 모델 (배열만 보관)"""
+
+    user_keys: np.ndarray  # (n_users,) 사용자 ID 문자열
+    item_keys: np.ndarray  # (n_items,) 아이템 ID 문자열
+    user_indptr: np.ndarray  # CSR 행 포인터 (n_users + 1,)
+    user_items: np.ndarray  # CSR 열 인덱스
+    user_weights: np.ndarray  # CSR 값
+    item_neighbors: np.ndarray  # (n_items, k)
+    item_similarities: np.ndarray  # (n_items, k)
+    user_neighbors: np.ndarray  # (n_users, k)
+    user_similarities: np.ndarray  # (n_users, k)
+    built_at: float
+
+    def __post_init__(self):
+        self.user_index = {key: i for i, key in enumerate(self.user_keys.tolist())}
+        self.item_index = {key: i for i, key in enumerate(self.item_keys.tolist())}
+        self.course_items = np.flatnonzero(
+            np.char.startswith(self.item_keys.astype(str), COURSE_ITEM_PREFIX)
+        )
+
+    @property
+    def n_users(self) -> int:
+        return len(self.user_keys)
+
+    @property
+    def n_items(self) -> int:
+        return len(self.item_keys)
+
+    @classmethod
+    def build(
+        cls,
+        users: list[str],
+        items: list[str],
+        weights: list[float],
+        k: int = 50,
+        max_group_size: int = MAX_GROUP_SIZE,
+    ) -> "CollaborativeModel":
+        """(사용자, 아이템, 가중치) 목록으로 모델 생성"""
+        user_keys, user_codes = np.unique(np.asarray(users, dtype=str), return_inverse=True)
+        item_keys, item_codes = np.unique(np.asarray(items, dtype=str), return_inverse=True)
+        values = np.asarray(weights, dtype=np.float64)
+
+        # 동일 (사용자, 아이템) 중복 합산 후 상한 적용
+        n_items = len(item_keys)
+        pair_keys, inverse = np.unique(
+            user_codes.astype(np.int64) * max(n_items, 1) + item_codes,
+            return_inverse=True,
+        )
+        values = np.minimum(
+            np.bincount(inverse, weights=values), MAX_INTERACTION_WEIGHT
+        )
+        user_codes = (pair_keys // max(n_items, 1)).astype(np.int32)
+        item_codes = (pair_keys % max(n_items, 1)).astype(np.int32)
+
+        # pair_keys가 사용자 순으로 정렬되어 있으므로 그대로 CSR 구성
+        user_indptr = np.concatenate(
+            ([0], np.cumsum(np.bincount(user_codes, minlength=len(user_keys))))
+        ).astype(np.int64)
+
+        item_neighbors, item_similarities = _cooccurrence_topk(
+            item_codes, user_codes, values, n_items, k, max_group_size
+        )
+        user_neighbors, user_similarities = _cooccurrence_topk(
+            user_codes, item_codes, values, len(user_keys), k, max_group_size
+        )
+
+        return cls(
+            user_keys=user_keys,
+            item_keys=item_keys,
+            user_indptr=user_indptr,
+            user_items=item_codes,
+            user_weights=values.astype(np.float32),
+            item_neighbors=item_neighbors,
+            item_similarities=item_similarities,
+            user_neighbors=user_neighbors,
+            user_similarities=user_similarities,
+            built_at=time.time(),
+        )
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+
+    def user_history(self, user_key: str) -> tuple[np.ndarray, np.ndarray]:
+        """사용자의 (아이템 인덱스, 가중치)"""
+        u = self.user_index.get(user_key)
+        if u is None:
+            return np.empty(0, dtype=np.int32), np.empty(0, dtype=np.float32)
+        start, end = self.user_indptr[u], self.user_indptr[u + 1]
+        return self.user_items[start:end], self.user_weights[start:end]
+
+    def recommend_items(
+        self,
+        user_key: str,
+        limit: int = 20,
+        exclude_seen: bool = True,
+        include_courses: bool = True,
+    ) -> list[tuple[str, float]]:
+        """아이템-아이템 이웃 기반 추천 (아이템 ID, 점수) - include_courses=False면 여행지만"""
+        items, weights = self.user_history(user_key)
+        if len(items) == 0:
+            return []
+
+        neighbors = self.item_neighbors[items]
+        contributions = self.item_similarities[items] * weights[:, None]
+        mask = neighbors >= 0
+        scores = np.bincount(
+            neighbors[mask], weights=contributions[mask], minlength=self.n_items
+        )
+        if exclude_seen:
+            scores[items] = 0.0
+        if not include_courses:
+            # 상위 limit개를 고르기 전에 제외해야 코스 때문에 여행지 추천이 줄지 않음
+            scores[self.course_items] = 0.0
+        return self._top(scores, self.item_keys, limit)
+
+    def similar_items(self, item_key: str, limit: int = 20) -> list[tuple[str, float]]:
+        """유사 아이템 (아이템 ID, 코사인 유사도)"""
+        i = self.item_index.get(item_key)
+        if i is None:
+            return []
+        return [
+            (str(self.item_keys[n]), float(s))
+            for n, s in zip(self.item_neighbors[i][:limit], self.item_similarities[i][:limit])
+            if n >= 0
+        ]
+
+    def similar_users(self, user_key: str, limit: int = 10) -> list[tuple[str, float]]:
+        """유사 사용자 (사용자 ID, 코사인 유사도)"""
+        u = self.user_index.get(user_key)
+        if u is None:
+            return []
+        return [
+            (str(self.user_keys[n]), float(s))
+            for n, s in zip(self.user_neighbors[u][:limit], self.user_similarities[u][:limit])
+            if n >= 0
+        ]
+
+    @staticmethod
+    def _top(scores: np.ndarray, keys: np.ndarray, limit: int) -> list[tuple[str, float]]:
+        candidates = np.flatnonzero(scores > 0)
+        if len(candidates) == 0:
+            return []
+        if len(candidates) > limit:
+            part = np.argpartition(-scores[candidates], limit - 1)[:limit]
+            candidates = candidates[part]
+        candidates = candidates[np.argsort(-scores[candidates], kind="stable")]
+        return [(str(keys[i]), float(scores[i])) for i in candidates]
+
+    # ------------------------------------------------------------------
+    # 직렬화 (Redis 공유용)
+    # ------------------------------------------------------------------
+
+    def to_bytes(self) -> bytes:
+        buffer = io.BytesIO()
+        np.savez_compressed(
+            buffer,
+            user_keys=self.user_keys,
+            item_keys=self.item_keys,
+            user_indptr=self.user_indptr,
+            user_items=self.user_items,
+            user_weights=self.user_weights,
+            item_neighbors=self.item_neighbors,
+            item_similarities=self.item_similarities,
+            user_neighbors=self.user_neighbors,
+            user_similarities=self.user_similarities,
+            built_at=np.array(self.built_at),
+        )
+        return buffer.getvalue()
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "CollaborativeModel":
+        with np.load(io.BytesIO(data), allow_pickle=False) as arrays:
+            fields = {name: arrays[name] for name in arrays.files}
+        fields["built_at"] = float(fields["built_at"])
+        return cls(**fields)
+
+
+def load_interactions(db: Session) -> tuple[list[str], list[str], list[float]]:
+    """원본 테이블에서 (사용자, 아이템, 가중치) 상호작용을 GROUP BY 집계로 적재"""
+    users: list[str] = []
+    items: list[str] = []
+    weights: list[float] = []
+
+    def add(user_id, item_id, weight):
+        if user_id is None or item_id is None or weight <= 0:
+            return
+        users.append(str(user_id))
+        items.append(str(item_id))
+        weights.append(float(weight))
+
+    for user_id, course_id in db.query(RecommendLike.user_id, RecommendLike.course_id):
+        add(user_id, f"{COURSE_ITEM_PREFIX}{course_id}", WEIGHT_COURSE_LIKE)
+
+    for user_id, destination_id in db.query(
+        DestinationLike.user_id, DestinationLike.destination_id
+    ):
+        add(user_id, destination_id, WEIGHT_DESTINATION_LIKE)
+
+    for user_id, destination_id, rating in (
+        db.query(Review.user_id, Review.destination_id, func.max(Review.rating))
+        .filter(Review.destination_id.isnot(None), Review.rating >= 4)
+        .group_by(Review.user_id, Review.destination_id)
+    ):
+        add(user_id, destination_id, rating - WEIGHT_REVIEW_BASE)
+
+    since = datetime.now() - timedelta(days=ACTIVITY_LOOKBACK_DAYS)
+    destination_id = UserActivityLog.activity_data["destination_id"].astext
+    activity_rows = (
+        db.query(
+            UserActivityLog.user_id,
+            UserActivityLog.activity_type,
+            destination_id,
+            func.count(),
+        )
+        .filter(
+            UserActivityLog.activity_type.in_(list(ACTIVITY_WEIGHTS)),
+            UserActivityLog.created_at >= since,
+            destination_id.isnot(None),
+        )
+        .group_by(UserActivityLog.user_id, UserActivityLog.activity_type, destination_id)
+    )
+    for user_id, activity_type, item_id, count in activity_rows:
+        add(user_id, item_id, ACTIVITY_WEIGHTS[activity_type] * count)
+
+    return users, items, weights
+
+
+class CollaborativeFilteringEngine:
+    """협업 필터링 모델 보관 및 주기적 재계산"""
+
+    def __init__(self, k: int = 50):
+        self.k = k
+        self.model: CollaborativeModel | None = None
+        self._version: str | None = None
+
+    def _get_redis(self):
+        return get_redis_client().get_client()
+
+    def rebuild(self, db: Session) -> CollaborativeModel:
+        """DB에서 상호작용을 읽어 모델을 다시 계산하고 Redis에 게시"""
+        started = time.perf_counter()
+        users, items, weights = load_interactions(db)
+        model = CollaborativeModel.build(users, items, weights, k=self.k)
+        self.model = model
+        self._version = uuid.uuid4().hex
+        logger.info(
+            f"협업 필터링 모델 생성: 사용자 {model.n_users}명, 아이템 {model.n_items}개, "
+            f"상호작용 {len(model.user_items)}건 ({time.perf_counter() - started:.2f}s)"
+        )
+
+        redis_client = self._get_redis()
+        if redis_client:
+            try:
+                encoded = base64.b64encode(model.to_bytes()).decode()
+                pipe = redis_client.pipeline()
+                pipe.set(MODEL_KEY, encoded)
+                pipe.set(MODEL_VERSION_KEY, self._version)
+                pipe.execute()
+            except Exception as e:
+                logger.warning(f"협업 필터링 모델 Redis 게시 실패: {e}")
+        return model
+
+    def sync_from_redis(self) -> bool:
+        """Redis에 더 새로운 모델이 있으면 적재"""
+        redis_client = self._get_redis()
+        if not redis_client:
+            return False
+        try:
+            version = redis_client.get(MODEL_VERSION_KEY)
+            if not version or version == self._version:
+                return False
+            encoded = redis_client.get(MODEL_KEY)
+            if not encoded:
+                return False
+            self.model = CollaborativeModel.from_bytes(base64.b64decode(encoded))
+            self._version = version
+            logger.info("협업 필터링 모델을 Redis에서 적재했습니다.")
+            return True
+        except Exception as e:
+            logger.warning(f"협업 필터링 모델 Redis 적재 실패: {e}")
+            return False
+
+    def try_acquire_rebuild(self) -> bool:
+        """재계산 담당 워커 선정 (Redis 미사용 시 항상 담당)"""
+        redis_client = self._get_redis()
+        if not redis_client:
+            return True
+        try:
+            return bool(
+                redis_client.set(
+                    MODEL_LOCK_KEY, "1", nx=True, ex=REBUILD_INTERVAL_SECONDS - 5
+                )
+            )
+        except Exception:
+            return True
+
+    # ------------------------------------------------------------------
+    # 조회 (모델이 아직 없으면 빈 결과)
+    # ------------------------------------------------------------------
+
+    def recommend_items(
+        self, user_id: Any, limit: int = 20, include_courses: bool = True
+    ) -> list[tuple[str, float]]:
+        if self.model is None:
+            return []
+        return self.model.recommend_items(str(user_id), limit, include_courses=include_courses)
+
+    def similar_users(self, user_id: Any, limit: int = 10) -> list[tuple[str, float]]:
+        if self.model is None:
+            return []
+        return self.model.similar_users(str(user_id), limit)
+
+    def similar_items(self, item_id: Any, limit: int = 20) -> list[tuple[str, float]]:
+        if self.model is None:
+            return []
+        return self.model.similar_items(str(item_id), limit)
+
+
+# 전역 인스턴스
+collaborative_engine = CollaborativeFilteringEngine()
+
+
+def _run_rebuild() -> None:
+    from app.database import SessionLocal
+
+    db = SessionLocal()
+    try:
+        collaborative_engine.rebuild(db)
+    finally:
+        db.close()
+
+
+# 백그라운드 작업으로 모델 주기적 재계산/동기화
+async def refresh_collaborative_model():
+    """한 워커만 주기적으로 모델을 재계산하고 나머지는 Redis에서 적재"""
+    elapsed = REBUILD_INTERVAL_SECONDS
+    while True:
+        try:
+            if collaborative_engine.model is None:
+                await asyncio.to_thread(collaborative_engine.sync_from_redis)
+
+            if elapsed >= REBUILD_INTERVAL_SECONDS:
+                elapsed = 0
+                if collaborative_engine.try_acquire_rebuild():
+                    await asyncio.to_thread(_run_rebuild)
+            else:
+                await asyncio.to_thread(collaborative_engine.sync_from_redis)
+
+            await asyncio.sleep(SYNC_INTERVAL_SECONDS)
+            elapsed += SYNC_INTERVAL_SECONDS
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"협업 필터링 모델 갱신 작업 오류: {e}")
+            await asyncio.sleep(SYNC_INTERVAL_SECONDS)
+            elapsed += SYNC_INTERVAL_SECONDS
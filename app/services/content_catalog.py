@@ -0,0 +1,426 @@
+"""
+통합 콘텐츠 카탈로그
+content_id → (콘텐츠 타입, 요약 정보, 태그) 프로세스 내 인덱스
+
+- 관광지/음식점/숙박/문화시설/쇼핑/레저 + 여행지(destinations)를 한 번에 적재
+- 이후에는 테이블별 동기화 시각(last_sync_at/created_at) 이후 변경분만 증분 반영
+- 주기마다 한 워커만 DB 변경 여부를 확인해 Redis에 동기화 상태(워터마크)를 게시하고,
+  나머지 워커는 게시된 워터마크가 앞서 있을 때만 증분 반영 (Redis 미사용 시 워커별 주기 반영)
+- 적재 전이거나 인덱스에 없는 ID는 UNION ALL 한 번으로 DB에서 조회
+- 태그는 카테고리 코드명(category_codes), 음식 종류, 숙박 유형 등에서 생성
+"""
+
+import asyncio
+import json
+import logging
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import Float, String, cast, func, literal, null, select, union_all
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Session
+
+from app.models import CategoryCode, Destination
+from app.services.content_registry import CONTENT_TABLES
+from app.utils.redis_client import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+DESTINATION_TYPE = "destination"
+
+# 콘텐츠 타입별 태그 원천 컬럼: (카테고리 코드 컬럼, 그대로 쓰는 라벨 컬럼)
+TAG_FIELDS: dict[str, tuple[tuple[str, ...], tuple[str, ...]]] = {
+    "tourist_attraction": (("category_code",), ("category_name",)),
+    "restaurant": (("category_code", "sub_category_code"), ("cuisine_type",)),
+    "accommodation": (("category_code", "sub_category_code"), ("accommodation_type",)),
+    "cultural_facility": (("category_code", "sub_category_code"), ()),
+    "shopping": (("category_code", "sub_category_code"), ()),
+    "leisure_sports": (("category_code", "sub_category_code"), ()),
+}
+# 증분 반영 기준 컬럼 (last_sync_at이 없는 테이블은 created_at)
+SYNC_FIELDS = {"accommodation": "created_at"}
+
+TAG_SLOTS = 3
+REFRESH_INTERVAL_SECONDS = 300
+FULL_RELOAD_INTERVAL_SECONDS = 6 * 3600  # 삭제 반영용 전체 재적재 주기
+# 워커 간 공유 동기화 상태 (전체 재적재 시각, 테이블별 워터마크)
+SYNC_STATE_KEY = "catalog:sync_state"
+
+
+@dataclass(frozen=True, slots=True)
+class CatalogEntry:
+    """카탈로그 항목 (요약 정보)"""
+
+    content_id: str
+    content_type: str
+    name: str
+    address: str | None
+    region_code: str | None
+    latitude: float | None
+    longitude: float | None
+    image_url: str | None
+    rating: float | None
+    tags: tuple[str, ...]
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "id": self.content_id,
+            "name": self.name,
+            "type": self.content_type,
+            "address": self.address or "",
+            "region_code": self.region_code,
+            "latitude": self.latitude,
+            "longitude": self.longitude,
+            "image_url": self.image_url,
+            "rating": self.rating if self.rating is not None else 4.0,
+            "tags": list(self.tags),
+        }
+
+
+def _tag_columns(model, content_type: str) -> list:
+    code_fields, label_fields = TAG_FIELDS.get(content_type, ((), ()))
+    columns = [
+        getattr(model, field).label(f"code_{i}") for i, field in enumerate(code_fields)
+    ]
+    columns += [null().label(f"code_{i}") for i in range(len(code_fields), TAG_SLOTS)]
+    columns += [
+        cast(getattr(model, field), String).label(f"label_{i}")
+        for i, field in enumerate(label_fields)
+    ]
+    columns += [null().label(f"label_{i}") for i in range(len(label_fields), TAG_SLOTS)]
+    return columns
+
+
+def _content_select(content_type: str):
+    table = CONTENT_TABLES[content_type]
+    model = table.model
+    image_column = table.image_column
+    return select(
+        literal(content_type).label("content_type"),
+        cast(model.content_id, String).label("content_id"),
+        table.name_column.label("name"),
+        model.address.label("address"),
+        model.region_code.label("region_code"),
+        cast(model.latitude, Float).label("latitude"),
+        cast(model.longitude, Float).label("longitude"),
+        (image_column if image_column is not None else literal(None, String)).label(
+            "image_url"
+        ),
+        cast(null(), Float).label("rating"),
+        literal(None, JSONB).label("tag_list"),
+        getattr(model, SYNC_FIELDS.get(content_type, "last_sync_at")).label("synced_at"),
+        *_tag_columns(model, content_type),
+    )
+
+
+def _destination_select():
+    return select(
+        literal(DESTINATION_TYPE).label("content_type"),
+        cast(Destination.destination_id, String).label("content_id"),
+        Destination.name.label("name"),
+        func.concat_ws(" ", Destination.province, Destination.region).label("address"),
+        literal(None, String).label("region_code"),
+        cast(Destination.latitude, Float).label("latitude"),
+        cast(Destination.longitude, Float).label("longitude"),
+        Destination.image_url.label("image_url"),
+        Destination.rating.label("rating"),
+        Destination.tags.label("tag_list"),
+        Destination.created_at.label("synced_at"),
+        *[null().label(f"code_{i}") for i in range(TAG_SLOTS)],
+        Destination.category.label("label_0"),
+        *[null().label(f"label_{i}") for i in range(1, TAG_SLOTS)],
+    )
+
+
+def _source_selects() -> dict[str, Any]:
+    """카탈로그 원천별 (select, 기본 키 컬럼, 동기화 컬럼)"""
+    sources = {}
+    for content_type, table in CONTENT_TABLES.items():
+        model = table.model
+        sources[content_type] = (
+            _content_select(content_type),
+            model.content_id,
+            getattr(model, SYNC_FIELDS.get(content_type, "last_sync_at")),
+        )
+    sources[DESTINATION_TYPE] = (
+        _destination_select(),
+        Destination.destination_id,
+        Destination.created_at,
+    )
+    return sources
+
+
+class ContentCatalog:
+    """프로세스 단위 콘텐츠 카탈로그"""
+
+    def __init__(self, refresh_interval: int = REFRESH_INTERVAL_SECONDS):
+        self.refresh_interval = refresh_interval
+        self._lock = threading.Lock()
+        self._entries: dict[str, CatalogEntry] = {}
+        self._category_names: dict[str, str] = {}
+        self._watermarks: dict[str, Any] = {}
+        self._loaded_at = 0.0
+        self._refreshed_at = 0.0
+        # 따르고 있는 클러스터 전체 재적재 시각 (공유 동기화 상태 기준)
+        self._reloaded_at: float | None = None
+        # 적재/증분 반영 시마다 증가 (파생 인덱스 재생성 판단용)
+        self.version = 0
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._loaded_at > 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def snapshot(self) -> list[CatalogEntry]:
+        """현재 적재된 전체 항목 목록"""
+        return list(self._entries.values())
+
+    # ------------------------------------------------------------------
+    # 적재 및 갱신
+    # ------------------------------------------------------------------
+
+    def _to_entry(self, row) -> CatalogEntry:
+        tags: list[str] = []
+        for i in range(TAG_SLOTS):
+            code = row[f"code_{i}"]
+            if code and code in self._category_names:
+                tags.append(self._category_names[code])
+            label = row[f"label_{i}"]
+            if label:
+                tags.append(label)
+        if isinstance(row["tag_list"], list):
+            tags.extend(str(tag) for tag in row["tag_list"] if tag)
+
+        return CatalogEntry(
+            content_id=row["content_id"],
+            content_type=row["content_type"],
+            name=row["name"],
+            address=row["address"],
+            region_code=row["region_code"],
+            latitude=row["latitude"],
+            longitude=row["longitude"],
+            image_url=row["image_url"],
+            rating=row["rating"],
+            tags=tuple(dict.fromkeys(tags)),
+        )
+
+    def _load_category_names(self, db: Session) -> None:
+        self._category_names = dict(
+            db.query(CategoryCode.category_code, CategoryCode.category_name).all()
+        )
+
+    def load(self, db: Session) -> None:
+        """전체 적재 (새 딕셔너리를 만든 뒤 교체)"""
+        started = time.perf_counter()
+        self._load_category_names(db)
+        entries: dict[str, CatalogEntry] = {}
+        watermarks: dict[str, Any] = {}
+        for content_type, (stmt, _, _) in _source_selects().items():
+            latest = None
+            for row in db.execute(stmt).mappings():
+                entry = self._to_entry(row)
+                # 여러 테이블에 같은 ID가 있으면 먼저 적재된 타입 우선 (기존 조회 순서와 동일)
+                entries.setdefault(entry.content_id, entry)
+                synced_at = row["synced_at"]
+                if synced_at is not None and (latest is None or synced_at > latest):
+                    latest = synced_at
+            watermarks[content_type] = latest
+
+        self._entries = entries
+        self._watermarks = watermarks
+        self.version += 1
+        self._loaded_at = self._refreshed_at = time.monotonic()
+        logger.info(
+            f"콘텐츠 카탈로그 적재 완료: {len(entries)}건 "
+            f"({time.perf_counter() - started:.2f}s)"
+        )
+
+    def refresh(self, db: Session) -> int:
+        """동기화 시각 기준 변경분만 반영, 반영 건수 반환"""
+        updated = 0
+        for content_type, (stmt, _, sync_column) in _source_selects().items():
+            watermark = self._watermarks.get(content_type)
+            if watermark is not None:
+                stmt = stmt.where(sync_column > watermark)
+            latest = watermark
+            for row in db.execute(stmt).mappings():
+                entry = self._to_entry(row)
+                existing = self._entries.get(entry.content_id)
+                if existing is None or existing.content_type == entry.content_type:
+                    self._entries[entry.content_id] = entry
+                    updated += 1
+                synced_at = row["synced_at"]
+                if synced_at is not None and (latest is None or synced_at > latest):
+                    latest = synced_at
+            self._watermarks[content_type] = latest
+
+        self._refreshed_at = time.monotonic()
+        if updated:
+            self.version += 1
+            logger.info(f"콘텐츠 카탈로그 증분 반영: {updated}건")
+        return updated
+
+    def _sync_local(self, db: Session) -> None:
+        now = time.monotonic()
+        if not self.is_loaded or now - self._loaded_at >= FULL_RELOAD_INTERVAL_SECONDS:
+            self.load(db)
+        elif now - self._refreshed_at >= self.refresh_interval:
+            self.refresh(db)
+
+    def _sync_leader(self, db: Session, redis_client, state: dict | None) -> None:
+        now = time.time()
+        reloaded_at = state["reloaded_at"] if state else None
+        if reloaded_at is None or now - reloaded_at >= FULL_RELOAD_INTERVAL_SECONDS:
+            self.load(db)
+            reloaded_at = now
+        elif not self.is_loaded or self._reloaded_at != reloaded_at:
+            self.load(db)
+        else:
+            self.refresh(db)
+        self._reloaded_at = reloaded_at
+
+        watermarks = {
+            content_type: watermark.isoformat() if watermark is not None else None
+            for content_type, watermark in self._watermarks.items()
+        }
+        try:
+            redis_client.set(
+                SYNC_STATE_KEY,
+                json.dumps({"reloaded_at": reloaded_at, "watermarks": watermarks}),
+                ex=FULL_RELOAD_INTERVAL_SECONDS * 2,
+            )
+        except Exception as e:
+            logger.warning(f"콘텐츠 카탈로그 동기화 상태 게시 실패: {e}")
+
+    def _is_behind(self, watermarks: dict[str, str | None]) -> bool:
+        """게시된 워터마크가 이 워커보다 앞선 테이블이 있는지 여부"""
+        for content_type, published in watermarks.items():
+            if published is None:
+                continue
+            local = self._watermarks.get(content_type)
+            if local is None or datetime.fromisoformat(published) > local:
+                return True
+        return False
+
+    def _sync_follower(self, db: Session, state: dict | None) -> None:
+        if state is None:
+            # 담당 워커가 아직 게시 전이면 첫 적재만 수행
+            if not self.is_loaded:
+                self.load(db)
+            return
+        if not self.is_loaded or self._reloaded_at != state["reloaded_at"]:
+            self.load(db)
+            self._reloaded_at = state["reloaded_at"]
+        elif self._is_behind(state["watermarks"]):
+            self.refresh(db)
+
+    def sync(self, db: Session, leader: bool = True) -> None:
+        """필요 시 전체 적재 또는 증분 반영 (leader: 이번 주기 DB 확인 담당 워커)"""
+        with self._lock:
+            redis_client = get_redis_client().get_client()
+            if not redis_client:
+                self._sync_local(db)
+                return
+            try:
+                raw = redis_client.get(SYNC_STATE_KEY)
+                state = json.loads(raw) if raw else None
+            except Exception as e:
+                logger.warning(f"콘텐츠 카탈로그 동기화 상태 조회 실패: {e}")
+                self._sync_local(db)
+                return
+            if leader:
+                self._sync_leader(db, redis_client, state)
+            else:
+                self._sync_follower(db, state)
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+
+    def _fetch_missing(self, db: Session, content_ids: list[str]) -> dict[str, CatalogEntry]:
+        """인덱스에 없는 ID를 UNION ALL 한 번으로 조회"""
+        if not self._category_names:
+            self._load_category_names(db)
+        destination_ids = []
+        for content_id in content_ids:
+            try:
+                destination_ids.append(uuid.UUID(content_id))
+            except ValueError:
+                continue
+
+        branches = []
+        for content_type, (stmt, id_column, _) in _source_selects().items():
+            # 원본 컬럼 타입 그대로 비교해야 기본 키 인덱스를 사용
+            if content_type == DESTINATION_TYPE:
+                if destination_ids:
+                    branches.append(stmt.where(id_column.in_(destination_ids)))
+            else:
+                branches.append(stmt.where(id_column.in_(content_ids)))
+        found: dict[str, CatalogEntry] = {}
+        for row in db.execute(union_all(*branches)).mappings():
+            entry = self._to_entry(row)
+            found.setdefault(entry.content_id, entry)
+        return found
+
+    def get_many(
+        self, db: Session, content_ids: list[Any]
+    ) -> dict[str, CatalogEntry]:
+        """여러 ID를 한 번에 조회 (적재된 항목은 DB 조회 없음)"""
+        keys = list(dict.fromkeys(str(content_id) for content_id in content_ids if content_id))
+        result = {key: self._entries[key] for key in keys if key in self._entries}
+        missing = [key for key in keys if key not in result]
+        if missing:
+            try:
+                fetched = self._fetch_missing(db, missing)
+            except Exception as e:
+                logger.error(f"콘텐츠 카탈로그 조회 실패: {e}")
+                db.rollback()
+                fetched = {}
+            if self.is_loaded:
+                self._entries.update(fetched)
+            result.update(fetched)
+        return result
+
+    def get(self, db: Session, content_id: Any) -> CatalogEntry | None:
+        """단일 ID 조회"""
+        return self.get_many(db, [content_id]).get(str(content_id))
+
+
+# 전역 인스턴스
+content_catalog = ContentCatalog()
+
+
+def _run_catalog_sync() -> None:
+    from app.database import SessionLocal
+
+    leader = get_redis_client().acquire_job_lock("catalog:refresh", REFRESH_INTERVAL_SECONDS - 5)
+    db = SessionLocal()
+    try:
+        content_catalog.sync(db, leader)
+    finally:
+        db.close()
+
+    # 카탈로그가 바뀌었으면 태그 인덱스도 요청 경로 밖에서 미리 생성
+    from app.services.content_scoring import content_scorer
+
+    content_scorer.refresh()
+
+
+# 백그라운드 작업으로 카탈로그 적재 및 증분 반영
+async def refresh_content_catalog():
+    """시작 시 전체 적재 후 주기적으로 변경분 반영"""
+    while True:
+        try:
+            await asyncio.to_thread(_run_catalog_sync)
+            await asyncio.sleep(REFRESH_INTERVAL_SECONDS)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"콘텐츠 카탈로그 갱신 작업 오류: {e}")
+            await asyncio.sleep(60)
@@ -0,0 +1,74 @@
+"""
+콘텐츠 테이블 레지스트리
+관광지/음식점/숙박 등 한국관광공사 콘텐츠 테이블의 공통 컬럼 매핑
+"""
+
+from dataclasses import dataclass
+
+from app.models import (
+    Accommodation,
+    CulturalFacility,
+    LeisureSports,
+    Restaurant,
+    Shopping,
+    TouristAttraction,
+)
+
+
+@dataclass(frozen=True)
+class ContentTable:
+    """콘텐츠 테이블별 컬럼 매핑"""
+
+    content_type: str  # API 응답에 사용되는 타입명
+    label: str  # 한글 표시명
+    model: type
+    name_field: str
+    image_field: str | None
+
+    @property
+    def table_name(self) -> str:
+        return self.model.__tablename__
+
+    @property
+    def name_column(self):
+        return getattr(self.model, self.name_field)
+
+    @property
+    def image_column(self):
+        return getattr(self.model, self.image_field) if self.image_field else None
+
+
+CONTENT_TABLES: dict[str, ContentTable] = {
+    table.content_type: table
+    for table in (
+        ContentTable(
+            "tourist_attraction", "관광지", TouristAttraction, "attraction_name", "image_url"
+        ),
+        ContentTable("restaurant", "음식점", Restaurant, "restaurant_name", "first_image"),
+        ContentTable(
+            "accommodation", "숙박", Accommodation, "accommodation_name", None
+        ),
+        ContentTable(
+            "cultural_facility", "문화시설", CulturalFacility, "facility_name", "first_image"
+        ),
+        ContentTable("shopping", "쇼핑", Shopping, "shop_name", "first_image"),
+        ContentTable(
+            "leisure_sports", "레저스포츠", LeisureSports, "facility_name", "first_image"
+        ),
+    )
+}
+
+
+def resolve_content_types(types: str | None) -> list[ContentTable]:
+    """쉼표로 구분된 타입 문자열을 ContentTable 목록으로 변환 (없으면 전체)"""
+    if not types:
+        return list(CONTENT_TABLES.values())
+
+    resolved = []
+    for content_type in (t.strip() for t in types.split(",")):
+        if not content_type:
+            continue
+        if content_type not in CONTENT_TABLES:
+            raise ValueError(f"지원하지 않는 콘텐츠 타입입니다: {content_type}")
+        resolved.append(CONTENT_TABLES[content_type])
+    return resolved
@@ -0,0 +1,162 @@
+"""
+콘텐츠 기반 점수 계산
+콘텐츠 카탈로그 전체를 태그 희소 행렬로 인코딩하여 벡터 연산으로 점수 계산
+
+- 태그를 어휘(vocabulary)로 인턴하여 정수 ID로 변환
+- 장소별 태그를 CSR 희소 행렬(indptr, indices)로 보관
+- 사용자 태그 가중치 벡터와의 행렬-벡터 곱 한 번으로 전체 카탈로그 점수 계산
+- argpartition으로 상위 k개만 정렬
+"""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+
+import numpy as np
+
+from app.services.content_catalog import CatalogEntry, content_catalog
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class TagIndex:
+    """카탈로그 태그 희소 행렬"""
+
+    entries: list[CatalogEntry]
+    vocabulary: dict[str, int]
+    indptr: np.ndarray  # (n_entries + 1,)
+    indices: np.ndarray  # 태그 ID
+    rows: np.ndarray  # indices와 같은 길이의 행 번호 (bincount용)
+    catalog_version: int
+
+    @classmethod
+    def build(cls, entries: list[CatalogEntry], catalog_version: int = 0) -> "TagIndex":
+        vocabulary: dict[str, int] = {}
+        counts = np.zeros(len(entries), dtype=np.int64)
+        indices: list[int] = []
+        for i, entry in enumerate(entries):
+            for tag in entry.tags:
+                indices.append(vocabulary.setdefault(tag, len(vocabulary)))
+            counts[i] = len(entry.tags)
+
+        indptr = np.concatenate(([0], np.cumsum(counts))).astype(np.int64)
+        return cls(
+            entries=entries,
+            vocabulary=vocabulary,
+            indptr=indptr,
+            indices=np.asarray(indices, dtype=np.int32),
+            rows=np.repeat(np.arange(len(entries), dtype=np.int32), counts),
+            catalog_version=catalog_version,
+        )
+
+    def weight_vector(self, tag_weights: dict[str, float]) -> np.ndarray:
+        """태그 가중치 딕셔너리를 어휘 순서의 벡터로 변환 (어휘에 없는 태그는 무시)"""
+        vector = np.zeros(len(self.vocabulary), dtype=np.float64)
+        for tag, weight in tag_weights.items():
+            tag_id = self.vocabulary.get(tag)
+            if tag_id is not None:
+                vector[tag_id] += weight
+        return vector
+
+    def scores(self, tag_weights: dict[str, float]) -> np.ndarray:
+        """전체 카탈로그 점수 (행렬-벡터 곱)"""
+        vector = self.weight_vector(tag_weights)
+        if len(self.indices) == 0 or not vector.any():
+            return np.zeros(len(self.entries), dtype=np.float64)
+        return np.bincount(
+            self.rows, weights=vector[self.indices], minlength=len(self.entries)
+        )
+
+    def top(
+        self, tag_weights: dict[str, float], limit: int = 100
+    ) -> list[tuple[CatalogEntry, float]]:
+        """점수 상위 limit개 (점수 0 이하는 제외)"""
+        scores = self.scores(tag_weights)
+        candidates = np.flatnonzero(scores > 0)
+        if len(candidates) == 0:
+            return []
+        if len(candidates) > limit:
+            part = np.argpartition(-scores[candidates], limit - 1)[:limit]
+            candidates = candidates[part]
+        candidates = candidates[np.argsort(-scores[candidates], kind="stable")]
+        return [(self.entries[i], float(scores[i])) for i in candidates]
+
+
+class ContentScorer:
+    """
+    카탈로그 변경 시에만 태그 인덱스를 다시 만드는 점수 계산기
+
+    인덱스는 카탈로그 동기화 작업에서 미리 생성하고, 요청 시점에 오래된 인덱스를 발견하면
+    백그라운드 스레드에서 다시 만드는 동안 이전 인덱스로 응답합니다 (요청 경로에서 생성하지 않음).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._index: TagIndex | None = None
+
+    def _is_stale(self, index: TagIndex | None) -> bool:
+        return index is None or index.catalog_version != content_catalog.version
+
+    def refresh(self) -> TagIndex | None:
+        """카탈로그가 바뀌었으면 태그 인덱스를 다시 생성 (다른 스레드가 생성 중이면 건너뜀)"""
+        if not content_catalog.is_loaded:
+            return None
+        if not self._lock.acquire(blocking=False):
+            return self._index
+
+        try:
+            index = self._index
+            if self._is_stale(index):
+                started = time.perf_counter()
+                version = content_catalog.version
+                index = TagIndex.build(content_catalog.snapshot(), version)
+                # 완성된 인덱스만 교체 (생성 중에는 이전 인덱스로 응답)
+                self._index = index
+                logger.info(
+                    f"태그 인덱스 생성: 장소 {len(index.entries)}개, "
+                    f"태그 {len(index.vocabulary)}종 ({time.perf_counter() - started:.2f}s)"
+                )
+            return index
+        finally:
+            self._lock.release()
+
+    def _refresh_in_background(self) -> None:
+        try:
+            self.refresh()
+        except Exception as e:
+            logger.error(f"태그 인덱스 생성 실패: {e}")
+
+    def get_index(self) -> TagIndex | None:
+        """현재 태그 인덱스 (카탈로그 미적재 또는 첫 인덱스 생성 전에는 None)"""
+        if not content_catalog.is_loaded:
+            return None
+
+        index = self._index
+        if self._is_stale(index) and not self._lock.locked():
+            threading.Thread(
+                target=self._refresh_in_background, name="tag-index-refresh", daemon=True
+            ).start()
+        return index
+
+    def recommend(
+        self, tag_weights: dict[str, float], limit: int = 100
+    ) -> list[dict]:
+        """태그 가중치 기반 상위 장소"""
+        index = self.get_index()
+        if index is None or not tag_weights:
+            return []
+
+        results = []
+        for entry, score in index.top(tag_weights, limit):
+            results.append({
+                **entry.to_dict(),
+                "score": score,
+                "matched_tags": [tag for tag in entry.tags if tag in tag_weights],
+            })
+        return results
+
+
+# 전역 인스턴스
+content_scorer = ContentScorer()
@@ -0,0 +1,455 @@
+"""
+좋아요/저장 카운터 서비스
+Redis HINCRBY 기반 카운터 캐시 + entity_counters 테이블 write-behind
+
+- 좋아요/저장 추가·취소 시 Redis 해시에 증감만 기록 (COUNT 쿼리 없음)
+- 주기적으로 변경된 카운터를 entity_counters 테이블에 일괄 반영
+- 정합성 보정(reconcile) 작업으로 원본 테이블 기준 재집계
+- 목록 조회 시 여러 엔티티의 카운트를 한 번에 조회
+"""
+
+import asyncio
+import logging
+from collections.abc import Iterable
+from typing import Any
+
+import redis
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.models import (
+    DestinationLike,
+    DestinationSave,
+    EntityCounter,
+    TravelCourseLike,
+    TravelCourseSave,
+)
+from app.utils.redis_client import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+# 카운터 종류별 원본 테이블 컬럼 (집계 기준)
+COUNTER_SOURCES = {
+    "travel_course_likes": TravelCourseLike.content_id,
+    "travel_course_saves": TravelCourseSave.content_id,
+    "destination_likes": DestinationLike.destination_id,
+    "destination_saves": DestinationSave.destination_id,
+}
+
+COUNTER_HASH_KEY = "counter:{counter_type}"
+COUNTER_DIRTY_KEY = "counter:dirty:{counter_type}"
+# 정합성 보정 중 사용하는 임시 키 (재집계 해시, 보정 대상 dirty 목록)
+COUNTER_REBUILD_KEY = "counter:rebuild:{counter_type}"
+COUNTER_RECONCILING_KEY = "counter:reconciling:{counter_type}"
+# 보정 중 변경된 엔티티 목록 (보정 중에만 존재, 표시용 항목으로 키를 유지)
+COUNTER_TOUCHED_KEY = "counter:touched:{counter_type}"
+TOUCHED_MARKER = "*"
+
+# 캐시에 값이 있을 때만 증감하고 dirty 목록에 추가 (없으면 nil → 원본 기준 값으로 다시 호출해 초기화)
+# 보정 중이면 보정 중 변경 목록에도 추가 (캐시 교체 전에 원본 기준으로 다시 집계)
+INCREMENT_SCRIPT = """
+local value
+if ARGV[3] then
+    redis.call('HSETNX', KEYS[1], ARGV[1], ARGV[3])
+    value = redis.call('HGET', KEYS[1], ARGV[1])
+elseif redis.call('HEXISTS', KEYS[1], ARGV[1]) == 1 then
+    value = redis.call('HINCRBY', KEYS[1], ARGV[1], ARGV[2])
+else
+    return false
+end
+redis.call('SADD', KEYS[2], ARGV[1])
+if redis.call('EXISTS', KEYS[3]) == 1 then
+    redis.call('SADD', KEYS[3], ARGV[1])
+end
+return value
+"""
+
+# 백그라운드 동기화 주기 (초)
+FLUSH_INTERVAL_SECONDS = 30
+RECONCILE_INTERVAL_SECONDS = 3600
+# 캐시 교체 재시도 횟수 (교체 직전 증감이 들어오면 다시 집계)
+REBUILD_MAX_ATTEMPTS = 5
+
+
+class CounterService:
+    """좋아요/저장 카운터 관리 서비스"""
+
+    def __init__(self, flush_batch_size: int = 500):
+        self.flush_batch_size = flush_batch_size
+        self._increment_script = None
+
+    def _get_redis(self):
+        return get_redis_client().get_client()
+
+    @staticmethod
+    def _source_column(counter_type: str):
+        if counter_type not in COUNTER_SOURCES:
+            raise ValueError(f"지원하지 않는 카운터 종류입니다: {counter_type}")
+        return COUNTER_SOURCES[counter_type]
+
+    def _count_from_source(
+        self, db: Session, counter_type: str, entity_ids: list[Any]
+    ) -> dict[str, int]:
+        """원본 테이블에서 GROUP BY 한 번으로 카운트 집계"""
+        column = self._source_column(counter_type)
+        rows = (
+            db.query(column, func.count())
+            .filter(column.in_(entity_ids))
+            .group_by(column)
+            .all()
+        )
+        counts = {str(entity_id): 0 for entity_id in entity_ids}
+        counts.update({str(entity_id): count for entity_id, count in rows})
+        return counts
+
+    def _store_counts(
+        self, db: Session, counter_type: str, counts: dict[str, int]
+    ) -> None:
+        """entity_counters 테이블에 카운트 upsert (커밋 포함)"""
+        if not counts:
+            return
+        stmt = insert(EntityCounter).values(
+            [
+                {"counter_type": counter_type, "entity_id": entity_id, "value": value}
+                for entity_id, value in counts.items()
+            ]
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[EntityCounter.counter_type, EntityCounter.entity_id],
+            set_={"value": stmt.excluded.value, "updated_at": func.now()},
+        )
+        db.execute(stmt)
+        db.commit()
+
+    def increment(
+        self, db: Session, counter_type: str, entity_id: Any, delta: int = 1
+    ) -> int:
+        """
+        좋아요/저장 변경을 카운터에 반영하고 변경 후 값을 반환
+
+        원본 테이블 변경이 커밋된 뒤 호출해야 합니다.
+        Redis에 값이 없으면 원본 테이블 기준으로 초기화합니다.
+        """
+        field = str(entity_id)
+        hash_key = COUNTER_HASH_KEY.format(counter_type=counter_type)
+        dirty_key = COUNTER_DIRTY_KEY.format(counter_type=counter_type)
+        touched_key = COUNTER_TOUCHED_KEY.format(counter_type=counter_type)
+
+        client = self._get_redis()
+        if client:
+            try:
+                if self._increment_script is None:
+                    self._increment_script = client.register_script(INCREMENT_SCRIPT)
+                keys = [hash_key, dirty_key, touched_key]
+                # 확인과 증감을 한 번에 실행 (확인 후 다른 요청의 재설정으로 값이 유실되지 않도록)
+                value = self._increment_script(keys=keys, args=[field, delta], client=client)
+                if value is None:
+                    # 캐시 미스: 커밋된 원본 기준 값으로 초기화 (이번 변경 포함)
+                    initial = self._count_from_source(db, counter_type, [entity_id])[field]
+                    value = self._increment_script(
+                        keys=keys, args=[field, delta, initial], client=client
+                    )
+                return max(int(value), 0)
+            except Exception as e:
+                logger.warning(f"카운터 캐시 갱신 실패 [{counter_type}:{field}]: {e}")
+
+        # Redis 미사용 시 원본 기준 값을 카운터 테이블에 직접 기록
+        counts = self._count_from_source(db, counter_type, [entity_id])
+        try:
+            self._store_counts(db, counter_type, counts)
+        except Exception as e:
+            db.rollback()
+            logger.error(f"카운터 테이블 갱신 실패 [{counter_type}:{field}]: {e}")
+        return counts[field]
+
+    def get_count(self, db: Session, counter_type: str, entity_id: Any) -> int:
+        """단일 엔티티 카운트 조회"""
+        return self.get_counts(db, counter_type, [entity_id]).get(str(entity_id), 0)
+
+    def get_counts(
+        self, db: Session, counter_type: str, entity_ids: Iterable[Any]
+    ) -> dict[str, int]:
+        """
+        여러 엔티티의 카운트를 일괄 조회
+
+        Redis HMGET → entity_counters → 원본 GROUP BY 순으로 조회하며,
+        각 단계는 최대 한 번의 왕복만 발생합니다. 반환 키는 str(entity_id)입니다.
+        """
+        self._source_column(counter_type)
+        ids_by_field: dict[str, Any] = {}
+        for entity_id in entity_ids:
+            if entity_id is not None:
+                ids_by_field.setdefault(str(entity_id), entity_id)
+        if not ids_by_field:
+            return {}
+
+        fields = list(ids_by_field)
+        hash_key = COUNTER_HASH_KEY.format(counter_type=counter_type)
+        counts: dict[str, int] = {}
+
+        client = self._get_redis()
+        if client:
+            try:
+                for field, value in zip(fields, client.hmget(hash_key, fields)):
+                    if value is not None:
+                        counts[field] = max(int(value), 0)
+            except Exception as e:
+                logger.warning(f"카운터 캐시 조회 실패 [{counter_type}]: {e}")
+                client = None
+
+        missing = [field for field in fields if field not in counts]
+        if not missing:
+            return counts
+
+        # 카운터 테이블 조회
+        rows = (
+            db.query(EntityCounter.entity_id, EntityCounter.value)
+            .filter(
+                EntityCounter.counter_type == counter_type,
+                EntityCounter.entity_id.in_(missing),
+            )
+            .all()
+        )
+        loaded = {entity_id: max(value, 0) for entity_id, value in rows}
+
+        # 카운터 테이블에도 없는 엔티티는 원본에서 집계
+        not_loaded = [field for field in missing if field not in loaded]
+        if not_loaded:
+            loaded.update(
+                self._count_from_source(
+                    db, counter_type, [ids_by_field[field] for field in not_loaded]
+                )
+            )
+
+        counts.update(loaded)
+
+        if client:
+            try:
+                pipe = client.pipeline()
+                for field, value in loaded.items():
+                    pipe.hsetnx(hash_key, field, value)
+                pipe.execute()
+            except Exception as e:
+                logger.warning(f"카운터 캐시 초기화 실패 [{counter_type}]: {e}")
+
+        return counts
+
+    def flush(self, db: Session) -> int:
+        """변경된 카운터를 entity_counters 테이블에 일괄 반영 (write-behind)"""
+        client = self._get_redis()
+        if not client:
+            return 0
+
+        flushed = 0
+        for counter_type in COUNTER_SOURCES:
+            hash_key = COUNTER_HASH_KEY.format(counter_type=counter_type)
+            dirty_key = COUNTER_DIRTY_KEY.format(counter_type=counter_type)
+
+            while True:
+                fields = client.spop(dirty_key, self.flush_batch_size)
+                if not fields:
+                    break
+                try:
+                    values = client.hmget(hash_key, fields)
+                    counts = {
+                        field: max(int(value), 0)
+                        for field, value in zip(fields, values)
+                        if value is not None
+                    }
+                    self._store_counts(db, counter_type, counts)
+                    flushed += len(counts)
+                except Exception:
+                    db.rollback()
+                    # 다음 주기에 다시 반영되도록 dirty 목록 복구
+                    client.sadd(dirty_key, *fields)
+                    raise
+
+        if flushed:
+            logger.debug(f"카운터 {flushed}개 DB 반영 완료")
+        return flushed
+
+    def _rebuild_cache(
+        self, db: Session, client, counter_type: str, exact: dict[str, int]
+    ) -> None:
+        """
+        재집계 값으로 Redis 해시를 교체
+
+        임시 키에 새 해시를 만든 뒤 RENAME으로 한 번에 교체하므로 조회 중 빈 해시가 보이지 않습니다.
+        보정 시작 후 변경된 엔티티(보정 중 변경 목록)는 원본에서 다시 집계하고, dirty 목록에 추가해 다음 반영에 포함합니다.
+        카운터 해시를 WATCH하므로 다시 집계한 뒤 교체 전에 들어온 증감이 있으면 처음부터 다시 집계합니다.
+        """
+        hash_key = COUNTER_HASH_KEY.format(counter_type=counter_type)
+        dirty_key = COUNTER_DIRTY_KEY.format(counter_type=counter_type)
+        rebuild_key = COUNTER_REBUILD_KEY.format(counter_type=counter_type)
+        reconciling_key = COUNTER_RECONCILING_KEY.format(counter_type=counter_type)
+        touched_key = COUNTER_TOUCHED_KEY.format(counter_type=counter_type)
+
+        client.delete(rebuild_key)
+        items = list(exact.items())
+        for offset in range(0, len(items), self.flush_batch_size):
+            client.hset(rebuild_key, mapping=dict(items[offset : offset + self.flush_batch_size]))
+        rebuilt = bool(items)
+
+        for _ in range(REBUILD_MAX_ATTEMPTS):
+            with client.pipeline(transaction=True) as pipe:
+                try:
+                    pipe.watch(hash_key, touched_key)
+                    # WATCH 이후 집계하므로 이전 증감은 원본에 반영된 상태로 집계됨
+                    # (dirty 목록은 다른 워커의 반영 작업이 꺼내 갈 수 있어 보정 중 변경 목록 사용)
+                    late = [
+                        field for field in pipe.smembers(touched_key) if field != TOUCHED_MARKER
+                    ]
+                    for offset in range(0, len(late), self.flush_batch_size):
+                        client.hset(
+                            rebuild_key,
+                            mapping=self._count_from_source(
+                                db, counter_type, late[offset : offset + self.flush_batch_size]
+                            ),
+                        )
+                        rebuilt = True
+
+                    pipe.multi()
+                    if rebuilt:
+                        pipe.rename(rebuild_key, hash_key)
+                    else:
+                        pipe.delete(hash_key)
+                    if late:
+                        # 다른 워커가 보정 전 값으로 반영했을 수 있어 다음 반영에 다시 포함
+                        pipe.sadd(dirty_key, *late)
+                    # 보정에 포함된 dirty 항목만 제거
+                    pipe.delete(reconciling_key, touched_key)
+                    pipe.execute()
+                    return
+                except redis.WatchError:
+                    # 교체 전에 증감이 들어옴 → 보정 중 변경 항목을 다시 집계
+                    continue
+
+        client.delete(rebuild_key)
+        raise RuntimeError(f"카운터 캐시 교체 중 변경이 계속되어 중단합니다: {counter_type}")
+
+    def _restore_dirty(self, client, counter_type: str) -> None:
+        """보정하지 못한 dirty 항목을 다음 반영에 포함되도록 복구"""
+        dirty_key = COUNTER_DIRTY_KEY.format(counter_type=counter_type)
+        reconciling_key = COUNTER_RECONCILING_KEY.format(counter_type=counter_type)
+        try:
+            pipe = client.pipeline(transaction=True)
+            pipe.sunionstore(dirty_key, [dirty_key, reconciling_key])
+            pipe.delete(reconciling_key, COUNTER_TOUCHED_KEY.format(counter_type=counter_type))
+            pipe.execute()
+        except Exception as e:
+            logger.warning(f"카운터 dirty 목록 복구 실패 [{counter_type}]: {e}")
+
+    def reconcile(self, db: Session, counter_type: str | None = None) -> int:
+        """원본 테이블 기준으로 카운터 전체 재집계 (정합성 보정)"""
+        counter_types = [counter_type] if counter_type else list(COUNTER_SOURCES)
+        client = self._get_redis()
+        corrected = 0
+
+        for current_type in counter_types:
+            cache_client = client
+            if cache_client:
+                try:
+                    # 지금까지의 dirty 항목은 이번 재집계로 보정 (이후 변경분은 새 dirty 목록에 기록)
+                    pipe = cache_client.pipeline(transaction=True)
+                    pipe.sunionstore(
+                        COUNTER_RECONCILING_KEY.format(counter_type=current_type),
+                        [
+                            COUNTER_RECONCILING_KEY.format(counter_type=current_type),
+                            COUNTER_DIRTY_KEY.format(counter_type=current_type),
+                        ],
+                    )
+                    pipe.delete(COUNTER_DIRTY_KEY.format(counter_type=current_type))
+                    # 이후 변경분은 보정 중 변경 목록에도 기록 (비정상 종료 대비 만료 설정)
+                    touched_key = COUNTER_TOUCHED_KEY.format(counter_type=current_type)
+                    pipe.delete(touched_key)
+                    pipe.sadd(touched_key, TOUCHED_MARKER)
+                    pipe.expire(touched_key, RECONCILE_INTERVAL_SECONDS)
+                    pipe.execute()
+                except Exception as e:
+                    logger.warning(f"카운터 보정 대상 확보 실패 [{current_type}]: {e}")
+                    cache_client = None
+
+            try:
+                column = self._source_column(current_type)
+                exact = {
+                    str(entity_id): count
+                    for entity_id, count in db.query(column, func.count())
+                    .group_by(column)
+                    .all()
+                }
+
+                stored = dict(
+                    db.query(EntityCounter.entity_id, EntityCounter.value)
+                    .filter(EntityCounter.counter_type == current_type)
+                    .all()
+                )
+                # 원본에서 사라진 엔티티는 0으로 보정
+                for entity_id in stored:
+                    exact.setdefault(entity_id, 0)
+
+                changed = {
+                    entity_id: value
+                    for entity_id, value in exact.items()
+                    if stored.get(entity_id) != value
+                }
+                for offset in range(0, len(changed), self.flush_batch_size):
+                    chunk = dict(
+                        list(changed.items())[offset : offset + self.flush_batch_size]
+                    )
+                    self._store_counts(db, current_type, chunk)
+                corrected += len(changed)
+            except Exception:
+                if cache_client:
+                    self._restore_dirty(cache_client, current_type)
+                raise
+
+            if cache_client:
+                try:
+                    self._rebuild_cache(db, cache_client, current_type, exact)
+                except Exception as e:
+                    logger.warning(f"카운터 캐시 재설정 실패 [{current_type}]: {e}")
+                    self._restore_dirty(cache_client, current_type)
+
+        logger.info(f"카운터 정합성 보정 완료: {corrected}개 수정")
+        return corrected
+
+
+# 전역 인스턴스
+counter_service = CounterService()
+
+
+def _run_counter_job(job_name: str) -> None:
+    from app.database import SessionLocal
+
+    db = SessionLocal()
+    try:
+        getattr(counter_service, job_name)(db)
+    finally:
+        db.close()
+
+
+# 백그라운드 작업으로 카운터 주기적 동기화
+async def sync_counters():
+    """백그라운드에서 카운터 write-behind 및 정합성 보정 수행"""
+    elapsed = 0
+    while True:
+        try:
+            await asyncio.sleep(FLUSH_INTERVAL_SECONDS)
+            elapsed += FLUSH_INTERVAL_SECONDS
+            await asyncio.to_thread(_run_counter_job, "flush")
+
+            if elapsed >= RECONCILE_INTERVAL_SECONDS:
+                elapsed = 0
+                # 정합성 보정은 주기마다 한 워커만 수행
+                if await asyncio.to_thread(
+                    get_redis_client().acquire_job_lock,
+                    "counter:reconcile",
+                    RECONCILE_INTERVAL_SECONDS - FLUSH_INTERVAL_SECONDS,
+                ):
+                    await asyncio.to_thread(_run_counter_job, "reconcile")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"카운터 동기화 백그라운드 작업 오류: {e}")
+            await asyncio.sleep(60)
@@ -0,0 +1,216 @@
+"""
+데이터셋 버전 스탬프
+자주 바뀌지 않는 카탈로그 데이터(지역, 카테고리, 여행 코스)의 변경 여부를 주기적으로 확인하여 버전으로 보관
+조건부 요청(ETag/Last-Modified) 처리 시 DB 조회 없이 이 버전만 비교
+
+- 버전: pg_stat_user_tables의 테이블별 누적 삽입/수정/삭제 수 + 최종 수정 시각의 해시
+  → 수정 시각을 갱신하지 않는 배치 수정도 감지, 확인 비용은 데이터 크기와 무관
+- 주기마다 한 워커만 DB에서 확인해 Redis에 게시하고 나머지 워커는 게시된 버전을 적재
+  → 워커 간 버전(ETag)이 같고 DB 확인 비용은 워커 수와 무관 (Redis 미사용 시 워커별 확인)
+- 코드에 고정된 데이터(날씨 지원 도시 등)는 테이블 없이 등록하고 첫 응답 본문 해시를 버전으로 사용
+- 확인 작업이 멈춰 버전이 오래되면 버전을 모르는 것으로 처리 (캐시 검증 생략)
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from dataclasses import dataclass
+from datetime import datetime
+
+from sqlalchemy import func, text
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models import CategoryCode, Region, TravelCourse
+from app.utils.redis_client import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+# 데이터셋 이름 → 원본 테이블 모델 (빈 튜플은 코드에 고정된 데이터)
+DATASETS: dict[str, tuple] = {
+    "regions": (Region,),
+    "categories": (CategoryCode,),
+    "travel_courses": (TravelCourse,),
+    "weather_cities": (),
+}
+
+# 워커 간 공유 버전 (주기 확인 담당 워커가 게시)
+SHARED_VERSIONS_KEY = "dataset:versions"
+
+# 최종 수정 시각 계산에 쓰는 컬럼 (모델에 있는 것만 사용)
+TIMESTAMP_COLUMNS = ("updated_at", "created_at", "last_sync_at")
+
+TABLE_STATS_SQL = text(
+    "SELECT relname, n_tup_ins, n_tup_upd, n_tup_del "
+    "FROM pg_stat_user_tables WHERE relname = ANY(:names)"
+)
+
+
+@dataclass(frozen=True, slots=True)
+class DatasetVersion:
+    """데이터셋 버전"""
+
+    version: str
+    last_modified: datetime | None = None
+
+
+def _digest(*parts) -> str:
+    return hashlib.md5(repr(parts).encode()).hexdigest()[:16]
+
+
+def _last_modified(db: Session, model) -> datetime | None:
+    columns = [getattr(model, name) for name in TIMESTAMP_COLUMNS if hasattr(model, name)]
+    if not columns:
+        return None
+    values = db.query(*(func.max(column) for column in columns)).one()
+    values = [value for value in values if value is not None]
+    return max(values) if values else None
+
+
+class DatasetVersionTracker:
+    """데이터셋별 버전 스탬프 (워커 프로세스 메모리)"""
+
+    def __init__(
+        self,
+        datasets: dict[str, tuple] = DATASETS,
+        interval: float = settings.dataset_version_interval,
+    ):
+        self.datasets = datasets
+        self.interval = interval
+        self._versions: dict[str, DatasetVersion] = {}
+        self.checked_at: float | None = None
+
+    @property
+    def max_age(self) -> float:
+        # 확인 주기를 몇 번 놓쳐야 오래된 버전으로 판단
+        return self.interval * 3
+
+    def is_static(self, name: str) -> bool:
+        return name in self.datasets and not self.datasets[name]
+
+    def get(self, name: str) -> DatasetVersion | None:
+        """현재 버전 (모르거나 오래되었으면 None)"""
+        if self.is_static(name):
+            return self._versions.get(name)
+        if self.checked_at is None or time.time() - self.checked_at > self.max_age:
+            return None
+        return self._versions.get(name)
+
+    def set_static(self, name: str, body: bytes) -> DatasetVersion:
+        """고정 데이터 버전을 응답 본문으로 결정 (프로세스 수명 동안 유지)"""
+        version = self._versions.get(name)
+        if version is None:
+            version = DatasetVersion(hashlib.md5(body).hexdigest()[:16])
+            self._versions[name] = version
+        return version
+
+    def refresh(self, db: Session) -> None:
+        """테이블 통계와 최종 수정 시각으로 버전 갱신"""
+        table_names = [
+            model.__tablename__ for models in self.datasets.values() for model in models
+        ]
+        stats = {
+            row.relname: (row.n_tup_ins, row.n_tup_upd, row.n_tup_del)
+            for row in db.execute(TABLE_STATS_SQL, {"names": table_names})
+        }
+
+        versions = {}
+        for name, models in self.datasets.items():
+            if not models:
+                continue
+            parts = []
+            last_modified = None
+            for model in models:
+                modified = _last_modified(db, model)
+                parts.append((model.__tablename__, stats.get(model.__tablename__), modified))
+                if modified is not None and (last_modified is None or modified > last_modified):
+                    last_modified = modified
+            versions[name] = DatasetVersion(_digest(*parts), last_modified)
+
+        for name, version in versions.items():
+            previous = self._versions.get(name)
+            if previous is not None and previous.version != version.version:
+                logger.info(f"데이터셋 변경 감지: {name} ({previous.version} → {version.version})")
+            self._versions[name] = version
+        self.checked_at = time.time()
+
+    def publish(self) -> None:
+        """확인한 버전을 다른 워커가 적재하도록 Redis에 게시"""
+        redis_client = get_redis_client().get_client()
+        if not redis_client or self.checked_at is None:
+            return
+        payload = {
+            "checked_at": self.checked_at,
+            "versions": {
+                name: [
+                    version.version,
+                    version.last_modified.isoformat() if version.last_modified else None,
+                ]
+                for name, version in self._versions.items()
+                if not self.is_static(name)
+            },
+        }
+        try:
+            redis_client.set(SHARED_VERSIONS_KEY, json.dumps(payload), ex=int(self.max_age))
+        except Exception as e:
+            logger.warning(f"데이터셋 버전 게시 실패: {e}")
+
+    def sync_from_redis(self) -> bool:
+        """게시된 버전 적재 (게시된 버전이 없으면 False)"""
+        redis_client = get_redis_client().get_client()
+        if not redis_client:
+            return False
+        try:
+            raw = redis_client.get(SHARED_VERSIONS_KEY)
+            if not raw:
+                return False
+            payload = json.loads(raw)
+        except Exception as e:
+            logger.warning(f"데이터셋 버전 적재 실패: {e}")
+            return False
+        for name, (version, last_modified) in payload["versions"].items():
+            self._versions[name] = DatasetVersion(
+                version, datetime.fromisoformat(last_modified) if last_modified else None
+            )
+        # 게시 시각을 유지해 확인 작업이 멈추면 모든 워커에서 오래된 버전으로 판단
+        self.checked_at = payload["checked_at"]
+        return True
+
+
+# 전역 인스턴스
+dataset_versions = DatasetVersionTracker()
+
+
+def _run_version_refresh() -> None:
+    # 담당 워커가 아니면 게시된 버전 사용 (아직 게시 전이면 직접 확인)
+    leader = get_redis_client().acquire_job_lock(
+        "dataset:versions", max(int(dataset_versions.interval) - 1, 1)
+    )
+    if not leader and dataset_versions.sync_from_redis():
+        return
+
+    from app.database import SessionLocal
+
+    db = SessionLocal()
+    try:
+        dataset_versions.refresh(db)
+    finally:
+        db.close()
+    if leader:
+        dataset_versions.publish()
+
+
+# 백그라운드 작업으로 데이터셋 버전 갱신
+async def track_dataset_versions():
+    """시작 시 확인 후 주기적으로 버전 갱신"""
+    while True:
+        try:
+            await asyncio.to_thread(_run_version_refresh)
+            await asyncio.sleep(dataset_versions.interval)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"데이터셋 버전 확인 작업 오류: {e}")
+            await asyncio.sleep(60)
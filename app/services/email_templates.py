@@ -0,0 +1,106 @@
+"""
+이메일 HTML 템플릿 렌더러
+app/templates/email의 Jinja2 템플릿을 시작 시 한 번 컴파일해 두고 수신자별 변수만 렌더링
+
+- 컴파일된 템플릿은 정적 HTML 조각을 상수 문자열로 가지므로 렌더링 시에는 변수 치환만 수행
+- 바이트코드 캐시로 프로세스 재시작/워커 추가 시 파싱·컴파일 비용 제거
+- 변수가 없는 템플릿은 렌더링 결과 자체가 정적 조각이므로 한 번만 렌더링해 보관
+  (수신자별 결과 HTML은 개인 정보가 담기므로 캐시하지 않음)
+"""
+
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Any
+
+from jinja2 import (
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+    Template,
+    meta,
+    select_autoescape,
+)
+from markupsafe import Markup, escape
+
+logger = logging.getLogger(__name__)
+
+TEMPLATE_DIR = Path(__file__).resolve().parent.parent / "templates" / "email"
+BYTECODE_CACHE_DIR = Path(
+    os.getenv("EMAIL_TEMPLATE_CACHE_DIR", Path(tempfile.gettempdir()) / "weather-flick-email-templates")
+)
+
+
+def nl2br(value: Any) -> Markup:
+    """줄바꿈을 <br>로 변환 (내용은 이스케이프)"""
+    return Markup("<br>").join(escape(str(value)).split("\n"))
+
+
+def _bytecode_cache() -> FileSystemBytecodeCache | None:
+    try:
+        BYTECODE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        return FileSystemBytecodeCache(str(BYTECODE_CACHE_DIR))
+    except OSError as e:
+        logger.warning(f"Email template bytecode cache disabled: {e}")
+        return None
+
+
+class EmailTemplateRenderer:
+    """사전 컴파일된 이메일 템플릿 렌더러"""
+
+    def __init__(self, template_dir: Path = TEMPLATE_DIR):
+        self.env = Environment(
+            loader=FileSystemLoader(str(template_dir)),
+            autoescape=select_autoescape(["html"]),
+            bytecode_cache=_bytecode_cache(),
+            auto_reload=False,
+        )
+        self.env.filters["nl2br"] = nl2br
+        # 템플릿 목록은 실행 중 바뀌지 않으므로(auto_reload=False) 한 번만 조회
+        self._template_names = frozenset(self.env.list_templates())
+        self._templates: dict[str, Template] = {}
+        self._static_html: dict[str, str] = {}
+
+    def _compile(self, name: str) -> Template:
+        template = self.env.get_template(name)
+        ast = self.env.parse(self.env.loader.get_source(self.env, name)[0])
+        # 다른 템플릿을 포함/상속하지 않고 변수도 없으면 결과가 항상 같음
+        if not meta.find_undeclared_variables(ast) and not any(
+            True for _ in meta.find_referenced_templates(ast)
+        ):
+            self._static_html[name] = template.render()
+        self._templates[name] = template
+        return template
+
+    def precompile(self) -> int:
+        """모든 템플릿 컴파일, 컴파일한 템플릿 수 반환"""
+        for name in sorted(self._template_names):
+            if name.endswith(".html"):
+                self._compile(name)
+        logger.info(
+            f"Email templates compiled: {len(self._templates)} "
+            f"({len(self._static_html)} static)"
+        )
+        return len(self._templates)
+
+    def get_template(self, name: str) -> Template:
+        template = self._templates.get(name)
+        if template is None:
+            template = self._compile(name)
+        return template
+
+    def has_template(self, name: str) -> bool:
+        return name in self._template_names
+
+    def render(self, name: str, **context: Any) -> str:
+        """템플릿 렌더링 (변수가 없는 템플릿은 보관한 HTML 반환)"""
+        template = self.get_template(name)
+        html = self._static_html.get(name)
+        if html is not None:
+            return html
+        return template.render(**context)
+
+
+# 전역 인스턴스
+email_template_renderer = EmailTemplateRenderer()
@@ -3,17 +3,182 @@ FCM (Firebase Cloud Messaging) 서비스 v2
 Firebase Admin SDK를 사용하여 FCM HTTP v1 API로 푸시 알림 전송
 """
 
+import asyncio
+import functools
 import json
 import logging
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, Optional, List
 from datetime import datetime
 import firebase_admin
-from firebase_admin import credentials, messaging
+from firebase_admin import credentials, exceptions, messaging
 from firebase_admin.messaging import Message, Notification, AndroidConfig, APNSConfig, WebpushConfig
 
+from app.utils.redis_client import get_redis_client
+
 logger = logging.getLogger(__name__)
 
+# FCM 멀티캐스트 1회 요청당 최대 토큰 수
+MULTICAST_BATCH_SIZE = 500
+
+# firebase-admin의 동기 HTTP 호출을 실행할 전용 스레드 풀 크기
+FCM_MAX_WORKERS = int(os.getenv("FCM_MAX_WORKERS", "16"))
+
+# 무효 토큰 일괄 비활성화 기준
+PRUNE_BATCH_SIZE = 500
+PRUNE_INTERVAL_SECONDS = 30
+# 워커별로 모은 무효 토큰을 한 워커가 비활성화하도록 공유하는 Redis 집합
+SHARED_INVALID_TOKENS_KEY = "fcm:invalid_tokens"
+
+_fcm_executor = ThreadPoolExecutor(max_workers=FCM_MAX_WORKERS, thread_name_prefix="fcm")
+
+
+async def _run_blocking(func, *args, **kwargs):
+    """동기 firebase-admin 호출을 FCM 전용 스레드 풀에서 실행 (이벤트 루프 비차단)"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_fcm_executor, functools.partial(func, *args, **kwargs))
+
+
+def is_invalid_token_error(exception: Optional[Exception]) -> bool:
+    """토큰 자체가 더 이상 유효하지 않음을 나타내는 FCM 오류인지 여부"""
+    if isinstance(exception, (messaging.UnregisteredError, messaging.SenderIdMismatchError)):
+        return True
+    # 형식이 잘못된 토큰은 INVALID_ARGUMENT로 응답됨 (페이로드 오류와 구분)
+    return (
+        isinstance(exception, exceptions.InvalidArgumentError)
+        and "registration token" in str(exception).lower()
+    )
+
+
+class InvalidTokenPruner:
+    """무효 토큰을 모아 user_device_tokens에서 한 번의 UPDATE로 비활성화"""
+
+    def __init__(self, batch_size: int = PRUNE_BATCH_SIZE):
+        self.batch_size = batch_size
+        self._pending: set[str] = set()
+        self._lock = threading.Lock()
+        # 즉시 비활성화 작업 참조 유지 (완료 전 가비지 컬렉션 방지)
+        self._flush_tasks: set[asyncio.Task] = set()
+
+    def add(self, tokens: List[str]):
+        """무효 토큰 등록 (배치 크기에 도달하면 즉시 비활성화 예약)"""
+        if not tokens:
+            return
+        with self._lock:
+            self._pending.update(tokens)
+            full = len(self._pending) >= self.batch_size
+        if full:
+            try:
+                task = asyncio.get_running_loop().create_task(self.flush())
+            except RuntimeError:
+                return  # 이벤트 루프 밖에서는 주기 작업에 맡김
+            self._flush_tasks.add(task)
+            task.add_done_callback(self._flush_tasks.discard)
+
+    def _take(self) -> List[str]:
+        with self._lock:
+            tokens = list(self._pending)
+            self._pending.clear()
+        return tokens
+
+    def _deactivate(self, tokens: List[str]) -> int:
+        from app.database import SessionLocal
+        from app.models import UserDeviceToken
+
+        db = SessionLocal()
+        try:
+            count = 0
+            for start in range(0, len(tokens), self.batch_size):
+                count += db.query(UserDeviceToken).filter(
+                    UserDeviceToken.device_token.in_(tokens[start:start + self.batch_size]),
+                    UserDeviceToken.is_active == True
+                ).update({"is_active": False}, synchronize_session=False)
+            db.commit()
+            return count
+        finally:
+            db.close()
+
+    def _publish(self, tokens: List[str]) -> bool:
+        redis_client = get_redis_client().get_client()
+        if not redis_client:
+            return False
+        redis_client.sadd(SHARED_INVALID_TOKENS_KEY, *tokens)
+        return True
+
+    def _take_shared(self) -> List[str]:
+        redis_client = get_redis_client().get_client()
+        if not redis_client:
+            return []
+        return list(redis_client.spop(SHARED_INVALID_TOKENS_KEY, self.batch_size) or [])
+
+    async def share(self):
+        """대기 중인 무효 토큰을 공유 집합으로 이동 (Redis 미사용 시 직접 비활성화)"""
+        tokens = self._take()
+        if not tokens:
+            return
+        try:
+            if await asyncio.to_thread(self._publish, tokens):
+                return
+        except Exception as e:
+            logger.warning(f"Error sharing invalid FCM tokens: {str(e)}")
+        await self._deactivate_tokens(tokens)
+
+    async def flush_shared(self) -> int:
+        """공유 집합의 무효 토큰 비활성화 (주기마다 한 워커만 호출)"""
+        count = 0
+        while True:
+            tokens = await asyncio.to_thread(self._take_shared)
+            if not tokens:
+                return count
+            count += await self._deactivate_tokens(tokens)
+            if len(tokens) < self.batch_size:
+                return count
+
+    async def flush(self) -> int:
+        """대기 중인 무효 토큰 비활성화, 비활성화한 토큰 수 반환"""
+        return await self._deactivate_tokens(self._take())
+
+    async def _deactivate_tokens(self, tokens: List[str]) -> int:
+        if not tokens:
+            return 0
+        try:
+            count = await asyncio.to_thread(self._deactivate, tokens)
+            logger.info(f"Deactivated {count} invalid FCM tokens")
+            return count
+        except Exception as e:
+            logger.error(f"Error deactivating invalid FCM tokens: {str(e)}")
+            # 다음 주기에 다시 시도
+            with self._lock:
+                self._pending.update(tokens)
+            return 0
+
+
+# 전역 인스턴스
+invalid_token_pruner = InvalidTokenPruner()
+
+
+# 백그라운드 작업으로 무효 토큰 주기적 정리
+async def prune_invalid_tokens():
+    """등록된 무효 토큰을 주기적으로 비활성화"""
+    while True:
+        try:
+            await asyncio.sleep(PRUNE_INTERVAL_SECONDS)
+            await invalid_token_pruner.share()
+            # 공유된 토큰은 주기마다 한 워커만 비활성화
+            if await asyncio.to_thread(
+                get_redis_client().acquire_job_lock,
+                "fcm:prune",
+                PRUNE_INTERVAL_SECONDS - 5,
+            ):
+                await invalid_token_pruner.flush_shared()
+        except asyncio.CancelledError:
+            await invalid_token_pruner.flush()
+            raise
+        except Exception as e:
+            logger.error(f"Error in invalid token prune task: {str(e)}")
+
 
 class FCMService:
     """FCM 푸시 알림 서비스 (HTTP v1 API)"""
@@ -147,12 +312,13 @@ class FCMService:
             )
 
             # 메시지 전송
-            response = messaging.send(message)
+            response = await _run_blocking(messaging.send, message)
             logger.info(f"FCM notification sent successfully: {response}")
             return True
 
-        except messaging.UnregisteredError:
+        except (messaging.UnregisteredError, messaging.SenderIdMismatchError):
             logger.error(f"FCM token is not registered: {token[:20]}...")
+            invalid_token_pruner.add([token])
             return False
         except ValueError as e:
             logger.error(f"Invalid FCM message arguments: {str(e)}")
@@ -174,7 +340,12 @@ class FCMService:
         sound: str = "default",
         priority: str = "high",
     ) -> Dict[str, Any]:
-        """다중 디바이스에 푸시 알림 전송"""
+        """
+        다중 디바이스에 푸시 알림 전송 (최대 MULTICAST_BATCH_SIZE개)
+
+        results의 index는 tokens 내 위치입니다.
+        무효 토큰(invalid_token)은 invalid_token_pruner가 모아서 비활성화합니다.
+        """
         
         if not tokens:
             return {"success": 0, "failure": 0, "results": []}
@@ -216,7 +387,11 @@ class FCMService:
                         body=body,
                         icon=image or '/pwa-192x192.png',
                         badge='/pwa-64x64.png',
-                        tag=data_payload.get('notification_id', str(int(datetime.now().timestamp()))),
+                        tag=(
+                            data_payload.get('notification_id')
+                            or data_payload.get('batch_id')
+                            or str(int(datetime.now().timestamp()))
+                        ),
                         require_interaction=False,
                         silent=False,
                         data=data_payload
@@ -230,27 +405,37 @@ class FCMService:
             )
 
             # 멀티캐스트 메시지 전송
-            batch_response = messaging.send_each_for_multicast(message)
+            batch_response = await _run_blocking(messaging.send_each_for_multicast, message)
             
             success_count = batch_response.success_count
             failure_count = batch_response.failure_count
             
             # 결과 처리
             results = []
+            invalid_tokens = []
             for i, response in enumerate(batch_response.responses):
                 if response.success:
                     results.append({
+                        "index": i,
                         "token": tokens[i][:20] + "...",
                         "success": True,
                         "message_id": response.message_id
                     })
                 else:
+                    invalid_token = is_invalid_token_error(response.exception)
+                    if invalid_token:
+                        invalid_tokens.append(tokens[i])
                     results.append({
+                        "index": i,
                         "token": tokens[i][:20] + "...",
                         "success": False,
-                        "error": str(response.exception)
+                        "error": str(response.exception),
+                        "invalid_token": invalid_token
                     })
             
+            # 무효 토큰은 모아서 일괄 비활성화
+            invalid_token_pruner.add(invalid_tokens)
+            
             logger.info(
                 f"FCM multicast sent: {success_count} success, {failure_count} failure"
             )
@@ -320,7 +505,7 @@ class FCMService:
             )
 
             # 메시지 전송
-            response = messaging.send(message)
+            response = await _run_blocking(messaging.send, message)
             logger.info(f"FCM topic notification sent successfully to {topic}: {response}")
             return True
 
@@ -331,7 +516,7 @@ class FCMService:
     async def subscribe_to_topic(self, tokens: List[str], topic: str) -> Dict[str, Any]:
         """토픽 구독"""
         try:
-            response = messaging.subscribe_to_topic(tokens, topic)
+            response = await _run_blocking(messaging.subscribe_to_topic, tokens, topic)
             
             success_count = response.success_count
             failure_count = response.failure_count
@@ -357,7 +542,7 @@ class FCMService:
     async def unsubscribe_from_topic(self, tokens: List[str], topic: str) -> Dict[str, Any]:
         """토픽 구독 해제"""
         try:
-            response = messaging.unsubscribe_from_topic(tokens, topic)
+            response = await _run_blocking(messaging.unsubscribe_from_topic, tokens, topic)
             
             success_count = response.success_count
             failure_count = response.failure_count
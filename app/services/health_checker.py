@@ -0,0 +1,181 @@
+"""
+헬스 체크 상태 수집기
+DB/Redis/외부 API 상태를 백그라운드에서 주기적으로 확인하고 마지막 결과(스냅샷)를 보관
+
+- 라이브니스(/livez, /): 프로세스 응답 여부만 확인, I/O 없음
+- 레디니스(/readyz, /health, /api/health): 스냅샷만 읽음 → 프로브 횟수와 무관하게 DB 부하 일정
+- DB가 끊겼거나 스냅샷이 오래되면(수집 작업 정지) 준비되지 않음으로 응답
+- Redis는 없어도 캐시 없이 동작하므로 상태만 보고하고 레디니스에는 반영하지 않음
+"""
+
+import asyncio
+import logging
+import time
+from datetime import datetime
+from typing import Any
+
+import httpx
+from sqlalchemy import text
+
+from app.config import settings
+from app.utils.redis_client import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+# 상태 점검 대상 외부 API (설정 속성명, 표시 이름)
+UPSTREAM_URL_SETTINGS = (
+    ("KMA_API_URL", "weather_api"),
+    ("TOUR_API_BASE_URL", "tourism_api"),
+    ("GOOGLE_PLACES_API_URL", "google_places"),
+    ("NAVER_MAP_API_URL", "naver_map"),
+)
+
+
+def _check_database() -> dict[str, Any]:
+    """데이터베이스 연결 상태 (동기, 스레드에서 실행)"""
+    from app.database import engine
+
+    try:
+        start_time = time.time()
+        with engine.connect() as connection:
+            result = connection.execute(text("SELECT 1")).fetchone()
+        response_time = round((time.time() - start_time) * 1000, 2)
+        return {
+            "status": "연결됨" if result else "오류",
+            "response_time": f"{response_time}ms",
+        }
+    except Exception as e:
+        logger.error(f"Database connection check failed: {str(e)}")
+        return {"status": f"오류({str(e)})", "response_time": "N/A"}
+
+
+def _check_redis() -> dict[str, Any]:
+    """Redis 연결 상태 (동기, 스레드에서 실행)"""
+    client = get_redis_client().get_client()
+    if client is None:
+        return {"status": "미사용", "response_time": "N/A"}
+    try:
+        start_time = time.time()
+        client.ping()
+        response_time = round((time.time() - start_time) * 1000, 2)
+        return {"status": "연결됨", "response_time": f"{response_time}ms"}
+    except Exception as e:
+        logger.warning(f"Redis connection check failed: {str(e)}")
+        return {"status": f"오류({str(e)})", "response_time": "N/A"}
+
+
+async def check_external_api(url: str, timeout: int = 5) -> dict[str, Any]:
+    """외부 API 상태를 확인합니다."""
+    try:
+        start_time = time.time()
+        async with httpx.AsyncClient(timeout=timeout) as client:
+            response = await client.get(url)
+            response_time = round((time.time() - start_time) * 1000, 2)
+
+            if response.status_code == 200:
+                return {"status": "정상", "response_time": f"{response_time}ms"}
+            return {
+                "status": f"오류({response.status_code})",
+                "response_time": f"{response_time}ms",
+            }
+    except (TimeoutError, httpx.TimeoutException):
+        return {"status": "타임아웃", "response_time": "N/A"}
+    except Exception as e:
+        logger.error(f"External API check failed for {url}: {str(e)}")
+        return {"status": f"오류({str(e)})", "response_time": "N/A"}
+
+
+class HealthChecker:
+    """백그라운드 헬스 체크와 캐시된 스냅샷"""
+
+    def __init__(
+        self,
+        interval: float = settings.health_check_interval,
+        upstream_interval: float = settings.health_upstream_check_interval,
+    ):
+        self.interval = interval
+        self.upstream_interval = upstream_interval
+        self.database: dict[str, Any] | None = None
+        self.redis: dict[str, Any] | None = None
+        self.external_apis: dict[str, dict[str, Any]] = {}
+        self.checked_at: float | None = None
+        self.upstreams_checked_at: float | None = None
+        self.started_at = time.time()
+
+    @property
+    def max_age(self) -> float:
+        # 수집 주기를 몇 번 놓쳐야 오래된 스냅샷으로 판단
+        return self.interval * 3
+
+    async def refresh(self):
+        """DB/Redis 상태 갱신"""
+        self.database, self.redis = await asyncio.gather(
+            asyncio.to_thread(_check_database), asyncio.to_thread(_check_redis)
+        )
+        self.checked_at = time.time()
+
+    async def refresh_upstreams(self):
+        """외부 API 상태 갱신 (병렬 처리)"""
+        checks = [
+            (name, getattr(settings, attr))
+            for attr, name in UPSTREAM_URL_SETTINGS
+            if getattr(settings, attr, None)
+        ]
+        results = await asyncio.gather(*(check_external_api(url) for _, url in checks))
+        self.external_apis = {name: result for (name, _), result in zip(checks, results)}
+        self.upstreams_checked_at = time.time()
+
+    def is_alive(self) -> dict[str, Any]:
+        """라이브니스 (I/O 없음)"""
+        return {
+            "status": "healthy",
+            "uptime_seconds": round(time.time() - self.started_at, 1),
+            "service": "weather-flick-backend",
+        }
+
+    def readiness(self) -> tuple[bool, dict[str, Any]]:
+        """레디니스 (마지막 스냅샷 기준), (준비 여부, 응답 본문) 반환"""
+        if self.checked_at is None:
+            return False, {"status": "starting", "service": "weather-flick-backend"}
+
+        age = time.time() - self.checked_at
+        db_ok = self.database is not None and self.database["status"] == "연결됨"
+        ready = db_ok and age <= self.max_age
+        body = {
+            "status": "healthy" if ready else "unhealthy",
+            "database": "connected" if db_ok else self.database["status"],
+            "redis": self.redis["status"] if self.redis else None,
+            "checked_at": datetime.fromtimestamp(self.checked_at).isoformat(),
+            "age_seconds": round(age, 1),
+            "service": "weather-flick-backend",
+        }
+        if age > self.max_age:
+            body["error"] = "health snapshot is stale"
+        return ready, body
+
+    async def run_forever(self):
+        """DB/Redis는 interval, 외부 API는 upstream_interval 주기로 확인"""
+        while True:
+            try:
+                await self.refresh()
+                upstream_due = (
+                    self.upstreams_checked_at is None
+                    or time.time() - self.upstreams_checked_at >= self.upstream_interval
+                )
+                if upstream_due:
+                    await self.refresh_upstreams()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"헬스 체크 작업 오류: {e}")
+            await asyncio.sleep(self.interval)
+
+
+# 전역 인스턴스
+health_checker = HealthChecker()
+
+
+# 백그라운드 작업으로 헬스 체크 스냅샷 갱신
+async def run_health_checks():
+    """애플리케이션 수명 주기 안에서 헬스 체크 실행"""
+    await health_checker.run_forever()
@@ -1,3 +1,4 @@
+import asyncio
 from typing import Any
 
 import httpx
@@ -7,6 +8,22 @@ from sqlalchemy.orm import Session
 
 from app.config import settings
 from app.models import Region
+from app.services.local_search_orchestrator import SearchSource, local_search_orchestrator
+from app.services.nearby_service import nearby_service
+from app.services.region_gazetteer import region_gazetteer
+
+# 팬아웃 검색 소스 설정 (초)
+DB_SOURCE_DEADLINE_SECONDS = 3.0
+EXTERNAL_SOURCE_DEADLINE_SECONDS = 4.0
+EXTERNAL_HEDGE_DELAY_SECONDS = 0.3  # DB가 이 시간 안에 limit개를 채우지 못하면 외부 API 시작
+
+# /local/nearby 카테고리 → 콘텐츠 타입
+NEARBY_CATEGORY_TYPES = {
+    "restaurants": ["restaurant"],
+    "accommodations": ["accommodation"],
+    "attractions": ["tourist_attraction", "cultural_facility", "leisure_sports"],
+    "shopping": ["shopping"],
+}
 
 
 class LocalInfoService:
@@ -20,66 +37,82 @@ class LocalInfoService:
 
     async def _search_db_restaurants(
         self,
-        db: Session,
         city: str | None,
         region: str | None = None,
         category: str | None = None,
         keyword: str | None = None,
         limit: int = 20,
     ) -> list[dict[str, Any]]:
-        """DB restaurants 테이블에서 직접 맛집 검색"""
+        """DB restaurants 테이블에서 직접 맛집 검색 (별도 스레드·세션에서 실행해 마감 시간/헤징이 동작)"""
+        return await asyncio.to_thread(
+            self._query_db_restaurants, city, region, category, keyword, limit
+        )
+
+    def _query_db_restaurants(
+        self,
+        city: str | None,
+        region: str | None,
+        category: str | None,
+        keyword: str | None,
+        limit: int,
+    ) -> list[dict[str, Any]]:
+        from app.database import SessionLocal
         from app.models import Restaurant
 
-        query = db.query(Restaurant)
-        if city:
-            query = query.filter(Restaurant.address.ilike(f"%{city}%"))
-        if region:
-            query = query.filter(Restaurant.address.ilike(f"%{region}%"))
-        if category:
-            query = query.filter(Restaurant.category_code == category)
-        if keyword:
-            query = query.filter(Restaurant.restaurant_name.ilike(f"%{keyword}%"))
-        results = query.limit(limit).all()
-        return [
-            {
-                "content_id": r.content_id,
-                "region_code": r.region_code,
-                "restaurant_name": r.restaurant_name,
-                "category_code": r.category_code,
-                "sub_category_code": r.sub_category_code,
-                "address": r.address,
-                "detail_address": r.detail_address,
-                "zipcode": r.zipcode,
-                "tel": r.tel,
-                "homepage": r.homepage,
-                "overview": r.overview,
-                "first_image": r.first_image,
-                "first_image_small": r.first_image_small,
-                "cuisine_type": r.cuisine_type,
-                "specialty_dish": r.specialty_dish,
-                "operating_hours": r.operating_hours,
-                "rest_date": r.rest_date,
-                "reservation_info": r.reservation_info,
-                "credit_card": r.credit_card,
-                "smoking": r.smoking,
-                "parking": r.parking,
-                "room_available": r.room_available,
-                "children_friendly": r.children_friendly,
-                "takeout": r.takeout,
-                "delivery": r.delivery,
-                "latitude": float(r.latitude) if r.latitude is not None else None,
-                "longitude": float(r.longitude) if r.longitude is not None else None,
-                "data_quality_score": float(r.data_quality_score)
-                if r.data_quality_score is not None
-                else None,
-                "raw_data_id": str(r.raw_data_id) if r.raw_data_id else None,
-                "created_at": r.created_at,
-                "updated_at": r.updated_at,
-                "last_sync_at": r.last_sync_at,
-                "processing_status": r.processing_status,
-            }
-            for r in results
-        ]
+        db = SessionLocal()
+        try:
+            query = db.query(Restaurant)
+            if city:
+                query = query.filter(Restaurant.address.ilike(f"%{city}%"))
+            if region:
+                query = query.filter(Restaurant.address.ilike(f"%{region}%"))
+            if category:
+                query = query.filter(Restaurant.category_code == category)
+            if keyword:
+                query = query.filter(Restaurant.restaurant_name.ilike(f"%{keyword}%"))
+            results = query.limit(limit).all()
+            return [
+                {
+                    "content_id": r.content_id,
+                    "region_code": r.region_code,
+                    "restaurant_name": r.restaurant_name,
+                    "category_code": r.category_code,
+                    "sub_category_code": r.sub_category_code,
+                    "address": r.address,
+                    "detail_address": r.detail_address,
+                    "zipcode": r.zipcode,
+                    "tel": r.tel,
+                    "homepage": r.homepage,
+                    "overview": r.overview,
+                    "first_image": r.first_image,
+                    "first_image_small": r.first_image_small,
+                    "cuisine_type": r.cuisine_type,
+                    "specialty_dish": r.specialty_dish,
+                    "operating_hours": r.operating_hours,
+                    "rest_date": r.rest_date,
+                    "reservation_info": r.reservation_info,
+                    "credit_card": r.credit_card,
+                    "smoking": r.smoking,
+                    "parking": r.parking,
+                    "room_available": r.room_available,
+                    "children_friendly": r.children_friendly,
+                    "takeout": r.takeout,
+                    "delivery": r.delivery,
+                    "latitude": float(r.latitude) if r.latitude is not None else None,
+                    "longitude": float(r.longitude) if r.longitude is not None else None,
+                    "data_quality_score": float(r.data_quality_score)
+                    if r.data_quality_score is not None
+                    else None,
+                    "raw_data_id": str(r.raw_data_id) if r.raw_data_id else None,
+                    "created_at": r.created_at,
+                    "updated_at": r.updated_at,
+                    "last_sync_at": r.last_sync_at,
+                    "processing_status": r.processing_status,
+                }
+                for r in results
+            ]
+        finally:
+            db.close()
 
     async def search_restaurants(
         self,
@@ -88,40 +121,91 @@ class LocalInfoService:
         category: str | None = None,
         keyword: str | None = None,
         limit: int = 20,
-        db: Session | None = None,
+        include_db: bool = False,
     ) -> list[dict[str, Any]]:
-        """맛집 검색 (DB → 외부 API → 내장 데이터)"""
-        results = []
-        if db is not None:
-            db_results = await self._search_db_restaurants(
-                db, city, region, category, keyword, limit
-            )
-            results.extend(db_results)
+        """
+        맛집 검색 (DB 우선, 외부 API 동시 조회, 모두 비면 내장 데이터)
 
-        # 기존 외부 API/내장 데이터 로직 유지
-        if not results:
-            # 카카오 API로 맛집 검색
-            if self.kakao_api_key:
-                kakao_results = await self._search_kakao_restaurants(
-                    city or "", category or "", keyword or "", limit
+        include_db가 True이면 DB도 조회 (워커 스레드에서 별도 세션을 열어 조회)
+        """
+        sources = []
+        if include_db:
+            sources.append(
+                SearchSource(
+                    "db",
+                    lambda: self._search_db_restaurants(
+                        city, region, category, keyword, limit
+                    ),
+                    deadline=DB_SOURCE_DEADLINE_SECONDS,
                 )
-                results.extend(kakao_results)
-
-            # 한국관광공사 API로 맛집 검색
-            if self.korea_tourism_api_key:
-                tourism_results = await self._search_korea_tourism_restaurants(
-                    city or "", keyword or "", limit
+            )
+        hedge_delay = EXTERNAL_HEDGE_DELAY_SECONDS if include_db else 0.0
+        # 카카오 API로 맛집 검색
+        if self.kakao_api_key:
+            sources.append(
+                SearchSource(
+                    "kakao",
+                    lambda: self._search_kakao_restaurants(
+                        city or "", category or "", keyword or "", limit
+                    ),
+                    deadline=EXTERNAL_SOURCE_DEADLINE_SECONDS,
+                    hedge_delay=hedge_delay,
                 )
-                results.extend(tourism_results)
-
-            # 내장 데이터로 보완
-            if not results:
-                results = await self._search_local_restaurants(
-                    city or "", region or "", category or "", keyword or "", limit
+            )
+        # 한국관광공사 API로 맛집 검색
+        if self.korea_tourism_api_key:
+            sources.append(
+                SearchSource(
+                    "korea_tourism",
+                    lambda: self._search_korea_tourism_restaurants(
+                        city or "", keyword or "", limit
+                    ),
+                    deadline=EXTERNAL_SOURCE_DEADLINE_SECONDS,
+                    hedge_delay=hedge_delay,
                 )
+            )
+        # 내장 데이터로 보완
+        sources.append(
+            SearchSource(
+                "local",
+                lambda: self._search_local_restaurants(
+                    city or "", region or "", category or "", keyword or "", limit
+                ),
+                fallback=True,
+            )
+        )
 
-        unique_results = self._remove_duplicates(results)
-        return unique_results[:limit]
+        return await local_search_orchestrator.search(
+            sources,
+            limit,
+            dedupe=self._remove_duplicates,
+            cache_key=local_search_orchestrator.cache_key(
+                "restaurants",
+                city=city,
+                region=region,
+                category=category,
+                keyword=keyword,
+                limit=limit,
+                db=include_db,
+            ),
+        )
+
+    async def get_nearby_places(
+        self,
+        db: Session,
+        latitude: float,
+        longitude: float,
+        radius: float = 5.0,
+        category: str | None = None,
+        limit: int = 20,
+    ) -> list[dict[str, Any]]:
+        """주변 장소 검색 (콘텐츠 테이블 geo_cell 인덱스 사용, 외부 API 호출 없음)"""
+        types = None
+        if category:
+            types = NEARBY_CATEGORY_TYPES.get(category, [category])
+        return nearby_service.nearby(
+            db, latitude, longitude, radius_km=radius, types=types, limit=limit
+        )
 
     async def search_transportation(
         self, city: str, region: str = None, transport_type: str = None, limit: int = 20
@@ -152,22 +236,41 @@ class LocalInfoService:
         limit: int = 20,
     ) -> list[dict]:
         """숙소 정보 검색 (한국관광공사 API 사용)"""
-        results = []
-
+        sources = []
         # 한국관광공사 API로 숙소 검색
         if self.korea_tourism_api_key:
-            tourism_results = await self._search_korea_tourism_accommodations(
-                city, accommodation_type, limit
+            sources.append(
+                SearchSource(
+                    "korea_tourism",
+                    lambda: self._search_korea_tourism_accommodations(
+                        city, accommodation_type, limit
+                    ),
+                    deadline=EXTERNAL_SOURCE_DEADLINE_SECONDS,
+                )
             )
-            results.extend(tourism_results)
-
         # 내장 데이터로 보완
-        if not results:
-            results = await self._search_local_accommodations(
-                city, region, accommodation_type, limit
+        sources.append(
+            SearchSource(
+                "local",
+                lambda: self._search_local_accommodations(
+                    city, region, accommodation_type, limit
+                ),
+                fallback=True,
             )
+        )
 
-        return results[:limit]
+        return await local_search_orchestrator.search(
+            sources,
+            limit,
+            dedupe=self._remove_duplicates,
+            cache_key=local_search_orchestrator.cache_key(
+                "accommodations",
+                city=city,
+                region=region,
+                type=accommodation_type,
+                limit=limit,
+            ),
+        )
 
     async def get_city_info(self, city: str) -> dict | None:
         """도시 정보 조회 (한국관광공사 API 사용)"""
@@ -505,26 +608,7 @@ class LocalInfoService:
 
     def _get_area_code(self, city: str) -> str:
         """도시명을 기반으로 지역 코드 반환"""
-        area_codes = {
-            "서울": "1",
-            "인천": "2",
-            "대전": "3",
-            "대구": "4",
-            "광주": "5",
-            "부산": "6",
-            "울산": "7",
-            "세종": "8",
-            "경기": "31",
-            "강원": "32",
-            "충북": "33",
-            "충남": "34",
-            "경북": "35",
-            "경남": "36",
-            "전북": "37",
-            "전남": "38",
-            "제주": "39",
-        }
-        return area_codes.get(city, "1")
+        return region_gazetteer.get_tour_api_area_code(city) or "1"
 
     def _remove_duplicates(self, results: list[dict]) -> list[dict]:
         """중복 결과 제거"""
@@ -0,0 +1,227 @@
+"""
+로컬 정보 팬아웃 검색
+여러 검색 소스(DB, 카카오, 한국관광공사, 내장 데이터)를 동시에 조회하여 병합
+
+- 소스별 마감 시간: 시간을 넘긴 소스는 빈 결과로 보고 나머지 소스 결과로 응답
+- 헤지 시작: 앞선 소스가 hedge_delay 안에 끝나지 않거나 결과가 모자라면 다음 소스를 추가로 시작
+- 조기 반환: 품질 조건을 만족하는 결과가 limit개 모이면 남은 소스는 취소
+- 대체 소스: 다른 소스가 모두 빈 결과일 때만 실행 (내장 데이터)
+- 병합 결과는 정규화한 검색 조건을 키로 Redis에 캐시 (Redis 미사용 시 프로세스 메모리)
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any
+
+from fastapi.encoders import jsonable_encoder
+
+from app.utils.redis_client import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DEADLINE_SECONDS = 4.0
+CACHE_TTL_SECONDS = 600
+CACHE_KEY_PREFIX = "local_search"
+MEMORY_CACHE_SIZE = 512
+
+
+@dataclass
+class SearchSource:
+    """검색 소스 하나"""
+
+    name: str
+    fetch: Callable[[], Awaitable[list[dict[str, Any]]]]
+    deadline: float = DEFAULT_DEADLINE_SECONDS
+    hedge_delay: float = 0.0  # 시작 지연 (먼저 시작한 소스가 모두 끝나면 즉시 시작)
+    fallback: bool = False
+
+
+def has_basic_fields(result: dict[str, Any]) -> bool:
+    """이름과 주소가 있는 결과만 품질 결과로 인정"""
+    return bool((result.get("restaurant_name") or result.get("name")) and result.get("address"))
+
+
+def normalize_query(**params: Any) -> str:
+    """검색 조건 정규화 (공백/대소문자 차이, 빈 값 무시)"""
+    normalized = {
+        key: " ".join(str(value).split()).lower()
+        for key, value in params.items()
+        if value is not None and str(value).strip() != ""
+    }
+    return json.dumps(sorted(normalized.items()), ensure_ascii=False)
+
+
+class LocalSearchOrchestrator:
+    """동시 조회 + 조기 반환 + 결과 캐시"""
+
+    def __init__(self, cache_ttl: int = CACHE_TTL_SECONDS, memory_cache_size: int = MEMORY_CACHE_SIZE):
+        self.cache_ttl = cache_ttl
+        self.memory_cache_size = memory_cache_size
+        self._memory_cache: OrderedDict[str, tuple[float, list[dict[str, Any]]]] = OrderedDict()
+        self.stats = {
+            "searches": 0,
+            "cache_hits": 0,
+            "early_returns": 0,
+            "hedged_starts": 0,
+            "timeouts": 0,
+            "errors": 0,
+            "fallbacks": 0,
+        }
+
+    # ------------------------------------------------------------------
+    # 캐시
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def cache_key(kind: str, **params: Any) -> str:
+        digest = hashlib.md5(normalize_query(**params).encode()).hexdigest()
+        return f"{CACHE_KEY_PREFIX}:{kind}:{digest}"
+
+    def _get_cached(self, key: str) -> list[dict[str, Any]] | None:
+        redis_client = get_redis_client()
+        if redis_client.get_client() is not None:
+            cached = redis_client.get_cache(key)
+            return cached if isinstance(cached, list) else None
+
+        entry = self._memory_cache.get(key)
+        if entry is None:
+            return None
+        expires_at, results = entry
+        if expires_at < time.monotonic():
+            del self._memory_cache[key]
+            return None
+        self._memory_cache.move_to_end(key)
+        return results
+
+    def _set_cached(self, key: str, results: list[dict[str, Any]]):
+        # datetime 등은 응답 직렬화와 같은 형태로 저장
+        encoded = jsonable_encoder(results)
+        redis_client = get_redis_client()
+        if redis_client.get_client() is not None:
+            redis_client.set_cache(key, encoded, expire=self.cache_ttl)
+            return
+
+        self._memory_cache[key] = (time.monotonic() + self.cache_ttl, encoded)
+        self._memory_cache.move_to_end(key)
+        while len(self._memory_cache) > self.memory_cache_size:
+            self._memory_cache.popitem(last=False)
+
+    # ------------------------------------------------------------------
+    # 검색
+    # ------------------------------------------------------------------
+
+    async def _run_source(self, source: SearchSource) -> tuple[list[dict[str, Any]], bool]:
+        """소스 실행, (결과, 정상 완료 여부) 반환"""
+        try:
+            results = await asyncio.wait_for(source.fetch(), timeout=source.deadline)
+            return results or [], True
+        except asyncio.TimeoutError:
+            self.stats["timeouts"] += 1
+            logger.warning(f"로컬 검색 소스 시간 초과: {source.name} ({source.deadline}s)")
+        except Exception as e:
+            self.stats["errors"] += 1
+            logger.warning(f"로컬 검색 소스 오류: {source.name}: {e}")
+        return [], False
+
+    @staticmethod
+    def _merge(
+        sources: list[SearchSource],
+        results_by_source: dict[str, list[dict[str, Any]]],
+        dedupe: Callable[[list[dict[str, Any]]], list[dict[str, Any]]],
+    ) -> list[dict[str, Any]]:
+        # 완료 순서와 무관하게 소스 우선순위 순서로 병합
+        merged = []
+        for source in sources:
+            merged.extend(results_by_source.get(source.name, []))
+        return dedupe(merged)
+
+    async def search(
+        self,
+        sources: list[SearchSource],
+        limit: int,
+        dedupe: Callable[[list[dict[str, Any]]], list[dict[str, Any]]],
+        is_quality: Callable[[dict[str, Any]], bool] = has_basic_fields,
+        cache_key: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        소스들을 동시에 조회하여 중복 제거한 결과 최대 limit개 반환
+
+        Args:
+            sources: 우선순위 순서의 검색 소스 (병합 시 앞선 소스 결과가 먼저)
+            limit: 결과 개수 (품질 결과가 이만큼 모이면 조기 반환)
+            dedupe: 중복 제거 함수
+            is_quality: 조기 반환 개수에 포함할 결과 조건
+            cache_key: 병합 결과 캐시 키 (None이면 캐시하지 않음)
+        """
+        self.stats["searches"] += 1
+        if cache_key:
+            cached = self._get_cached(cache_key)
+            if cached is not None:
+                self.stats["cache_hits"] += 1
+                return cached[:limit]
+
+        primary = [source for source in sources if not source.fallback]
+        waiting = sorted(primary, key=lambda source: source.hedge_delay)
+        pending: dict[asyncio.Task, SearchSource] = {}
+        results_by_source: dict[str, list[dict[str, Any]]] = {}
+        degraded = False
+        merged: list[dict[str, Any]] = []
+
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        try:
+            while waiting or pending:
+                elapsed = loop.time() - started
+                while waiting and (waiting[0].hedge_delay <= elapsed or not pending):
+                    source = waiting.pop(0)
+                    if pending:
+                        # 앞선 소스가 아직 응답하지 않아 추가로 시작
+                        self.stats["hedged_starts"] += 1
+                    pending[asyncio.create_task(self._run_source(source))] = source
+
+                timeout = max(waiting[0].hedge_delay - elapsed, 0) if waiting else None
+                done, _ = await asyncio.wait(
+                    pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    source = pending.pop(task)
+                    results, ok = task.result()
+                    results_by_source[source.name] = results
+                    degraded = degraded or not ok
+
+                if done:
+                    merged = self._merge(sources, results_by_source, dedupe)
+                    if sum(1 for result in merged if is_quality(result)) >= limit:
+                        if waiting or pending:
+                            self.stats["early_returns"] += 1
+                        break
+        finally:
+            for task in pending:
+                task.cancel()
+
+        if not merged:
+            fallback = [source for source in sources if source.fallback]
+            if fallback:
+                self.stats["fallbacks"] += 1
+                for source, (results, ok) in zip(
+                    fallback, await asyncio.gather(*(self._run_source(s) for s in fallback))
+                ):
+                    results_by_source[source.name] = results
+                    degraded = degraded or not ok
+                merged = self._merge(sources, results_by_source, dedupe)
+
+        merged = merged[:limit]
+        # 시간 초과/오류로 일부 소스가 빠진 결과는 캐시하지 않음
+        if cache_key and merged and not degraded:
+            self._set_cached(cache_key, merged)
+        return merged
+
+
+# 전역 인스턴스
+local_search_orchestrator = LocalSearchOrchestrator()
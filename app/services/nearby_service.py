@@ -0,0 +1,189 @@
+"""
+주변 장소 검색 서비스
+콘텐츠 테이블의 geo_cell 격자 인덱스 + 하버사인 거리로 반경 내 장소를 조회
+"""
+
+import logging
+import math
+from typing import Any
+
+from sqlalchemy import Float, String, and_, cast, func, literal, or_, select, union_all
+from sqlalchemy.orm import Session
+
+from app.models import GEO_CELL_SIZE_DEG
+from app.services.content_registry import CONTENT_TABLES, ContentTable
+from app.services.region_gazetteer import EARTH_RADIUS_KM, KM_PER_DEGREE
+
+logger = logging.getLogger(__name__)
+
+MAX_RADIUS_KM = 50.0
+# 셀 경계에서 numeric/float 반올림 차이로 셀이 누락되지 않도록 여유를 둠
+CELL_EPSILON_DEG = 1e-7
+
+
+def geo_cell_row(latitude: float) -> int:
+    return math.floor(latitude / GEO_CELL_SIZE_DEG) + 1800
+
+
+def geo_cell_column(longitude: float) -> int:
+    return math.floor(longitude / GEO_CELL_SIZE_DEG) + 3600
+
+
+def geo_cell(latitude: float, longitude: float) -> int:
+    """models.GEO_CELL_EXPRESSION과 동일한 격자 셀 값"""
+    return geo_cell_row(latitude) * 10000 + geo_cell_column(longitude)
+
+
+def bounding_box(
+    latitude: float, longitude: float, radius_km: float
+) -> tuple[float, float, float, float]:
+    """반경을 포함하는 (최소 위도, 최대 위도, 최소 경도, 최대 경도)"""
+    lat_delta = radius_km / KM_PER_DEGREE
+    lng_delta = radius_km / (
+        KM_PER_DEGREE * max(math.cos(math.radians(min(89.0, abs(latitude) + lat_delta))), 0.01)
+    )
+    return (
+        latitude - lat_delta,
+        latitude + lat_delta,
+        longitude - lng_delta,
+        longitude + lng_delta,
+    )
+
+
+def cell_ranges(
+    latitude: float, longitude: float, radius_km: float
+) -> list[tuple[int, int]]:
+    """
+    반경을 덮는 geo_cell 정수 구간 목록
+
+    같은 위도 행의 셀은 연속된 정수이므로 행마다 BETWEEN 구간 하나로 표현되어
+    geo_cell B-tree 인덱스의 범위 스캔으로 처리됩니다.
+    """
+    min_lat, max_lat, min_lng, max_lng = bounding_box(latitude, longitude, radius_km)
+    first_row = geo_cell_row(min_lat - CELL_EPSILON_DEG)
+    last_row = geo_cell_row(max_lat + CELL_EPSILON_DEG)
+    first_column = geo_cell_column(min_lng - CELL_EPSILON_DEG)
+    last_column = geo_cell_column(max_lng + CELL_EPSILON_DEG)
+    return [
+        (row * 10000 + first_column, row * 10000 + last_column)
+        for row in range(first_row, last_row + 1)
+    ]
+
+
+def _distance_km(lat_column, lng_column, latitude: float, longitude: float):
+    """하버사인 거리 SQL 표현식 (km)"""
+    lat = cast(lat_column, Float)
+    lng = cast(lng_column, Float)
+    half_dlat = func.radians(lat - latitude, type_=Float) * 0.5
+    half_dlng = func.radians(lng - longitude, type_=Float) * 0.5
+    a = func.power(func.sin(half_dlat), 2) + math.cos(math.radians(latitude)) * func.cos(
+        func.radians(lat, type_=Float)
+    ) * func.power(func.sin(half_dlng), 2)
+    return 2 * EARTH_RADIUS_KM * func.asin(func.least(1.0, func.sqrt(a)))
+
+
+class NearbyService:
+    """격자 인덱스 기반 주변 장소 검색"""
+
+    def _content_select(
+        self,
+        table: ContentTable,
+        latitude: float,
+        longitude: float,
+        radius_km: float,
+        ranges: list[tuple[int, int]],
+        limit: int,
+    ):
+        model = table.model
+        image_column = table.image_column
+        distance = _distance_km(model.latitude, model.longitude, latitude, longitude)
+        min_lat, max_lat, min_lng, max_lng = bounding_box(latitude, longitude, radius_km)
+
+        return (
+            select(
+                literal(table.content_type).label("place_type"),
+                cast(model.content_id, String).label("id"),
+                table.name_column.label("name"),
+                model.address.label("address"),
+                cast(model.latitude, Float).label("latitude"),
+                cast(model.longitude, Float).label("longitude"),
+                (image_column if image_column is not None else literal(None, String)).label(
+                    "image_url"
+                ),
+                model.region_code.label("region_code"),
+                distance.label("distance_km"),
+            )
+            .where(
+                or_(*(model.geo_cell.between(low, high) for low, high in ranges)),
+                and_(
+                    model.latitude.between(min_lat, max_lat),
+                    model.longitude.between(min_lng, max_lng),
+                ),
+                distance <= radius_km,
+            )
+            .order_by(distance)
+            .limit(limit)
+        )
+
+    def nearby(
+        self,
+        db: Session,
+        latitude: float,
+        longitude: float,
+        radius_km: float = 5.0,
+        types: list[str] | None = None,
+        limit: int = 20,
+    ) -> list[dict[str, Any]]:
+        """
+        반경 내 장소를 거리순으로 한 번의 쿼리로 조회
+
+        Args:
+            db: 데이터베이스 세션
+            latitude: 기준 위도
+            longitude: 기준 경도
+            radius_km: 검색 반경 (km, 최대 MAX_RADIUS_KM)
+            types: 콘텐츠 타입 목록 (None이면 전체)
+            limit: 최대 결과 수
+        """
+        if not (-90 <= latitude <= 90 and -180 <= longitude <= 180):
+            raise ValueError("유효하지 않은 좌표입니다.")
+        if radius_km <= 0 or radius_km > MAX_RADIUS_KM:
+            raise ValueError(f"반경은 0 초과 {MAX_RADIUS_KM:g}km 이하여야 합니다.")
+
+        tables = []
+        for content_type in types or list(CONTENT_TABLES):
+            if content_type not in CONTENT_TABLES:
+                raise ValueError(f"지원하지 않는 콘텐츠 타입입니다: {content_type}")
+            tables.append(CONTENT_TABLES[content_type])
+
+        ranges = cell_ranges(latitude, longitude, radius_km)
+        branches = [
+            select(
+                self._content_select(
+                    table, latitude, longitude, radius_km, ranges, limit
+                ).subquery()
+            )
+            for table in tables
+        ]
+        combined = union_all(*branches).subquery()
+        stmt = select(combined).order_by(combined.c.distance_km).limit(limit)
+
+        rows = db.execute(stmt).mappings().all()
+        return [
+            {
+                "place_type": row["place_type"],
+                "id": row["id"],
+                "name": row["name"],
+                "address": row["address"],
+                "latitude": row["latitude"],
+                "longitude": row["longitude"],
+                "image_url": row["image_url"],
+                "region_code": row["region_code"],
+                "distance_km": round(float(row["distance_km"]), 3),
+            }
+            for row in rows
+        ]
+
+
+# 전역 인스턴스
+nearby_service = NearbyService()
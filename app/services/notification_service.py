@@ -4,11 +4,14 @@
 """
 
 import uuid
-from datetime import datetime, timedelta
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
 from typing import List, Optional, Dict, Any
+from sqlalchemy import insert, or_, update
 from sqlalchemy.orm import Session
 from sqlalchemy.sql import func
 import asyncio
+import json
 import logging
 
 from app.models import (
@@ -23,11 +26,121 @@ from app.models import (
     NotificationType,
     NotificationChannel
 )
-from app.services.fcm_service import FCMService
+from app.services.fcm_service import FCMService, MULTICAST_BATCH_SIZE
 from app.services.email_service import EmailService
 
 logger = logging.getLogger(__name__)
 
+# 대량 발송 시 한 트랜잭션에서 처리할 사용자 수
+BULK_USER_CHUNK_SIZE = 1000
+
+# 재시도 지수 백오프 (1분, 2분, 4분 ... 최대 1시간)
+RETRY_BASE_DELAY = timedelta(minutes=1)
+RETRY_MAX_DELAY = timedelta(hours=1)
+
+# 토큰이 더 이상 유효하지 않음을 나타내는 FCM 오류 키워드
+INVALID_TOKEN_KEYWORDS = ("invalid", "not registered", "unregistered")
+
+
+def _normalize_data(data: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """알림 데이터 정규화 (JSON 직렬화가 불가능한 값은 문자열로 변환)"""
+    normalized = dict(data or {})
+    if normalized.get('location'):
+        normalized['location'] = str(normalized['location']).strip()
+    for key, value in normalized.items():
+        if value is not None and not isinstance(value, (str, int, float, bool, list, dict)):
+            normalized[key] = str(value)
+    return normalized
+
+
+def retry_delay(attempt_count: int) -> timedelta:
+    """재시도 대기 시간 (시도 횟수마다 두 배)"""
+    return min(RETRY_BASE_DELAY * (2 ** max(attempt_count - 1, 0)), RETRY_MAX_DELAY)
+
+
+def _queue_name(priority: int) -> str:
+    """우선순위별 큐 이름"""
+    return "high" if priority >= 8 else "normal" if priority >= 5 else "low"
+
+
+def _settings_allow(
+    settings: Optional[UserNotificationSettings], notification: Notification
+) -> bool:
+    """사용자 알림 설정상 전송 허용 여부"""
+    if not settings:
+        return True  # 설정이 없으면 기본값으로 허용
+    
+    # 채널별 설정 확인
+    if notification.channel == NotificationChannel.PUSH and not settings.push_enabled:
+        return False
+    if notification.channel == NotificationChannel.EMAIL and not settings.email_enabled:
+        return False
+    if notification.channel == NotificationChannel.SMS and not settings.sms_enabled:
+        return False
+    if notification.channel == NotificationChannel.IN_APP and not settings.in_app_enabled:
+        return False
+    
+    # 유형별 설정 확인
+    if notification.type == NotificationType.WEATHER_ALERT and not settings.weather_alerts:
+        return False
+    if notification.type == NotificationType.TRAVEL_PLAN_UPDATE and not settings.travel_plan_updates:
+        return False
+    if notification.type == NotificationType.RECOMMENDATION and not settings.recommendation_updates:
+        return False
+    if notification.type == NotificationType.MARKETING and not settings.marketing_messages:
+        return False
+    if notification.type == NotificationType.SYSTEM and not settings.system_messages:
+        return False
+    if notification.type == NotificationType.EMERGENCY and not settings.emergency_alerts:
+        return False
+    
+    return True
+
+
+def _in_quiet_hours(settings: Optional[UserNotificationSettings]) -> bool:
+    """방해금지 시간 여부"""
+    if not settings or not settings.quiet_hours_enabled:
+        return False
+    
+    if not settings.quiet_hours_start or not settings.quiet_hours_end:
+        return False
+    
+    now = datetime.now().time()
+    start_time = datetime.strptime(settings.quiet_hours_start, "%H:%M").time()
+    end_time = datetime.strptime(settings.quiet_hours_end, "%H:%M").time()
+    
+    if start_time <= end_time:
+        return start_time <= now <= end_time
+    else:
+        return now >= start_time or now <= end_time
+
+
+def _quiet_hours_end(settings: Optional[UserNotificationSettings]) -> Optional[datetime]:
+    """방해금지 시간이 끝나는 다음 시각"""
+    if not settings or not settings.quiet_hours_end:
+        return None
+    
+    next_time = datetime.strptime(settings.quiet_hours_end, "%H:%M").time()
+    next_datetime = datetime.combine(datetime.now().date(), next_time)
+    
+    if next_datetime <= datetime.now():
+        next_datetime += timedelta(days=1)
+    return next_datetime
+
+
+def _push_payload(notification: Notification) -> Dict[str, Any]:
+    """FCM 데이터 페이로드 (None 값 제거, 알림 ID 포함)"""
+    safe_data = {}
+    if notification.data:
+        for key, value in notification.data.items():
+            # None 값 제거 및 문자열 변환
+            if value is not None:
+                safe_data[key] = str(value) if not isinstance(value, (str, int, float, bool, list, dict)) else value
+    
+    # 알림 ID 추가 (Firefox 태그용)
+    safe_data['notification_id'] = str(notification.id)
+    return safe_data
+
 
 class NotificationService:
     """알림 서비스 클래스"""
@@ -53,15 +166,9 @@ class NotificationService:
         try:
             # 데이터 검증 및 정규화
             if data:
-                # 지역 정보가 있는 경우 특수 문자 처리
-                if 'location' in data and data['location']:
-                    data['location'] = str(data['location']).strip()
+                data.update(_normalize_data(data))
+                if data.get('location'):
                     logger.info(f"Creating notification for location: {data['location']}")
-                
-                # 모든 데이터 값을 문자열로 변환하여 JSON 직렬화 문제 방지
-                for key, value in data.items():
-                    if value is not None and not isinstance(value, (str, int, float, bool, list, dict)):
-                        data[key] = str(value)
             
             notification = Notification(
                 user_id=user_id,
@@ -165,53 +272,104 @@ class NotificationService:
         scheduled_at: Optional[datetime] = None,
         expires_at: Optional[datetime] = None
     ) -> Dict[str, Any]:
-        """대량 알림 발송"""
+        """
+        대량 알림 발송
+
+        사용자 청크마다 존재 여부를 IN 쿼리 한 번으로 확인하고,
+        알림/큐/로그 행을 일괄 INSERT한 뒤 청크 단위로 커밋합니다.
+        실제 전송은 큐 처리 시 채널별로 묶어서 수행됩니다.
+        """
         notification_ids = []
         queued_count = 0
         failed_count = 0
-        
-        for user_id in user_ids:
+
+        # 같은 발송 요청의 알림은 동일한 배치 ID를 가짐 (멀티캐스트 묶음 기준)
+        batch_id = str(uuid.uuid4())
+        validated_data = _normalize_data(data)
+        validated_data['batch_id'] = batch_id
+        queue_name = _queue_name(priority)
+
+        unique_user_ids = list(dict.fromkeys(user_ids))
+
+        for start in range(0, len(unique_user_ids), BULK_USER_CHUNK_SIZE):
+            chunk = unique_user_ids[start:start + BULK_USER_CHUNK_SIZE]
+            # 실패 시 집계할 발송 대상 (존재 확인 전에는 청크 전체)
+            sendable = len(chunk)
             try:
-                # 사용자 존재 확인
-                user = self.db.query(User).filter(User.user_id == user_id).first()
-                if not user:
-                    logger.warning(f"User not found: {user_id}")
-                    failed_count += 1
+                # 사용자 존재 확인 (청크당 쿼리 1회)
+                existing = {
+                    row.user_id
+                    for row in self.db.query(User.user_id).filter(User.user_id.in_(chunk))
+                }
+                missing = len(chunk) - len(existing)
+                sendable = len(existing)
+                if missing:
+                    logger.warning(f"Bulk notification: {missing} users not found")
+                    failed_count += missing
+
+                scheduled_for = scheduled_at or datetime.now(timezone.utc)
+                notification_rows = []
+                queue_rows = []
+                log_rows = []
+                for user_id in chunk:
+                    if user_id not in existing:
+                        continue
+                    for channel in channels:
+                        notification_id = uuid.uuid4()
+                        notification_rows.append({
+                            "id": notification_id,
+                            "user_id": user_id,
+                            "type": notification_type,
+                            "channel": channel,
+                            "status": NotificationStatus.PENDING,
+                            "title": title,
+                            "message": message,
+                            "data": validated_data,
+                            "priority": priority,
+                            "scheduled_at": scheduled_at,
+                            "expires_at": expires_at,
+                        })
+                        queue_rows.append({
+                            "notification_id": notification_id,
+                            "queue_name": queue_name,
+                            "priority": priority,
+                            "scheduled_for": scheduled_for,
+                        })
+                        log_rows.append({
+                            "notification_id": notification_id,
+                            "event_type": "created",
+                            "message": "Notification created",
+                            "details": {
+                                "user_id": str(user_id),
+                                "type": notification_type.value,
+                                "channel": channel.value,
+                                "batch_id": batch_id,
+                            },
+                        })
+
+                if not notification_rows:
                     continue
-                
-                # 데이터 검증
-                validated_data = data.copy() if data else {}
-                
-                # 각 채널별로 알림 생성
-                for channel in channels:
-                    try:
-                        notification = await self.create_notification(
-                            user_id=user_id,
-                            notification_type=notification_type,
-                            channel=channel,
-                            title=title,
-                            message=message,
-                            data=validated_data,
-                            priority=priority,
-                            scheduled_at=scheduled_at,
-                            expires_at=expires_at
-                        )
-                        
-                        notification_ids.append(notification.id)
-                        
-                        # 큐에 추가
-                        await self._add_to_queue(notification)
-                        queued_count += 1
-                        
-                    except Exception as channel_error:
-                        logger.error(f"Error creating {channel.value} notification for user {user_id}: {str(channel_error)}")
-                        logger.error(f"Notification details: title='{title}', message='{message}', data={validated_data}")
-                        failed_count += 1
-                    
+
+                self.db.execute(insert(Notification), notification_rows)
+                self.db.execute(insert(NotificationQueue), queue_rows)
+                self.db.execute(insert(NotificationLog), log_rows)
+                self.db.commit()
+
+                notification_ids.extend(row["id"] for row in notification_rows)
+                queued_count += len(queue_rows)
+
             except Exception as e:
-                logger.error(f"Error processing notifications for user {user_id}: {str(e)}")
-                failed_count += 1
-        
+                self.db.rollback()
+                logger.error(f"Error creating bulk notifications for {len(chunk)} users: {str(e)}")
+                logger.error(f"Notification details: title='{title}', message='{message}', data={validated_data}")
+                # 없는 사용자는 위에서 이미 집계했으므로 실제 발송 대상만 추가
+                failed_count += sendable * len(channels)
+
+        logger.info(
+            f"Bulk notification {batch_id}: {queued_count} queued, {failed_count} failed "
+            f"({len(unique_user_ids)} users, {len(channels)} channels)"
+        )
+
         return {
             "notification_ids": notification_ids,
             "queued_count": queued_count,
@@ -219,72 +377,293 @@ class NotificationService:
         }
     
     async def process_notification_queue(self, queue_name: str = "normal", limit: int = 100):
-        """알림 큐 처리"""
-        # 처리 대기 중인 알림 조회
+        """알림 큐 처리 (다른 워커와 동시에 실행해도 같은 항목을 중복 처리하지 않음)"""
+        queue_items = self.claim_queue_items([queue_name], limit)
+        if not queue_items:
+            return 0
+        
+        outcomes = await self.deliver_queue_items(queue_items)
+        return sum(outcomes.values())
+    
+    def claim_queue_items(self, queue_names: List[str], limit: int = 100) -> List[NotificationQueue]:
+        """
+        처리할 큐 항목 선점
+
+        SELECT ... FOR UPDATE SKIP LOCKED로 다른 워커가 잠근 행은 건너뛰고,
+        선점한 항목을 processing으로 바꿔 커밋하므로 여러 워커가 동시에 실행돼도
+        같은 항목을 두 번 가져가지 않습니다.
+        """
         queue_items = self.db.query(NotificationQueue).filter(
-            NotificationQueue.queue_name == queue_name,
+            NotificationQueue.queue_name.in_(queue_names),
             NotificationQueue.status == "pending",
-            NotificationQueue.scheduled_for <= func.now()
+            NotificationQueue.scheduled_for <= func.now(),
+            or_(
+                NotificationQueue.next_retry_at.is_(None),
+                NotificationQueue.next_retry_at <= func.now()
+            )
         ).order_by(
             NotificationQueue.priority.desc(),
             NotificationQueue.scheduled_for.asc()
-        ).limit(limit).all()
+        ).limit(limit).with_for_update(skip_locked=True).all()
         
-        processed_count = 0
+        for queue_item in queue_items:
+            queue_item.status = "processing"
+        self.db.commit()
+        return queue_items
+    
+    def release_stale_items(self, lease_seconds: int) -> int:
+        """처리 중 워커가 종료되어 processing에 남은 항목을 다시 pending으로 되돌림"""
+        result = self.db.execute(
+            update(NotificationQueue)
+            .where(
+                NotificationQueue.status == "processing",
+                NotificationQueue.updated_at < func.now() - timedelta(seconds=lease_seconds)
+            )
+            .values(status="pending")
+        )
+        self.db.commit()
+        if result.rowcount:
+            logger.warning(f"Released {result.rowcount} stale notification queue items")
+        return result.rowcount
+    
+    async def deliver_queue_items(self, queue_items: List[NotificationQueue]) -> Dict[str, int]:
+        """
+        선점한 큐 항목 전송
+
+        푸시 알림은 모아서 send_push_batch로 멀티캐스트 전송하고,
+        나머지 채널은 알림별로 전송합니다.
+
+        Returns:
+            처리 결과별 항목 수 (completed, retry, failed, expired)
+        """
+        outcomes = defaultdict(int)
+        if not queue_items:
+            return outcomes
+        
+        notifications = {
+            notification.id: notification
+            for notification in self.db.query(Notification).filter(
+                Notification.id.in_([item.notification_id for item in queue_items])
+            )
+        }
+        
+        push_items = []
         
         for queue_item in queue_items:
             try:
-                # 상태 업데이트
-                queue_item.status = "processing"
-                self.db.commit()
-                
-                # 알림 조회
-                notification = self.db.query(Notification).filter(
-                    Notification.id == queue_item.notification_id
-                ).first()
+                notification = notifications.get(queue_item.notification_id)
                 
                 if not notification:
                     queue_item.status = "failed"
                     queue_item.error_message = "Notification not found"
                     self.db.commit()
+                    outcomes["failed"] += 1
                     continue
                 
                 # 만료 확인
-                if notification.expires_at and notification.expires_at < datetime.now():
+                if notification.expires_at and notification.expires_at < datetime.now(timezone.utc):
                     queue_item.status = "completed"
                     queue_item.result = {"expired": True}
                     notification.status = NotificationStatus.FAILED
                     notification.failure_reason = "Expired"
                     self.db.commit()
+                    outcomes["expired"] += 1
+                    continue
+                
+                # 푸시 알림은 모아서 전송
+                if notification.channel == NotificationChannel.PUSH:
+                    push_items.append((queue_item, notification))
                     continue
                 
                 # 알림 전송
                 success = await self.send_notification(notification)
-                
-                if success:
-                    queue_item.status = "completed"
-                    queue_item.result = {"success": True}
-                    queue_item.processed_at = func.now()
-                else:
-                    # 재시도 로직
-                    if queue_item.attempt_count < queue_item.max_attempts:
-                        queue_item.attempt_count += 1
-                        queue_item.next_retry_at = func.now() + timedelta(minutes=5 * queue_item.attempt_count)
-                        queue_item.status = "pending"
-                    else:
-                        queue_item.status = "failed"
-                        queue_item.error_message = "Max retry attempts reached"
+                outcomes[self._apply_queue_result(queue_item, success)] += 1
                 
                 self.db.commit()
-                processed_count += 1
                 
             except Exception as e:
                 logger.error(f"Error processing queue item {queue_item.id}: {str(e)}")
+                self.db.rollback()
                 queue_item.status = "failed"
                 queue_item.error_message = str(e)
                 self.db.commit()
+                outcomes["failed"] += 1
+        
+        if push_items:
+            try:
+                results = await self.send_push_batch([notification for _, notification in push_items])
+                for queue_item, notification in push_items:
+                    outcomes[self._apply_queue_result(queue_item, results.get(notification.id, False))] += 1
+                self.db.commit()
+            except Exception as e:
+                logger.error(f"Error processing {len(push_items)} push queue items: {str(e)}")
+                self.db.rollback()
+                for queue_item, _ in push_items:
+                    queue_item.status = "failed"
+                    queue_item.error_message = str(e)
+                self.db.commit()
+                outcomes["failed"] += len(push_items)
+        
+        return outcomes
+    
+    def _apply_queue_result(self, queue_item: NotificationQueue, success: bool) -> str:
+        """전송 결과를 큐 항목에 반영 (실패 시 지수 백오프로 재시도 스케줄), 처리 결과 반환"""
+        if success:
+            queue_item.status = "completed"
+            queue_item.result = {"success": True}
+            queue_item.processed_at = func.now()
+            return "completed"
+        
+        # 재시도 로직
+        attempt_count = (queue_item.attempt_count or 0) + 1
+        queue_item.attempt_count = attempt_count
+        if attempt_count < (queue_item.max_attempts or 3):
+            queue_item.next_retry_at = datetime.now(timezone.utc) + retry_delay(attempt_count)
+            queue_item.status = "pending"
+            return "retry"
         
-        return processed_count
+        queue_item.status = "failed"
+        queue_item.error_message = "Max retry attempts reached"
+        return "failed"
+    
+    async def send_push_batch(self, notifications: List[Notification]) -> Dict[uuid.UUID, bool]:
+        """
+        푸시 알림 일괄 전송
+
+        알림 설정과 디바이스 토큰을 IN 쿼리로 한 번에 조회하고, 같은 내용의 알림을 묶어
+        MULTICAST_BATCH_SIZE개 토큰 단위의 멀티캐스트로 전송합니다.
+        알림 상태와 로그는 마지막에 한 번에 반영합니다.
+
+        Returns:
+            알림 ID별 전송 성공 여부
+        """
+        results = {notification.id: False for notification in notifications}
+        if not notifications:
+            return results
+        
+        user_ids = {notification.user_id for notification in notifications}
+        settings_by_user = {
+            settings.user_id: settings
+            for settings in self.db.query(UserNotificationSettings).filter(
+                UserNotificationSettings.user_id.in_(user_ids)
+            )
+        }
+        
+        log_rows = []
+        sendable = []
+        for notification in notifications:
+            settings = settings_by_user.get(notification.user_id)
+            if not _settings_allow(settings, notification):
+                log_rows.append({
+                    "notification_id": notification.id,
+                    "event_type": "skipped",
+                    "message": "User notification settings disabled",
+                    "details": {},
+                })
+            elif _in_quiet_hours(settings):
+                # 방해금지 시간이 끝난 후로 스케줄링
+                next_datetime = _quiet_hours_end(settings)
+                if next_datetime:
+                    notification.scheduled_at = next_datetime
+            else:
+                sendable.append(notification)
+        
+        # 디바이스 토큰 일괄 조회
+        tokens_by_user = defaultdict(list)
+        if sendable:
+            token_rows = self.db.query(
+                UserDeviceToken.id, UserDeviceToken.user_id, UserDeviceToken.device_token
+            ).filter(
+                UserDeviceToken.user_id.in_({notification.user_id for notification in sendable}),
+                UserDeviceToken.is_active == True
+            )
+            for token in token_rows:
+                tokens_by_user[token.user_id].append(token)
+        
+        # 같은 제목/본문/데이터의 알림끼리 묶음 (알림 ID는 묶음마다 다르므로 제외)
+        groups = defaultdict(list)
+        for notification in sendable:
+            payload = _push_payload(notification)
+            payload.pop('notification_id')
+            key = (
+                notification.title,
+                notification.message,
+                json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str),
+            )
+            groups[key].append(notification)
+        
+        sent_token_ids = []
+        invalid_token_count = 0
+        for group in groups.values():
+            targets = [
+                (token, notification)
+                for notification in group
+                for token in tokens_by_user.get(notification.user_id, [])
+            ]
+            if not targets:
+                continue
+            
+            payload = _push_payload(group[0])
+            if len(group) > 1:
+                payload.pop('notification_id')
+            
+            for start in range(0, len(targets), MULTICAST_BATCH_SIZE):
+                batch = targets[start:start + MULTICAST_BATCH_SIZE]
+                response = await self.fcm_service.send_multicast_notification(
+                    tokens=[token.device_token for token, _ in batch],
+                    title=group[0].title,
+                    body=group[0].message,
+                    data=payload,
+                    badge=1  # Firefox를 위한 배지 추가
+                )
+                for result in response["results"]:
+                    token, notification = batch[result["index"]]
+                    if result["success"]:
+                        results[notification.id] = True
+                        sent_token_ids.append(token.id)
+                    elif result.get("invalid_token"):
+                        # 비활성화는 FCMService의 invalid_token_pruner가 일괄 처리
+                        invalid_token_count += 1
+        
+        if sent_token_ids:
+            self.db.execute(
+                update(UserDeviceToken)
+                .where(UserDeviceToken.id.in_(sent_token_ids))
+                .values(last_used=func.now())
+            )
+        
+        for notification in sendable:
+            if results[notification.id]:
+                notification.status = NotificationStatus.SENT
+                notification.sent_at = func.now()
+                log_rows.append({
+                    "notification_id": notification.id,
+                    "event_type": "sent",
+                    "message": "Notification sent successfully",
+                    "details": {},
+                })
+            else:
+                notification.status = NotificationStatus.FAILED
+                notification.retry_count = (notification.retry_count or 0) + 1
+                if not tokens_by_user.get(notification.user_id):
+                    notification.failure_reason = "No active device tokens"
+                log_rows.append({
+                    "notification_id": notification.id,
+                    "event_type": "failed",
+                    "message": "Failed to send notification",
+                    "details": {},
+                })
+        
+        if log_rows:
+            self.db.execute(insert(NotificationLog), log_rows)
+        self.db.commit()
+        
+        sent_count = sum(results.values())
+        logger.info(
+            f"Push batch summary: {sent_count}/{len(notifications)} notifications sent, "
+            f"{len(sent_token_ids)} tokens delivered, {invalid_token_count} invalid tokens"
+        )
+        return results
     
     async def _check_user_notification_settings(self, notification: Notification) -> bool:
         """사용자 알림 설정 확인"""
@@ -292,34 +671,7 @@ class NotificationService:
             UserNotificationSettings.user_id == notification.user_id
         ).first()
         
-        if not settings:
-            return True  # 설정이 없으면 기본값으로 허용
-        
-        # 채널별 설정 확인
-        if notification.channel == NotificationChannel.PUSH and not settings.push_enabled:
-            return False
-        if notification.channel == NotificationChannel.EMAIL and not settings.email_enabled:
-            return False
-        if notification.channel == NotificationChannel.SMS and not settings.sms_enabled:
-            return False
-        if notification.channel == NotificationChannel.IN_APP and not settings.in_app_enabled:
-            return False
-        
-        # 유형별 설정 확인
-        if notification.type == NotificationType.WEATHER_ALERT and not settings.weather_alerts:
-            return False
-        if notification.type == NotificationType.TRAVEL_PLAN_UPDATE and not settings.travel_plan_updates:
-            return False
-        if notification.type == NotificationType.RECOMMENDATION and not settings.recommendation_updates:
-            return False
-        if notification.type == NotificationType.MARKETING and not settings.marketing_messages:
-            return False
-        if notification.type == NotificationType.SYSTEM and not settings.system_messages:
-            return False
-        if notification.type == NotificationType.EMERGENCY and not settings.emergency_alerts:
-            return False
-        
-        return True
+        return _settings_allow(settings, notification)
     
     async def _is_quiet_hours(self, user_id: uuid.UUID) -> bool:
         """방해금지 시간 확인"""
@@ -327,20 +679,7 @@ class NotificationService:
             UserNotificationSettings.user_id == user_id
         ).first()
         
-        if not settings or not settings.quiet_hours_enabled:
-            return False
-        
-        if not settings.quiet_hours_start or not settings.quiet_hours_end:
-            return False
-        
-        now = datetime.now().time()
-        start_time = datetime.strptime(settings.quiet_hours_start, "%H:%M").time()
-        end_time = datetime.strptime(settings.quiet_hours_end, "%H:%M").time()
-        
-        if start_time <= end_time:
-            return start_time <= now <= end_time
-        else:
-            return now >= start_time or now <= end_time
+        return _in_quiet_hours(settings)
     
     async def _send_push_notification(self, notification: Notification) -> bool:
         """푸시 알림 전송"""
@@ -359,15 +698,7 @@ class NotificationService:
         failure_details = []
         
         # 데이터 검증 및 정리
-        safe_data = {}
-        if notification.data:
-            for key, value in notification.data.items():
-                # None 값 제거 및 문자열 변환
-                if value is not None:
-                    safe_data[key] = str(value) if not isinstance(value, (str, int, float, bool, list, dict)) else value
-        
-        # 알림 ID 추가 (Firefox 태그용)
-        safe_data['notification_id'] = str(notification.id)
+        safe_data = _push_payload(notification)
         
         logger.info(f"Sending push notification: title='{notification.title}', data={safe_data}")
         
@@ -412,7 +743,7 @@ class NotificationService:
                 })
                 
                 # 토큰이 유효하지 않으면 비활성화
-                if any(keyword in error_msg.lower() for keyword in ["invalid", "not registered", "unregistered"]):
+                if any(keyword in error_msg.lower() for keyword in INVALID_TOKEN_KEYWORDS):
                     logger.info(f"Deactivating invalid token {token.id}")
                     token.is_active = False
         
@@ -500,7 +831,7 @@ class NotificationService:
     async def _add_to_queue(self, notification: Notification):
         """알림을 큐에 추가"""
         try:
-            queue_name = "high" if notification.priority >= 8 else "normal" if notification.priority >= 5 else "low"
+            queue_name = _queue_name(notification.priority)
             
             queue_item = NotificationQueue(
                 notification_id=notification.id,
@@ -526,13 +857,8 @@ class NotificationService:
             UserNotificationSettings.user_id == notification.user_id
         ).first()
         
-        if settings and settings.quiet_hours_end:
-            next_time = datetime.strptime(settings.quiet_hours_end, "%H:%M").time()
-            next_datetime = datetime.combine(datetime.now().date(), next_time)
-            
-            if next_datetime <= datetime.now():
-                next_datetime += timedelta(days=1)
-            
+        next_datetime = _quiet_hours_end(settings)
+        if next_datetime:
             notification.scheduled_at = next_datetime
             self.db.commit()
     
@@ -0,0 +1,385 @@
+"""
+알림 큐 워커
+notification_queue를 SKIP LOCKED로 선점하여 채널별 동시성 제한 안에서 병렬 전송
+
+- 선점: SELECT ... FOR UPDATE SKIP LOCKED → processing 커밋 (워커를 여러 대 띄워도 중복 전송 없음)
+- 전송: 푸시는 멀티캐스트 배치 단위, 나머지 채널은 알림 단위 작업으로 나누어 채널별 세마포어로 제한
+- 재시도: 실패 항목은 지수 백오프로 next_retry_at을 정해 다시 pending
+- 복구: processing 상태로 임대 시간을 넘긴 항목(워커 비정상 종료)은 pending으로 되돌림
+- 메트릭: 배치마다 워커별 Redis 해시에 누적 → gunicorn 워커/단독 실행 워커 전체를 합산 조회
+
+단독 실행:
+    python -m app.services.notification_worker --queues high,normal,low
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import socket
+import time
+from collections import defaultdict, deque
+from typing import Any
+
+from app.models import Notification, NotificationChannel, NotificationQueue
+from app.services.fcm_service import MULTICAST_BATCH_SIZE, prune_invalid_tokens
+from app.utils.redis_client import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+QUEUE_NAMES = ("high", "normal", "low")
+
+# 채널별 동시 실행 작업 수 (푸시는 작업 하나가 멀티캐스트 배치 하나)
+CHANNEL_CONCURRENCY = {
+    NotificationChannel.PUSH: 4,
+    NotificationChannel.EMAIL: 10,
+    NotificationChannel.SMS: 5,
+    NotificationChannel.IN_APP: 20,
+}
+
+DEFAULT_BATCH_SIZE = 1000
+DEFAULT_POLL_INTERVAL_SECONDS = 2.0
+LEASE_SECONDS = 600  # processing 상태 최대 유지 시간
+THROUGHPUT_WINDOW_SECONDS = 60
+
+# 워커별 메트릭 (Redis 공유) - 마지막 배치 후 METRICS_TTL_SECONDS 동안 보관
+WORKER_METRICS_KEY = "notification_worker:metrics:{worker_id}"
+WORKER_REGISTRY_KEY = "notification_worker:workers"
+METRICS_TTL_SECONDS = 86400
+
+
+class WorkerMetrics:
+    """워커 처리량 메트릭"""
+
+    def __init__(self):
+        self.started_at = time.time()
+        self.claimed = 0
+        self.batches = 0
+        self.outcomes: dict[str, int] = defaultdict(int)
+        self.channel_counts: dict[str, int] = defaultdict(int)
+        self.last_batch_seconds = 0.0
+        self._recent: deque[tuple[float, int]] = deque()
+
+    def record_batch(
+        self,
+        claimed: int,
+        outcomes: dict[str, int],
+        channels: dict[str, int],
+        elapsed: float,
+    ):
+        now = time.time()
+        self.claimed += claimed
+        self.batches += 1
+        self.last_batch_seconds = elapsed
+        for outcome, count in outcomes.items():
+            self.outcomes[outcome] += count
+        for channel, count in channels.items():
+            self.channel_counts[channel] += count
+        self._recent.append((now, sum(outcomes.values())))
+        while self._recent and self._recent[0][0] < now - THROUGHPUT_WINDOW_SECONDS:
+            self._recent.popleft()
+
+    def throughput(self) -> float:
+        """최근 구간의 초당 처리 항목 수"""
+        if not self._recent:
+            return 0.0
+        window = min(THROUGHPUT_WINDOW_SECONDS, max(time.time() - self.started_at, 1.0))
+        return sum(count for _, count in self._recent) / window
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "uptime_seconds": round(time.time() - self.started_at, 1),
+            "claimed": self.claimed,
+            "batches": self.batches,
+            "outcomes": dict(self.outcomes),
+            "channels": dict(self.channel_counts),
+            "last_batch_seconds": round(self.last_batch_seconds, 3),
+            "throughput_per_second": round(self.throughput(), 2),
+        }
+
+    def publish(
+        self,
+        worker_id: str,
+        queue_names: list[str],
+        claimed: int,
+        outcomes: dict[str, int],
+        channels: dict[str, int],
+    ):
+        """배치 결과를 워커별 Redis 해시에 누적 (Redis 미사용 시 건너뜀)"""
+        client = get_redis_client().get_client()
+        if not client:
+            return
+
+        key = WORKER_METRICS_KEY.format(worker_id=worker_id)
+        try:
+            pipe = client.pipeline()
+            pipe.hset(
+                key,
+                mapping={
+                    "started_at": self.started_at,
+                    "last_seen": time.time(),
+                    "queues": ",".join(queue_names),
+                    "last_batch_seconds": self.last_batch_seconds,
+                    "throughput_per_second": self.throughput(),
+                },
+            )
+            pipe.hincrby(key, "claimed", claimed)
+            pipe.hincrby(key, "batches", 1)
+            for outcome, count in outcomes.items():
+                pipe.hincrby(key, f"outcome:{outcome}", count)
+            for channel, count in channels.items():
+                pipe.hincrby(key, f"channel:{channel}", count)
+            pipe.expire(key, METRICS_TTL_SECONDS)
+            pipe.sadd(WORKER_REGISTRY_KEY, worker_id)
+            pipe.execute()
+        except Exception as e:
+            logger.warning(f"[{worker_id}] 워커 메트릭 기록 실패: {e}")
+
+
+def _parse_worker_metrics(worker_id: str, data: dict[str, str], now: float) -> dict[str, Any]:
+    started_at = float(data.get("started_at", now))
+    last_seen = float(data.get("last_seen", now))
+    active = now - last_seen <= THROUGHPUT_WINDOW_SECONDS
+    return {
+        "worker_id": worker_id,
+        "queues": [name for name in data.get("queues", "").split(",") if name],
+        "uptime_seconds": round(last_seen - started_at, 1),
+        "last_seen_seconds_ago": round(now - last_seen, 1),
+        "claimed": int(data.get("claimed", 0)),
+        "batches": int(data.get("batches", 0)),
+        "outcomes": {
+            field.split(":", 1)[1]: int(value)
+            for field, value in data.items()
+            if field.startswith("outcome:")
+        },
+        "channels": {
+            field.split(":", 1)[1]: int(value)
+            for field, value in data.items()
+            if field.startswith("channel:")
+        },
+        "last_batch_seconds": round(float(data.get("last_batch_seconds", 0)), 3),
+        # 최근 구간에 배치가 없던 워커는 처리량 0
+        "throughput_per_second": (
+            round(float(data.get("throughput_per_second", 0)), 2) if active else 0.0
+        ),
+    }
+
+
+def collect_worker_metrics() -> list[dict[str, Any]] | None:
+    """Redis에 기록된 전체 워커 메트릭 (Redis 미사용/조회 실패 시 None)"""
+    client = get_redis_client().get_client()
+    if not client:
+        return None
+
+    try:
+        worker_ids = sorted(client.smembers(WORKER_REGISTRY_KEY))
+        pipe = client.pipeline()
+        for worker_id in worker_ids:
+            pipe.hgetall(WORKER_METRICS_KEY.format(worker_id=worker_id))
+        results = pipe.execute()
+    except Exception as e:
+        logger.warning(f"워커 메트릭 조회 실패: {e}")
+        return None
+
+    now = time.time()
+    workers = []
+    expired = []
+    for worker_id, data in zip(worker_ids, results):
+        if data:
+            workers.append(_parse_worker_metrics(worker_id, data, now))
+        else:
+            expired.append(worker_id)
+    if expired:
+        # 보관 기간이 지난 워커는 목록에서 제거
+        try:
+            client.srem(WORKER_REGISTRY_KEY, *expired)
+        except Exception:
+            pass
+    return workers
+
+
+def summarize_worker_metrics(workers: list[dict[str, Any]]) -> dict[str, Any]:
+    """워커별 메트릭 합계"""
+    outcomes: dict[str, int] = defaultdict(int)
+    channels: dict[str, int] = defaultdict(int)
+    for worker in workers:
+        for outcome, count in worker["outcomes"].items():
+            outcomes[outcome] += count
+        for channel, count in worker["channels"].items():
+            channels[channel] += count
+    return {
+        "workers": len(workers),
+        "claimed": sum(worker["claimed"] for worker in workers),
+        "batches": sum(worker["batches"] for worker in workers),
+        "outcomes": dict(outcomes),
+        "channels": dict(channels),
+        "throughput_per_second": round(
+            sum(worker["throughput_per_second"] for worker in workers), 2
+        ),
+    }
+
+
+class NotificationWorker:
+    """SKIP LOCKED 기반 알림 큐 워커"""
+
+    def __init__(
+        self,
+        queue_names: tuple[str, ...] | list[str] = QUEUE_NAMES,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        poll_interval: float = DEFAULT_POLL_INTERVAL_SECONDS,
+        channel_concurrency: dict[NotificationChannel, int] | None = None,
+    ):
+        self.queue_names = list(queue_names)
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.channel_concurrency = {**CHANNEL_CONCURRENCY, **(channel_concurrency or {})}
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}"
+        self.metrics = WorkerMetrics()
+        self._semaphores: dict[NotificationChannel, asyncio.Semaphore] = {}
+        self._last_stale_check = 0.0
+
+    def _semaphore(self, channel: NotificationChannel) -> asyncio.Semaphore:
+        # 세마포어는 실행 중인 이벤트 루프에서 생성
+        if channel not in self._semaphores:
+            self._semaphores[channel] = asyncio.Semaphore(self.channel_concurrency.get(channel, 1))
+        return self._semaphores[channel]
+
+    def _claim(self) -> list[tuple[Any, NotificationChannel]]:
+        """큐 항목을 선점하고 (큐 항목 ID, 채널) 목록 반환"""
+        from app.database import SessionLocal
+        from app.services.notification_service import NotificationService
+
+        db = SessionLocal()
+        try:
+            service = NotificationService(db)
+            if time.time() - self._last_stale_check > LEASE_SECONDS / 2:
+                service.release_stale_items(LEASE_SECONDS)
+                self._last_stale_check = time.time()
+
+            queue_items = service.claim_queue_items(self.queue_names, self.batch_size)
+            if not queue_items:
+                return []
+
+            channels = dict(
+                db.query(Notification.id, Notification.channel).filter(
+                    Notification.id.in_([item.notification_id for item in queue_items])
+                )
+            )
+            return [(item.id, channels.get(item.notification_id)) for item in queue_items]
+        finally:
+            db.close()
+
+    async def _deliver(self, channel: NotificationChannel | None, queue_item_ids: list) -> dict[str, int]:
+        """선점한 항목 묶음을 별도 세션으로 전송"""
+        from app.database import SessionLocal
+        from app.services.notification_service import NotificationService
+
+        async with self._semaphore(channel or NotificationChannel.IN_APP):
+            db = SessionLocal()
+            try:
+                queue_items = (
+                    db.query(NotificationQueue)
+                    .filter(NotificationQueue.id.in_(queue_item_ids))
+                    .all()
+                )
+                return await NotificationService(db).deliver_queue_items(queue_items)
+            except Exception as e:
+                logger.error(f"[{self.worker_id}] {len(queue_item_ids)}건 전송 작업 오류: {e}")
+                # 임대 만료 후 release_stale_items가 다시 pending으로 돌림
+                return {"error": len(queue_item_ids)}
+            finally:
+                db.close()
+
+    async def run_once(self) -> int:
+        """한 배치 선점 후 전송, 선점한 항목 수 반환"""
+        started = time.perf_counter()
+        claimed = await asyncio.to_thread(self._claim)
+        if not claimed:
+            return 0
+
+        by_channel: dict[NotificationChannel | None, list] = defaultdict(list)
+        for queue_item_id, channel in claimed:
+            by_channel[channel].append(queue_item_id)
+
+        channel_counts = {
+            channel.value if channel else "unknown": len(ids) for channel, ids in by_channel.items()
+        }
+        jobs = []
+        for channel, ids in by_channel.items():
+            # 푸시는 멀티캐스트 한 번에 보낼 만큼씩, 나머지는 항목별로 분할
+            chunk_size = MULTICAST_BATCH_SIZE if channel == NotificationChannel.PUSH else 1
+            for start in range(0, len(ids), chunk_size):
+                jobs.append(self._deliver(channel, ids[start:start + chunk_size]))
+
+        outcomes: dict[str, int] = defaultdict(int)
+        for result in await asyncio.gather(*jobs):
+            for outcome, count in result.items():
+                outcomes[outcome] += count
+
+        elapsed = time.perf_counter() - started
+        self.metrics.record_batch(len(claimed), outcomes, channel_counts, elapsed)
+        await asyncio.to_thread(
+            self.metrics.publish,
+            self.worker_id,
+            self.queue_names,
+            len(claimed),
+            dict(outcomes),
+            channel_counts,
+        )
+        logger.info(
+            f"[{self.worker_id}] 알림 {len(claimed)}건 처리 ({elapsed:.2f}s): {dict(outcomes)}"
+        )
+        return len(claimed)
+
+    async def run_forever(self):
+        """큐가 비어 있을 때만 대기하며 계속 처리"""
+        logger.info(f"[{self.worker_id}] 알림 큐 워커 시작: {self.queue_names}")
+        while True:
+            try:
+                claimed = await self.run_once()
+                if claimed < self.batch_size:
+                    await asyncio.sleep(self.poll_interval)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"[{self.worker_id}] 알림 큐 워커 오류: {e}")
+                await asyncio.sleep(max(self.poll_interval, 10))
+
+
+# 전역 인스턴스
+notification_worker = NotificationWorker()
+
+
+# 백그라운드 작업으로 알림 큐 처리
+async def run_notification_worker():
+    """애플리케이션 수명 주기 안에서 알림 큐 워커 실행"""
+    await notification_worker.run_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="알림 큐 워커")
+    parser.add_argument("--queues", default=",".join(QUEUE_NAMES), help="처리할 큐 (쉼표 구분)")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    parser.add_argument("--poll-interval", type=float, default=DEFAULT_POLL_INTERVAL_SECONDS)
+    args = parser.parse_args()
+
+    from app.logging_config import setup_logging
+
+    setup_logging()
+    worker = NotificationWorker(
+        queue_names=[name.strip() for name in args.queues.split(",") if name.strip()],
+        batch_size=args.batch_size,
+        poll_interval=args.poll_interval,
+    )
+
+    async def run():
+        await asyncio.gather(worker.run_forever(), prune_invalid_tokens())
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        logger.info("알림 큐 워커 종료")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,12 +3,15 @@ ODsay LAB API 서비스
 대중교통 통합 정보 제공
 """
 
+import asyncio
 import logging
 from typing import Any
 
 import httpx
 
 from app.config import settings
+from app.services.region_gazetteer import region_gazetteer
+from app.services.route_geometry import compact_stations
 
 logger = logging.getLogger(__name__)
 
@@ -18,6 +21,7 @@ class OdsayService:
         self.api_key = settings.odsay_api_key
         self.base_url = settings.odsay_api_url
         self.session = None
+        self._semaphore: asyncio.Semaphore | None = None
         
         # ODsay API 지역별 CID (City ID) 매핑
         self.city_id_mapping = {
@@ -46,6 +50,18 @@ class OdsayService:
             self.session = httpx.AsyncClient(timeout=30.0)
         return self.session
 
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        # 실행 중인 이벤트 루프에서 생성
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(settings.odsay_max_concurrency)
+        return self._semaphore
+
+    async def _request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """ODsay API 요청 (워커당 동시 요청 수 제한)"""
+        session = await self._get_session()
+        async with self._get_semaphore():
+            return await session.request(method, url, **kwargs)
+
     async def close(self):
         """세션 종료"""
         if self.session and not self.session.is_closed:
@@ -69,7 +85,6 @@ class OdsayService:
             logger.info(f"🚌 ODsay API 요청 시작 - 지역: {target_city} (CID: {city_id})")
             logger.info(f"📍 좌표: ({start_y}, {start_x}) -> ({end_y}, {end_x})")
             
-            session = await self._get_session()
 
             url = f"{self.base_url}/searchPubTransPathT"
             params = {
@@ -84,7 +99,7 @@ class OdsayService:
             logger.info(f"🔗 요청 URL: {url}")
             logger.info(f"📝 요청 파라미터: {params}")
 
-            response = await session.get(url, params=params)
+            response = await self._request("GET", url, params=params)
             logger.info(f"📊 ODsay API 응답 상태: {response.status_code}")
             response.raise_for_status()
 
@@ -176,47 +191,7 @@ class OdsayService:
 
     def _get_region_from_coordinates(self, lat: float, lng: float) -> str:
         """좌표로부터 지역 코드 추출"""
-        # 주요 도시별 좌표 범위 (좁은 범위부터 넓은 범위 순으로 검사)
-        
-        # 광역시 (좁은 범위)
-        if 35.0 <= lat <= 35.3 and 128.9 <= lng <= 129.3:
-            return "부산"
-        elif 37.45 <= lat <= 37.70 and 126.8 <= lng <= 127.2:
-            return "서울"
-        elif 35.8 <= lat <= 36.0 and 128.5 <= lng <= 128.7:
-            return "대구"
-        elif 37.3 <= lat <= 37.5 and 126.4 <= lng <= 126.8:
-            return "인천"
-        elif 35.1 <= lat <= 35.2 and 126.8 <= lng <= 127.0:
-            return "광주"
-        elif 36.2 <= lat <= 36.4 and 127.3 <= lng <= 127.5:
-            return "대전"
-        elif 35.5 <= lat <= 35.6 and 129.2 <= lng <= 129.4:
-            return "울산"
-        elif 33.1 <= lat <= 33.6 and 126.1 <= lng <= 126.9:
-            return "제주"
-        elif 36.4 <= lat <= 36.5 and 127.2 <= lng <= 127.3:
-            return "세종"
-        
-        # 도 단위 (넓은 범위)
-        elif 37.0 <= lat <= 38.3 and 126.4 <= lng <= 127.5:
-            return "경기"
-        elif 37.1 <= lat <= 38.8 and 127.6 <= lng <= 129.5:
-            return "강원"
-        elif 36.0 <= lat <= 37.2 and 127.2 <= lng <= 129.0:
-            return "충북"
-        elif 35.7 <= lat <= 37.0 and 126.1 <= lng <= 127.8:
-            return "충남"
-        elif 35.6 <= lat <= 36.8 and 126.4 <= lng <= 127.8:
-            return "전북"
-        elif 34.2 <= lat <= 35.8 and 126.0 <= lng <= 127.5:
-            return "전남"
-        elif 35.4 <= lat <= 37.2 and 128.0 <= lng <= 130.0:
-            return "경북"
-        elif 34.5 <= lat <= 36.0 and 127.4 <= lng <= 129.5:
-            return "경남"
-        else:
-            return "기타"
+        return region_gazetteer.locate_province(lat, lng)
 
     def _process_sub_paths(self, sub_paths: list[dict]) -> list[dict]:
         """세부 경로 정보 처리"""
@@ -336,13 +311,12 @@ class OdsayService:
                     "section_time": sub_path.get("sectionTime", 0)
                 })
 
-        return processed_paths
+        # 정류장 좌표는 폴리라인으로 압축 (저장/응답 크기 축소)
+        return [compact_stations(path) for path in processed_paths]
 
     async def search_station(self, station_name: str, city_code: int = 1000) -> dict[str, Any]:
         """지하철역 검색"""
         try:
-            session = await self._get_session()
-
             url = f"{self.base_url}/searchStation"
             params = {
                 "stationName": station_name,
@@ -350,7 +324,7 @@ class OdsayService:
                 "apiKey": self.api_key
             }
 
-            response = await session.get(url, params=params)
+            response = await self._request("GET", url, params=params)
             response.raise_for_status()
 
             data = response.json()
@@ -377,15 +351,13 @@ class OdsayService:
     async def get_bus_lane_info(self, bus_id: str) -> dict[str, Any]:
         """버스 노선 정보 조회"""
         try:
-            session = await self._get_session()
-
             url = f"{self.base_url}/busLaneDetail"
             params = {
                 "busID": bus_id,
                 "apiKey": self.api_key
             }
 
-            response = await session.get(url, params=params)
+            response = await self._request("GET", url, params=params)
             response.raise_for_status()
 
             data = response.json()
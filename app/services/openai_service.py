@@ -3,9 +3,8 @@
 import logging
 from typing import Any
 
-from openai import OpenAI
-
 from app.config import settings
+from app.utils.lazy import lazy_instance
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +23,9 @@ class OpenAIService:
                 os.environ.pop(proxy_var, None)
             
             try:
+                # openai 패키지는 import 비용이 커서 클라이언트 생성 시점에 로드
+                from openai import OpenAI
+
                 # OpenAI v1.x에서는 proxies 파라미터를 지원하지 않음
                 # 환경 변수로 설정된 proxy는 이미 제거했으므로 기본 설정으로 초기화
                 self.client = OpenAI(api_key=settings.openai_api_key)
@@ -342,5 +344,5 @@ class OpenAIService:
             # Fallback to regular response
             return await self.generate_chatbot_response(user_message, conversation_history)
 
-# OpenAI 서비스 인스턴스
-openai_service = OpenAIService()
+# OpenAI 서비스 인스턴스 (첫 사용 시 생성)
+openai_service = lazy_instance(OpenAIService, "openai_service")
@@ -0,0 +1,187 @@
+"""
+통합 장소 검색 서비스
+pg_trgm 트라이그램 인덱스 기반 유사도 검색 (관광지/음식점/숙박/문화시설/쇼핑/레저/지역)
+"""
+
+import logging
+from typing import Any
+
+from sqlalchemy import (
+    Float,
+    String,
+    case,
+    cast,
+    func,
+    literal,
+    or_,
+    select,
+    union_all,
+)
+from sqlalchemy.orm import Session
+
+from app.models import Region
+from app.services.content_registry import CONTENT_TABLES, ContentTable
+
+logger = logging.getLogger(__name__)
+
+REGION_TYPE = "region"
+SEARCH_TYPES = (*CONTENT_TABLES.keys(), REGION_TYPE)
+
+# 이름 접두 일치 시 가산점
+PREFIX_MATCH_BONUS = 0.2
+# 주소 유사도 반영 비율 (이름보다 낮게)
+ADDRESS_WEIGHT = 0.5
+
+
+def _escape_like(term: str) -> str:
+    return term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+class PlaceSearchService:
+    """트라이그램 유사도 기반 통합 장소 검색"""
+
+    @staticmethod
+    def _score(name_column, address_column, term: str, prefix_pattern: str):
+        """이름/주소 트라이그램 유사도 점수"""
+        name_score = func.greatest(
+            func.similarity(name_column, term),
+            func.word_similarity(term, name_column),
+        )
+        address_score = func.coalesce(func.similarity(address_column, term), 0.0)
+        prefix_bonus = case((name_column.ilike(prefix_pattern), PREFIX_MATCH_BONUS), else_=0.0)
+        return func.greatest(name_score, address_score * ADDRESS_WEIGHT) + prefix_bonus
+
+    def _content_select(
+        self, table: ContentTable, term: str, region_code: str | None, limit: int
+    ):
+        model = table.model
+        name_column = table.name_column
+        pattern = f"%{_escape_like(term)}%"
+        prefix_pattern = f"{_escape_like(term)}%"
+        image_column = table.image_column
+
+        score = self._score(name_column, model.address, term, prefix_pattern)
+        stmt = select(
+            literal(table.content_type).label("place_type"),
+            cast(model.content_id, String).label("id"),
+            name_column.label("name"),
+            model.address.label("address"),
+            cast(model.latitude, Float).label("latitude"),
+            cast(model.longitude, Float).label("longitude"),
+            (image_column if image_column is not None else literal(None, String)).label(
+                "image_url"
+            ),
+            model.region_code.label("region_code"),
+            score.label("score"),
+        ).where(
+            # % 연산자와 ILIKE 모두 gin_trgm_ops 인덱스를 사용
+            or_(
+                name_column.op("%")(term),
+                name_column.ilike(pattern),
+                model.address.ilike(pattern),
+            )
+        )
+        if region_code:
+            stmt = stmt.where(model.region_code == region_code)
+
+        # 테이블별 상위 limit건만 가져온 뒤 병합
+        return stmt.order_by(score.desc()).limit(limit)
+
+    def _region_select(self, term: str, region_code: str | None, limit: int):
+        pattern = f"%{_escape_like(term)}%"
+        prefix_pattern = f"{_escape_like(term)}%"
+        score = self._score(Region.region_name, Region.region_name_full, term, prefix_pattern)
+        stmt = (
+            select(
+                literal(REGION_TYPE).label("place_type"),
+                Region.region_code.label("id"),
+                Region.region_name.label("name"),
+                Region.region_name_full.label("address"),
+                cast(Region.latitude, Float).label("latitude"),
+                cast(Region.longitude, Float).label("longitude"),
+                literal(None, String).label("image_url"),
+                Region.region_code.label("region_code"),
+                score.label("score"),
+            )
+            .where(
+                Region.is_active == True,
+                or_(
+                    Region.region_name.op("%")(term),
+                    Region.region_name.ilike(pattern),
+                    Region.region_name_full.ilike(pattern),
+                ),
+            )
+        )
+        if region_code:
+            # 해당 지역과 그 하위 지역
+            stmt = stmt.where(
+                or_(
+                    Region.region_code == region_code,
+                    Region.parent_region_code == region_code,
+                )
+            )
+        return stmt.order_by(score.desc()).limit(limit)
+
+    def search(
+        self,
+        db: Session,
+        term: str,
+        types: list[str] | None = None,
+        region_code: str | None = None,
+        limit: int = 20,
+    ) -> list[dict[str, Any]]:
+        """
+        여러 테이블을 한 번의 쿼리(UNION ALL)로 검색하고 유사도순으로 정렬
+
+        Args:
+            db: 데이터베이스 세션
+            term: 검색어
+            types: 검색할 타입 목록 (None이면 전체)
+            region_code: 지역 코드 필터 (지역 검색은 해당 지역과 하위 지역)
+            limit: 최대 결과 수
+        """
+        term = term.strip()
+        if not term:
+            return []
+
+        selected_types = types or list(SEARCH_TYPES)
+        branches = []
+        for place_type in selected_types:
+            if place_type == REGION_TYPE:
+                branches.append(self._region_select(term, region_code, limit))
+            elif place_type in CONTENT_TABLES:
+                branches.append(
+                    self._content_select(
+                        CONTENT_TABLES[place_type], term, region_code, limit
+                    )
+                )
+            else:
+                raise ValueError(f"지원하지 않는 검색 타입입니다: {place_type}")
+
+        if not branches:
+            return []
+
+        # 각 분기는 ORDER BY/LIMIT를 포함하므로 서브쿼리로 감싸서 병합
+        subqueries = [select(branch.subquery()) for branch in branches]
+        combined = union_all(*subqueries).subquery()
+        stmt = select(combined).order_by(combined.c.score.desc()).limit(limit)
+
+        rows = db.execute(stmt).mappings().all()
+        return [
+            {
+                "place_type": row["place_type"],
+                "id": row["id"],
+                "name": row["name"],
+                "address": row["address"],
+                "latitude": row["latitude"],
+                "longitude": row["longitude"],
+                "image_url": row["image_url"],
+                "region_code": row["region_code"],
+                "score": round(float(row["score"] or 0.0), 4),
+            }
+            for row in rows
+        ]
+
+
+# 전역 인스턴스
+place_search_service = PlaceSearchService()
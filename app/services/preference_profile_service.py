@@ -0,0 +1,388 @@
+"""
+사용자 선호도 프로필 저장소
+활동 이벤트마다 Redis 해시의 감쇠 카운터만 증분하고, 주기적으로 Postgres에 압축 반영
+
+- 태그/지역/체류시간 카운터: 반감기 기반 지수 감쇠 (기준 시각 대비 배율을 곱해 저장하므로
+  증분은 HINCRBYFLOAT 한 번, 조회 시 현재 배율로 나누기만 하면 됨)
+- 최근 활동: 일자별 활동 유형 카운트 해시(TTL) + 최근 조회 여행지 리스트
+- 복원: 사용자별 첫 반영 전에 DB에 압축된 값을 Redis 카운터에 한 번 더함 (복원 표시 키와 함께 원자적으로 반영)
+  → Redis 프로필은 항상 저장된 값을 포함하므로 압축 시 그대로 교체해도 기존 이력이 사라지지 않음
+- 압축: 변경된 사용자만 users.preferences의 implicit 키를 jsonb_set으로 갱신
+"""
+
+import asyncio
+import json
+import logging
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+import redis
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.utils.redis_client import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+HALF_LIFE_DAYS = 30
+DECAY_EPOCH = datetime(2025, 1, 1, tzinfo=UTC).timestamp()
+MIN_COUNTER_VALUE = 0.01  # 압축 시 이보다 작아진 카운터는 제거
+
+PROFILE_FIELDS = ("tag_counts", "liked_tags", "region_counts", "engagement")
+PROFILE_KEY = "profile:{user_id}:{field}"
+ACTIVITY_KEY = "profile:{user_id}:activity:{day}"
+RECENT_VIEWS_KEY = "profile:{user_id}:recent_views"
+HYDRATED_KEY = "profile:{user_id}:hydrated"
+DIRTY_KEY = "profile:dirty"
+
+ACTIVITY_WINDOW_DAYS = 30
+RECENT_VIEWS_LIMIT = 10
+COMPACT_INTERVAL_SECONDS = 300
+COMPACT_BATCH_SIZE = 500
+
+
+def decay_scale(timestamp: float | None = None) -> float:
+    """기준 시각 대비 감쇠 배율 (저장값 = 실제값 × 배율)"""
+    now = time.time() if timestamp is None else timestamp
+    return 2 ** ((now - DECAY_EPOCH) / (HALF_LIFE_DAYS * 86400))
+
+
+def implicit_increments(
+    activity_type: str,
+    activity_data: dict[str, Any],
+    load_tags: Callable[[str], list[str]],
+) -> dict[str, dict[str, float]]:
+    """활동 이벤트 → 필드별 카운터 증분 (기존 암묵적 선호도 규칙과 동일)"""
+    increments: dict[str, dict[str, float]] = {}
+
+    def add(field: str, key: Any, amount: float) -> None:
+        if key is None or amount <= 0:
+            return
+        bucket = increments.setdefault(field, {})
+        bucket[str(key)] = bucket.get(str(key), 0.0) + amount
+
+    destination_id = activity_data.get("destination_id")
+    if activity_type == "destination_view" and destination_id:
+        for tag in load_tags(destination_id):
+            add("tag_counts", tag, 1)
+    elif activity_type == "plan_created":
+        add("region_counts", activity_data.get("region"), 1)
+    elif activity_type == "review_created":
+        rating = activity_data.get("rating", 0)
+        if rating >= 4 and destination_id:
+            for tag in load_tags(destination_id):
+                add("liked_tags", tag, rating - 3)
+    elif activity_type in ["like_added", "bookmark_added"] and destination_id:
+        for tag in load_tags(destination_id):
+            add("liked_tags", tag, 2)
+
+    if activity_type == "page_view" and "duration" in activity_data:
+        duration = activity_data["duration"]
+        if duration > 30:  # 30초 이상 체류 시
+            add("engagement", activity_data.get("page_type"), duration)
+
+    return increments
+
+
+class PreferenceProfileStore:
+    """Redis 기반 증분 선호도 프로필"""
+
+    def _get_redis(self):
+        return get_redis_client().get_client()
+
+    @property
+    def available(self) -> bool:
+        return self._get_redis() is not None
+
+    # ------------------------------------------------------------------
+    # 쓰기
+    # ------------------------------------------------------------------
+
+    def record_event(
+        self,
+        user_id: Any,
+        activity_type: str,
+        activity_data: dict[str, Any],
+        load_tags: Callable[[str], list[str]],
+        load_implicit: Callable[[], dict[str, Any] | None],
+    ) -> bool:
+        """
+        활동 이벤트를 프로필 카운터에 반영
+
+        Args:
+            load_implicit: DB에 압축된 암묵적 선호도 조회 (Redis 프로필 복원 전 한 번만 호출)
+
+        Returns:
+            Redis에 반영했으면 True (Redis 미사용 시 False - 호출자가 DB에 직접 반영)
+        """
+        redis_client = self._get_redis()
+        if not redis_client:
+            return False
+
+        increments = implicit_increments(activity_type, activity_data, load_tags)
+        if increments and not self.ensure_hydrated(user_id, load_implicit):
+            return False
+        now = time.time()
+        scale = decay_scale(now)
+        day = datetime.fromtimestamp(now, UTC).strftime("%Y%m%d")
+
+        try:
+            pipe = redis_client.pipeline(transaction=False)
+            for field, values in increments.items():
+                key = PROFILE_KEY.format(user_id=user_id, field=field)
+                for name, amount in values.items():
+                    pipe.hincrbyfloat(key, name, amount * scale)
+
+            activity_key = ACTIVITY_KEY.format(user_id=user_id, day=day)
+            pipe.hincrby(activity_key, activity_type, 1)
+            pipe.expire(activity_key, (ACTIVITY_WINDOW_DAYS + 1) * 86400)
+
+            destination_id = activity_data.get("destination_id")
+            if activity_type == "destination_view" and destination_id:
+                views_key = RECENT_VIEWS_KEY.format(user_id=user_id)
+                pipe.lpush(
+                    views_key,
+                    json.dumps(
+                        {
+                            "destination_id": str(destination_id),
+                            "viewed_at": datetime.fromtimestamp(now, UTC).isoformat(),
+                        }
+                    ),
+                )
+                pipe.ltrim(views_key, 0, RECENT_VIEWS_LIMIT - 1)
+
+            if increments:
+                pipe.sadd(DIRTY_KEY, str(user_id))
+            pipe.execute()
+            return True
+        except Exception as e:
+            logger.warning(f"선호도 프로필 반영 실패: {e}")
+            return False
+
+    def ensure_hydrated(
+        self, user_id: Any, load_implicit: Callable[[], dict[str, Any] | None]
+    ) -> bool:
+        """
+        Redis 프로필에 DB에 압축된 값을 (사용자당 한 번) 더함
+
+        카운터를 덮어쓰지 않고 더하므로 다른 워커의 증분과 순서에 관계없이 합산되고,
+        복원할 값을 먼저 모두 계산한 뒤 복원 표시 키와 함께 MULTI/EXEC 한 번으로 반영하므로
+        다른 요청/압축 작업이 일부만 복원된 프로필을 보지 않음 (복원 표시 키 WATCH로 중복 반영 방지)
+
+        Returns:
+            Redis 프로필이 저장된 값을 포함하면 True (Redis 미사용/오류 시 False)
+        """
+        redis_client = self._get_redis()
+        if not redis_client:
+            return False
+        hydrated_key = HYDRATED_KEY.format(user_id=user_id)
+        try:
+            with redis_client.pipeline(transaction=True) as pipe:
+                pipe.watch(hydrated_key)
+                if pipe.exists(hydrated_key):
+                    return True
+
+                implicit = load_implicit() or {}
+                # 압축 시점 기준 값이므로 그 시점 배율을 적용해야 이후 감쇠가 이어짐
+                try:
+                    scale = decay_scale(
+                        datetime.fromisoformat(implicit.get("compacted_at")).timestamp()
+                    )
+                except (TypeError, ValueError):
+                    scale = decay_scale()
+                restored: dict[str, dict[str, float]] = {}
+                for field in PROFILE_FIELDS:
+                    values = implicit.get(field) or {}
+                    restored[field] = {
+                        str(name): float(value) * scale
+                        for name, value in values.items()
+                        if isinstance(value, int | float) and value > 0
+                    }
+
+                pipe.multi()
+                pipe.set(hydrated_key, "1")
+                for field, values in restored.items():
+                    key = PROFILE_KEY.format(user_id=user_id, field=field)
+                    for name, value in values.items():
+                        pipe.hincrbyfloat(key, name, value)
+                pipe.execute()
+            return True
+        except redis.WatchError:
+            return True  # 다른 워커가 복원함
+        except Exception as e:
+            logger.warning(f"선호도 프로필 복원 실패: {e}")
+            return False
+
+    # ------------------------------------------------------------------
+    # 읽기
+    # ------------------------------------------------------------------
+
+    def get_implicit(self, user_id: Any) -> dict[str, Any] | None:
+        """현재 시점으로 감쇠된 암묵적 선호도 (Redis 미사용 시 None)"""
+        redis_client = self._get_redis()
+        if not redis_client:
+            return None
+        try:
+            pipe = redis_client.pipeline(transaction=False)
+            for field in PROFILE_FIELDS:
+                pipe.hgetall(PROFILE_KEY.format(user_id=user_id, field=field))
+            raw_fields = pipe.execute()
+        except Exception as e:
+            logger.warning(f"선호도 프로필 조회 실패: {e}")
+            return None
+
+        scale = decay_scale()
+        implicit = {}
+        for field, values in zip(PROFILE_FIELDS, raw_fields):
+            if values:
+                implicit[field] = {
+                    name: round(float(value) / scale, 3) for name, value in values.items()
+                }
+        return implicit
+
+    def get_recent_activities(
+        self, user_id: Any, days: int = ACTIVITY_WINDOW_DAYS
+    ) -> dict[str, Any] | None:
+        """최근 활동 요약 (일자별 카운트 합산, Redis 미사용 시 None)"""
+        redis_client = self._get_redis()
+        if not redis_client:
+            return None
+
+        today = datetime.now(UTC).date()
+        try:
+            pipe = redis_client.pipeline(transaction=False)
+            for offset in range(days):
+                day = (today - timedelta(days=offset)).strftime("%Y%m%d")
+                pipe.hgetall(ACTIVITY_KEY.format(user_id=user_id, day=day))
+            pipe.lrange(RECENT_VIEWS_KEY.format(user_id=user_id), 0, RECENT_VIEWS_LIMIT - 1)
+            *daily, recent_views = pipe.execute()
+        except Exception as e:
+            logger.warning(f"최근 활동 조회 실패: {e}")
+            return None
+
+        if not recent_views and not any(daily):
+            # Redis에 기록이 없으면 (도입 이전 활동, 만료 등) 호출자가 활동 로그로 집계
+            return None
+
+        activity_summary: dict[str, int] = {}
+        for counts in daily:
+            for activity_type, count in counts.items():
+                activity_summary[activity_type] = activity_summary.get(activity_type, 0) + int(count)
+
+        return {
+            "activity_summary": activity_summary,
+            # 기존 응답과 같이 오래된 순서
+            "recent_destination_views": [json.loads(item) for item in reversed(recent_views)],
+            "total_activities": sum(activity_summary.values()),
+        }
+
+    # ------------------------------------------------------------------
+    # 압축 (Redis → Postgres)
+    # ------------------------------------------------------------------
+
+    def compact(self, db: Session, batch_size: int = COMPACT_BATCH_SIZE) -> int:
+        """변경된 사용자 프로필을 users.preferences.implicit에 반영, 처리 건수 반환"""
+        redis_client = self._get_redis()
+        if not redis_client:
+            return 0
+
+        user_ids = redis_client.spop(DIRTY_KEY, batch_size) or []
+        if not user_ids:
+            return 0
+
+        # 복원되지 않은 프로필은 저장된 값을 포함하지 않으므로 DB에 덮어쓰지 않음
+        pipe = redis_client.pipeline(transaction=False)
+        for user_id in user_ids:
+            pipe.exists(HYDRATED_KEY.format(user_id=user_id))
+        hydrated = pipe.execute()
+        skipped = [user_id for user_id, exists in zip(user_ids, hydrated) if not exists]
+        if skipped:
+            logger.warning(f"복원되지 않은 선호도 프로필 압축 생략: {len(skipped)}명")
+
+        params = []
+        for user_id, exists in zip(user_ids, hydrated):
+            if not exists:
+                continue
+            implicit = self.get_implicit(user_id) or {}
+            # 충분히 감쇠된 카운터 정리
+            pipe = redis_client.pipeline(transaction=False)
+            for field, values in implicit.items():
+                stale = [name for name, value in values.items() if value < MIN_COUNTER_VALUE]
+                if stale:
+                    pipe.hdel(PROFILE_KEY.format(user_id=user_id, field=field), *stale)
+                    for name in stale:
+                        values.pop(name)
+            pipe.execute()
+
+            implicit["compacted_at"] = datetime.now(UTC).isoformat()
+            params.append(
+                {"user_id": user_id, "implicit": json.dumps(implicit, ensure_ascii=False)}
+            )
+
+        if not params:
+            return len(user_ids)
+
+        try:
+            # implicit 키만 교체 (preferences 문서 전체를 읽고 쓰지 않음)
+            db.execute(
+                text(
+                    """
+                    UPDATE users
+                    SET preferences = jsonb_set(
+                        COALESCE(preferences, '{}'::jsonb),
+                        '{implicit}',
+                        CAST(:implicit AS jsonb)
+                    )
+                    WHERE user_id = CAST(:user_id AS uuid)
+                    """
+                ),
+                params,
+            )
+            db.commit()
+        except Exception:
+            db.rollback()
+            # 다음 주기에 다시 시도
+            redis_client.sadd(DIRTY_KEY, *user_ids)
+            raise
+
+        logger.info(f"선호도 프로필 압축 반영: {len(params)}명")
+        return len(params)
+
+
+# 전역 인스턴스
+preference_profile_store = PreferenceProfileStore()
+
+
+def _run_compaction() -> int:
+    from app.database import SessionLocal
+
+    db = SessionLocal()
+    try:
+        return preference_profile_store.compact(db)
+    finally:
+        db.close()
+
+
+# 백그라운드 작업으로 프로필 주기적 압축
+async def compact_preference_profiles():
+    """Redis 프로필 카운터를 주기적으로 Postgres에 반영"""
+    while True:
+        try:
+            await asyncio.sleep(COMPACT_INTERVAL_SECONDS)
+            # 주기마다 한 워커만 압축 수행
+            if not await asyncio.to_thread(
+                get_redis_client().acquire_job_lock,
+                "profile:compact",
+                COMPACT_INTERVAL_SECONDS - 5,
+            ):
+                continue
+            # 배치 크기만큼 처리했으면 남은 사용자가 있을 수 있으므로 이어서 처리
+            while await asyncio.to_thread(_run_compaction) >= COMPACT_BATCH_SIZE:
+                pass
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"선호도 프로필 압축 작업 오류: {e}")
+            await asyncio.sleep(60)
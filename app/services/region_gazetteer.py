@@ -0,0 +1,325 @@
+"""
+지역 가제티어 (Region Gazetteer)
+좌표 ↔ 지역 조회를 위한 프로세스 단위 공간 인덱스
+
+- regions 테이블을 한 번만 적재하고 변경 시에만 다시 적재
+- 격자(grid) 인덱스 + 하버사인 거리로 최근접 지역 조회
+- 광역시도 경계 박스 기반 point-in-region 조회 (DB 불필요)
+"""
+
+import logging
+import math
+import threading
+import time
+from dataclasses import dataclass
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.models import Region
+
+logger = logging.getLogger(__name__)
+
+EARTH_RADIUS_KM = 6371.0
+KM_PER_DEGREE = 111.32
+
+# 광역시도 정보: (약칭, 관광공사 지역 코드, 경계 박스 목록)
+# 경계 박스는 (최소 위도, 최대 위도, 최소 경도, 최대 경도)이며
+# 좁은 범위(광역시)부터 넓은 범위(도) 순으로 검사합니다.
+PROVINCES: list[tuple[str, str, list[tuple[float, float, float, float]]]] = [
+    ("부산", "6", [(35.0, 35.3, 128.9, 129.3)]),
+    ("서울", "1", [(37.45, 37.70, 126.8, 127.2)]),
+    ("대구", "4", [(35.8, 36.0, 128.5, 128.7)]),
+    ("인천", "2", [(37.3, 37.5, 126.4, 126.8)]),
+    ("광주", "5", [(35.1, 35.2, 126.8, 127.0)]),
+    ("대전", "3", [(36.2, 36.4, 127.3, 127.5)]),
+    ("울산", "7", [(35.5, 35.6, 129.2, 129.4)]),
+    ("제주", "39", [(33.1, 33.6, 126.1, 126.9)]),
+    ("세종", "8", [(36.4, 36.5, 127.2, 127.3)]),
+    ("경기", "31", [(37.0, 38.3, 126.4, 127.5)]),
+    ("강원", "32", [(37.1, 38.8, 127.6, 129.5)]),
+    ("충북", "33", [(36.0, 37.2, 127.2, 129.0)]),
+    ("충남", "34", [(35.7, 37.0, 126.1, 127.8)]),
+    ("전북", "37", [(35.6, 36.8, 126.4, 127.8)]),
+    ("전남", "38", [(34.2, 35.8, 126.0, 127.5)]),
+    ("경북", "35", [(35.4, 37.2, 128.0, 130.0), (37.4, 37.6, 130.8, 131.0)]),
+    ("경남", "36", [(34.5, 36.0, 127.4, 129.5)]),
+]
+
+# 섬 지역 경계 박스 (제주도, 울릉도)
+ISLAND_BOXES: list[tuple[float, float, float, float]] = [
+    (33.1, 33.6, 126.1, 126.9),
+    (37.4, 37.6, 130.8, 131.0),
+]
+
+UNKNOWN_REGION = "기타"
+
+
+def haversine_km(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    """두 지점 간 대원 거리 (km, 하버사인 공식)"""
+    lat1_rad = math.radians(lat1)
+    lat2_rad = math.radians(lat2)
+    delta_lat = math.radians(lat2 - lat1)
+    delta_lng = math.radians(lng2 - lng1)
+
+    a = (
+        math.sin(delta_lat / 2) ** 2
+        + math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(delta_lng / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+def _in_box(lat: float, lng: float, box: tuple[float, float, float, float]) -> bool:
+    min_lat, max_lat, min_lng, max_lng = box
+    return min_lat <= lat <= max_lat and min_lng <= lng <= max_lng
+
+
+@dataclass(frozen=True)
+class RegionEntry:
+    """가제티어에 적재되는 지역 요약 정보"""
+
+    region_code: str
+    region_name: str
+    region_level: int | None
+    parent_region_code: str | None
+    tour_api_area_code: str | None
+    latitude: float
+    longitude: float
+
+
+class RegionGazetteer:
+    """프로세스 단위 지역 공간 인덱스"""
+
+    def __init__(self, cell_size_deg: float = 0.25, refresh_interval: int = 300):
+        self.cell_size_deg = cell_size_deg
+        self.refresh_interval = refresh_interval
+        self._lock = threading.Lock()
+        # (지역 목록, 격자 셀 → 지역 인덱스, 셀 범위) - 갱신 시 통째로 교체
+        self._index: tuple[list[RegionEntry], dict, tuple[int, int, int, int]] = (
+            [],
+            {},
+            (0, 0, 0, 0),
+        )
+        self._by_code: dict[str, RegionEntry] = {}
+        self._version: tuple | None = None
+        self._checked_at = 0.0
+
+    # ------------------------------------------------------------------
+    # 적재 및 갱신
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _fetch_version(db: Session) -> tuple:
+        """regions 테이블 변경 감지용 버전 (행 수, 최종 수정 시각)"""
+        count, last_updated = db.query(
+            func.count(Region.region_code), func.max(Region.updated_at)
+        ).one()
+        return (count, last_updated)
+
+    def _cell(self, lat: float, lng: float) -> tuple[int, int]:
+        return (
+            math.floor(lat / self.cell_size_deg),
+            math.floor(lng / self.cell_size_deg),
+        )
+
+    def _load(self, db: Session, version: tuple) -> None:
+        rows = (
+            db.query(
+                Region.region_code,
+                Region.region_name,
+                Region.region_level,
+                Region.parent_region_code,
+                Region.tour_api_area_code,
+                Region.latitude,
+                Region.longitude,
+            )
+            .filter(
+                Region.is_active == True,
+                Region.latitude.isnot(None),
+                Region.longitude.isnot(None),
+            )
+            .all()
+        )
+
+        entries = [
+            RegionEntry(
+                region_code=row.region_code,
+                region_name=row.region_name,
+                region_level=row.region_level,
+                parent_region_code=row.parent_region_code,
+                tour_api_area_code=row.tour_api_area_code,
+                latitude=float(row.latitude),
+                longitude=float(row.longitude),
+            )
+            for row in rows
+        ]
+        grid: dict[tuple[int, int], list[int]] = {}
+        for index, entry in enumerate(entries):
+            grid.setdefault(self._cell(entry.latitude, entry.longitude), []).append(
+                index
+            )
+
+        cells = list(grid) or [(0, 0)]
+        bounds = (
+            min(i for i, _ in cells),
+            max(i for i, _ in cells),
+            min(j for _, j in cells),
+            max(j for _, j in cells),
+        )
+        self._index = (entries, grid, bounds)
+        self._by_code = {entry.region_code: entry for entry in entries}
+        self._version = version
+        logger.info(f"지역 가제티어 적재 완료: {len(entries)}개 지역")
+
+    def ensure_loaded(self, db: Session) -> None:
+        """최초 호출 시 적재, 이후에는 refresh_interval마다 변경 여부만 확인"""
+        now = time.monotonic()
+        if self._version is not None and now - self._checked_at < self.refresh_interval:
+            return
+
+        with self._lock:
+            if (
+                self._version is not None
+                and now - self._checked_at < self.refresh_interval
+            ):
+                return
+            try:
+                version = self._fetch_version(db)
+                if version != self._version:
+                    self._load(db, version)
+            except Exception as e:
+                # 적재 실패 시 기존 인덱스 유지
+                logger.error(f"지역 가제티어 적재 실패: {e}")
+            self._checked_at = now
+
+    def invalidate(self) -> None:
+        """다음 조회 시 변경 여부를 즉시 다시 확인하도록 표시"""
+        self._checked_at = 0.0
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+
+    def get(self, db: Session, region_code: str) -> RegionEntry | None:
+        """지역 코드로 적재된 지역 조회"""
+        self.ensure_loaded(db)
+        return self._by_code.get(region_code)
+
+    def nearest(
+        self,
+        db: Session,
+        latitude: float,
+        longitude: float,
+        region_level: int | None = None,
+        max_distance_km: float | None = None,
+    ) -> tuple[RegionEntry, float] | None:
+        """
+        가장 가까운 지역과 거리(km) 반환
+
+        조회 지점의 격자 셀부터 고리(ring) 단위로 넓혀가며 탐색하고,
+        남은 셀의 최소 거리가 현재 최단 거리보다 크면 중단합니다.
+        """
+        self.ensure_loaded(db)
+        entries, grid, (min_i, max_i, min_j, max_j) = self._index
+        if not entries:
+            return None
+
+        center_i, center_j = self._cell(latitude, longitude)
+        max_ring = max(
+            abs(min_i - center_i),
+            abs(max_i - center_i),
+            abs(min_j - center_j),
+            abs(max_j - center_j),
+        )
+
+        best: RegionEntry | None = None
+        best_distance = float("inf")
+
+        for ring in range(max_ring + 1):
+            if best is not None:
+                # ring 바깥 셀까지의 최소 거리 (경도 방향은 고위도 기준으로 보수적으로 계산)
+                reach_deg = (ring - 1) * self.cell_size_deg
+                lat_bound = min(89.0, abs(latitude) + reach_deg)
+                min_km = reach_deg * KM_PER_DEGREE * math.cos(math.radians(lat_bound))
+                if min_km > best_distance:
+                    break
+
+            for i in range(center_i - ring, center_i + ring + 1):
+                for j in range(center_j - ring, center_j + ring + 1):
+                    if max(abs(i - center_i), abs(j - center_j)) != ring:
+                        continue
+                    for index in grid.get((i, j), ()):
+                        entry = entries[index]
+                        if region_level is not None and entry.region_level != region_level:
+                            continue
+                        distance = haversine_km(
+                            latitude, longitude, entry.latitude, entry.longitude
+                        )
+                        if distance < best_distance:
+                            best, best_distance = entry, distance
+
+        if best is None:
+            return None
+        if max_distance_km is not None and best_distance > max_distance_km:
+            return None
+        return best, best_distance
+
+    def within(
+        self,
+        db: Session,
+        latitude: float,
+        longitude: float,
+        radius_km: float,
+        region_level: int | None = None,
+    ) -> list[tuple[RegionEntry, float]]:
+        """반경 내 지역 목록 (거리순)"""
+        self.ensure_loaded(db)
+        entries, grid, _ = self._index
+        lat_cells = math.ceil(radius_km / KM_PER_DEGREE / self.cell_size_deg)
+        lng_km = KM_PER_DEGREE * max(
+            math.cos(math.radians(min(89.0, abs(latitude) + radius_km / KM_PER_DEGREE))),
+            0.01,
+        )
+        lng_cells = math.ceil(radius_km / lng_km / self.cell_size_deg)
+        center_i, center_j = self._cell(latitude, longitude)
+
+        results = []
+        for i in range(center_i - lat_cells, center_i + lat_cells + 1):
+            for j in range(center_j - lng_cells, center_j + lng_cells + 1):
+                for index in grid.get((i, j), ()):
+                    entry = entries[index]
+                    if region_level is not None and entry.region_level != region_level:
+                        continue
+                    distance = haversine_km(
+                        latitude, longitude, entry.latitude, entry.longitude
+                    )
+                    if distance <= radius_km:
+                        results.append((entry, distance))
+
+        results.sort(key=lambda item: item[1])
+        return results
+
+    @staticmethod
+    def locate_province(latitude: float, longitude: float) -> str:
+        """좌표가 속한 광역시도 약칭 반환 (경계 밖이면 '기타')"""
+        for name, _, boxes in PROVINCES:
+            if any(_in_box(latitude, longitude, box) for box in boxes):
+                return name
+        return UNKNOWN_REGION
+
+    @staticmethod
+    def is_island(latitude: float, longitude: float) -> bool:
+        """섬 지역(제주도, 울릉도) 여부"""
+        return any(_in_box(latitude, longitude, box) for box in ISLAND_BOXES)
+
+    @staticmethod
+    def get_tour_api_area_code(province_name: str) -> str | None:
+        """광역시도 약칭으로 관광공사 지역 코드 조회"""
+        for name, area_code, _ in PROVINCES:
+            if name == province_name:
+                return area_code
+        return None
+
+
+# 전역 인스턴스
+region_gazetteer = RegionGazetteer()
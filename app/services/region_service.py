@@ -8,6 +8,7 @@ from sqlalchemy.orm import Session
 
 from app.database import get_db
 from app.models import Region
+from app.services.region_gazetteer import region_gazetteer
 
 
 class RegionService:
@@ -134,24 +135,13 @@ class RegionService:
     def get_nearest_region(
         db: Session, latitude: float, longitude: float
     ) -> Region | None:
-        """가장 가까운 지역 찾기"""
-        regions = RegionService.get_all_regions(db)
-
-        min_distance = float("inf")
-        nearest_region = None
-
-        for region in regions:
-            if region.latitude and region.longitude:
-                distance = (
-                    (latitude - float(region.latitude)) ** 2
-                    + (longitude - float(region.longitude)) ** 2
-                ) ** 0.5
-
-                if distance < min_distance:
-                    min_distance = distance
-                    nearest_region = region
+        """가장 가까운 지역 찾기 (지역 가제티어 공간 인덱스 사용)"""
+        result = region_gazetteer.nearest(db, latitude, longitude)
+        if result is None:
+            return None
 
-        return nearest_region
+        nearest_entry, _ = result
+        return RegionService.get_region_by_code(db, nearest_entry.region_code)
 
     @staticmethod
     def get_region_statistics(db: Session) -> dict:
@@ -0,0 +1,248 @@
+"""
+경로 geometry 압축
+TMAP/ODsay 경로의 좌표 목록을 인코딩된 폴리라인(Encoded Polyline Algorithm Format) 문자열로 저장/응답
+
+- route_data["geometry"] ([경도, 위도] 목록) → route_data["polyline"] (위도/경도 순서의 표준 폴리라인, 정밀도 5 ≈ 1m)
+  → 프론트엔드 지도 라이브러리(google.maps.geometry.encoding, @mapbox/polyline)로 바로 디코딩 가능
+- 저장 시 허용 오차(기본 1m) Douglas–Peucker 단순화로 직선 구간의 중복 점 제거
+- 응답 시 zoom을 지정하면 해당 줌 레벨의 화면 1픽셀 크기를 허용 오차로 추가 단순화
+- 대중교통 정류장 좌표(x, y)는 세부 경로별 stations_polyline으로 압축
+- expand_route_data로 기존 형식(좌표 목록)을 복원하므로 이전 형식 데이터/클라이언트와 호환
+"""
+
+import math
+from collections.abc import Sequence
+from typing import Any
+
+from app.config import settings
+
+POLYLINE_PRECISION = 5
+EARTH_RADIUS_M = 6_371_008.8
+# 웹 메르카토르 줌 0에서 적도 기준 픽셀당 거리 (m, 256px 타일)
+METERS_PER_PIXEL_Z0 = 156_543.03392
+
+GEOMETRY_FORMAT_PATTERN = "^(polyline|coordinates)$"
+
+
+def encode_polyline(points: Sequence[Sequence[float]], precision: int = POLYLINE_PRECISION) -> str:
+    """[경도, 위도] 목록을 폴리라인 문자열로 인코딩 (표준 형식이므로 위도, 경도 순서로 기록)"""
+    factor = 10**precision
+    chunks = []
+    prev_lat = prev_lng = 0
+    for lng, lat in points:
+        lat_i = round(lat * factor)
+        lng_i = round(lng * factor)
+        for delta in (lat_i - prev_lat, lng_i - prev_lng):
+            value = ~(delta << 1) if delta < 0 else delta << 1
+            while value >= 0x20:
+                chunks.append(chr((0x20 | (value & 0x1F)) + 63))
+                value >>= 5
+            chunks.append(chr(value + 63))
+        prev_lat, prev_lng = lat_i, lng_i
+    return "".join(chunks)
+
+
+def decode_polyline(encoded: str, precision: int = POLYLINE_PRECISION) -> list[list[float]]:
+    """폴리라인 문자열을 [경도, 위도] 목록으로 디코딩"""
+    factor = 10**precision
+    points = []
+    index = lat = lng = 0
+    length = len(encoded)
+    while index < length:
+        deltas = []
+        for _ in range(2):
+            result = shift = 0
+            while True:
+                byte = ord(encoded[index]) - 63
+                index += 1
+                result |= (byte & 0x1F) << shift
+                shift += 5
+                if byte < 0x20:
+                    break
+            deltas.append(~(result >> 1) if result & 1 else result >> 1)
+        lat += deltas[0]
+        lng += deltas[1]
+        points.append([lng / factor, lat / factor])
+    return points
+
+
+def normalize_geometry(geometry: Sequence) -> list[list[float]]:
+    """geometry를 [경도, 위도] 쌍 목록으로 정리 (펼쳐진 숫자 목록 처리, 연속 중복점 제거)"""
+    points: list[list[float]] = []
+    pending: float | None = None
+    for item in geometry:
+        if isinstance(item, (list, tuple)) and len(item) >= 2:
+            point = [float(item[0]), float(item[1])]
+        elif isinstance(item, (int, float)):
+            # 이전 형식: Point 좌표가 목록에 펼쳐져 들어간 경우
+            if pending is None:
+                pending = float(item)
+                continue
+            point, pending = [pending, float(item)], None
+        else:
+            continue
+        if not points or points[-1] != point:
+            points.append(point)
+    return points
+
+
+def tolerance_for_zoom(zoom: int, latitude: float = 37.5) -> float:
+    """줌 레벨에서 화면 1픽셀에 해당하는 거리 (m) - 이보다 작은 편차는 화면에서 구분되지 않음"""
+    return METERS_PER_PIXEL_Z0 * math.cos(math.radians(latitude)) / (2**zoom)
+
+
+def simplify(points: list[list[float]], tolerance_m: float) -> list[list[float]]:
+    """Douglas–Peucker 단순화 (허용 오차 m, 국소 등장방형 투영으로 거리 계산)"""
+    if tolerance_m <= 0 or len(points) < 3:
+        return points
+
+    # 경로 중심 위도 기준으로 평면 좌표(m) 변환
+    mid_lat = math.radians(sum(lat for _, lat in points) / len(points))
+    scale_x = math.radians(1) * EARTH_RADIUS_M * math.cos(mid_lat)
+    scale_y = math.radians(1) * EARTH_RADIUS_M
+    xy = [(lng * scale_x, lat * scale_y) for lng, lat in points]
+
+    keep = [False] * len(points)
+    keep[0] = keep[-1] = True
+    tolerance_sq = tolerance_m * tolerance_m
+    stack = [(0, len(points) - 1)]
+    while stack:
+        start, end = stack.pop()
+        ax, ay = xy[start]
+        bx, by = xy[end]
+        dx, dy = bx - ax, by - ay
+        length_sq = dx * dx + dy * dy
+        max_dist_sq, index = 0.0, -1
+        for i in range(start + 1, end):
+            px, py = xy[i]
+            if length_sq == 0:
+                dist_sq = (px - ax) ** 2 + (py - ay) ** 2
+            else:
+                t = max(0.0, min(1.0, ((px - ax) * dx + (py - ay) * dy) / length_sq))
+                dist_sq = (px - ax - t * dx) ** 2 + (py - ay - t * dy) ** 2
+            if dist_sq > max_dist_sq:
+                max_dist_sq, index = dist_sq, i
+        if index != -1 and max_dist_sq > tolerance_sq:
+            keep[index] = True
+            stack.append((start, index))
+            stack.append((index, end))
+
+    return [point for point, kept in zip(points, keep, strict=True) if kept]
+
+
+def route_geometry(route_data: dict[str, Any] | None) -> list[list[float]]:
+    """route_data의 경로 좌표 ([경도, 위도] 목록) - 폴리라인/이전 좌표 목록 형식 모두 지원"""
+    if not route_data:
+        return []
+    if route_data.get("polyline") is not None:
+        return decode_polyline(
+            route_data["polyline"], route_data.get("polyline_precision", POLYLINE_PRECISION)
+        )
+    return normalize_geometry(route_data.get("geometry") or [])
+
+
+def compact_geometry(
+    geometry: Sequence, tolerance_m: float = settings.route_geometry_tolerance
+) -> dict[str, Any]:
+    """좌표 목록 → route_data에 병합할 폴리라인 필드"""
+    points = simplify(normalize_geometry(geometry), tolerance_m)
+    return {
+        "polyline": encode_polyline(points),
+        "polyline_precision": POLYLINE_PRECISION,
+        "point_count": len(points),
+    }
+
+
+def _parse_coordinate(value) -> float | None:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def compact_stations(sub_path: dict[str, Any]) -> dict[str, Any]:
+    """대중교통 세부 경로의 정류장 좌표(x, y) → stations_polyline"""
+    stations = sub_path.get("stations")
+    if not stations or "stations_polyline" in sub_path:
+        return sub_path
+    coordinates = [
+        (_parse_coordinate(station.get("x")), _parse_coordinate(station.get("y")))
+        for station in stations
+    ]
+    if any(x is None or y is None for x, y in coordinates):
+        return sub_path
+    return {
+        **sub_path,
+        "stations": [
+            {key: value for key, value in station.items() if key not in ("x", "y")}
+            for station in stations
+        ],
+        "stations_polyline": encode_polyline(coordinates),
+    }
+
+
+def _expand_stations(sub_path: dict[str, Any]) -> dict[str, Any]:
+    encoded = sub_path.get("stations_polyline")
+    if encoded is None:
+        return sub_path
+    expanded = {key: value for key, value in sub_path.items() if key != "stations_polyline"}
+    coordinates = decode_polyline(encoded)
+    # ODsay 원본과 같이 문자열 좌표로 복원
+    expanded["stations"] = [
+        {**station, "x": f"{x:.{POLYLINE_PRECISION}f}", "y": f"{y:.{POLYLINE_PRECISION}f}"}
+        for station, (x, y) in zip(sub_path.get("stations", []), coordinates, strict=False)
+    ]
+    return expanded
+
+
+def compact_route_data(
+    route_data: dict[str, Any] | None,
+    tolerance_m: float = settings.route_geometry_tolerance,
+) -> dict[str, Any] | None:
+    """저장/응답용 압축 형식으로 변환 (이미 압축된 데이터는 그대로)"""
+    if not isinstance(route_data, dict):
+        return route_data
+    compacted = dict(route_data)
+    if "geometry" in compacted and "polyline" not in compacted:
+        compacted.update(compact_geometry(compacted.pop("geometry") or [], tolerance_m))
+    if isinstance(compacted.get("sub_paths"), list):
+        compacted["sub_paths"] = [
+            compact_stations(sub_path) if isinstance(sub_path, dict) else sub_path
+            for sub_path in compacted["sub_paths"]
+        ]
+    return compacted
+
+
+def expand_route_data(route_data: dict[str, Any] | None) -> dict[str, Any] | None:
+    """이전 형식(geometry 좌표 목록, 정류장 x/y)으로 복원"""
+    if not isinstance(route_data, dict):
+        return route_data
+    expanded = dict(route_data)
+    if "polyline" in expanded:
+        expanded["geometry"] = route_geometry(expanded)
+        for key in ("polyline", "polyline_precision", "point_count"):
+            expanded.pop(key, None)
+    if isinstance(expanded.get("sub_paths"), list):
+        expanded["sub_paths"] = [
+            _expand_stations(sub_path) if isinstance(sub_path, dict) else sub_path
+            for sub_path in expanded["sub_paths"]
+        ]
+    return expanded
+
+
+def prepare_route_data(
+    route_data: dict[str, Any] | None,
+    zoom: int | None = None,
+    geometry_format: str = "polyline",
+) -> dict[str, Any] | None:
+    """응답용 route_data (zoom 지정 시 해당 줌 레벨로 단순화, geometry_format에 따라 압축/복원)"""
+    if not isinstance(route_data, dict):
+        return route_data
+    route_data = compact_route_data(route_data)
+    if zoom is not None and route_data.get("polyline"):
+        points = route_geometry(route_data)
+        latitude = points[0][1] if points else 37.5
+        route_data.update(compact_geometry(points, tolerance_for_zoom(zoom, latitude)))
+    if geometry_format == "coordinates":
+        return expand_route_data(route_data)
+    return route_data
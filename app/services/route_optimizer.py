@@ -8,16 +8,21 @@ import hashlib
 import json
 import logging
 import os
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional, Tuple
 
-import aiohttp
 import numpy as np
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
 logger = logging.getLogger(__name__)
 
+# 장소 간 거리/시간 추정 캐시 (워커 프로세스 로컬, 요청마다 만드는 RouteOptimizer가 함께 사용)
+# 좌표만으로 결정되는 계산 결과라 워커 간 공유(Redis 왕복)보다 로컬 계산이 빠름
+DISTANCE_CACHE_SIZE = 10_000
+_distance_cache: OrderedDict[str, Tuple[float, int]] = OrderedDict()
+
 
 class Location(BaseModel):
     """위치 정보"""
@@ -91,7 +96,7 @@ class RouteOptimizer:
         self.db = db
         self.kakao_local_key = os.getenv("KAKAO_LOCAL_API_KEY")
         self.kakao_mobility_key = os.getenv("KAKAO_MOBILITY_API_KEY")
-        self.distance_cache = {}  # 메모리 캐시
+        self.distance_cache = _distance_cache  # 워커 로컬 공유 캐시
         
     def optimize_route(self, places: List[Place], constraints: RouteConstraints) -> List[Place]:
         """
@@ -317,6 +322,7 @@ class RouteOptimizer:
         cache_key = f"{origin.latitude},{origin.longitude}:{destination.latitude},{destination.longitude}:{mode}"
         
         if cache_key in self.distance_cache:
+            self.distance_cache.move_to_end(cache_key)
             return self.distance_cache[cache_key]
         
         # 직선 거리 계산 (Haversine formula)
@@ -339,6 +345,8 @@ class RouteOptimizer:
             result = (distance, time)
         
         self.distance_cache[cache_key] = result
+        if len(self.distance_cache) > DISTANCE_CACHE_SIZE:
+            self.distance_cache.popitem(last=False)
         return result
     
     def _haversine_distance(self, lat1: float, lon1: float, lat2: float, lon2: float) -> float:
@@ -574,6 +582,9 @@ class KakaoRouteService:
         self.session = None
         
     async def __aenter__(self):
+        # aiohttp는 import 비용이 커서 세션 생성 시점에 로드
+        import aiohttp
+
         self.session = aiohttp.ClientSession()
         return self
         
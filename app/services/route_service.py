@@ -5,13 +5,13 @@ ODsay, TMAP, 구글 API를 통합하여 최적의 경로 정보 제공
 
 import asyncio
 import logging
-import math
 from typing import Any
 
 import httpx
 
 from app.config import settings
 from app.services.odsay_service import odsay_service
+from app.services.region_gazetteer import haversine_km, region_gazetteer
 from app.services.tmap_service import tmap_service
 
 logger = logging.getLogger(__name__)
@@ -35,21 +35,7 @@ class RouteService:
 
     def _calculate_distance(self, lat1: float, lng1: float, lat2: float, lng2: float) -> float:
         """두 지점 간 직선 거리 계산 (하버사인 공식)"""
-        R = 6371  # 지구 반지름 (km)
-
-        lat1_rad = math.radians(lat1)
-        lat2_rad = math.radians(lat2)
-        delta_lat = math.radians(lat2 - lat1)
-        delta_lng = math.radians(lng2 - lng1)
-
-        a = (math.sin(delta_lat / 2) * math.sin(delta_lat / 2) +
-             math.cos(lat1_rad) * math.cos(lat2_rad) *
-             math.sin(delta_lng / 2) * math.sin(delta_lng / 2))
-
-        c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
-        distance = R * c
-
-        return distance
+        return haversine_km(lat1, lng1, lat2, lng2)
 
     def _estimate_road_distance(self, lat1: float, lng1: float, lat2: float, lng2: float) -> float:
         """실제 도로망 거리 추정 (직선거리 기반 보정)"""
@@ -61,13 +47,9 @@ class RouteService:
         # 3. 섬 지역: 해안선 따라 우회 (1.4배)
         # 4. 고속도로 주행 가능 구간: 직선에 가까운 경로 (1.1배)
         
-        # 제주도 지역 확인
-        is_jeju = (33.1 <= lat1 <= 33.6 and 126.1 <= lng1 <= 126.9) or \
-                  (33.1 <= lat2 <= 33.6 and 126.1 <= lng2 <= 126.9)
-        
-        # 울릉도 지역 확인
-        is_ulleung = (37.4 <= lat1 <= 37.6 and 130.8 <= lng1 <= 131.0) or \
-                     (37.4 <= lat2 <= 37.6 and 130.8 <= lng2 <= 131.0)
+        # 섬 지역 확인 (제주도, 울릉도)
+        is_island = self._is_island_region(lat1, lng1) or \
+                    self._is_island_region(lat2, lng2)
         
         # 서울 수도권 지역 확인 (격자형 도로망)
         is_seoul_metro = (37.4 <= lat1 <= 37.7 and 126.8 <= lng1 <= 127.2) or \
@@ -92,7 +74,7 @@ class RouteService:
             correction_factor = 1.6
         
         # 지역별 추가 보정
-        if is_jeju or is_ulleung:
+        if is_island:
             correction_factor *= 1.2  # 섬 지역 해안선 우회
         elif is_seoul_metro:
             correction_factor *= 1.1  # 수도권 격자형 도로망
@@ -117,14 +99,7 @@ class RouteService:
 
     def _is_island_region(self, lat: float, lng: float) -> bool:
         """섬 지역 여부 판단"""
-        # 제주도 (33.1-33.6도, 126.1-126.9도)
-        if 33.1 <= lat <= 33.6 and 126.1 <= lng <= 126.9:
-            return True
-        # 울릉도 (37.4-37.6도, 130.8-131.0도)
-        if 37.4 <= lat <= 37.6 and 130.8 <= lng <= 131.0:
-            return True
-        # 기타 섬 지역 추가 가능
-        return False
+        return region_gazetteer.is_island(lat, lng)
 
     def _get_regional_transport_info(self, dep_lat: float, dep_lng: float, 
                                    dest_lat: float, dest_lng: float) -> dict[str, Any]:
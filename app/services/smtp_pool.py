@@ -0,0 +1,205 @@
+"""
+SMTP 연결 풀
+인증을 마친 SMTP 세션을 재사용하여 메시지마다 TCP/TLS 핸드셰이크와 로그인을 반복하지 않음
+
+- 최대 pool_size개의 연결을 유지하고 동시 전송 수도 그만큼으로 제한
+- 오래 쉬었거나 일정 개수를 보낸 연결은 닫고 새로 연결 (서버 측 유휴 종료/전송 제한 대비)
+- 전송 중 연결이 끊기면 새 연결로 한 번 재시도
+- MAIL_BACKEND=memory 이면 실제 전송 대신 메모리에 보관 (로컬 개발/테스트용 SMTP 대체)
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from email.message import EmailMessage
+
+import aiosmtplib
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+IDLE_TIMEOUT_SECONDS = 60  # 이 시간 이상 쉰 연결은 재사용하지 않음
+MAX_MESSAGES_PER_CONNECTION = 100  # 연결당 최대 전송 수 (Gmail 등 서버 제한 대비)
+SMTP_TIMEOUT_SECONDS = 30
+
+
+@dataclass
+class _PooledConnection:
+    client: aiosmtplib.SMTP
+    created_at: float = field(default_factory=time.monotonic)
+    last_used: float = field(default_factory=time.monotonic)
+    sent: int = 0
+
+    @property
+    def reusable(self) -> bool:
+        return (
+            self.client.is_connected
+            and self.sent < MAX_MESSAGES_PER_CONNECTION
+            and time.monotonic() - self.last_used < IDLE_TIMEOUT_SECONDS
+        )
+
+
+class SMTPConnectionPool:
+    """인증된 SMTP 연결 풀"""
+
+    def __init__(
+        self,
+        hostname: str,
+        port: int,
+        username: str = "",
+        password: str = "",
+        use_tls: bool = False,
+        start_tls: bool = True,
+        validate_certs: bool = True,
+        pool_size: int = 5,
+    ):
+        self.hostname = hostname
+        self.port = port
+        self.username = username
+        self.password = password
+        self.use_tls = use_tls
+        self.start_tls = start_tls
+        self.validate_certs = validate_certs
+        self.pool_size = pool_size
+        self._idle: list[_PooledConnection] = []
+        self._semaphore: asyncio.Semaphore | None = None
+        self.stats = {"sent": 0, "failed": 0, "connections_opened": 0}
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        # 실행 중인 이벤트 루프에서 생성
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.pool_size)
+        return self._semaphore
+
+    async def _connect(self) -> _PooledConnection:
+        client = aiosmtplib.SMTP(
+            hostname=self.hostname,
+            port=self.port,
+            use_tls=self.use_tls,
+            start_tls=self.start_tls and not self.use_tls,
+            validate_certs=self.validate_certs,
+            timeout=SMTP_TIMEOUT_SECONDS,
+        )
+        await client.connect()
+        if self.username:
+            await client.login(self.username, self.password)
+        self.stats["connections_opened"] += 1
+        return _PooledConnection(client=client)
+
+    async def _discard(self, connection: _PooledConnection):
+        try:
+            if connection.client.is_connected:
+                await connection.client.quit()
+        except Exception:
+            connection.client.close()
+
+    async def _acquire(self) -> _PooledConnection:
+        while self._idle:
+            connection = self._idle.pop()
+            if connection.reusable:
+                return connection
+            await self._discard(connection)
+        return await self._connect()
+
+    def _release(self, connection: _PooledConnection):
+        connection.last_used = time.monotonic()
+        if connection.reusable:
+            self._idle.append(connection)
+        else:
+            asyncio.get_running_loop().create_task(self._discard(connection))
+
+    async def send(self, message: EmailMessage):
+        """메시지 전송 (실패 시 예외)"""
+        async with self._get_semaphore():
+            connection = await self._acquire()
+            try:
+                await connection.client.send_message(message)
+            except (aiosmtplib.SMTPServerDisconnected, aiosmtplib.SMTPConnectError):
+                # 서버가 재사용 연결을 끊은 경우 새 연결로 한 번 재시도
+                connection.client.close()
+                connection = await self._connect()
+                try:
+                    await connection.client.send_message(message)
+                except Exception:
+                    self.stats["failed"] += 1
+                    await self._discard(connection)
+                    raise
+            except Exception:
+                self.stats["failed"] += 1
+                await self._discard(connection)
+                raise
+            connection.sent += 1
+            self.stats["sent"] += 1
+            self._release(connection)
+
+    async def send_many(self, messages: list[EmailMessage]) -> list[bool]:
+        """여러 메시지를 풀 크기만큼 동시에 전송, 메시지별 성공 여부 반환"""
+
+        async def _send(message: EmailMessage) -> bool:
+            try:
+                await self.send(message)
+                return True
+            except Exception as e:
+                logger.error(f"Failed to send email to {message['To']}: {str(e)}")
+                return False
+
+        return list(await asyncio.gather(*(_send(message) for message in messages)))
+
+    async def close(self):
+        """유휴 연결 모두 종료"""
+        idle, self._idle = self._idle, []
+        for connection in idle:
+            await self._discard(connection)
+
+
+class MemoryMailTransport:
+    """실제 전송 없이 메시지를 보관하는 SMTP 대체 (로컬 개발/테스트용)"""
+
+    def __init__(self, max_messages: int = 1000):
+        self.max_messages = max_messages
+        self.outbox: list[EmailMessage] = []
+        self.stats = {"sent": 0, "failed": 0, "connections_opened": 0}
+
+    async def send(self, message: EmailMessage):
+        self.outbox.append(message)
+        del self.outbox[: -self.max_messages]
+        self.stats["sent"] += 1
+
+    async def send_many(self, messages: list[EmailMessage]) -> list[bool]:
+        for message in messages:
+            await self.send(message)
+        return [True] * len(messages)
+
+    async def close(self):
+        pass
+
+
+_transport: SMTPConnectionPool | MemoryMailTransport | None = None
+
+
+def get_mail_transport() -> SMTPConnectionPool | MemoryMailTransport:
+    """설정에 따른 메일 전송 수단 (프로세스당 하나)"""
+    global _transport
+    if _transport is None:
+        if settings.mail_backend == "memory":
+            _transport = MemoryMailTransport()
+            logger.info("Using in-memory mail transport")
+        else:
+            _transport = SMTPConnectionPool(
+                hostname=settings.mail_server,
+                port=settings.mail_port,
+                username=settings.mail_username,
+                password=settings.mail_password,
+                use_tls=settings.mail_ssl_tls,
+                start_tls=settings.mail_starttls,
+                pool_size=settings.mail_pool_size,
+            )
+    return _transport
+
+
+async def close_mail_transport():
+    """애플리케이션 종료 시 SMTP 연결 정리"""
+    if _transport is not None:
+        await _transport.close()
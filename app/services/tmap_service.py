@@ -3,6 +3,7 @@ TMAP API 서비스
 자동차 경로 안내 및 교통정보 제공
 """
 
+import asyncio
 import logging
 from datetime import datetime
 from typing import Any
@@ -10,6 +11,7 @@ from typing import Any
 import httpx
 
 from app.config import settings
+from app.services.route_geometry import compact_geometry
 
 logger = logging.getLogger(__name__)
 
@@ -19,6 +21,7 @@ class TmapService:
         self.api_key = settings.tmap_api_key
         self.base_url = settings.tmap_api_url
         self.session = None
+        self._semaphore: asyncio.Semaphore | None = None
 
     async def _get_session(self) -> httpx.AsyncClient:
         """HTTP 세션 생성"""
@@ -26,6 +29,18 @@ class TmapService:
             self.session = httpx.AsyncClient(timeout=30.0)
         return self.session
 
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        # 실행 중인 이벤트 루프에서 생성
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(settings.tmap_max_concurrency)
+        return self._semaphore
+
+    async def _request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """TMAP API 요청 (워커당 동시 요청 수 제한)"""
+        session = await self._get_session()
+        async with self._get_semaphore():
+            return await session.request(method, url, **kwargs)
+
     async def close(self):
         """세션 종료"""
         if self.session and not self.session.is_closed:
@@ -36,8 +51,6 @@ class TmapService:
                            route_option: str = "trafast") -> dict[str, Any]:
         """자동차 경로 안내"""
         try:
-            session = await self._get_session()
-
             url = f"{self.base_url}/routes"
             headers = {
                 "appKey": self.api_key,
@@ -62,7 +75,7 @@ class TmapService:
                 "carType": 1  # 일반차량
             }
 
-            response = await session.post(url, headers=headers, json=data)
+            response = await self._request("POST", url, headers=headers, json=data)
             response.raise_for_status()
 
             result = response.json()
@@ -86,7 +99,7 @@ class TmapService:
                         "taxi_fee": route_info.get("taxi_fee", 0),
                         "guide_points": route_info.get("guide_points", []),
                         "detailed_guides": route_info.get("detailed_guides", []),
-                        "geometry": route_info.get("geometry", []),
+                        **route_info["geometry"],
                         "source": "TMAP",
                         "route_summary": {
                             "total_steps": len(route_info.get("guide_points", [])),
@@ -113,8 +126,6 @@ class TmapService:
                             end_x: float, end_y: float) -> dict[str, Any]:
         """도보 경로 안내"""
         try:
-            session = await self._get_session()
-
             url = f"{self.base_url}/routes/pedestrian"
             headers = {
                 "appKey": self.api_key,
@@ -132,7 +143,7 @@ class TmapService:
                 "endName": "도착지"
             }
 
-            response = await session.post(url, headers=headers, json=data)
+            response = await self._request("POST", url, headers=headers, json=data)
             response.raise_for_status()
 
             result = response.json()
@@ -151,7 +162,7 @@ class TmapService:
                         "total_time": route_info["total_time"],
                         "total_distance": route_info["total_distance"],
                         "guide_points": route_info.get("guide_points", []),
-                        "geometry": route_info.get("geometry", [])
+                        **route_info["geometry"]
                     }
                 }
             else:
@@ -247,8 +258,8 @@ class TmapService:
                         "instruction": guide_point.get("turn_instruction", "계속 진행")
                     })
 
-            # 경로 geometry
-            if geometry_data.get("coordinates"):
+            # 경로 geometry (안내점 Point 좌표는 선 구간 끝점과 같으므로 LineString만 사용)
+            if geometry_data.get("type") == "LineString" and geometry_data.get("coordinates"):
                 geometry.extend(geometry_data["coordinates"])
 
         return {
@@ -258,7 +269,7 @@ class TmapService:
             "taxi_fee": taxi_fee,
             "guide_points": guide_points,
             "detailed_guides": detailed_guides,
-            "geometry": geometry
+            "geometry": compact_geometry(geometry)  # 폴리라인 필드
         }
 
     def _extract_walk_route_info(self, features: list[dict]) -> dict[str, Any]:
@@ -286,15 +297,15 @@ class TmapService:
                     "time": props.get("time", 0)
                 })
 
-            # 경로 geometry
-            if geometry_data.get("coordinates"):
+            # 경로 geometry (안내점 Point 좌표는 선 구간 끝점과 같으므로 LineString만 사용)
+            if geometry_data.get("type") == "LineString" and geometry_data.get("coordinates"):
                 geometry.extend(geometry_data["coordinates"])
 
         return {
             "total_time": total_time,
             "total_distance": total_distance,
             "guide_points": guide_points,
-            "geometry": geometry
+            "geometry": compact_geometry(geometry)  # 폴리라인 필드
         }
 
     def _calculate_fuel_cost(self, distance_m: float) -> float:
@@ -311,8 +322,6 @@ class TmapService:
                             categories: str = "parking") -> dict[str, Any]:
         """주변 POI 검색 (주차장, 주유소 등)"""
         try:
-            session = await self._get_session()
-
             url = f"{self.base_url}/pois"
             headers = {
                 "appKey": self.api_key
@@ -329,7 +338,7 @@ class TmapService:
                 "count": 20
             }
 
-            response = await session.get(url, headers=headers, params=params)
+            response = await self._request("GET", url, headers=headers, params=params)
             response.raise_for_status()
 
             result = response.json()
@@ -360,8 +369,6 @@ class TmapService:
                                     route_option: str = "trafast") -> dict[str, Any]:
         """타임머신 경로 안내 - 특정 시간대 기준 경로 예측"""
         try:
-            session = await self._get_session()
-
             url = f"{self.base_url}/routes"
             headers = {
                 "appKey": self.api_key,
@@ -399,7 +406,7 @@ class TmapService:
                 "departureTime": formatted_time  # 타임머신 기능 - 출발 시간 지정
             }
 
-            response = await session.post(url, headers=headers, json=data)
+            response = await self._request("POST", url, headers=headers, json=data)
             response.raise_for_status()
 
             result = response.json()
@@ -425,7 +432,7 @@ class TmapService:
                         "taxi_fee": route_info.get("taxi_fee", 0),
                         "guide_points": route_info.get("guide_points", []),
                         "detailed_guides": route_info.get("detailed_guides", []),
-                        "geometry": route_info.get("geometry", []),
+                        **route_info["geometry"],
                         "source": "TMAP_TIMEMACHINE",
                         "departure_time": departure_time,
                         "predicted_for_time": formatted_time,
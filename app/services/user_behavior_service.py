@@ -10,10 +10,15 @@ from sqlalchemy.orm import Session
 from fastapi import Request
 
 from app.models import (
-    User, UserActivityLog, TravelPlan, Review, 
-    ReviewLike, TravelCourseLike, RecommendLike,
-    TouristAttraction, Restaurant, Accommodation,
-    CulturalFacility, Shopping
+    User, UserActivityLog, TravelPlan,
+    ReviewLike, TravelCourseLike
+)
+from app.services.collaborative_filtering import collaborative_engine
+from app.services.content_catalog import content_catalog
+from app.services.content_scoring import content_scorer
+from app.services.preference_profile_service import (
+    implicit_increments,
+    preference_profile_store,
 )
 
 
@@ -63,91 +68,53 @@ class UserBehaviorService:
         activity_type: str,
         activity_data: Dict[str, Any]
     ):
-        """암묵적 선호도 업데이트"""
+        """암묵적 선호도 업데이트 (Redis 프로필 카운터 증분, 미사용 시 DB 직접 반영)"""
+        
+        if preference_profile_store.record_event(
+            user_id,
+            activity_type,
+            activity_data,
+            self._get_destination_tags,
+            lambda: self._get_stored_implicit(user_id),
+        ):
+            return
+        
+        increments = implicit_increments(
+            activity_type, activity_data, self._get_destination_tags
+        )
+        if not increments:
+            return
         
         user = self.db.query(User).filter(User.user_id == user_id).first()
         if not user:
             return
         
-        # 현재 preferences 가져오기
         preferences = user.preferences or {}
-        implicit_prefs = preferences.get("implicit", {})
-        
-        # 활동 유형별 선호도 업데이트
-        if activity_type == "destination_view":
-            # 여행지 조회 시 태그 카운트 증가
-            destination_id = activity_data.get("destination_id")
-            if destination_id:
-                tags = self._get_destination_tags(destination_id)
-                tag_counts = implicit_prefs.get("tag_counts", {})
-                for tag in tags:
-                    tag_counts[tag] = tag_counts.get(tag, 0) + 1
-                implicit_prefs["tag_counts"] = tag_counts
-        
-        elif activity_type == "plan_created":
-            # 여행 계획 생성 시 지역 선호도 업데이트
-            region = activity_data.get("region")
-            if region:
-                region_counts = implicit_prefs.get("region_counts", {})
-                region_counts[region] = region_counts.get(region, 0) + 1
-                implicit_prefs["region_counts"] = region_counts
-        
-        elif activity_type == "review_created":
-            # 리뷰 작성 시 평점 기반 선호도 업데이트
-            rating = activity_data.get("rating", 0)
-            destination_id = activity_data.get("destination_id")
-            if rating >= 4 and destination_id:
-                tags = self._get_destination_tags(destination_id)
-                liked_tags = implicit_prefs.get("liked_tags", {})
-                for tag in tags:
-                    liked_tags[tag] = liked_tags.get(tag, 0) + (rating - 3)
-                implicit_prefs["liked_tags"] = liked_tags
-        
-        elif activity_type in ["like_added", "bookmark_added"]:
-            # 좋아요/북마크 시 강한 선호도 신호
-            destination_id = activity_data.get("destination_id")
-            if destination_id:
-                tags = self._get_destination_tags(destination_id)
-                liked_tags = implicit_prefs.get("liked_tags", {})
-                for tag in tags:
-                    liked_tags[tag] = liked_tags.get(tag, 0) + 2
-                implicit_prefs["liked_tags"] = liked_tags
-        
-        # 체류 시간 기록
-        if activity_type == "page_view" and "duration" in activity_data:
-            duration = activity_data["duration"]
-            if duration > 30:  # 30초 이상 체류 시
-                page_type = activity_data.get("page_type")
-                engagement = implicit_prefs.get("engagement", {})
-                engagement[page_type] = engagement.get(page_type, 0) + duration
-                implicit_prefs["engagement"] = engagement
+        implicit_prefs = dict(preferences.get("implicit", {}))
+        for field, values in increments.items():
+            counters = dict(implicit_prefs.get(field, {}))
+            for name, amount in values.items():
+                counters[name] = counters.get(name, 0) + amount
+            implicit_prefs[field] = counters
         
         # 업데이트된 preferences 저장
-        preferences["implicit"] = implicit_prefs
-        preferences["last_updated"] = datetime.now().isoformat()
-        user.preferences = preferences
+        user.preferences = {
+            **preferences,
+            "implicit": implicit_prefs,
+            "last_updated": datetime.now().isoformat(),
+        }
         
         self.db.commit()
     
+    def _get_stored_implicit(self, user_id: UUID) -> Dict[str, Any]:
+        """DB에 압축된 암묵적 선호도"""
+        preferences = self.db.query(User.preferences).filter(User.user_id == user_id).scalar()
+        return (preferences or {}).get("implicit", {})
+    
     def _get_destination_tags(self, destination_id: str) -> List[str]:
-        """여행지의 태그 목록 가져오기"""
-        tags = []
-        
-        # 각 테이블에서 태그 조회
-        tables = [
-            TouristAttraction, Restaurant, Accommodation,
-            CulturalFacility, Shopping
-        ]
-        
-        for table in tables:
-            destination = self.db.query(table).filter(
-                table.content_id == destination_id
-            ).first()
-            if destination and hasattr(destination, 'tags'):
-                tags.extend(destination.tags or [])
-                break
-        
-        return tags
+        """여행지의 태그 목록 가져오기 (콘텐츠 카탈로그)"""
+        entry = content_catalog.get(self.db, destination_id)
+        return list(entry.tags) if entry else []
     
     async def get_user_preferences_profile(self, user_id: UUID) -> Dict[str, Any]:
         """사용자의 종합적인 선호도 프로필 생성"""
@@ -163,11 +130,18 @@ class UserBehaviorService:
             "tags": user.preferences.get("tags", []) if user.preferences else []
         }
         
-        # 암묵적 선호도
-        implicit_prefs = user.preferences.get("implicit", {}) if user.preferences else {}
+        # 암묵적 선호도 (Redis 프로필, 처음이면 DB에 압축된 값으로 복원)
+        stored_implicit = user.preferences.get("implicit", {}) if user.preferences else {}
+        implicit_prefs = None
+        if preference_profile_store.ensure_hydrated(user_id, lambda: stored_implicit):
+            implicit_prefs = preference_profile_store.get_implicit(user_id)
+        if implicit_prefs is None:
+            implicit_prefs = stored_implicit
         
         # 최근 활동 분석
-        recent_activities = self._analyze_recent_activities(user_id)
+        recent_activities = preference_profile_store.get_recent_activities(user_id)
+        if recent_activities is None:
+            recent_activities = self._analyze_recent_activities(user_id)
         
         # 협업 필터링을 위한 유사 사용자 찾기
         similar_users = self._find_similar_users(user_id)
@@ -226,43 +200,14 @@ class UserBehaviorService:
         user_id: UUID, 
         limit: int = 10
     ) -> List[Dict[str, Any]]:
-        """유사한 사용자 찾기 (협업 필터링)"""
+        """유사한 사용자 찾기 (사전 계산된 사용자-사용자 이웃)"""
         
-        user = self.db.query(User).filter(User.user_id == user_id).first()
-        if not user or not user.preferences:
-            return []
-        
-        user_tags = set(user.preferences.get("tags", []))
-        if not user_tags:
-            return []
-        
-        # 태그 기반 유사도 계산
-        similar_users = []
-        
-        other_users = self.db.query(User).filter(
-            User.user_id != user_id,
-            User.preferences.isnot(None)
-        ).limit(100).all()  # 성능을 위해 제한
-        
-        for other_user in other_users:
-            other_tags = set(other_user.preferences.get("tags", []))
-            if other_tags:
-                # Jaccard 유사도 계산
-                intersection = len(user_tags & other_tags)
-                union = len(user_tags | other_tags)
-                similarity = intersection / union if union > 0 else 0
-                
-                if similarity > 0.2:  # 20% 이상 유사도
-                    similar_users.append({
-                        "user_id": str(other_user.user_id),
-                        "similarity_score": similarity,
-                        "shared_tags": list(user_tags & other_tags)
-                    })
-        
-        # 유사도 높은 순으로 정렬
-        similar_users.sort(key=lambda x: x["similarity_score"], reverse=True)
-        
-        return similar_users[:limit]
+        return [
+            {"user_id": other_user_id, "similarity_score": similarity}
+            for other_user_id, similarity in collaborative_engine.similar_users(
+                user_id, limit
+            )
+        ]
     
     def _calculate_profile_completeness(self, user: User) -> float:
         """프로필 완성도 계산"""
@@ -365,8 +310,6 @@ class UserBehaviorService:
     ) -> List[Dict[str, Any]]:
         """콘텐츠 기반 필터링"""
         
-        recommendations = []
-        
         # 사용자의 선호 태그 가져오기
         explicit_tags = user_profile["explicit_preferences"]["tags"]
         implicit_tags = user_profile["implicit_preferences"].get("liked_tags", {})
@@ -382,125 +325,37 @@ class UserBehaviorService:
         if not tag_weights:
             return []
         
-        # 각 여행지 테이블에서 추천 점수 계산
-        tables = [
-            (TouristAttraction, "tourist_attraction"),
-            (Restaurant, "restaurant"),
-            (Accommodation, "accommodation"),
-            (CulturalFacility, "cultural_facility"),
-            (Shopping, "shopping")
-        ]
-        
-        for table, type_name in tables:
-            destinations = self.db.query(table).limit(100).all()
-            
-            for dest in destinations:
-                if not hasattr(dest, 'tags') or not dest.tags:
-                    continue
-                
-                # 태그 매칭 점수 계산
-                score = 0
-                matched_tags = []
-                
-                for tag in dest.tags:
-                    if tag in tag_weights:
-                        score += tag_weights[tag]
-                        matched_tags.append(tag)
-                
-                if score > 0:
-                    recommendations.append({
-                        "id": dest.content_id,
-                        "name": dest.name,
-                        "type": type_name,
-                        "score": score,
-                        "matched_tags": matched_tags,
-                        "tags": dest.tags,
-                        "rating": getattr(dest, 'rating', 4.0)
-                    })
-        
-        return recommendations
+        # 전체 카탈로그 대상 벡터 연산으로 점수 계산
+        return content_scorer.recommend(tag_weights, limit=100)
     
     async def _collaborative_filtering(
         self, 
         user_profile: Dict[str, Any]
     ) -> List[Dict[str, Any]]:
-        """협업 필터링"""
+        """협업 필터링 (사전 계산된 아이템-아이템 이웃 기반)"""
         
         recommendations = []
-        similar_users = user_profile["similar_users"]
-        
-        if not similar_users:
-            return []
-        
-        # 유사 사용자들이 좋아한 여행지 찾기
-        destination_scores = {}
+        scored_items = collaborative_engine.recommend_items(
+            user_profile["user_id"], limit=50, include_courses=False
+        )
         
-        for similar_user in similar_users[:5]:  # 상위 5명만
-            user_id = UUID(similar_user["user_id"])
-            similarity = similar_user["similarity_score"]
-            
-            # 해당 사용자의 좋아요 목록
-            likes = self.db.query(RecommendLike).filter(
-                RecommendLike.user_id == user_id
-            ).all()
-            
-            for like in likes:
-                dest_id = like.recommend_id
-                if dest_id not in destination_scores:
-                    destination_scores[dest_id] = 0
-                destination_scores[dest_id] += similarity
-            
-            # 높은 평점 리뷰
-            reviews = self.db.query(Review).filter(
-                Review.user_id == user_id,
-                Review.rating >= 4
-            ).all()
-            
-            for review in reviews:
-                dest_id = review.content_id
-                if dest_id not in destination_scores:
-                    destination_scores[dest_id] = 0
-                destination_scores[dest_id] += similarity * (review.rating / 5)
-        
-        # 점수가 높은 여행지 정보 가져오기
-        for dest_id, score in destination_scores.items():
-            # 각 테이블에서 여행지 정보 조회
-            destination_info = self._get_destination_info(dest_id)
-            if destination_info:
+        catalog_entries = content_catalog.get_many(
+            self.db, [dest_id for dest_id, _ in scored_items]
+        )
+        for dest_id, score in scored_items:
+            entry = catalog_entries.get(dest_id)
+            if entry:
                 recommendations.append({
-                    **destination_info,
+                    **entry.to_dict(),
                     "score": score
                 })
         
         return recommendations
     
     def _get_destination_info(self, destination_id: str) -> Optional[Dict[str, Any]]:
-        """여행지 정보 조회"""
-        
-        tables = [
-            (TouristAttraction, "tourist_attraction"),
-            (Restaurant, "restaurant"),
-            (Accommodation, "accommodation"),
-            (CulturalFacility, "cultural_facility"),
-            (Shopping, "shopping")
-        ]
-        
-        for table, type_name in tables:
-            dest = self.db.query(table).filter(
-                table.content_id == destination_id
-            ).first()
-            
-            if dest:
-                return {
-                    "id": dest.content_id,
-                    "name": dest.name,
-                    "type": type_name,
-                    "tags": getattr(dest, 'tags', []),
-                    "rating": getattr(dest, 'rating', 4.0),
-                    "address": getattr(dest, 'address', '')
-                }
-        
-        return None
+        """여행지 정보 조회 (콘텐츠 카탈로그)"""
+        entry = content_catalog.get(self.db, destination_id)
+        return entry.to_dict() if entry else None
     
     def _apply_context_boost(
         self,
@@ -0,0 +1,182 @@
+"""
+지연 초기화 유틸리티
+무거운 라이브러리(openai 등)에 의존하는 전역 인스턴스를 모듈 import 시점이 아니라
+첫 사용 시점(또는 lifespan의 백그라운드 예열)에 생성
+
+- 전역 인스턴스를 LazyInstance로 감싸면 기존 사용 코드(속성 접근/메서드 호출)는 그대로 동작
+- 생성은 한 번만 수행 (스레드 안전), 생성 중 예외는 호출한 쪽으로 전달되고 다음 접근 시 재시도
+- 등록된 인스턴스는 warm_up_lazy_instances()로 시작 직후 미리 생성 가능
+- 사용 빈도가 낮은 라우터는 include_lazy_router()로 등록하면 경로 접두사의 첫 요청 시 import
+"""
+
+import asyncio
+import importlib
+import logging
+import threading
+import time
+from collections.abc import Callable
+from typing import Any, Generic, TypeVar
+
+from fastapi import FastAPI
+from starlette.routing import BaseRoute, Match, NoMatchFound, get_route_path
+from starlette.types import Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_UNSET = object()
+
+
+class LazyInstance(Generic[T]):
+    """첫 속성 접근 시 factory로 생성되는 전역 인스턴스 프록시"""
+
+    def __init__(self, factory: Callable[[], T], name: str | None = None):
+        self._factory = factory
+        self._name = name or getattr(factory, "__name__", repr(factory))
+        self._instance: Any = _UNSET
+        self._lock = threading.Lock()
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def is_initialized(self) -> bool:
+        return self._instance is not _UNSET
+
+    def get(self) -> T:
+        """실제 인스턴스 반환 (없으면 생성)"""
+        instance = self._instance
+        if instance is _UNSET:
+            with self._lock:
+                instance = self._instance
+                if instance is _UNSET:
+                    start = time.perf_counter()
+                    instance = self._factory()
+                    self._instance = instance
+                    logger.debug(
+                        f"지연 초기화 완료: {self._name} ({(time.perf_counter() - start) * 1000:.1f}ms)"
+                    )
+        return instance
+
+    def __getattr__(self, name: str) -> Any:
+        # 프록시 자체 속성은 여기까지 오지 않으므로 나머지는 실제 인스턴스로 위임
+        return getattr(self.get(), name)
+
+    def __repr__(self) -> str:
+        state = "initialized" if self.is_initialized else "pending"
+        return f"<LazyInstance {self._name} ({state})>"
+
+
+# 예열 대상 목록
+_registry: list[LazyInstance] = []
+
+
+def lazy_instance(factory: Callable[[], T], name: str | None = None) -> LazyInstance[T]:
+    """지연 초기화 전역 인스턴스 생성 및 예열 대상 등록"""
+    instance = LazyInstance(factory, name)
+    _registry.append(instance)
+    return instance
+
+
+def warm_up_lazy_instances() -> dict[str, float]:
+    """등록된 인스턴스를 모두 생성 (동기, 스레드에서 실행), 이름별 소요 시간(ms) 반환"""
+    timings = {}
+    for instance in list(_registry):
+        if instance.is_initialized:
+            continue
+        start = time.perf_counter()
+        try:
+            instance.get()
+        except Exception as e:
+            logger.error(f"지연 초기화 실패: {instance.name}: {e}")
+            continue
+        timings[instance.name] = round((time.perf_counter() - start) * 1000, 1)
+    return timings
+
+
+class LazyRouterRoute(BaseRoute):
+    """
+    라우터 모듈 자리 표시자
+    경로 접두사로 첫 요청이 오면 모듈을 import하여 앱에 등록하고, 자신을 제거한 뒤 요청을 다시 라우팅
+    """
+
+    def __init__(self, app: FastAPI, module_name: str, path_prefix: str, prefix: str = ""):
+        self.app = app
+        self.module_name = module_name
+        self.path_prefix = path_prefix.rstrip("/")
+        self.prefix = prefix
+        self.loaded = False
+
+    @property
+    def path(self) -> str:
+        return self.path_prefix
+
+    def matches(self, scope: Scope) -> tuple[Match, Scope]:
+        if scope["type"] in ("http", "websocket"):
+            route_path = get_route_path(scope)
+            if route_path == self.path_prefix or route_path.startswith(self.path_prefix + "/"):
+                return Match.FULL, {}
+        return Match.NONE, {}
+
+    def url_path_for(self, name: str, /, **path_params: Any):
+        # 로드 전에는 라우트 이름을 알 수 없음
+        raise NoMatchFound(name, path_params)
+
+    async def load(self):
+        """모듈 import(스레드) 후 라우터 등록 (등록은 이벤트 루프에서 수행하여 라우팅과 겹치지 않음)"""
+        if self.loaded:
+            return
+        start = time.perf_counter()
+        module = await asyncio.to_thread(importlib.import_module, self.module_name)
+        if self.loaded:
+            return
+        self.app.include_router(module.router, prefix=self.prefix)
+        if self in self.app.router.routes:
+            self.app.router.routes.remove(self)
+        # 새 라우트가 문서에 포함되도록 OpenAPI 스키마 재생성
+        self.app.openapi_schema = None
+        self.loaded = True
+        logger.info(
+            f"지연 라우터 로드: {self.module_name} ({(time.perf_counter() - start) * 1000:.1f}ms)"
+        )
+
+    async def handle(self, scope: Scope, receive: Receive, send: Send):
+        await self.load()
+        await self.app.router(scope, receive, send)
+
+
+# 지연 라우터 목록
+_lazy_routes: list[LazyRouterRoute] = []
+
+
+def include_lazy_router(
+    app: FastAPI, module_name: str, path_prefix: str, prefix: str = "", lazy: bool = True
+):
+    """
+    라우터를 첫 요청 시 로드하도록 등록
+
+    Args:
+        module_name: router 속성을 가진 라우터 모듈 (예: app.routers.advanced_travel)
+        path_prefix: 해당 라우터가 처리하는 전체 경로 접두사 (include prefix + 라우터 prefix)
+        prefix: include_router에 전달할 prefix
+        lazy: False면 즉시 import하여 등록
+    """
+    if not lazy:
+        module = importlib.import_module(module_name)
+        app.include_router(module.router, prefix=prefix)
+        return
+    route = LazyRouterRoute(app, module_name, path_prefix, prefix)
+    app.router.routes.append(route)
+    _lazy_routes.append(route)
+
+
+async def warm_up_lazy_components() -> dict[str, float]:
+    """시작 직후 지연 라우터와 지연 인스턴스를 미리 로드 (첫 요청 지연 방지)"""
+    for route in list(_lazy_routes):
+        try:
+            await route.load()
+        except Exception as e:
+            logger.error(f"지연 라우터 로드 실패: {route.module_name}: {e}")
+    return await asyncio.to_thread(warm_up_lazy_instances)
@@ -0,0 +1,248 @@
+"""
+커서(keyset) 페이지네이션 유틸리티
+(created_at, id) 기준 불투명 커서와 추정 전체 개수 계산
+"""
+
+import base64
+import hashlib
+import json
+import logging
+import uuid
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import and_, or_, text, tuple_
+from sqlalchemy.orm import Query
+
+from app.utils.redis_client import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+# 전체 개수 계산 방식
+TOTAL_MODES = ("exact", "estimated", "cached", "none")
+TOTAL_MODE_PATTERN = "^(exact|estimated|cached|none)$"
+
+CACHED_COUNT_TTL = 300  # 정확한 개수 캐시 유효시간 (초)
+
+
+class InvalidCursorError(ValueError):
+    """잘못된 페이지네이션 커서"""
+
+
+def encode_cursor(created_at: datetime | None, *item_ids: Any) -> str:
+    """(created_at, id...)를 URL-safe 불투명 커서 문자열로 인코딩"""
+    payload = json.dumps(
+        [created_at.isoformat() if created_at else None, *(str(item_id) for item_id in item_ids)],
+        separators=(",", ":"),
+    )
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, id_count: int = 1) -> tuple[datetime | None, list[str]]:
+    """커서 문자열을 (created_at, [id...])로 디코딩"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, *item_ids = json.loads(base64.urlsafe_b64decode(padded))
+    except Exception as e:
+        raise InvalidCursorError("유효하지 않은 커서입니다.") from e
+    if len(item_ids) != id_count:
+        raise InvalidCursorError("유효하지 않은 커서입니다.")
+    try:
+        return (
+            datetime.fromisoformat(created_at) if created_at else None,
+            [str(item_id) for item_id in item_ids],
+        )
+    except Exception as e:
+        raise InvalidCursorError("유효하지 않은 커서입니다.") from e
+
+
+def _coerce_id(id_column, item_id: str) -> Any:
+    """커서의 id 문자열을 컬럼 타입에 맞게 변환"""
+    if getattr(id_column.type, "as_uuid", False):
+        try:
+            return uuid.UUID(item_id)
+        except ValueError as e:
+            raise InvalidCursorError("유효하지 않은 커서입니다.") from e
+    return item_id
+
+
+def paginate_by_cursor(
+    query: Query,
+    created_column,
+    id_column,
+    cursor: str | None,
+    limit: int,
+    descending: bool = True,
+) -> tuple[list[Any], str | None]:
+    """
+    (created_at, id) keyset 기준으로 한 페이지를 조회합니다.
+
+    OFFSET 없이 마지막 항목 이후부터 인덱스를 따라 읽으므로
+    페이지 깊이와 관계없이 조회 비용이 일정합니다.
+    PostgreSQL 기본 NULL 정렬(ASC: NULLS LAST, DESC: NULLS FIRST)을 따라
+    created_at이 비어 있는 행도 누락 없이 순회합니다.
+
+    Args:
+        query: 필터가 적용된 기본 쿼리 (정렬 미적용)
+        created_column: 생성 시각 컬럼
+        id_column: 동일 시각 내 순서를 결정하는 컬럼
+            (복합 기본 키 테이블은 키를 이루는 컬럼 튜플을 전달해 순서를 고유하게 유지)
+        cursor: 이전 페이지의 next_cursor (첫 페이지는 None 또는 빈 문자열)
+        limit: 페이지 크기
+        descending: 최신순 정렬 여부
+
+    Returns:
+        (항목 목록, 다음 페이지 커서 또는 None)
+    """
+    id_columns = tuple(id_column) if isinstance(id_column, (tuple, list)) else (id_column,)
+
+    if cursor:
+        created_at, raw_ids = decode_cursor(cursor, len(id_columns))
+        item_ids = tuple(
+            _coerce_id(column, raw_id) for column, raw_id in zip(id_columns, raw_ids, strict=True)
+        )
+        if len(id_columns) == 1:
+            ids, id_values = id_columns[0], item_ids[0]
+        else:
+            ids, id_values = tuple_(*id_columns), item_ids
+        if descending:
+            if created_at is None:
+                # NULL 구간(맨 앞) 이후: 남은 NULL 행 + 모든 NOT NULL 행
+                condition = or_(
+                    and_(created_column.is_(None), ids < id_values),
+                    created_column.isnot(None),
+                )
+            else:
+                condition = tuple_(created_column, *id_columns) < (created_at, *item_ids)
+        else:
+            if created_at is None:
+                # NULL 구간(맨 뒤) 내부
+                condition = and_(created_column.is_(None), ids > id_values)
+            else:
+                condition = or_(
+                    tuple_(created_column, *id_columns) > (created_at, *item_ids),
+                    created_column.is_(None),
+                )
+        query = query.filter(condition)
+
+    if descending:
+        query = query.order_by(created_column.desc(), *(column.desc() for column in id_columns))
+    else:
+        query = query.order_by(created_column.asc(), *(column.asc() for column in id_columns))
+
+    # 다음 페이지 존재 여부 확인을 위해 한 건 더 조회
+    rows = query.limit(limit + 1).all()
+    items = rows[:limit]
+
+    next_cursor = None
+    if len(rows) > limit:
+        last = items[-1]
+        next_cursor = encode_cursor(
+            getattr(last, created_column.key),
+            *(getattr(last, column.key) for column in id_columns),
+        )
+
+    return items, next_cursor
+
+
+def estimate_count(query: Query) -> int:
+    """
+    플래너 통계 기반 추정 행 수 (EXPLAIN)
+
+    필터가 없는 단일 테이블 쿼리는 pg_class.reltuples를 바로 사용하고,
+    필터가 있으면 컬럼 통계로 선택도를 반영합니다. 테이블을 스캔하지 않습니다.
+    """
+    statement = query.order_by(None).statement
+    froms = statement.get_final_froms()
+    if query.whereclause is None and len(froms) == 1 and hasattr(froms[0], "name"):
+        return get_table_row_estimate(query, froms[0].name)
+
+    compiled = statement.compile(
+        dialect=query.session.get_bind().dialect,
+        compile_kwargs={"literal_binds": True},
+    )
+    plan = query.session.execute(text(f"EXPLAIN (FORMAT JSON) {compiled}")).scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def get_table_row_estimate(query: Query, table_name: str) -> int:
+    """pg_class.reltuples 기반 테이블 전체 행 수 추정"""
+    estimate = query.session.execute(
+        text("SELECT reltuples::bigint FROM pg_class WHERE relname = :table_name"),
+        {"table_name": table_name},
+    ).scalar()
+    # 한 번도 ANALYZE되지 않은 테이블은 -1을 반환
+    return max(int(estimate or 0), 0)
+
+
+def cached_count(query: Query, ttl: int = CACHED_COUNT_TTL) -> int:
+    """정확한 COUNT 결과를 쿼리별로 Redis에 캐시"""
+    statement = query.order_by(None).statement
+    compiled = statement.compile(dialect=query.session.get_bind().dialect)
+    key_source = f"{compiled}|{sorted(compiled.params.items())}"
+    cache_key = f"count:{hashlib.md5(key_source.encode()).hexdigest()}"
+
+    redis_client = get_redis_client()
+    cached = redis_client.get_cache(cache_key)
+    if cached is not None:
+        return int(cached)
+
+    total = query.order_by(None).count()
+    redis_client.set_cache(cache_key, total, ttl)
+    return total
+
+
+def count_total(query: Query, mode: str = "exact") -> tuple[int | None, bool]:
+    """
+    전체 개수 계산
+
+    Args:
+        query: 필터가 적용된 쿼리
+        mode: exact(정확한 COUNT), estimated(플래너 추정),
+            cached(캐시된 정확한 COUNT), none(계산 안 함)
+
+    Returns:
+        (전체 개수 또는 None, 추정값 여부)
+    """
+    if mode == "none":
+        return None, False
+    if mode == "estimated":
+        try:
+            # 실패해도 요청 트랜잭션이 중단되지 않도록 SAVEPOINT 안에서 추정
+            with query.session.begin_nested():
+                return estimate_count(query), True
+        except Exception as e:
+            logger.warning(f"추정 개수 계산 실패, 정확한 COUNT로 대체: {e}")
+            return query.order_by(None).count(), False
+    if mode == "cached":
+        return cached_count(query), False
+    return query.order_by(None).count(), False
+
+
+def create_cursor_pagination_info(
+    limit: int,
+    next_cursor: str | None,
+    total: int | None = None,
+    total_is_estimate: bool = False,
+) -> dict[str, Any]:
+    """
+    커서 페이지네이션 정보를 생성합니다.
+
+    Args:
+        limit: 페이지당 항목 수
+        next_cursor: 다음 페이지 커서 (마지막 페이지면 None)
+        total: 전체 항목 수 (계산하지 않았으면 None)
+        total_is_estimate: 전체 항목 수가 추정값인지 여부
+
+    Returns:
+        페이지네이션 정보 딕셔너리
+    """
+    return {
+        "limit": limit,
+        "next_cursor": next_cursor,
+        "has_more": next_cursor is not None,
+        "total": total,
+        "total_is_estimate": total_is_estimate,
+    }
@@ -167,6 +167,18 @@ class RedisClient:
             self.logger.error(f"패턴 캐시 삭제 실패 [{pattern}]: {e}")
             return 0
 
+    def acquire_job_lock(self, job_name: str, ttl: int) -> bool:
+        """주기 작업 담당 워커 선정 (ttl 동안 한 워커만 획득, Redis 미사용 시 항상 담당)"""
+        try:
+            client = self.get_client()
+            if not client:
+                return True
+
+            return bool(client.set(f"job:{job_name}:lock", os.getpid(), nx=True, ex=max(ttl, 1)))
+        except Exception as e:
+            self.logger.warning(f"작업 잠금 획득 실패 [{job_name}]: {e}")
+            return True
+
     def get_info(self) -> dict[str, Any]:
         """Redis 서버 정보 조회"""
         try:
@@ -198,6 +210,12 @@ class RedisClient:
             finally:
                 self._client = None
 
+    def reset_after_fork(self):
+        """fork된 워커에서 부모 프로세스의 연결을 쓰지 않도록 클라이언트를 다시 생성"""
+        # 부모 소켓은 닫지 않고 참조만 버림 (부모/다른 워커 연결에 영향 없음)
+        self._client = None
+        self._connection_failed = False
+
 
 # 전역 Redis 클라이언트 인스턴스
 _redis_client = None
@@ -211,6 +229,13 @@ def get_redis_client() -> RedisClient:
     return _redis_client
 
 
+def reset_redis_clients_after_fork():
+    """gunicorn post_fork 훅에서 호출 (preload 시 마스터에서 만든 연결 재사용 방지)"""
+    for client in (_redis_client, redis_client):
+        if client is not None:
+            client.reset_after_fork()
+
+
 # Redis 연결 테스트 함수
 def test_redis_connection() -> bool:
     """Redis 연결 테스트"""
@@ -0,0 +1,118 @@
+"""
+응답 압축 벤치마크 (identity / gzip / brotli)
+
+대표 응답 크기의 JSON 본문을 만들어 인코딩·레벨별 압축 크기와 압축 시간을 비교합니다.
+- 동적 레벨 (CompressionMiddleware가 요청마다 사용하는 레벨)
+- 캐시 레벨 (ConditionalCacheMiddleware가 본문 캐시에 한 번 압축해 보관하는 레벨)
+
+DB 없이 합성 데이터(경로 상세, 맞춤 추천, 지역별 전체 목록 형태)를 사용합니다.
+
+사용법:
+    python benchmarks/compression_benchmark.py --repeat 50
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import orjson
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.middleware.compression import (  # noqa: E402
+    CACHED_LEVELS,
+    DYNAMIC_LEVELS,
+    compress,
+    supported_encodings,
+)
+
+
+def route_details(points: int) -> bytes:
+    return orjson.dumps({
+        "route_id": "b6f0c7e2-2f0d-4a59-9d0e-6b8f3c1e2a11",
+        "transport_type": "car",
+        "distance": 182.4,
+        "duration": 145,
+        "route_data": {
+            "path": [[126.9780 + i * 0.0007, 37.5665 - i * 0.0004] for i in range(points)],
+            "guides": [{"name": f"교차로 {i}", "distance": 120 + i, "type": 1} for i in range(points // 20)],
+        },
+    })
+
+
+def recommendations(days: int) -> bytes:
+    return orjson.dumps({
+        "days": [
+            {
+                "day": day,
+                "places": [
+                    {
+                        "content_id": f"{day}{i:05d}",
+                        "name": f"추천 장소 {day}-{i}",
+                        "address": "서울특별시 중구 세종대로 110",
+                        "latitude": 37.5665 + i * 0.001,
+                        "longitude": 126.9780 + i * 0.001,
+                        "tags": ["실내", "가족", "사진명소"],
+                        "description": "날씨에 맞춘 추천 장소 설명 " * 4,
+                    }
+                    for i in range(6)
+                ],
+            }
+            for day in range(1, days + 1)
+        ]
+    })
+
+
+def local_all(items: int) -> bytes:
+    return orjson.dumps({
+        "items": [
+            {
+                "content_id": str(100000 + i),
+                "title": f"관광지 {i}",
+                "region_code": str(i % 17 + 1),
+                "address": "강원특별자치도 강릉시 창해로 " + str(i),
+                "first_image": f"https://tong.visitkorea.or.kr/cms/resource/{i:06d}_image2_1.jpg",
+                "latitude": 37.7 + i * 0.0001,
+                "longitude": 128.9 + i * 0.0001,
+            }
+            for i in range(items)
+        ]
+    })
+
+
+PAYLOADS = {
+    "route_details (2k pts)": lambda: route_details(2000),
+    "recommendations (5 days)": lambda: recommendations(5),
+    "local/*/all (3k items)": lambda: local_all(3000),
+}
+
+
+def measure(body: bytes, encoding: str, level: int, repeat: int) -> tuple[int, float]:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        data = compress(body, encoding, level)
+        timings.append(time.perf_counter() - start)
+    return len(data), statistics.median(timings) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    for name, build in PAYLOADS.items():
+        body = build()
+        print(f"\n[{name}] identity {len(body) / 1024:.1f} KB")
+        for encoding in supported_encodings():
+            for label, levels in (("동적", DYNAMIC_LEVELS), ("캐시", CACHED_LEVELS)):
+                level = levels[encoding]
+                size, ms = measure(body, encoding, level, args.repeat)
+                print(f"  {encoding:4s} {label} (level {level}): {size / 1024:7.1f} KB "
+                      f"({size / len(body):5.1%})  {ms:7.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+이메일 템플릿 렌더링 벤치마크
+
+app/templates/email 템플릿으로 초당 렌더링 수를 측정합니다.
+- 매번 컴파일: 발송마다 템플릿 소스를 파싱/컴파일 (사전 컴파일 전 방식에 해당)
+- 사전 컴파일: 시작 시 컴파일한 템플릿으로 수신자별 변수만 렌더링
+- 렌더러: EmailTemplateRenderer.render (사전 컴파일 템플릿 조회 포함)
+
+사용법:
+    python benchmarks/email_template_benchmark.py --renders 20000
+"""
+
+import argparse
+import importlib.util
+import time
+from pathlib import Path
+
+from jinja2 import Environment, FileSystemLoader, select_autoescape
+
+# app.services 패키지 초기화(설정/DB 로드) 없이 렌더러 모듈만 로드
+_spec = importlib.util.spec_from_file_location(
+    "email_templates",
+    Path(__file__).resolve().parent.parent / "app" / "services" / "email_templates.py",
+)
+email_templates = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(email_templates)
+
+TEMPLATE_DIR = email_templates.TEMPLATE_DIR
+EmailTemplateRenderer = email_templates.EmailTemplateRenderer
+nl2br = email_templates.nl2br
+
+CASES = {
+    "verification.html": lambda i: {"code": f"{i % 1_000_000:06d}", "nickname": f"사용자{i}"},
+    "notification.html": lambda i: {
+        "subject": "🌧️ 서울 비 예보 알림",
+        "content": f"비 예보가 있습니다.\n우산을 준비하세요! ({i % 30}°C)",
+    },
+    "weather_alert.html": lambda i: {
+        "location": "서울",
+        "weather_condition": "비",
+        "temperature": str(i % 30),
+    },
+}
+
+
+def measure(label: str, render, renders: int) -> None:
+    start = time.perf_counter()
+    for i in range(renders):
+        render(i)
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<14} {renders / elapsed:>12,.0f} renders/s   {elapsed / renders * 1e6:8.1f} µs/render")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--renders", type=int, default=20_000)
+    args = parser.parse_args()
+
+    sources = {name: (TEMPLATE_DIR / name).read_text(encoding="utf-8") for name in CASES}
+    renderer = EmailTemplateRenderer()
+    start = time.perf_counter()
+    count = renderer.precompile()
+    print(f"템플릿 {count}개 사전 컴파일 ({(time.perf_counter() - start) * 1000:.1f} ms)")
+
+    uncompiled_env = Environment(
+        loader=FileSystemLoader(str(TEMPLATE_DIR)),
+        autoescape=select_autoescape(["html"]),
+        cache_size=0,
+    )
+    uncompiled_env.filters["nl2br"] = nl2br
+
+    for name, make_context in CASES.items():
+        print(f"\n[{name}] ({len(sources[name]):,} bytes)")
+        # 매번 컴파일은 느리므로 횟수를 줄여 측정
+        measure(
+            "매번 컴파일",
+            lambda i: uncompiled_env.from_string(sources[name]).render(**make_context(i)),
+            max(args.renders // 20, 100),
+        )
+        template = renderer.get_template(name)
+        measure("사전 컴파일", lambda i: template.render(**make_context(i)), args.renders)
+        measure("렌더러", lambda i: renderer.render(name, **make_context(i)), args.renders)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,218 @@
+"""
+API 응답 JSON 직렬화 벤치마크
+
+대표 응답 형태로 초당 직렬화 수를 비교합니다.
+- 기본 경로: jsonable_encoder 순회 + 표준 json (FastAPI 기본 JSONResponse)
+- 후처리 경로: process_response_data 순회 + 표준 json (create_timezone_aware_response 이전 방식)
+- orjson 경로: FastJSONResponse.render (datetime/Decimal/UUID를 직렬화 중에 처리)
+
+페이로드:
+- restaurants_all: /local/restaurants/all 200건 × 32필드
+- travel_courses: /travel-courses 50건
+- custom_travel: /custom-travel/recommendations 5일 × 6곳 (Pydantic 모델)
+
+사용법:
+    python benchmarks/json_response_benchmark.py --iterations 200
+"""
+
+import argparse
+import json
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta
+from decimal import Decimal
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from fastapi.encoders import jsonable_encoder  # noqa: E402
+from fastapi.responses import JSONResponse  # noqa: E402
+from pydantic import BaseModel  # noqa: E402
+
+from app.middleware.json_encoder import (  # noqa: E402
+    FastJSONResponse,
+    process_response_data,
+)
+
+BASE_TIME = datetime(2025, 7, 1, 9, 30)
+
+
+def restaurants_all(rows: int = 200) -> dict:
+    restaurants = []
+    for i in range(rows):
+        restaurants.append({
+            "content_id": str(2_800_000 + i),
+            "region_code": "6",
+            "restaurant_name": f"해운대 국밥 {i}호점",
+            "category_code": "A05020100",
+            "sub_category_code": "A05020100",
+            "address": f"부산광역시 해운대구 해운대로 {i}번길 12",
+            "detail_address": "1층",
+            "zipcode": "48094",
+            "latitude": Decimal("35.1631") + Decimal(i) / 10000,
+            "longitude": Decimal("129.1635") + Decimal(i) / 10000,
+            "tel": "051-000-0000",
+            "homepage": "https://example.com",
+            "cuisine_type": "한식",
+            "specialty_dish": "돼지국밥",
+            "operating_hours": "09:00~21:00",
+            "rest_date": "연중무휴",
+            "reservation_info": "불가",
+            "credit_card": "가능",
+            "smoking": "불가",
+            "parking": "가능",
+            "room_available": "가능",
+            "children_friendly": "가능",
+            "takeout": "가능",
+            "delivery": "불가",
+            "overview": "해운대 해수욕장 인근의 오래된 국밥집입니다. " * 8,
+            "first_image": f"https://tong.visitkorea.or.kr/cms/resource/{i}.jpg",
+            "first_image_small": f"https://tong.visitkorea.or.kr/cms/resource/{i}_s.jpg",
+            "data_quality_score": Decimal("87.50"),
+            "processing_status": "processed",
+            "created_at": BASE_TIME + timedelta(minutes=i),
+            "updated_at": BASE_TIME + timedelta(hours=i),
+            "last_sync_at": BASE_TIME + timedelta(days=1),
+        })
+    return {
+        "restaurants": restaurants,
+        "pagination": {"page": 1, "page_size": rows, "total_count": 12_345, "total_pages": 62,
+                       "has_next": True, "has_prev": False},
+        "filters": {"region_code": "26", "category_code": None},
+    }
+
+
+def travel_courses(rows: int = 50) -> dict:
+    return {
+        "courses": [
+            {
+                "content_id": str(1_900_000 + i),
+                "region_code": "6",
+                "course_name": f"부산 바다 코스 {i}",
+                "course_theme": "힐링",
+                "required_time": "1일",
+                "difficulty_level": "쉬움",
+                "schedule": "해운대 → 동백섬 → 광안리",
+                "course_distance": "12km",
+                "address": "부산광역시 해운대구",
+                "overview": "바다를 따라 걷는 코스입니다. " * 10,
+                "first_image": f"https://tong.visitkorea.or.kr/cms/resource/c{i}.jpg",
+                "created_at": BASE_TIME + timedelta(days=i),
+                "place_id": str(uuid.UUID(int=i)),
+                "is_liked": i % 2 == 0,
+                "is_saved": False,
+                "total_likes": i * 3,
+            }
+            for i in range(rows)
+        ],
+        "totalCount": 1200,
+        "nextCursor": "eyJjIjoiMjAyNS0wNy0wMSJ9",
+        "hasMore": True,
+        "totalIsEstimate": True,
+    }
+
+
+class Place(BaseModel):
+    id: str
+    name: str
+    time: str
+    tags: list[str]
+    description: str
+    rating: float | None
+    address: str
+    latitude: float
+    longitude: float
+
+
+class Day(BaseModel):
+    day: int
+    date: str
+    places: list[Place]
+    weather: dict | None
+
+
+class Recommendation(BaseModel):
+    days: list[Day]
+    weather_summary: dict | None
+    total_places: int
+    recommendation_type: str
+    created_at: datetime
+
+
+def custom_travel(days: int = 5, places: int = 6) -> Recommendation:
+    return Recommendation(
+        days=[
+            Day(
+                day=d + 1,
+                date=(BASE_TIME + timedelta(days=d)).strftime("%Y-%m-%d"),
+                places=[
+                    Place(
+                        id=str(uuid.UUID(int=d * 100 + p)),
+                        name=f"추천 장소 {d}-{p}",
+                        time=f"{9 + p * 2:02d}:00-{10 + p * 2:02d}:30",
+                        tags=["힐링", "자연", "경치"],
+                        description="바다 전망이 좋은 명소입니다. " * 4,
+                        rating=4.5,
+                        address="부산광역시 해운대구 중동",
+                        latitude=35.16 + p / 100,
+                        longitude=129.16 + p / 100,
+                    )
+                    for p in range(places)
+                ],
+                weather={"status": "맑음", "temperature": "24°C"},
+            )
+            for d in range(days)
+        ],
+        weather_summary={"forecast": "대체로 맑음", "average_temperature": "22-27°C"},
+        total_places=days * places,
+        recommendation_type="custom_basic",
+        created_at=BASE_TIME,
+    )
+
+
+def default_path(data) -> bytes:
+    return JSONResponse(jsonable_encoder(data)).body
+
+
+def process_path(data) -> bytes:
+    if isinstance(data, BaseModel):
+        data = data.model_dump()
+    return JSONResponse(jsonable_encoder(process_response_data(data))).body
+
+
+def orjson_path(data) -> bytes:
+    return FastJSONResponse(data).body
+
+
+def measure(label: str, func, data, iterations: int) -> float:
+    func(data)  # 워밍업
+    start = time.perf_counter()
+    for _ in range(iterations):
+        body = func(data)
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<12} {iterations / elapsed:>10,.0f} resp/s   "
+          f"{elapsed / iterations * 1000:8.3f} ms/resp   {len(body):>9,} bytes")
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    payloads = {
+        "restaurants_all": restaurants_all(),
+        "travel_courses": travel_courses(),
+        "custom_travel": custom_travel(),
+    }
+    for name, data in payloads.items():
+        print(f"\n[{name}]")
+        base = measure("기본 경로", default_path, data, args.iterations)
+        measure("후처리 경로", process_path, data, args.iterations)
+        fast = measure("orjson", orjson_path, data, args.iterations)
+        print(f"  → orjson {base / fast:.1f}배")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+프로덕션 gunicorn 설정 (uvicorn 워커)
+
+실행:
+    gunicorn -c gunicorn.conf.py main:app
+
+- 워커 수: WEB_CONCURRENCY, 없으면 컨테이너 CPU 할당량(cgroup) 기준 코어 수
+- preload: 마스터에서 앱을 한 번 import한 뒤 fork (워커 시작 시간/메모리 절약)
+  → DB 엔진 풀과 Redis 클라이언트는 post_fork에서 워커별로 새로 생성
+- 워커 재시작: max_requests(+jitter)마다 순차 재시작, graceful_timeout 동안 처리 중인 요청 완료
+- Prometheus: 워커별 메트릭 파일을 PROMETHEUS_MULTIPROC_DIR에 기록하고 /metrics에서 합산
+"""
+
+import math
+import os
+import shutil
+
+
+def _available_cpus() -> int:
+    """컨테이너 CPU 할당량(cgroup v2 cpu.max)을 고려한 사용 가능 코어 수"""
+    try:
+        with open("/sys/fs/cgroup/cpu.max") as f:
+            quota, period = f.read().split()
+        if quota != "max":
+            return max(1, math.ceil(int(quota) / int(period)))
+    except (OSError, ValueError):
+        pass
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+# Prometheus 멀티프로세스 디렉터리는 preload(앱 import) 전에 준비해야 함
+PROMETHEUS_MULTIPROC_DIR = os.environ.setdefault(
+    "PROMETHEUS_MULTIPROC_DIR", "/tmp/weather_flick_prometheus"
+)
+shutil.rmtree(PROMETHEUS_MULTIPROC_DIR, ignore_errors=True)  # 이전 실행의 워커 파일 제거
+os.makedirs(PROMETHEUS_MULTIPROC_DIR, exist_ok=True)
+
+# 서버 소켓
+bind = os.getenv("BIND", "0.0.0.0:8000")
+backlog = 2048
+
+# 워커 (비동기 워커라 코어당 1개)
+worker_class = "uvicorn.workers.UvicornWorker"
+workers = int(os.getenv("WEB_CONCURRENCY", _available_cpus()))
+preload_app = os.getenv("GUNICORN_PRELOAD", "true").lower() == "true"
+
+# 워커 재시작 (메모리 증가 방지, 동시에 재시작되지 않도록 jitter)
+max_requests = int(os.getenv("GUNICORN_MAX_REQUESTS", "5000"))
+max_requests_jitter = int(os.getenv("GUNICORN_MAX_REQUESTS_JITTER", "500"))
+
+# 타임아웃 (요청 타임아웃 미들웨어 30초보다 길게)
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "60"))
+graceful_timeout = int(os.getenv("GUNICORN_GRACEFUL_TIMEOUT", "30"))
+keepalive = int(os.getenv("GUNICORN_KEEPALIVE", "5"))
+
+# 프록시 뒤에서 실행 (X-Forwarded-*는 이 주소의 프록시만 신뢰, 쉼표로 구분해 프록시 주소 지정)
+forwarded_allow_ips = os.getenv("FORWARDED_ALLOW_IPS", "127.0.0.1")
+
+# 로그는 앱 로깅 설정을 사용하고 접근 로그만 표준 출력
+accesslog = os.getenv("GUNICORN_ACCESS_LOG", "-")
+loglevel = os.getenv("GUNICORN_LOG_LEVEL", "info")
+
+
+def post_fork(server, worker):
+    """워커별 연결 재생성 (마스터에서 만든 DB/Redis 연결 공유 방지)"""
+    from app.database import dispose_engine_after_fork
+    from app.utils.redis_client import reset_redis_clients_after_fork
+
+    dispose_engine_after_fork()
+    reset_redis_clients_after_fork()
+    server.log.info(f"Worker {worker.pid}: DB/Redis connections reset after fork")
+
+
+def child_exit(server, worker):
+    """종료된 워커의 Prometheus 게이지 파일 정리"""
+    from prometheus_client import multiprocess
+
+    multiprocess.mark_process_dead(worker.pid)
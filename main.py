@@ -5,20 +5,22 @@ from fastapi.middleware.cors import CORSMiddleware
 
 from app.exception_handlers import register_exception_handlers
 from app.logging_config import setup_logging
+from app.middleware.compression import CompressionMiddleware
+from app.middleware.conditional_cache import ConditionalCacheMiddleware
 from app.middleware.activity_tracking import ActivityTrackingMiddleware
 from app.middleware.error_handling import (
     ErrorHandlingMiddleware,
     HealthCheckMiddleware,
     TimeoutMiddleware,
 )
-from app.middleware.json_encoder import setup_json_encoding
+from app.middleware.json_encoder import FastJSONResponse, setup_json_encoding
 from app.middleware.monitoring import (
     MonitoringMiddleware,
     collect_system_metrics,
+    metrics_response,
 )
 from app.middleware.security import RateLimitMiddleware, SecurityHeadersMiddleware
 from app.routers import (
-    advanced_travel,
     attractions,
     auth,
     categories,
@@ -31,20 +33,18 @@ from app.routers import (
     destinations,
     events,
     google,
-    leisure_sports,
     likes_recommend,
     local_info,
     location,
     notifications,  # 2025-07-20: Notification system reactivation - Added inquiry response notification feature
     personalized_recommendations,
     plan,
-    realtime_travel,
     recommend_reviews,
     regions,
     review_likes,
     # recommendations,
-    route_optimization,
     routes,
+    search,
     system,
     travel_course,
     travel_course_saves,
@@ -53,6 +53,18 @@ from app.routers import (
     travel_plans,
     weather,
 )
+from app.services.collaborative_filtering import refresh_collaborative_model
+from app.services.content_catalog import refresh_content_catalog
+from app.config import settings
+from app.services.counter_service import sync_counters
+from app.services.dataset_versions import track_dataset_versions
+from app.services.email_templates import email_template_renderer
+from app.services.fcm_service import prune_invalid_tokens
+from app.services.health_checker import run_health_checks
+from app.services.notification_worker import run_notification_worker
+from app.services.preference_profile_service import compact_preference_profiles
+from app.services.smtp_pool import close_mail_transport
+from app.utils.lazy import include_lazy_router, warm_up_lazy_components
 from app.utils.redis_client import test_redis_connection
 
 # Initialize logging configuration
@@ -72,27 +84,72 @@ async def lifespan(app: FastAPI):
     else:
         logger.warning("Redis cache server connection failed - running without cache")
 
-    # OpenAI initialization status check
-    try:
-        from app.services.openai_service import openai_service
+    # Compile email templates once (bytecode cached across restarts)
+    email_template_renderer.precompile()
 
-        if openai_service.client:
-            logger.info("OpenAI service initialization successful")
-        else:
-            logger.warning("OpenAI service initialization failed - check API key")
-    except Exception as e:
-        logger.error(f"Error checking OpenAI service: {e}")
+    import asyncio
+
+    # Load lazy routers and heavy clients (OpenAI) in the background after startup
+    warm_up_task = None
+    if settings.lazy_warm_up_enabled:
+        warm_up_task = asyncio.create_task(warm_up_lazy_components())
+        logger.info("Lazy component warm-up task started")
 
     # Start monitoring background task
-    import asyncio
 
     monitoring_task = asyncio.create_task(collect_system_metrics())
     logger.info("System monitoring background task started")
 
+    # Start background health checks (readiness probes read the cached snapshot)
+    health_task = asyncio.create_task(run_health_checks())
+    logger.info("Health check background task started")
+
+    # Start catalog dataset version tracking (ETag validation without DB access)
+    dataset_version_task = asyncio.create_task(track_dataset_versions())
+    logger.info("Dataset version tracking task started")
+
+    # Start like/save counter write-behind task
+    counter_task = asyncio.create_task(sync_counters())
+    logger.info("Counter sync background task started")
+
+    # Start content catalog load/incremental refresh task
+    catalog_task = asyncio.create_task(refresh_content_catalog())
+    logger.info("Content catalog refresh task started")
+
+    # Start preference profile compaction task
+    profile_task = asyncio.create_task(compact_preference_profiles())
+    logger.info("Preference profile compaction task started")
+
+    # Start collaborative filtering model refresh task
+    cf_model_task = asyncio.create_task(refresh_collaborative_model())
+    logger.info("Collaborative filtering model refresh task started")
+
+    # Start invalid FCM token prune task
+    token_prune_task = asyncio.create_task(prune_invalid_tokens())
+    logger.info("FCM token prune task started")
+
+    # Start notification queue worker (when not running as a separate process)
+    notification_worker_task = None
+    if settings.notification_worker_enabled:
+        notification_worker_task = asyncio.create_task(run_notification_worker())
+        logger.info("Notification queue worker task started")
+
     yield
 
     # Shutdown (cleanup)
+    if warm_up_task:
+        warm_up_task.cancel()
+    if notification_worker_task:
+        notification_worker_task.cancel()
+    token_prune_task.cancel()
+    dataset_version_task.cancel()
+    health_task.cancel()
     monitoring_task.cancel()
+    counter_task.cancel()
+    cf_model_task.cancel()
+    catalog_task.cancel()
+    profile_task.cancel()
+    await close_mail_transport()
     logger.info("Shutting down Weather Flick API...")
 
 
@@ -101,12 +158,15 @@ app = FastAPI(
     description="Weather Flick Backend API with Authentication, Admin Management, and Local Information",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=FastJSONResponse,
 )
 
 # Register global exception handlers
 register_exception_handlers(app)
 
 # Add middleware (order matters: external → internal)
+app.add_middleware(ConditionalCacheMiddleware)  # Catalog ETag/304 and response body cache
+app.add_middleware(CompressionMiddleware)  # gzip/brotli response compression
 app.add_middleware(ErrorHandlingMiddleware)  # Top-level error handling
 app.add_middleware(TimeoutMiddleware, timeout_seconds=30)  # Timeout handling
 app.add_middleware(HealthCheckMiddleware)  # Health check handling
@@ -222,28 +282,34 @@ app.include_router(routes.router, prefix="/api")
 app.include_router(likes_recommend.router, prefix="/api")
 app.include_router(review_likes.router, prefix="/api")
 app.include_router(custom_travel.router, prefix="/api")
-app.include_router(advanced_travel.router, prefix="/api")  # 고급 AI 여행 추천 API
 app.include_router(custom_travel_converter.router, prefix="/api")
 app.include_router(attractions.router, prefix="/api")
-app.include_router(leisure_sports.router, prefix="/api")  # 레저 스포츠 API 라우터 추가
 app.include_router(categories.router, prefix="/api")  # 카테고리 API 라우터 추가
 app.include_router(regions.router)  # 지역 API 라우터 (prefix는 라우터에서 정의됨)
+app.include_router(search.router, prefix="/api")  # 통합 장소 검색 API 라우터
 app.include_router(system.router, prefix="/api")
-app.include_router(
-    route_optimization.router, prefix="/api"
-)  # 경로 최적화 API 라우터 추가
 app.include_router(notifications.router, prefix="/api")  # 2025-07-20: 알림 시스템 재활성화
 app.include_router(auth.router, prefix="/api")  # 인증 API 라우터
 app.include_router(google.router, prefix="/api")
-app.include_router(
-    realtime_travel.router, prefix="/api"
-)  # 실시간 여행 정보 API 라우터 추가
 app.include_router(travel_plan_share.router, prefix="/api")  # 여행 계획 공유 API 라우터
 app.include_router(
     travel_plan_share.shared_router, prefix="/api"
 )  # 공유된 계획 조회 라우터
 app.include_router(travel_plan_bookmarks.router, prefix="/api")  # 여행 계획 즐겨찾기 API 라우터
 
+# 사용 빈도가 낮은 라우터는 경로 접두사의 첫 요청 시 로드 (시작 후 예열 작업에서도 로드)
+# (모듈, 전체 경로 접두사) - 전체 경로 접두사는 "/api" + 라우터 prefix
+LAZY_ROUTERS = [
+    ("app.routers.advanced_travel", "/api/advanced-travel"),  # 고급 AI 여행 추천 API
+    ("app.routers.leisure_sports", "/api/leisure-sports"),  # 레저 스포츠 API
+    ("app.routers.route_optimization", "/api/route-optimization"),  # 경로 최적화 API
+    ("app.routers.realtime_travel", "/api/realtime"),  # 실시간 여행 정보 API
+]
+for module_name, path_prefix in LAZY_ROUTERS:
+    include_lazy_router(
+        app, module_name, path_prefix, prefix="/api", lazy=settings.lazy_routers_enabled
+    )
+
 
 @app.get("/")
 async def root():
@@ -255,6 +321,12 @@ async def health_check():
     return {"status": "healthy"}
 
 
+@app.get("/metrics", include_in_schema=False)
+async def prometheus_metrics():
+    """Prometheus 스크레이프 엔드포인트"""
+    return metrics_response()
+
+
 if __name__ == "__main__":
     import uvicorn
 
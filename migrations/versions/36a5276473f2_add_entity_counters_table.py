@@ -0,0 +1,55 @@
+"""add_entity_counters_table
+
+Revision ID: 36a5276473f2
+Revises: cdf8ad1599b0
+Create Date: 2025-07-21 10:02:41.152903
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '36a5276473f2'
+down_revision: Union[str, Sequence[str], None] = 'cdf8ad1599b0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# 카운터 종류별 원본 테이블 (초기 집계용)
+COUNTER_SOURCES = {
+    'travel_course_likes': ('travel_course_likes', 'content_id'),
+    'travel_course_saves': ('travel_course_saves', 'content_id'),
+    'destination_likes': ('destination_likes', 'destination_id'),
+    'destination_saves': ('destination_saves', 'destination_id'),
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 좋아요/저장 카운터 테이블 생성 (Redis 카운터 캐시의 write-behind 대상)
+    op.create_table('entity_counters',
+        sa.Column('counter_type', sa.String(50), nullable=False),
+        sa.Column('entity_id', sa.String(100), nullable=False),
+        sa.Column('value', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.PrimaryKeyConstraint('counter_type', 'entity_id')
+    )
+
+    # 기존 데이터 기준 초기 카운트 적재
+    for counter_type, (table_name, column_name) in COUNTER_SOURCES.items():
+        op.execute(
+            f"""
+            INSERT INTO entity_counters (counter_type, entity_id, value)
+            SELECT '{counter_type}', {column_name}::text, COUNT(*)
+            FROM {table_name}
+            GROUP BY {column_name}
+            """
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('entity_counters')
@@ -0,0 +1,40 @@
+"""add_keyset_pagination_indexes
+
+Revision ID: 7b1e0c94d2a6
+Revises: 36a5276473f2
+Create Date: 2025-07-21 15:27:09.630118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7b1e0c94d2a6'
+down_revision: Union[str, Sequence[str], None] = '36a5276473f2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# 커서 페이지네이션 (created_at, id) 정렬용 복합 인덱스
+KEYSET_INDEXES = [
+    ('idx_travel_courses_keyset', 'travel_courses', ['created_at', 'content_id', 'region_code', 'course_name']),
+    ('idx_travel_plans_user_keyset', 'travel_plans', ['user_id', 'created_at', 'plan_id']),
+    ('idx_regions_keyset', 'regions', ['created_at', 'region_code']),
+    ('idx_destination_likes_user_keyset', 'destination_likes', ['user_id', 'created_at', 'id']),
+    ('idx_destination_saves_user_keyset', 'destination_saves', ['user_id', 'created_at', 'id']),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for index_name, table_name, columns in KEYSET_INDEXES:
+        op.create_index(index_name, table_name, columns, if_not_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for index_name, table_name, _ in reversed(KEYSET_INDEXES):
+        op.drop_index(index_name, table_name=table_name, if_exists=True)
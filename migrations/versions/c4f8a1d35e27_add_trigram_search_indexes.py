@@ -0,0 +1,54 @@
+"""add_trigram_search_indexes
+
+Revision ID: c4f8a1d35e27
+Revises: 7b1e0c94d2a6
+Create Date: 2025-07-22 09:41:18.204517
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4f8a1d35e27'
+down_revision: Union[str, Sequence[str], None] = '7b1e0c94d2a6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# 통합 장소 검색용 트라이그램 GIN 인덱스 (similarity, %, ILIKE '%...%' 모두 사용)
+TRIGRAM_INDEXES = [
+    ('idx_tourist_attractions_name_trgm', 'tourist_attractions', 'attraction_name'),
+    ('idx_tourist_attractions_address_trgm', 'tourist_attractions', 'address'),
+    ('idx_restaurants_name_trgm', 'restaurants', 'restaurant_name'),
+    ('idx_restaurants_address_trgm', 'restaurants', 'address'),
+    ('idx_accommodations_name_trgm', 'accommodations', 'accommodation_name'),
+    ('idx_accommodations_address_trgm', 'accommodations', 'address'),
+    ('idx_cultural_facilities_name_trgm', 'cultural_facilities', 'facility_name'),
+    ('idx_cultural_facilities_address_trgm', 'cultural_facilities', 'address'),
+    ('idx_shopping_name_trgm', 'shopping', 'shop_name'),
+    ('idx_shopping_address_trgm', 'shopping', 'address'),
+    ('idx_leisure_sports_name_trgm', 'leisure_sports', 'facility_name'),
+    ('idx_leisure_sports_address_trgm', 'leisure_sports', 'address'),
+    ('idx_regions_name_trgm', 'regions', 'region_name'),
+    ('idx_regions_name_full_trgm', 'regions', 'region_name_full'),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for index_name, table_name, column_name in TRIGRAM_INDEXES:
+        op.execute(
+            f'CREATE INDEX IF NOT EXISTS {index_name} '
+            f'ON {table_name} USING gin ({column_name} gin_trgm_ops)'
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # pg_trgm 확장은 다른 객체가 사용할 수 있으므로 제거하지 않음
+    for index_name, _, _ in reversed(TRIGRAM_INDEXES):
+        op.execute(f'DROP INDEX IF EXISTS {index_name}')
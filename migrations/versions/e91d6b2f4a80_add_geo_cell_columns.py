@@ -0,0 +1,59 @@
+"""add_geo_cell_columns
+
+Revision ID: e91d6b2f4a80
+Revises: c4f8a1d35e27
+Create Date: 2025-07-22 14:12:53.871042
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e91d6b2f4a80'
+down_revision: Union[str, Sequence[str], None] = 'c4f8a1d35e27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# app.models.GEO_CELL_EXPRESSION과 동일해야 함 (마이그레이션은 모델을 import하지 않음)
+GEO_CELL_EXPRESSION = (
+    "(floor(latitude / 0.05)::integer + 1800) * 10000"
+    " + (floor(longitude / 0.05)::integer + 3600)"
+)
+
+CONTENT_TABLES = [
+    'tourist_attractions',
+    'cultural_facilities',
+    'restaurants',
+    'accommodations',
+    'shopping',
+    'leisure_sports',
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 위경도로부터 자동 계산되는 격자 셀 컬럼 (STORED 생성 컬럼, 테이블 재작성 발생)
+    for table_name in CONTENT_TABLES:
+        op.add_column(
+            table_name,
+            sa.Column(
+                'geo_cell',
+                sa.Integer(),
+                sa.Computed(GEO_CELL_EXPRESSION, persisted=True),
+                nullable=True,
+            ),
+        )
+        op.create_index(
+            f'ix_{table_name}_geo_cell', table_name, ['geo_cell'], if_not_exists=True
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table_name in reversed(CONTENT_TABLES):
+        op.drop_index(f'ix_{table_name}_geo_cell', table_name=table_name, if_exists=True)
+        op.drop_column(table_name, 'geo_cell')